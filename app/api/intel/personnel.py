@@ -1,13 +1,16 @@
 """Personnel Intelligence API endpoints."""
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 
+from app.api.responses import payload_cache
 from app.schemas.intel.personnel import (
     PersonnelChangesResponse,
     PersonnelEnrichedFeedResponse,
     PersonnelEnrichedStatsResponse,
     PersonnelFeedResponse,
 )
+from app.services.intel.intel_store import intel_generation
 from app.services.intel.personnel import service as personnel_service
+from app.services.intel.source_filter import source_names_generation
 
 router = APIRouter()
 
@@ -20,6 +23,7 @@ router = APIRouter()
     "包含从文章中自动提取的任免变动列表。",
 )
 async def get_personnel_feed(
+    request: Request,
     importance: str | None = Query(
         None, description="重要性级别: 紧急 / 重要 / 关注 / 一般"
     ),
@@ -36,16 +40,24 @@ async def get_personnel_feed(
     limit: int = Query(50, ge=1, le=200, description="返回条数上限"),
     offset: int = Query(0, ge=0, description="偏移量"),
 ):
-    return personnel_service.get_personnel_feed(
-        importance=importance,
-        min_match_score=min_match_score,
-        keyword=keyword,
-        source_id=source_id,
-        source_ids=source_ids,
-        source_name=source_name,
-        source_names=source_names,
-        limit=limit,
-        offset=offset,
+    return payload_cache.respond(
+        request,
+        generation=(
+            intel_generation("personnel_intel", "feed.json"),
+            source_names_generation(source_name, source_names),
+        ),
+        build=lambda: personnel_service.get_personnel_feed(
+            importance=importance,
+            min_match_score=min_match_score,
+            keyword=keyword,
+            source_id=source_id,
+            source_ids=source_ids,
+            source_name=source_name,
+            source_names=source_names,
+            limit=limit,
+            offset=offset,
+        ),
+        model=PersonnelFeedResponse,
     )
 
 
@@ -57,6 +69,7 @@ async def get_personnel_feed(
     "支持按部门、任免类型过滤。",
 )
 async def get_personnel_changes(
+    request: Request,
     department: str | None = Query(None, description="按部门过滤"),
     action: str | None = Query(None, description="任免类型: 任命 / 免去"),
     keyword: str | None = Query(
@@ -65,12 +78,17 @@ async def get_personnel_changes(
     limit: int = Query(50, ge=1, le=200, description="返回条数上限"),
     offset: int = Query(0, ge=0, description="偏移量"),
 ):
-    return personnel_service.get_personnel_changes(
-        department=department,
-        action=action,
-        keyword=keyword,
-        limit=limit,
-        offset=offset,
+    return payload_cache.respond(
+        request,
+        generation=intel_generation("personnel_intel", "changes.json"),
+        build=lambda: personnel_service.get_personnel_changes(
+            department=department,
+            action=action,
+            keyword=keyword,
+            limit=limit,
+            offset=offset,
+        ),
+        model=PersonnelChangesResponse,
     )
 
 
@@ -1,8 +1,11 @@
 """Policy Intelligence API endpoints."""
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 
+from app.api.responses import payload_cache
 from app.schemas.intel.policy import PolicyFeedResponse, PolicyOpportunitiesResponse
+from app.services.intel.intel_store import intel_generation
 from app.services.intel.policy import service as policy_service
+from app.services.intel.source_filter import source_names_generation
 
 router = APIRouter()
 
@@ -15,6 +18,7 @@ router = APIRouter()
     "数据经过规则引擎 + LLM 二级管线处理，包含匹配度评分、资金信息、AI 洞察等富化字段。",
 )
 async def get_policy_feed(
+    request: Request,
     category: str | None = Query(
         None, description="政策分类: 国家政策 / 北京政策 / 领导讲话 / 政策机会"
     ),
@@ -34,17 +38,25 @@ async def get_policy_feed(
     limit: int = Query(50, ge=1, le=200, description="返回条数上限"),
     offset: int = Query(0, ge=0, description="偏移量"),
 ):
-    return policy_service.get_policy_feed(
-        category=category,
-        importance=importance,
-        min_match_score=min_match_score,
-        keyword=keyword,
-        source_id=source_id,
-        source_ids=source_ids,
-        source_name=source_name,
-        source_names=source_names,
-        limit=limit,
-        offset=offset,
+    return payload_cache.respond(
+        request,
+        generation=(
+            intel_generation(policy_service.MODULE, "feed.json"),
+            source_names_generation(source_name, source_names),
+        ),
+        build=lambda: policy_service.get_policy_feed(
+            category=category,
+            importance=importance,
+            min_match_score=min_match_score,
+            keyword=keyword,
+            source_id=source_id,
+            source_ids=source_ids,
+            source_name=source_name,
+            source_names=source_names,
+            limit=limit,
+            offset=offset,
+        ),
+        model=PolicyFeedResponse,
     )
 
 
@@ -56,6 +68,7 @@ async def get_policy_feed(
     "包含资金规模、截止日期、匹配度评分、紧急状态等关键字段。",
 )
 async def get_policy_opportunities(
+    request: Request,
     status: str | None = Query(
         None, description="状态过滤: urgent / active / tracking"
     ),
@@ -65,11 +78,16 @@ async def get_policy_opportunities(
     limit: int = Query(50, ge=1, le=200, description="返回条数上限"),
     offset: int = Query(0, ge=0, description="偏移量"),
 ):
-    return policy_service.get_policy_opportunities(
-        status=status,
-        min_match_score=min_match_score,
-        limit=limit,
-        offset=offset,
+    return payload_cache.respond(
+        request,
+        generation=intel_generation(policy_service.MODULE, "opportunities.json"),
+        build=lambda: policy_service.get_policy_opportunities(
+            status=status,
+            min_match_score=min_match_score,
+            limit=limit,
+            offset=offset,
+        ),
+        model=PolicyOpportunitiesResponse,
     )
 
 
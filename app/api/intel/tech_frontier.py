@@ -1,12 +1,15 @@
 """Tech Frontier (科技前沿) API endpoints."""
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 
+from app.api.responses import payload_cache
 from app.schemas.intel.tech_frontier import (
     TechFrontierOpportunitiesResponse,
     TechFrontierSignalsResponse,
     TechFrontierStatsResponse,
     TechFrontierTopicsResponse,
 )
+from app.services.intel.intel_store import intel_generation
+from app.services.intel.source_filter import source_names_generation
 from app.services.intel.tech_frontier import service as tf_service
 
 router = APIRouter()
@@ -20,6 +23,7 @@ router = APIRouter()
     "支持按热度趋势、院方布局状态和关键词过滤。",
 )
 async def get_topics(
+    request: Request,
     heat_trend: str | None = Query(
         None, description="热度趋势: surging / rising / stable / declining"
     ),
@@ -32,12 +36,17 @@ async def get_topics(
     limit: int = Query(50, ge=1, le=200, description="返回条数上限"),
     offset: int = Query(0, ge=0, description="偏移量"),
 ):
-    return tf_service.get_topics(
-        heat_trend=heat_trend,
-        our_status=our_status,
-        keyword=keyword,
-        limit=limit,
-        offset=offset,
+    return payload_cache.respond(
+        request,
+        generation=intel_generation(tf_service.MODULE, "topics.json"),
+        build=lambda: tf_service.get_topics(
+            heat_trend=heat_trend,
+            our_status=our_status,
+            keyword=keyword,
+            limit=limit,
+            offset=offset,
+        ),
+        model=TechFrontierTopicsResponse,
     )
 
 
@@ -60,6 +69,7 @@ async def get_topic_detail(topic_id: str):
     description="获取检测到的科技前沿机会（会议、合作、内参），支持按优先级和类型过滤。",
 )
 async def get_opportunities(
+    request: Request,
     priority: str | None = Query(
         None, description="优先级: 紧急 / 高 / 中 / 低"
     ),
@@ -72,12 +82,17 @@ async def get_opportunities(
     limit: int = Query(50, ge=1, le=200, description="返回条数上限"),
     offset: int = Query(0, ge=0, description="偏移量"),
 ):
-    return tf_service.get_opportunities(
-        priority=priority,
-        opp_type=type,
-        keyword=keyword,
-        limit=limit,
-        offset=offset,
+    return payload_cache.respond(
+        request,
+        generation=intel_generation(tf_service.MODULE, "opportunities.json"),
+        build=lambda: tf_service.get_opportunities(
+            priority=priority,
+            opp_type=type,
+            keyword=keyword,
+            limit=limit,
+            offset=offset,
+        ),
+        model=TechFrontierOpportunitiesResponse,
     )
 
 
@@ -100,6 +115,7 @@ async def get_stats():
     "支持按主题、信号类型和关键词过滤。",
 )
 async def get_signals(
+    request: Request,
     topic_id: str | None = Query(
         None, description="主题 ID 过滤"
     ),
@@ -116,14 +132,22 @@ async def get_signals(
     limit: int = Query(50, ge=1, le=200, description="返回条数上限"),
     offset: int = Query(0, ge=0, description="偏移量"),
 ):
-    return tf_service.get_signals(
-        topic_id=topic_id,
-        signal_type=signal_type,
-        keyword=keyword,
-        source_id=source_id,
-        source_ids=source_ids,
-        source_name=source_name,
-        source_names=source_names,
-        limit=limit,
-        offset=offset,
+    return payload_cache.respond(
+        request,
+        generation=(
+            intel_generation(tf_service.MODULE, "topics.json"),
+            source_names_generation(source_name, source_names),
+        ),
+        build=lambda: tf_service.get_signals(
+            topic_id=topic_id,
+            signal_type=signal_type,
+            keyword=keyword,
+            source_id=source_id,
+            source_ids=source_ids,
+            source_name=source_name,
+            source_names=source_names,
+            limit=limit,
+            offset=offset,
+        ),
+        model=TechFrontierSignalsResponse,
     )
@@ -12,14 +12,26 @@ router = APIRouter()
     description="检查调度器运行状态，用于监控和部署健康探针。",
 )
 async def health_check():
+    from app.scheduler.leader import SchedulerCommandProxy, leader_is_running
     from app.scheduler.manager import get_scheduler_manager
 
     scheduler = get_scheduler_manager()
-    scheduler_status = "running" if scheduler else "not_started"
+    if isinstance(scheduler, SchedulerCommandProxy):
+        # Follower worker: the scheduler runs on whichever worker holds the lock.
+        try:
+            leader_running = await leader_is_running()
+        except Exception:  # noqa: BLE001
+            leader_running = False
+        scheduler_status = "follower" if leader_running else "no_leader"
+        role = "follower"
+    else:
+        scheduler_status = "running" if scheduler else "not_started"
+        role = "leader" if scheduler else None
 
     return {
         "status": "ok",
         "scheduler": scheduler_status,
+        "scheduler_role": role,
     }
 
 
@@ -39,9 +51,9 @@ async def crawl_status():
     description="获取上次每日管线运行的状态、各阶段耗时和结果摘要。",
 )
 async def pipeline_status():
-    from app.scheduler.pipeline import get_last_pipeline_result
+    from app.scheduler.pipeline import load_last_pipeline_result
 
-    result = get_last_pipeline_result()
+    result = await load_last_pipeline_result()
     if result is None:
         return {"status": "never_run", "message": "Pipeline has not run yet"}
     return result.to_dict()
@@ -0,0 +1,154 @@
+"""JSON response helpers: orjson rendering and a pre-serialized payload cache.
+
+Read-only list endpoints over data that only changes when a pipeline runs
+(processed intel files) serialize the same payload over and over. They can
+answer through ``payload_cache`` instead:
+
+    return payload_cache.respond(
+        request,
+        generation=intel_generation("policy_intel", "feed.json"),
+        build=lambda: policy_service.get_policy_feed(...),
+        model=PolicyFeedResponse,
+    )
+
+The body is built and serialized once per (path, query string, generation)
+and kept as bytes. The ETag is derived from the generation, so a client
+revalidating with ``If-None-Match`` gets a 304 without the payload being
+built at all. ``generation`` must change whenever the data does, and must be
+the same in every worker for the same data (file stamps, not counters).
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.datastructures import Default
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.config import settings
+from app.utils.metrics import API_PAYLOAD_CACHE
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+    HAS_ORJSON = False
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, byte-identical to Starlette's JSONResponse for plain data."""
+    if HAS_ORJSON:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (stdlib json when it is missing)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _fastapi_dumps_models_natively() -> bool:
+    # Newer FastAPI serializes response_model payloads straight to JSON bytes
+    # in pydantic-core, but only while no default response class is set; a
+    # custom class there would route them through a Python dict again.
+    from fastapi import routing  # noqa: PLC0415
+
+    serialize = getattr(routing, "serialize_response", None)
+    return serialize is not None and "dump_json" in inspect.signature(serialize).parameters
+
+
+# FastAPI(default_response_class=...): orjson where it is the faster path.
+DEFAULT_RESPONSE_CLASS = (
+    Default(JSONResponse) if _fastapi_dumps_models_natively() else ORJSONResponse
+)
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def serialize(content: Any, model: Any = None) -> bytes:
+    """JSON bytes of ``content``, validated through ``model`` like a response_model."""
+    if model is None:
+        return dumps(content)
+    adapter = _adapter(model)
+    return adapter.dump_json(adapter.validate_python(content), by_alias=True)
+
+
+def make_etag(generation: Hashable) -> str:
+    digest = hashlib.blake2b(repr(generation).encode("utf-8"), digest_size=10).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag``."""
+    if not if_none_match:
+        return False
+    wanted = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == wanted:
+            return True
+    return False
+
+
+class PayloadCache:
+    """LRU of serialized response bodies keyed by request path and query string."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def respond(
+        self,
+        request: Request,
+        *,
+        generation: Hashable,
+        build: Callable[[], Any],
+        model: Any = None,
+    ) -> Response:
+        """Cached body for this request at ``generation``, or a 304 when the client has it."""
+        etag = make_etag(generation)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            API_PAYLOAD_CACHE.inc("not_modified")
+            return Response(status_code=304, headers=headers)
+
+        key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == etag:
+            self._entries.move_to_end(key)
+            body = entry[1]
+            API_PAYLOAD_CACHE.inc("hit")
+        else:
+            body = serialize(build(), model)
+            API_PAYLOAD_CACHE.inc("miss")
+            if self.max_entries > 0:
+                self._entries[key] = (etag, body)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+payload_cache = PayloadCache(settings.API_PAYLOAD_CACHE_MAX_ENTRIES)
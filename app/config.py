@@ -18,6 +18,66 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_CRAWLS: int = 5
     DEFAULT_REQUEST_DELAY: float = 1.0
 
+    # Scheduler leader election (Postgres advisory lock) across workers
+    SCHEDULER_LEADER_ELECTION: bool = True
+    SCHEDULER_LEADER_RETRY_SECONDS: float = 15.0
+
+    # Executor child processes for crawls and pipelines (0 = in the API loop)
+    CRAWL_EXECUTOR_PROCESSES: int = 0
+
+    # Prometheus metrics at /metrics
+    METRICS_ENABLED: bool = True
+
+    # Circuit breakers (per source and per domain)
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 3
+    CIRCUIT_BREAKER_OPEN_HOURS: float = 12.0
+    CIRCUIT_BREAKER_MAX_OPEN_HOURS: float = 168.0
+    CIRCUIT_BREAKER_DOMAIN_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_DOMAIN_OPEN_SECONDS: float = 600.0
+
+    # Batched crawl log / source state writes
+    CRAWL_TELEMETRY_FLUSH_SECONDS: float = 2.0
+    CRAWL_TELEMETRY_MAX_BATCH: int = 200
+
+    # Near-duplicate detection
+    NEAR_DUP_ENABLED: bool = True
+    PAPER_FUZZY_DEDUP_ENABLED: bool = True
+
+    # Source catalog snapshot
+    SOURCE_CATALOG_RECHECK_SECONDS: float = 5.0
+    SOURCE_CATALOG_MAX_AGE_SECONDS: float = 60.0
+
+    # Serialized API payload cache
+    API_PAYLOAD_CACHE_MAX_ENTRIES: int = 256  # 0 disables; ETag/304 still apply
+
+    # Adaptive crawl intervals learned from change frequency
+    SCHEDULE_MODE: str = "fixed"  # fixed | adaptive
+    ADAPTIVE_SCHEDULE_MIN_HOURS: float = 2.0
+    ADAPTIVE_SCHEDULE_MAX_HOURS: float = 168.0
+    ADAPTIVE_SCHEDULE_HISTORY_DAYS: int = 30
+
+    # Crawl job queue (`python -m app.worker` drains it in "queue" mode)
+    CRAWL_EXECUTION_MODE: str = "inprocess"  # inprocess | queue
+    CRAWL_QUEUE_LEASE_SECONDS: int = 600
+    CRAWL_QUEUE_HEARTBEAT_SECONDS: int = 60
+    CRAWL_QUEUE_MAX_ATTEMPTS: int = 3
+    CRAWL_QUEUE_RETRY_BASE_SECONDS: int = 120
+    CRAWL_QUEUE_POLL_SECONDS: float = 5.0
+    CRAWL_QUEUE_WORKER_CONCURRENCY: int = 8
+    # Higher runs first; a source's `queue_priority` overrides it
+    CRAWL_QUEUE_DIMENSION_PRIORITIES: dict[str, int] = {
+        "national_policy": 100,
+        "beijing_policy": 100,
+        "personnel": 80,
+        "technology": 60,
+        "twitter": 60,
+        "industry": 50,
+        "talent": 50,
+        "universities": 40,
+        "events": 30,
+    }
+
     # Database backend
     DB_BACKEND: str = "postgres"  # postgres | supabase
 
@@ -51,9 +111,16 @@ class Settings(BaseSettings):
     # Dedicated model for daily briefing (stronger model for better narrative)
     BRIEFING_LLM_MODEL: str = "google/gemini-2.5-pro"
 
+    # LLM transport rate limits (per provider)
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_REQUESTS_PER_MINUTE: int = 0  # 0 = follow rate-limit headers
+    LLM_TOKENS_PER_MINUTE: int = 0  # 0 = follow rate-limit headers
+    LLM_PROVIDER_LIMITS: dict[str, dict[str, int]] = {}  # e.g. {"siliconflow": {...}}
+
     # Twitter API (twitterapi.io)
     TWITTER_API_KEY: str = ""
     TWITTER_API_PROXY: str = ""  # e.g. http://127.0.0.1:7890
+    TWITTER_FETCH_CONCURRENCY: int = 4  # parallel per-account fetches for twitter_kol sources
 
     # AMiner API
     AMINER_API_KEY: str = ""
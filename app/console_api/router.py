@@ -3,15 +3,17 @@ from fastapi.responses import FileResponse
 
 from app.schemas.common import ErrorResponse
 from app.schemas.console import (
-    CrawlJobResponse,
-    CrawlRequest,
-    CrawlStartResponse,
-    CrawlStatusResponse,
     ConsoleApiUsageResponse,
     ConsoleDailyTrendPoint,
     ConsoleOverviewResponse,
     ConsoleServerMetrics,
+    ConsoleSlowRunsResponse,
     ConsoleSourceLogsResponse,
+    ConsoleSourceTimingsResponse,
+    CrawlJobResponse,
+    CrawlRequest,
+    CrawlStartResponse,
+    CrawlStatusResponse,
 )
 from app.schemas.source import SourceCatalogResponse, SourceResponse, SourceUpdate
 from app.services import console_service, source_service
@@ -81,12 +83,33 @@ async def get_server_metrics():
 
 
 
+@router.get(
+    "/timings/slowest",
+    response_model=ConsoleSlowRunsResponse,
+    tags=["console-overview"],
+    summary="最慢爬取运行 Top N",
+    description=(
+        "返回最近 N 小时内耗时最长的爬取运行；"
+        "指定 stage 时按该阶段耗时排序（如 fetch、parse、persist、http_ttfb）。"
+    ),
+)
+async def get_slowest_runs(
+    hours: int = Query(default=24, ge=1, le=720, description="统计最近小时数"),
+    limit: int = Query(default=20, ge=1, le=200, description="返回条数"),
+    stage: str | None = Query(default=None, description="按阶段排序，缺省按总耗时"),
+):
+    return await console_service.get_console_slowest_runs(hours=hours, limit=limit, stage=stage)
+
+
 @router.get(
     "/api-monitor/usage",
     response_model=ConsoleApiUsageResponse,
     tags=["console-overview"],
     summary="API token/费用监控",
-    description="返回 OpenRouter API 的 token 消耗、费用、模块归因与最近调用明细；未知模型按 unpriced 返回并单独统计。",
+    description=(
+        "返回 OpenRouter API 的 token 消耗、费用、模块归因与最近调用明细；"
+        "未知模型按 unpriced 返回并单独统计。"
+    ),
 )
 async def get_api_usage(
     days: int = Query(default=7, ge=1, le=30, description="统计最近天数"),
@@ -196,6 +219,27 @@ async def get_console_source_logs(
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+@router.get(
+    "/sources/{source_id}/timings",
+    response_model=ConsoleSourceTimingsResponse,
+    tags=["console-sources"],
+    summary="信源分阶段耗时",
+    description=(
+        "汇总该信源最近 N 次运行的分阶段耗时"
+        "（抓取 / 解析 / 过滤 / 入库 / 限速等待）及 HTTP 指标。"
+    ),
+    responses={404: {"model": ErrorResponse, "description": "信源不存在"}},
+)
+async def get_console_source_timings(
+    source_id: str,
+    limit: int = Query(default=50, ge=1, le=500, description="统计最近运行次数"),
+):
+    try:
+        return await console_service.get_console_source_timings(source_id, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
 @router.patch(
     "/sources/{source_id}",
     response_model=SourceResponse,
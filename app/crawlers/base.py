@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
+from app.crawlers.utils.keyword_matcher import get_matcher
+from app.crawlers.utils.timing import COUNTER_KEYS, collect_timings
+from app.utils.metrics import CRAWLER_STAGE_SECONDS
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,6 +20,7 @@ class CrawlStatus(str, Enum):
     PARTIAL = "partial"
     FAILED = "failed"
     NO_NEW_CONTENT = "no_new_content"
+    SKIPPED = "skipped"  # not run: source circuit breaker is open
 
 
 @dataclass
@@ -48,6 +54,8 @@ class CrawlResult:
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     finished_at: datetime | None = None
     duration_seconds: float = 0.0
+    # Per-stage seconds and HTTP counters, see app.crawlers.utils.timing.
+    timings: dict[str, float] = field(default_factory=dict)
 
 
 class BaseCrawler(ABC):
@@ -94,11 +102,17 @@ class BaseCrawler(ABC):
         if not keywords:
             return items
 
+        # 不区分大小写；keyword_whole_word 为 true 时英文关键词按整词匹配
+        matcher = get_matcher(
+            keywords,
+            case_sensitive=False,
+            whole_word=bool(self.config.get("keyword_whole_word", False)),
+        )
         filtered_items = []
         for item in items:
             # 检查标题和正文
             text = (item.title or "") + " " + (item.content or "")
-            if any(kw.lower() in text.lower() for kw in keywords):
+            if matcher.search(text):
                 filtered_items.append(item)
 
         logger.info(
@@ -113,11 +127,25 @@ class BaseCrawler(ABC):
         """Orchestrate: timing, error handling, logging."""
         result = CrawlResult(source_id=self.source_id)
         result.started_at = datetime.now(timezone.utc)
+        timings = result.timings
         try:
-            items = await self.fetch_and_parse()
+            with collect_timings(timings):
+                fetch_started = time.perf_counter()
+                try:
+                    items = await self.fetch_and_parse()
+                finally:
+                    # Whatever fetch_and_parse spent outside I/O waits is parsing.
+                    elapsed = time.perf_counter() - fetch_started
+                    waited = sum(
+                        timings.get(key, 0.0)
+                        for key in ("fetch", "rate_limit_wait", "browser_setup")
+                    )
+                    timings["parse"] = max(0.0, elapsed - waited)
 
             # 应用领域过滤
+            filter_started = time.perf_counter()
             filtered_items = self._filter_by_keywords(items)
+            timings["filter"] = time.perf_counter() - filter_started
 
             result.items_total = len(items)
             result.items_all = items
@@ -133,10 +161,14 @@ class BaseCrawler(ABC):
         except Exception as e:
             logger.exception("Crawl failed for source %s", self.source_id)
             result.status = CrawlStatus.FAILED
-            result.error_message = str(e)
+            # Some exceptions (e.g. httpx timeouts) stringify to "", keep the type.
+            result.error_message = str(e) or type(e).__name__
         finally:
             result.finished_at = datetime.now(timezone.utc)
             result.duration_seconds = (result.finished_at - result.started_at).total_seconds()
+            for stage, seconds in timings.items():
+                if stage not in COUNTER_KEYS:
+                    CRAWLER_STAGE_SECONDS.observe(seconds, stage)
         return result
 
     @abstractmethod
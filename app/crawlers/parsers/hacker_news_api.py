@@ -9,6 +9,7 @@ from typing import Any
 from app.crawlers.base import BaseCrawler, CrawledItem
 from app.crawlers.utils.dedup import compute_content_hash
 from app.crawlers.utils.http_client import fetch_json
+from app.crawlers.utils.keyword_matcher import get_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,7 @@ class HackerNewsAPICrawler(BaseCrawler):
     async def fetch_and_parse(self) -> list[CrawledItem]:
         max_results = self.config.get("max_results", 30)
         keywords = self.config.get("keyword_filter", _DEFAULT_AI_KEYWORDS)
+        matcher = get_matcher(keywords, case_sensitive=False)
 
         # Get top story IDs
         story_ids: list[int] = await fetch_json(_HN_TOP_URL)
@@ -56,9 +58,7 @@ class HackerNewsAPICrawler(BaseCrawler):
 
                 # Keyword filter on title
                 title = story.get("title", "")
-                if keywords and not any(
-                    kw.lower() in title.lower() for kw in keywords
-                ):
+                if keywords and not matcher.search(title):
                     continue
 
                 url = story.get("url") or f"https://news.ycombinator.com/item?id={story['id']}"
@@ -26,7 +26,6 @@ import httpx
 from bs4 import BeautifulSoup
 
 from app.crawlers.base import BaseCrawler, CrawledItem
-from app.services.llm.llm_call_tracker import get_tracker
 from app.schemas.scholar import (
     AwardRecord,
     EducationRecord,
@@ -37,6 +36,8 @@ from app.schemas.scholar import (
     validate_research_areas,
     validate_scholar_name,
 )
+from app.services.llm.llm_call_tracker import get_tracker
+from app.services.llm.llm_transport import post_chat_completion
 
 logger = logging.getLogger(__name__)
 
@@ -259,79 +260,80 @@ class LLMFacultyCrawler(BaseCrawler):
         """使用 LLM 从清洗后的内容中提取结构化数据，带重试机制"""
         for attempt in range(retry_count):
             try:
-                async with httpx.AsyncClient(timeout=httpx.Timeout(120.0, connect=10.0)) as client:
-                    response = await client.post(
-                        self.llm_api_url,
-                        headers={
-                            "Content-Type": "application/json",
-                            "Authorization": f"Bearer {self.llm_api_key}",
-                        },
-                        json={
-                            "model": self.llm_model,
-                            "messages": [
-                                {
-                                    "role": "system",
-                                    "content": (
-                                        "你是一个数据提取助手。"
-                                        "从学术网页中提取结构化信息，"
-                                        "只返回有效的 JSON，不要包含任何解释或 markdown 格式。"
-                                    ),
-                                },
-                                {
-                                    "role": "user",
-                                    "content": f"{prompt}\n\n---\n\n{content}",
-                                },
-                            ],
-                            "temperature": 0,
-                            "max_tokens": max_tokens,
-                        },
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                    resp_content = result["choices"][0]["message"]["content"]
-
-                    # Track token usage
-                    usage = result.get("usage", {})
-                    input_tokens = int(usage.get("prompt_tokens", 0) or 0)
-                    output_tokens = int(usage.get("completion_tokens", 0) or 0)
-                    self.total_input_tokens += input_tokens
-                    self.total_output_tokens += output_tokens
-                    self.api_calls += 1
-                    logger.debug(
-                        "LLMFacultyCrawler: API call #%d - input: %d, output: %d tokens",
-                        self.api_calls, input_tokens, output_tokens
-                    )
+                response = await post_chat_completion(
+                    self.llm_provider,
+                    self.llm_api_url,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {self.llm_api_key}",
+                    },
+                    payload={
+                        "model": self.llm_model,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": (
+                                    "你是一个数据提取助手。"
+                                    "从学术网页中提取结构化信息，"
+                                    "只返回有效的 JSON，不要包含任何解释或 markdown 格式。"
+                                ),
+                            },
+                            {
+                                "role": "user",
+                                "content": f"{prompt}\n\n---\n\n{content}",
+                            },
+                        ],
+                        "temperature": 0,
+                        "max_tokens": max_tokens,
+                    },
+                    timeout=httpx.Timeout(120.0, connect=10.0),
+                )
+                result = response.json()
+                resp_content = result["choices"][0]["message"]["content"]
+
+                # Track token usage
+                usage = result.get("usage", {})
+                input_tokens = int(usage.get("prompt_tokens", 0) or 0)
+                output_tokens = int(usage.get("completion_tokens", 0) or 0)
+                self.total_input_tokens += input_tokens
+                self.total_output_tokens += output_tokens
+                self.api_calls += 1
+                logger.debug(
+                    "LLMFacultyCrawler: API call #%d - input: %d, output: %d tokens",
+                    self.api_calls, input_tokens, output_tokens
+                )
 
-                    self._tracker.log_call(
-                        model=self.llm_model,
-                        provider=self.llm_provider,
-                        prompt=prompt,
-                        system_prompt=(
-                            "你是一个数据提取助手。从学术网页中提取结构化信息，只返回有效的 JSON，不要包含任何解释或 markdown 格式。"
-                        ),
-                        response_text=str(resp_content),
-                        input_tokens=input_tokens,
-                        output_tokens=output_tokens,
-                        stage=stage,
-                        article_id=article_id,
-                        article_title=article_title,
-                        source_id=self.source_id,
-                        dimension=self.config.get("dimension"),
-                        success=True,
-                        provider_cost_usd=_extract_provider_cost_usd(result),
-                    )
+                self._tracker.log_call(
+                    model=self.llm_model,
+                    provider=self.llm_provider,
+                    prompt=prompt,
+                    system_prompt=(
+                        "你是一个数据提取助手。从学术网页中提取结构化信息，"
+                        "只返回有效的 JSON，不要包含任何解释或 markdown 格式。"
+                    ),
+                    response_text=str(resp_content),
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    stage=stage,
+                    article_id=article_id,
+                    article_title=article_title,
+                    source_id=self.source_id,
+                    dimension=self.config.get("dimension"),
+                    success=True,
+                    provider_cost_usd=_extract_provider_cost_usd(result),
+                )
 
-                    # 清理可能的 markdown 代码块
-                    resp_content = resp_content.strip()
-                    if resp_content.startswith("```json"):
-                        resp_content = resp_content[7:]
-                    if resp_content.startswith("```"):
-                        resp_content = resp_content[3:]
-                    if resp_content.endswith("```"):
-                        resp_content = resp_content[:-3]
-                    resp_content = resp_content.strip()
-
-                    return json.loads(_repair_json(resp_content))
+                # 清理可能的 markdown 代码块
+                resp_content = resp_content.strip()
+                if resp_content.startswith("```json"):
+                    resp_content = resp_content[7:]
+                if resp_content.startswith("```"):
+                    resp_content = resp_content[3:]
+                if resp_content.endswith("```"):
+                    resp_content = resp_content[:-3]
+                resp_content = resp_content.strip()
+
+                return json.loads(_repair_json(resp_content))
             except (json.JSONDecodeError, KeyError) as e:
                 logger.warning(
                     "LLMFacultyCrawler: JSON parse error attempt %d/%d: %s",
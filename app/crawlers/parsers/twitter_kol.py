@@ -5,7 +5,8 @@ Config fields (in YAML):
   - twitter_accounts_file: YAML file path under `sources/` (recommended)
   - max_tweets_per_account: max tweets per account (default 20)
   - min_likes: minimum like count to include a tweet (default 0)
-  - fetch_profiles: whether to also fetch user profiles (default true)
+  - fetch_profiles: whether to attach author bio/location (default true)
+  - twitter_fetch_concurrency: parallel account fetches (default TWITTER_FETCH_CONCURRENCY)
 
 Supported account item format:
   - "karpathy"
@@ -22,6 +23,8 @@ import yaml
 from app.config import settings
 from app.crawlers.base import BaseCrawler, CrawledItem
 from app.crawlers.utils.dedup import compute_content_hash
+from app.schemas.social_kol import SocialTwitterIngestRequest
+from app.services.external.social_kol_service import fetch_twitter_source_bundle
 from app.services.external.twitter_service import twitter_client
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,9 @@ logger = logging.getLogger(__name__)
 class TwitterKOLCrawler(BaseCrawler):
     """Crawl tweets from a curated list of KOL Twitter accounts."""
 
+    # Raw payload of the last fetch, reused for social_posts ingestion.
+    social_bundle: SocialTwitterIngestRequest | None = None
+
     @staticmethod
     def _clean_username(raw: Any) -> str:
         return str(raw or "").strip().lstrip("@")
@@ -139,29 +145,25 @@ class TwitterKOLCrawler(BaseCrawler):
             logger.warning("No twitter accounts configured for %s", self.source_id)
             return []
 
+        # One fetch per account; execute_crawl_job hands the same bundle to
+        # ingest_twitter_bundle instead of fetching the accounts again.
+        bundle = await fetch_twitter_source_bundle(self.config, accounts=accounts)
+        self.social_bundle = bundle
+
         all_items: list[CrawledItem] = []
 
-        for account in accounts:
-            username = account["username"]
-            configured_name = account.get("name")
-
-            try:
-                tweets, _ = await twitter_client.get_user_tweets(username)
-            except Exception as e:
-                logger.warning("Failed to fetch tweets for @%s: %s", username, e)
-                continue
-
-            # Optionally fetch profile for richer metadata
-            profile = None
-            if fetch_profiles:
-                try:
-                    profile = await twitter_client.get_user_info(username)
-                except Exception:
-                    pass
-
-            for tweet in tweets[:max_per]:
-                if tweet.is_reply or tweet.is_retweet:
+        for user in bundle.users:
+            configured_name = user.get("configured_name")
+            # The bundle page may include replies; count originals only.
+            originals = []
+            for raw in user.get("latest_5_posts") or []:
+                if raw.get("type") != "tweet":
                     continue
+                tweet = twitter_client.parse_tweet(raw)
+                if not (tweet.is_reply or tweet.is_retweet):
+                    originals.append((raw, tweet))
+
+            for raw, tweet in originals[:max_per]:
                 if tweet.like_count < min_likes:
                     continue
 
@@ -182,16 +184,19 @@ class TwitterKOLCrawler(BaseCrawler):
                 }
                 if configured_name:
                     extra["configured_kol_name"] = configured_name
-                if account.get("category"):
-                    extra["configured_kol_category"] = account.get("category")
-                if account.get("cohort"):
-                    extra["configured_kol_cohort"] = account.get("cohort")
-                if account.get("tags"):
-                    extra["configured_kol_tags"] = account.get("tags")
-
-                if profile:
-                    extra["author_bio"] = profile.description
-                    extra["author_location"] = profile.location
+                if user.get("category"):
+                    extra["configured_kol_category"] = user.get("category")
+                if user.get("cohort"):
+                    extra["configured_kol_cohort"] = user.get("cohort")
+                if user.get("tags"):
+                    extra["configured_kol_tags"] = user.get("tags")
+
+                # The tweet's embedded author object carries the profile fields,
+                # so no separate user/info request is needed.
+                author = raw.get("author") or {}
+                if fetch_profiles and author:
+                    extra["author_bio"] = author.get("description") or ""
+                    extra["author_location"] = author.get("location") or ""
 
                 if tweet.quoted_tweet_text:
                     extra["quoted_text"] = tweet.quoted_tweet_text[:500]
@@ -222,7 +227,7 @@ class TwitterKOLCrawler(BaseCrawler):
         )
 
         logger.info(
-            "TwitterKOL: fetched %d tweets from %d accounts for %s",
-            len(all_items), len(accounts), self.source_id,
+            "TwitterKOL: fetched %d tweets from %d/%d accounts for %s",
+            len(all_items), len(bundle.users), len(accounts), self.source_id,
         )
         return all_items
@@ -207,6 +207,7 @@ class DynamicPageCrawler(BaseCrawler):
         base_url = self.config.get("base_url", url)
         keyword_filter = self.config.get("keyword_filter", [])
         keyword_blacklist = self.config.get("keyword_blacklist", [])
+        keyword_whole_word = bool(self.config.get("keyword_whole_word", False))
         detail_selectors = self.config.get("detail_selectors")
         detail_use_playwright = self.config.get("detail_use_playwright", True)
         detail_fetch_js = self.config.get("detail_fetch_js", False)
@@ -248,7 +249,12 @@ class DynamicPageCrawler(BaseCrawler):
 
                 soup = BeautifulSoup(html, "lxml")
                 parsed_items = parse_list_items(
-                    soup, selectors, base_url, keyword_filter, keyword_blacklist
+                    soup,
+                    selectors,
+                    base_url,
+                    keyword_filter,
+                    keyword_blacklist,
+                    keyword_whole_word=keyword_whole_word,
                 )
                 for raw in parsed_items:
                     if raw.url in seen_urls:
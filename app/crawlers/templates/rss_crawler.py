@@ -12,6 +12,7 @@ from app.crawlers.utils.dedup import compute_content_hash
 from app.crawlers.utils.html_sanitizer import sanitize_html
 from app.crawlers.utils.http_client import fetch_page
 from app.crawlers.utils.image_extractor import extract_images
+from app.crawlers.utils.keyword_matcher import get_matcher
 from app.crawlers.utils.text_extract import html_to_text
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,9 @@ class RSSCrawler(BaseCrawler):
         feed_url = self._resolve_feed_url()
         max_entries = self.config.get("max_entries", 20)
         keyword_filter = self.config.get("keyword_filter", [])
+        keyword_matcher = get_matcher(
+            keyword_filter, whole_word=bool(self.config.get("keyword_whole_word", False))
+        )
         extract_detail_images = bool(self.config.get("extract_detail_images", False))
 
         # Fetch raw XML/RSS
@@ -60,7 +64,7 @@ class RSSCrawler(BaseCrawler):
             # Keyword filtering
             if keyword_filter:
                 text_to_check = f"{title} {entry.get('summary', '')}"
-                if not any(kw in text_to_check for kw in keyword_filter):
+                if not keyword_matcher.search(text_to_check):
                     continue
 
             # Parse published date
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import difflib
 import hashlib
 import logging
 import re
 from datetime import datetime, timezone
+from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
 
 from app.crawlers.base import BaseCrawler, CrawledItem, CrawlResult, CrawlStatus
 from app.crawlers.utils.http_client import fetch_page
@@ -14,17 +14,147 @@ from app.services.stores.snapshot_store import get_last_snapshot, save_snapshot
 
 logger = logging.getLogger(__name__)
 
+# Elements treated as content blocks. A block is the innermost one of these:
+# a <div> wrapping <p>s contributes its paragraphs, not itself.
+BLOCK_TAGS = (
+    "p", "li", "dt", "dd", "tr", "h1", "h2", "h3", "h4", "h5", "h6",
+    "blockquote", "pre", "figcaption", "caption", "div", "section", "article",
+    "header", "footer", "aside", "table", "ul", "ol", "dl", "form",
+)
+# Never part of the compared content.
+NOISE_TAGS = ("script", "style", "noscript", "template", "iframe", "svg")
+
+_WS_RE = re.compile(r"\s+")
+
+
+def block_hash(text: str) -> str:
+    """Short stable digest of one normalized block."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _clean(text: str, ignore_patterns: list[str]) -> str:
+    for pattern in ignore_patterns:
+        text = re.sub(pattern, "", text)
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _loose_text(el: Tag) -> list[str]:
+    """Text of ``el`` that sits outside its child blocks, one entry per line."""
+    parts: list[str] = []
+    for child in el.children:
+        if isinstance(child, Comment):
+            continue
+        if isinstance(child, NavigableString):
+            parts.append(str(child))
+        elif isinstance(child, Tag):
+            if child.name == "br" or child.name in BLOCK_TAGS or child.find(BLOCK_TAGS):
+                parts.append("\n")
+            else:
+                parts.append(child.get_text(separator=" "))
+    return "".join(parts).splitlines()
+
+
+def _block_texts(root: Tag, ignore_patterns: list[str]) -> list[str]:
+    texts: list[str] = []
+    for el in [root, *root.find_all(BLOCK_TAGS)]:
+        if el.find(BLOCK_TAGS) is None:
+            # Leaf block; <br>-separated text inside it stays one block unless
+            # the root itself is the leaf (plain-text pages).
+            raw = _loose_text(el) if el is root else [el.get_text(separator=" ")]
+        else:
+            raw = _loose_text(el)
+        texts.extend(text for text in (_clean(line, ignore_patterns) for line in raw) if text)
+    return texts
+
+
+def segment_blocks(
+    html: str,
+    *,
+    content_area: str | None = None,
+    ignore_selectors: list[str] | None = None,
+    ignore_patterns: list[str] | None = None,
+) -> list[tuple[str, str]]:
+    """Split a page into ordered ``(hash, text)`` content blocks.
+
+    Elements matching ``ignore_selectors`` (banners, carousels, visit counters)
+    are dropped first; ``ignore_patterns`` are stripped from each block's text.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    for el in soup.find_all(NOISE_TAGS):
+        el.decompose()
+    for selector in ignore_selectors or []:
+        for el in soup.select(selector):
+            el.decompose()
+    root = soup.select_one(content_area) if content_area else (soup.body or soup)
+    if root is None:
+        return []
+    return [(block_hash(text), text) for text in _block_texts(root, ignore_patterns or [])]
+
+
+def _legacy_content_hash(html: str, content_area: str | None, ignore_patterns: list[str]) -> str:
+    """Whole-page hash as computed before block snapshots, for migrating old rows."""
+    soup = BeautifulSoup(html, "lxml")
+    if content_area:
+        el = soup.select_one(content_area)
+        text = el.get_text(separator="\n").strip() if el else ""
+    else:
+        text = soup.get_text(separator="\n").strip()
+    for pattern in ignore_patterns:
+        text = re.sub(pattern, "", text)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def diff_blocks(
+    previous: list[tuple[str, str]], current: list[tuple[str, str]]
+) -> tuple[list[str], list[str]]:
+    """Return (removed, added) block texts by set difference of block hashes.
+
+    Reordering blocks is not a change; only blocks whose hash is new (or gone)
+    are reported, each once, in page order.
+    """
+    old_hashes = {digest for digest, _ in previous}
+    new_hashes = {digest for digest, _ in current}
+    removed: list[str] = []
+    added: list[str] = []
+    seen: set[str] = set()
+    for digest, text in previous:
+        if digest not in new_hashes and digest not in seen:
+            seen.add(digest)
+            removed.append(text)
+    for digest, text in current:
+        if digest not in old_hashes and digest not in seen:
+            seen.add(digest)
+            added.append(text)
+    return removed, added
+
+
+def format_block_diff(removed: list[str], added: list[str], total: int) -> str:
+    lines = [f"@@ {len(added)} blocks added, {len(removed)} removed ({total} blocks) @@"]
+    lines.extend(f"- {text}" for text in removed)
+    lines.extend(f"+ {text}" for text in added)
+    return "\n".join(lines)
+
+
+def _stored_blocks(snapshot: dict[str, Any]) -> list[tuple[str, str]] | None:
+    hashes = snapshot.get("block_hashes")
+    if hashes is None:
+        return None
+    texts = snapshot.get("blocks") or {}
+    return [(digest, texts.get(digest, "")) for digest in hashes]
+
 
 class SnapshotDiffCrawler(BaseCrawler):
     """
     Crawler for pages without news lists (leadership rosters, faculty directories).
-    Compares page content hash with last stored snapshot to detect changes.
+    Splits the page into content blocks and compares their hashes with the last
+    stored snapshot; only added/removed blocks are diffed and reported.
 
     Config fields:
       - url: target page URL
       - selectors:
           content_area: CSS selector for meaningful content area
-      - ignore_patterns: regex patterns to strip before hashing (timestamps, counters)
+      - ignore_selectors: CSS selectors removed before segmenting (banners, carousels)
+      - ignore_patterns: regex patterns stripped from block text (timestamps, counters)
       - headers, encoding, request_delay: same as StaticHTMLCrawler
     """
 
@@ -38,7 +168,7 @@ class SnapshotDiffCrawler(BaseCrawler):
 
         try:
             url = self.config["url"]
-            selectors = self.config.get("selectors", {})
+            content_area = self.config.get("selectors", {}).get("content_area")
             ignore_patterns = self.config.get("ignore_patterns", [])
 
             html = await fetch_page(
@@ -47,57 +177,66 @@ class SnapshotDiffCrawler(BaseCrawler):
                 encoding=self.config.get("encoding"),
                 request_delay=self.config.get("request_delay"),
             )
+            blocks = segment_blocks(
+                html,
+                content_area=content_area,
+                ignore_selectors=self.config.get("ignore_selectors", []),
+                ignore_patterns=ignore_patterns,
+            )
+            content_hash = hashlib.sha256(
+                "\n".join(digest for digest, _ in blocks).encode("ascii")
+            ).hexdigest()
 
-            # Extract content area
-            soup = BeautifulSoup(html, "lxml")
-            content_area_sel = selectors.get("content_area")
-            if content_area_sel:
-                el = soup.select_one(content_area_sel)
-                text = el.get_text(separator="\n").strip() if el else ""
-            else:
-                text = soup.get_text(separator="\n").strip()
-
-            # Apply ignore patterns
-            for pattern in ignore_patterns:
-                text = re.sub(pattern, "", text)
-
-            # Compute hash
-            content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-            # Get last snapshot from local JSON
             last = await get_last_snapshot(self.source_id)
+            previous = _stored_blocks(last) if last else None
+
+            removed: list[str] = []
+            added: list[str] = []
+            if previous is not None:
+                removed, added = diff_blocks(previous, blocks)
+                changed = bool(removed or added)
+            elif last is not None:
+                # Snapshot from the whole-page format: re-baseline on blocks if
+                # the page is unchanged by the old hash, else report everything.
+                changed = last.get("content_hash") != _legacy_content_hash(
+                    html, content_area, ignore_patterns
+                )
+                if changed:
+                    removed = (last.get("content_text") or "").splitlines()
+                    added = [text for _, text in blocks]
+                else:
+                    await save_snapshot(self.source_id, content_hash, blocks)
+            else:
+                changed = True
 
-            if last and last.get("content_hash") == content_hash:
-                # No change
+            if not changed:
                 result.status = CrawlStatus.NO_NEW_CONTENT
                 result.items_total = 0
                 result.items_new = 0
             else:
-                # Content changed (or first snapshot)
-                diff_text = None
-                if last and last.get("content_text"):
-                    diff_lines = difflib.unified_diff(
-                        last["content_text"].splitlines(),
-                        text.splitlines(),
-                        lineterm="",
-                    )
-                    diff_text = "\n".join(diff_lines)
-
-                # Store new snapshot
-                await save_snapshot(self.source_id, content_hash, text, diff_text)
+                diff_text = (
+                    format_block_diff(removed, added, len(blocks)) if last is not None else None
+                )
+                await save_snapshot(self.source_id, content_hash, blocks, diff_text)
 
                 # Create a CrawledItem for the change
                 title = f"[变更检测] {self.config.get('name', self.source_id)}"
                 item_url = f"{url}#snapshot-{content_hash[:12]}"
+                first_text = "\n".join(text for _, text in blocks)
                 item = CrawledItem(
                     title=title,
                     url=item_url,
-                    content=diff_text or f"初次快照: {text[:500]}",
+                    content=diff_text or f"初次快照: {first_text[:500]}",
                     content_hash=content_hash,
                     source_id=self.source_id,
                     dimension=self.config.get("dimension"),
                     tags=self.config.get("tags", []) + ["snapshot_diff"],
-                    extra={"is_first_snapshot": last is None},
+                    extra={
+                        "is_first_snapshot": last is None,
+                        "blocks_total": len(blocks),
+                        "blocks_added": len(added),
+                        "blocks_removed": len(removed),
+                    },
                 )
                 result.items = [item]
                 result.items_total = 1
@@ -28,6 +28,7 @@ class StaticHTMLCrawler(BaseCrawler):
       - base_url: for resolving relative links
       - encoding: page encoding override
       - keyword_filter: optional keywords
+      - keyword_whole_word: match ASCII keywords as whole words (default false)
       - detail_selectors: (optional) for fetching detail pages
           content: CSS selector for article body
           author: CSS selector for author
@@ -54,7 +55,14 @@ class StaticHTMLCrawler(BaseCrawler):
         )
 
         soup = BeautifulSoup(html, "lxml")
-        raw_items = parse_list_items(soup, selectors, base_url, keyword_filter, keyword_blacklist)
+        raw_items = parse_list_items(
+            soup,
+            selectors,
+            base_url,
+            keyword_filter,
+            keyword_blacklist,
+            keyword_whole_word=bool(self.config.get("keyword_whole_word", False)),
+        )
 
         items: list[CrawledItem] = []
         for raw in raw_items:
@@ -0,0 +1,270 @@
+"""AIMD concurrency limiter for grouped crawl execution.
+
+Each crawl-method group (static/rss/dynamic/...) gets one limiter whose
+configured concurrency from ``crawl_concurrency.yaml`` acts as a ceiling.
+The limit grows additively while the recent window of crawls is healthy
+(p95 duration within tolerance of the best window seen, low error rate,
+no local CPU/memory pressure) and shrinks multiplicatively on congestion
+signals: timeouts, HTTP 429 and 5xx responses, or host pressure.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_HTTP_STATUS_RE = re.compile(r"(?:Client|Server) error '(\d{3})")
+_TIMEOUT_RE = re.compile(r"timeout|timed out", re.IGNORECASE)
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_CONGESTION = "congestion"
+
+
+@dataclass
+class AdaptiveSettings:
+    """Tuning knobs loaded from the ``adaptive`` section of crawl_concurrency.yaml."""
+
+    enabled: bool = True
+    initial_fraction: float = 0.5
+    min_concurrency: int = 1
+    increase_step: int = 1
+    decrease_factor: float = 0.5
+    window: int = 10
+    latency_tolerance: float = 2.0
+    max_error_rate: float = 0.3
+    cpu_load_threshold: float = 0.9
+    min_available_memory_pct: float = 10.0
+
+    @classmethod
+    def from_config(cls, raw: Any) -> AdaptiveSettings:
+        defaults = cls()
+        if not isinstance(raw, dict):
+            return defaults
+        values: dict[str, Any] = {}
+        for name, default in vars(defaults).items():
+            if name not in raw:
+                continue
+            try:
+                values[name] = type(default)(raw[name])
+            except (TypeError, ValueError):
+                continue
+        return cls(**{**vars(defaults), **values})
+
+
+def classify_crawl_outcome(status: str, error_message: str | None) -> str:
+    """Map a crawl result to ok / error / congestion for the controller.
+
+    Only timeouts, 429 and 5xx count as congestion; other failures (parser
+    bugs, 404s) say nothing about load and must not shrink concurrency.
+    """
+    if status != "failed":
+        return OUTCOME_OK
+    text = error_message or ""
+    match = _HTTP_STATUS_RE.search(text)
+    if match:
+        code = int(match.group(1))
+        if code == 429 or code >= 500:
+            return OUTCOME_CONGESTION
+        return OUTCOME_ERROR
+    if _TIMEOUT_RE.search(text):
+        return OUTCOME_CONGESTION
+    return OUTCOME_ERROR
+
+
+def _p95(values: list[float]) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = max(0, math.ceil(0.95 * len(ordered)) - 1)
+    return ordered[idx]
+
+
+def read_host_pressure(settings: AdaptiveSettings) -> str | None:
+    """Return a reason string when the host is CPU- or memory-constrained."""
+    try:
+        load_1m = os.getloadavg()[0]
+        cpus = os.cpu_count() or 1
+        if load_1m / cpus > settings.cpu_load_threshold:
+            return f"cpu_load={load_1m:.2f}/{cpus}"
+    except (AttributeError, OSError):
+        pass
+
+    try:
+        meminfo: dict[str, int] = {}
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in {"MemTotal", "MemAvailable"}:
+                    meminfo[key] = int(rest.split()[0])
+        total = meminfo.get("MemTotal")
+        available = meminfo.get("MemAvailable")
+        if total and available is not None:
+            available_pct = available * 100.0 / total
+            if available_pct < settings.min_available_memory_pct:
+                return f"mem_available={available_pct:.1f}%"
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """Resizable async semaphore driven by additive-increase/multiplicative-decrease.
+
+    Use as ``async with limiter:`` around one crawl, then call ``record()``
+    with the crawl's duration and outcome. With ``settings.enabled`` false it
+    behaves as a plain semaphore fixed at ``ceiling``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ceiling: int,
+        settings: AdaptiveSettings | None = None,
+    ) -> None:
+        self.name = name
+        self.settings = settings or AdaptiveSettings()
+        self.ceiling = max(1, int(ceiling))
+        self.floor = max(1, min(self.settings.min_concurrency, self.ceiling))
+        if self.settings.enabled:
+            initial = math.ceil(self.ceiling * self.settings.initial_fraction)
+            self.limit = max(self.floor, min(self.ceiling, initial))
+        else:
+            self.limit = self.ceiling
+        self.decisions: list[dict[str, Any]] = []
+        self._active = 0
+        self._cond = asyncio.Condition()
+        self._durations: list[float] = []
+        self._outcomes: list[str] = []
+        self._baseline_p95: float | None = None
+        self._last_decrease_at = 0.0
+
+    async def __aenter__(self) -> AdaptiveConcurrencyLimiter:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def record(
+        self,
+        duration_seconds: float,
+        outcome: str,
+        detail: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Feed one finished crawl; returns the decision dict if the limit changed."""
+        if not self.settings.enabled:
+            return None
+
+        self._durations.append(max(0.0, float(duration_seconds or 0.0)))
+        self._outcomes.append(outcome)
+
+        if outcome == OUTCOME_CONGESTION:
+            return self._decrease(f"congestion: {(detail or 'timeout/429/5xx')[:80]}")
+
+        if len(self._outcomes) < self.settings.window:
+            return None
+
+        durations, outcomes = self._durations, self._outcomes
+        self._durations, self._outcomes = [], []
+
+        p95 = _p95(durations)
+        error_rate = sum(1 for o in outcomes if o != OUTCOME_OK) / len(outcomes)
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+
+        pressure = read_host_pressure(self.settings)
+        if pressure:
+            return self._decrease(f"host pressure ({pressure})", p95=p95, error_rate=error_rate)
+        if error_rate > self.settings.max_error_rate:
+            return self._decrease(
+                f"error rate {error_rate:.0%} > {self.settings.max_error_rate:.0%}",
+                p95=p95,
+                error_rate=error_rate,
+            )
+        baseline = self._baseline_p95 or 0.0
+        if baseline > 0 and p95 > baseline * self.settings.latency_tolerance:
+            return self._decrease(
+                f"p95 {p95:.1f}s > {self.settings.latency_tolerance:g}x baseline {baseline:.1f}s",
+                p95=p95,
+                error_rate=error_rate,
+            )
+        return self._increase(p95=p95, error_rate=error_rate)
+
+    def _increase(self, *, p95: float, error_rate: float) -> dict[str, Any] | None:
+        new_limit = min(self.ceiling, self.limit + self.settings.increase_step)
+        if new_limit == self.limit:
+            return None
+        return self._apply("increase", new_limit, "healthy window", p95=p95, error_rate=error_rate)
+
+    def _decrease(
+        self,
+        reason: str,
+        *,
+        p95: float | None = None,
+        error_rate: float | None = None,
+    ) -> dict[str, Any] | None:
+        # One multiplicative cut per window's worth of in-flight crawls: a wave
+        # of failures from the same burst should not collapse the limit to 1.
+        now = time.monotonic()
+        cooldown = self._baseline_p95 or max(self._durations, default=0.0)
+        if now - self._last_decrease_at < cooldown:
+            return None
+        new_limit = max(self.floor, math.floor(self.limit * self.settings.decrease_factor))
+        if new_limit == self.limit:
+            return None
+        self._last_decrease_at = now
+        return self._apply("decrease", new_limit, reason, p95=p95, error_rate=error_rate)
+
+    def _apply(
+        self,
+        action: str,
+        new_limit: int,
+        reason: str,
+        *,
+        p95: float | None,
+        error_rate: float | None,
+    ) -> dict[str, Any]:
+        decision = {
+            "method": self.name,
+            "at": datetime.now(timezone.utc).isoformat(),
+            "action": action,
+            "from": self.limit,
+            "to": new_limit,
+            "reason": reason,
+            "p95_seconds": round(p95, 2) if p95 is not None else None,
+            "error_rate": round(error_rate, 3) if error_rate is not None else None,
+        }
+        self.limit = new_limit
+        self.decisions.append(decision)
+        logger.info(
+            "Adaptive concurrency [%s]: %s %d -> %d (%s)",
+            self.name, action, decision["from"], new_limit, reason,
+        )
+        # Waiters are woken so a raised limit is used immediately; on a cut,
+        # the excess simply drains as in-flight crawls finish.
+        try:
+            asyncio.get_running_loop().create_task(self._notify())
+        except RuntimeError:
+            pass
+        return decision
+
+    async def _notify(self) -> None:
+        async with self._cond:
+            self._cond.notify_all()
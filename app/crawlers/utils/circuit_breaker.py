@@ -0,0 +1,205 @@
+"""Circuit breakers for the crawl path: per source and per domain.
+
+Source breaker (persistent). Derived from ``source_states`` so it survives
+restarts and is shared by every scheduler/worker process:
+
+- closed:    ``consecutive_failures`` below the threshold -> crawl normally.
+- open:      threshold reached and the cooldown since ``last_crawl_at`` has
+             not elapsed -> the scheduled run is skipped.
+- half_open: cooldown elapsed -> one lightweight GET of the source URL is
+             sent first; only if it answers does the full crawl run. A failed
+             probe counts as another failure, doubling the cooldown.
+
+Domain breaker (in-process). ``http_client`` counts timeouts, connection
+errors, 429 and 5xx per host. Once a host reaches the threshold, further
+requests fail fast with ``CircuitOpenError`` instead of burning their retry
+budget. After the cooldown a single probe request is let through.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.RequestError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+# ---------------------------------------------------------------------------
+# Source breaker
+# ---------------------------------------------------------------------------
+
+
+def source_open_seconds(consecutive_failures: int) -> float:
+    """Cooldown after ``consecutive_failures``: doubles per failure past the threshold."""
+    extra = max(0, consecutive_failures - settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD)
+    hours = settings.CIRCUIT_BREAKER_OPEN_HOURS * (2 ** min(extra, 16))
+    return min(hours, settings.CIRCUIT_BREAKER_MAX_OPEN_HOURS) * 3600.0
+
+
+def source_circuit_state(
+    consecutive_failures: Any,
+    last_crawl_at: Any,
+    *,
+    now: datetime | None = None,
+) -> tuple[str, datetime | None]:
+    """Return (state, next_probe_at) for a source_states row."""
+    failures = int(consecutive_failures or 0)
+    if (
+        not settings.CIRCUIT_BREAKER_ENABLED
+        or failures < settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+    ):
+        return CIRCUIT_CLOSED, None
+    last = _as_datetime(last_crawl_at)
+    if last is None:
+        return CIRCUIT_HALF_OPEN, None
+    next_probe_at = last + timedelta(seconds=source_open_seconds(failures))
+    current = now or datetime.now(timezone.utc)
+    if current < next_probe_at:
+        return CIRCUIT_OPEN, next_probe_at
+    return CIRCUIT_HALF_OPEN, next_probe_at
+
+
+async def probe_source(source_config: dict[str, Any]) -> str | None:
+    """Send one GET to the source URL; return an error string, or None if it answered.
+
+    Sources without an http(s) URL (API clients, social accounts) are not
+    probed: their next full crawl acts as the probe.
+    """
+    from app.crawlers.utils.http_client import fetch_page
+    from app.services.core.source_catalog_meta import build_source_catalog_meta
+
+    url = str(build_source_catalog_meta(source_config).get("source_url") or "")
+    if not url.startswith(("http://", "https://")):
+        return None
+    try:
+        await fetch_page(
+            url,
+            timeout=15.0,
+            max_retries=1,
+            verify=bool(source_config.get("verify_ssl", True)),
+        )
+    except httpx.HTTPError as exc:
+        # A 403/404 means the host is up; let the crawler decide.
+        if is_domain_failure(exc) or isinstance(exc, CircuitOpenError):
+            return f"{type(exc).__name__}: {exc}"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Domain breaker
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _DomainCircuit:
+    failures: int = 0
+    opened_at: float | None = None
+    probe_started_at: float | None = None
+
+
+_domains: dict[str, _DomainCircuit] = {}
+
+
+def is_domain_failure(exc: Exception) -> bool:
+    """Whether ``exc`` says something about the host's health (not e.g. a 404)."""
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code == 429 or code >= 500
+    return isinstance(exc, httpx.RequestError)
+
+
+def check_domain(domain: str) -> bool:
+    """Gate a request to ``domain``.
+
+    Returns True if this request is the half-open probe (the caller should
+    send it once, without retries); raises CircuitOpenError if the circuit
+    is open.
+    """
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return False
+    circuit = _domains.get(domain)
+    if circuit is None or circuit.opened_at is None:
+        return False
+    now = time.monotonic()
+    open_seconds = settings.CIRCUIT_BREAKER_DOMAIN_OPEN_SECONDS
+    # A probe that never reported back (cancelled task) stops blocking after one period.
+    probing = (
+        circuit.probe_started_at is not None
+        and now - circuit.probe_started_at < open_seconds
+    )
+    if now - circuit.opened_at < open_seconds or probing:
+        raise CircuitOpenError(f"Circuit open for {domain}")
+    circuit.probe_started_at = now
+    return True
+
+
+def record_domain_success(domain: str) -> None:
+    circuit = _domains.pop(domain, None)
+    if circuit is not None and circuit.opened_at is not None:
+        logger.info("Circuit closed for %s", domain)
+
+
+def record_domain_failure(domain: str, *, probe: bool = False) -> bool:
+    """Count a failure for ``domain``; return True if the circuit is (now) open."""
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return False
+    circuit = _domains.setdefault(domain, _DomainCircuit())
+    circuit.failures += 1
+    circuit.probe_started_at = None
+    if probe or circuit.opened_at is not None:
+        circuit.opened_at = time.monotonic()
+        return True
+    if circuit.failures >= settings.CIRCUIT_BREAKER_DOMAIN_FAILURE_THRESHOLD:
+        circuit.opened_at = time.monotonic()
+        logger.warning(
+            "Circuit opened for %s after %d consecutive failures", domain, circuit.failures
+        )
+        return True
+    return False
+
+
+def domain_circuit_snapshot() -> dict[str, dict[str, Any]]:
+    now = time.monotonic()
+    snapshot: dict[str, dict[str, Any]] = {}
+    for domain, circuit in _domains.items():
+        if circuit.opened_at is None:
+            state = CIRCUIT_CLOSED
+        elif now - circuit.opened_at < settings.CIRCUIT_BREAKER_DOMAIN_OPEN_SECONDS:
+            state = CIRCUIT_OPEN
+        else:
+            state = CIRCUIT_HALF_OPEN
+        snapshot[domain] = {"state": state, "failures": circuit.failures}
+    return snapshot
+
+
+def reset_domain_circuits() -> None:
+    _domains.clear()
+
+
+def _as_datetime(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, str) and value:
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
@@ -4,14 +4,22 @@ Provides flexible keyword-based filtering with support for:
 - Whitelist filtering (keyword_filter)
 - Blacklist filtering (keyword_blacklist)
 - No filtering (when both are empty/None)
+
+Keyword lists are compiled into cached Aho-Corasick matchers
+(``keyword_matcher``), so each text is scanned once per list.
 """
 from __future__ import annotations
 
+from app.crawlers.utils.keyword_matcher import get_matcher
+
 
 def should_keep_item(
     text: str,
     keyword_filter: list[str] | None = None,
     keyword_blacklist: list[str] | None = None,
+    *,
+    case_sensitive: bool = True,
+    whole_word: bool = False,
 ) -> bool:
     """Check if an item should be kept based on keyword filters.
 
@@ -19,6 +27,8 @@ def should_keep_item(
         text: Text to check (usually title or title+content)
         keyword_filter: Whitelist - if provided, text must contain at least one keyword
         keyword_blacklist: Blacklist - if provided, text must NOT contain any keyword
+        case_sensitive: Compare keywords case-sensitively (default, as before)
+        whole_word: ASCII keywords must not be glued to other ASCII letters/digits
 
     Returns:
         True if item should be kept, False if it should be filtered out
@@ -37,12 +47,18 @@ def should_keep_item(
     """
     # Blacklist check first (takes precedence)
     if keyword_blacklist:
-        if any(kw in text for kw in keyword_blacklist):
+        blacklist = get_matcher(
+            keyword_blacklist, case_sensitive=case_sensitive, whole_word=whole_word
+        )
+        if blacklist.search(text):
             return False
 
     # Whitelist check (only if provided)
     if keyword_filter:
-        if not any(kw in text for kw in keyword_filter):
+        whitelist = get_matcher(
+            keyword_filter, case_sensitive=case_sensitive, whole_word=whole_word
+        )
+        if not whitelist.search(text):
             return False
 
     # No filters or passed all checks
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import random
 import ssl
+import time
 from collections import defaultdict
 from collections.abc import Callable
 from urllib.parse import urlparse
@@ -11,6 +12,18 @@ from urllib.parse import urlparse
 import httpx
 
 from app.config import settings
+from app.crawlers.utils.circuit_breaker import (
+    check_domain,
+    is_domain_failure,
+    record_domain_failure,
+    record_domain_success,
+)
+from app.crawlers.utils.timing import add_timing, current_timings, http_trace
+from app.utils.metrics import (
+    CRAWLER_DOMAIN_WAIT_SECONDS,
+    CRAWLER_HTTP_REQUESTS,
+    CRAWLER_HTTP_SECONDS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +68,11 @@ async def _wait_for_domain(domain: str, delay: float) -> None:
     _domain_last_request[domain] = loop.time()
 
 
+def _observe_attempt(domain: str, status: int | str, started: float) -> None:
+    CRAWLER_HTTP_REQUESTS.inc(domain, status)
+    CRAWLER_HTTP_SECONDS.observe(time.perf_counter() - started, domain)
+
+
 async def _request_with_retry(
     url: str,
     *,
@@ -66,7 +84,11 @@ async def _request_with_retry(
     verify: bool = True,
     extract: Callable[[httpx.Response], object],
 ) -> object:
-    """Core retry logic shared by fetch_page and fetch_json."""
+    """Core retry logic shared by fetch_page and fetch_json.
+
+    Requests to a host whose circuit is open fail fast with CircuitOpenError;
+    a half-open probe gets a single attempt.
+    """
     domain = urlparse(url).netloc
     delay = request_delay or settings.DEFAULT_REQUEST_DELAY
 
@@ -90,8 +112,19 @@ async def _request_with_retry(
     if headers:
         merged_headers.update(headers)
 
+    timings = current_timings()
+    wait_started = time.perf_counter()
     async with _domain_semaphores[domain]:
+        probe = check_domain(domain)
+        if probe:
+            max_retries = 1
         await _wait_for_domain(domain, delay)
+        fetch_started = time.perf_counter()
+        CRAWLER_DOMAIN_WAIT_SECONDS.observe(fetch_started - wait_started, domain)
+        extensions = None
+        if timings is not None:
+            add_timing("rate_limit_wait", fetch_started - wait_started, timings)
+            extensions = {"trace": http_trace(timings)}
 
         last_exc: Exception | None = None
         # When verify=False, use a legacy SSL context that allows old cipher suites
@@ -104,24 +137,41 @@ async def _request_with_retry(
             ssl_param: bool | ssl.SSLContext = ssl_ctx
         else:
             ssl_param = True
-        async with httpx.AsyncClient(
-            timeout=timeout, follow_redirects=True, verify=ssl_param
-        ) as client:
-            for attempt in range(max_retries):
-                try:
-                    response = await client.get(
-                        url, headers=merged_headers, params=params,
-                    )
-                    response.raise_for_status()
-                    return extract(response)
-                except (httpx.HTTPStatusError, httpx.RequestError) as e:
-                    last_exc = e
-                    wait_time = 2**attempt + random.uniform(0, 1)
-                    logger.warning(
-                        "Request failed (attempt %d/%d) for %s: %s. Retrying in %.1fs",
-                        attempt + 1, max_retries, url, e, wait_time,
-                    )
-                    await asyncio.sleep(wait_time)
+        try:
+            async with httpx.AsyncClient(
+                timeout=timeout, follow_redirects=True, verify=ssl_param
+            ) as client:
+                for attempt in range(max_retries):
+                    attempt_started = time.perf_counter()
+                    try:
+                        response = await client.get(
+                            url, headers=merged_headers, params=params, extensions=extensions,
+                        )
+                        _observe_attempt(domain, response.status_code, attempt_started)
+                        if timings is not None:
+                            add_timing("http_requests", 1, timings)
+                            add_timing("http_body_bytes", response.num_bytes_downloaded, timings)
+                        response.raise_for_status()
+                        record_domain_success(domain)
+                        return extract(response)
+                    except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                        if isinstance(e, httpx.RequestError):
+                            _observe_attempt(domain, type(e).__name__, attempt_started)
+                        last_exc = e
+                        if not is_domain_failure(e):
+                            record_domain_success(domain)
+                        elif record_domain_failure(domain, probe=probe):
+                            logger.warning("Giving up on %s: circuit open for %s", url, domain)
+                            break
+                        wait_time = 2**attempt + random.uniform(0, 1)
+                        logger.warning(
+                            "Request failed (attempt %d/%d) for %s: %s. Retrying in %.1fs",
+                            attempt + 1, max_retries, url, e, wait_time,
+                        )
+                        await asyncio.sleep(wait_time)
+        finally:
+            if timings is not None:
+                add_timing("fetch", time.perf_counter() - fetch_started, timings)
 
         raise last_exc  # type: ignore[misc]
 
@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any
 
 from app.config import BASE_DIR
 from app.crawlers.utils.dedup import compute_url_hash
+from app.crawlers.utils.timing import add_timing
+from app.utils.metrics import CRAWLER_STAGE_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +17,9 @@ DATA_DIR = BASE_DIR / "data" / "raw"
 
 LATEST_FILENAME = "latest.json"
 
+# Keeps multi-row statements well under the Postgres bind-parameter limit.
+UPSERT_CHUNK_SIZE = 500
+
 
 def _normalize_tags(raw_tags: Any) -> list[str]:
     """Coerce crawler tags to a clean text list accepted by Postgres text[]."""
@@ -28,6 +34,86 @@ def _normalize_tags(raw_tags: Any) -> list[str]:
     return normalized
 
 
+def _empty_summary() -> dict[str, int]:
+    return {"upserted": 0, "new": 0, "deduped_in_batch": 0}
+
+
+async def _save_paper_result(result: Any, source_config: dict[str, Any]) -> dict[str, int]:
+    try:
+        from app.db.pool import get_pool  # noqa: PLC0415
+        from app.services import paper_service  # noqa: PLC0415
+
+        summary = await paper_service.ingest_crawl_result(
+            get_pool(),
+            result,
+            source_config,
+        )
+        return {
+            "upserted": summary.inserted_count + summary.updated_count,
+            "new": summary.inserted_count,
+            "deduped_in_batch": summary.skipped_count + summary.filtered_chinese_count,
+        }
+    except RuntimeError:
+        logger.warning(
+            "DB pool not initialized; skip persisting paper source %s", source_config.get("id")
+        )
+        return _empty_summary()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Paper ingest failed for %s: %s", source_config.get("id"), exc)
+        return _empty_summary()
+
+
+def _build_article_row(
+    item: Any,
+    url_hash: str,
+    source_config: dict[str, Any],
+    now_iso: str,
+) -> dict[str, Any]:
+    pub_at = item.published_at.isoformat() if item.published_at else None
+    return {
+        "url_hash": url_hash,
+        "source_id": source_config.get("id", "unknown"),
+        "dimension": source_config.get("dimension", "unknown"),
+        "group_name": source_config.get("group"),
+        "url": item.url,
+        "title": item.title,
+        "author": item.author,
+        "published_at": pub_at,
+        "content": item.content,
+        "content_html": item.content_html,
+        "content_hash": item.content_hash,
+        "tags": _normalize_tags(item.tags),
+        "extra": item.extra or {},
+        "crawled_at": now_iso,
+        "is_new": False,
+    }
+
+
+async def _fetch_existing_hash_owners(client: Any, url_hashes: list[str]) -> set[tuple[str, str]]:
+    """Return (url_hash, source_id) pairs already stored for the given hashes."""
+    existing: set[tuple[str, str]] = set()
+    for start in range(0, len(url_hashes), UPSERT_CHUNK_SIZE):
+        chunk = url_hashes[start:start + UPSERT_CHUNK_SIZE]
+        res = await (
+            client.table("articles")
+            .select("url_hash,source_id")
+            .in_("url_hash", chunk)
+            .execute()
+        )
+        existing.update(
+            (str(row["url_hash"]), str(row["source_id"])) for row in (res.data or [])
+        )
+    return existing
+
+
+async def _upsert_articles(client: Any, rows: list[dict[str, Any]]) -> None:
+    await client.table("articles").upsert(
+        rows,
+        on_conflict="url_hash",
+        ignore_duplicates=False,
+    ).execute()
+
+
 async def save_crawl_result_json(
     result: Any,
     source_config: dict[str, Any],
@@ -37,116 +123,140 @@ async def save_crawl_result_json(
     NOTE: Function name kept for backward compatibility with existing call-sites.
     No local JSON files are written.
     """
-    if source_config.get("persist_to_db") is False:
-        return {"upserted": 0, "new": 0, "deduped_in_batch": 0}
+    summaries = await save_crawl_results_batch([(result, source_config)])
+    return summaries[0]
 
-    entity_family = str(source_config.get("entity_family") or "").strip().lower()
-    if entity_family == "paper_record":
-        try:
-            from app.db.pool import get_pool  # noqa: PLC0415
-            from app.services import paper_service  # noqa: PLC0415
 
-            summary = await paper_service.ingest_crawl_result(
-                get_pool(),
-                result,
-                source_config,
-            )
-            return {
-                "upserted": summary.inserted_count + summary.updated_count,
-                "new": summary.inserted_count,
-                "deduped_in_batch": summary.skipped_count + summary.filtered_chinese_count,
-            }
-        except RuntimeError:
-            logger.warning("DB pool not initialized; skip persisting paper source %s", source_config.get("id"))
-            return {"upserted": 0, "new": 0, "deduped_in_batch": 0}
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Paper ingest failed for %s: %s", source_config.get("id"), exc)
-            return {"upserted": 0, "new": 0, "deduped_in_batch": 0}
+async def save_crawl_results_batch(
+    batch: list[tuple[Any, dict[str, Any]]],
+) -> list[dict[str, int]]:
+    """Persist several crawl results at once; returns one summary per input.
+
+    Article rows from every source in the batch share one existence lookup and
+    are written with chunked multi-row upserts, so callers that queue results
+    (e.g. ``run_all``) pay a few round trips per batch instead of per source.
+    Paper sources keep their dedicated ``paper_service`` ingest path. When an
+    upsert chunk fails, its sources are retried one at a time; only sources
+    that still fail get an empty summary.
+
+    The elapsed time is added to each result's ``timings["persist"]``, split
+    evenly across the batch.
+    """
+    started = time.perf_counter()
+    try:
+        return await _persist_batch(batch)
+    finally:
+        if batch:
+            share = (time.perf_counter() - started) / len(batch)
+            for result, _ in batch:
+                CRAWLER_STAGE_SECONDS.observe(share, "persist")
+                timings = getattr(result, "timings", None)
+                if isinstance(timings, dict):
+                    add_timing("persist", share, timings)
+
 
-    all_items = getattr(result, "items_all", None) or result.items
-    if not all_items:
-        return {"upserted": 0, "new": 0, "deduped_in_batch": 0}
+async def _persist_batch(
+    batch: list[tuple[Any, dict[str, Any]]],
+) -> list[dict[str, int]]:
+    summaries = [_empty_summary() for _ in batch]
+    pending: list[tuple[int, dict[str, Any], list[Any]]] = []
+    for idx, (result, source_config) in enumerate(batch):
+        if source_config.get("persist_to_db") is False:
+            continue
+        entity_family = str(source_config.get("entity_family") or "").strip().lower()
+        if entity_family == "paper_record":
+            summaries[idx] = await _save_paper_result(result, source_config)
+            continue
+        all_items = getattr(result, "items_all", None) or result.items
+        if all_items:
+            pending.append((idx, source_config, all_items))
 
-    dimension = source_config.get("dimension", "unknown")
-    group = source_config.get("group")
-    source_id = source_config.get("id", "unknown")
+    if not pending:
+        return summaries
+
+    source_ids = ", ".join(str(cfg.get("id", "unknown")) for _, cfg, _ in pending)
+    now_iso = datetime.now(timezone.utc).isoformat()
+    rows: list[dict[str, Any]] = []
+    owners: list[int] = []
+    seen_hashes: set[str] = set()
+    for idx, source_config, all_items in pending:
+        for item in all_items:
+            url_hash = compute_url_hash(item.url)
+            # Guard against duplicate hashes in the same batch, which can
+            # break a single Postgres upsert statement.
+            if url_hash in seen_hashes:
+                summaries[idx]["deduped_in_batch"] += 1
+                continue
+            seen_hashes.add(url_hash)
+            rows.append(_build_article_row(item, url_hash, source_config, now_iso))
+            owners.append(idx)
 
     # DB-only path
-    existing_hashes: set[str] = set()
     try:
         from app.db.client import get_client  # noqa: PLC0415
 
         client = get_client()
-        res = await client.table("articles").select("url_hash").eq("source_id", source_id).execute()
-        existing_hashes = {row["url_hash"] for row in (res.data or [])}
+        existing = await _fetch_existing_hash_owners(client, [row["url_hash"] for row in rows])
     except RuntimeError:
-        logger.warning("DB client not initialized; skip persisting source %s", source_id)
-        return {"upserted": 0, "new": 0, "deduped_in_batch": 0}
+        logger.warning("DB client not initialized; skip persisting sources %s", source_ids)
+        return [_empty_summary() for _ in batch]
     except Exception as exc:  # noqa: BLE001
         logger.warning(
             "DB fetch existing hashes failed for %s, skip persisting: %s",
-            source_id,
+            source_ids,
             exc,
         )
-        return {"upserted": 0, "new": 0, "deduped_in_batch": 0}
+        return [_empty_summary() for _ in batch]
 
-    now_dt = datetime.now(timezone.utc)
-    now_iso = now_dt.isoformat()
+    for row, idx in zip(rows, owners):
+        is_new = (row["url_hash"], row["source_id"]) not in existing
+        row["is_new"] = is_new
+        summaries[idx]["upserted"] += 1
+        if is_new:
+            summaries[idx]["new"] += 1
 
-    try:
-        from app.db.client import get_client  # noqa: PLC0415
+    from app.services.stores import near_dup_store  # noqa: PLC0415
 
-        client = get_client()
-        upsert_data = []
-        seen_hashes: set[str] = set()
-        new_count = 0
-        deduped_in_batch = 0
-        for item in all_items:
-            url_hash = compute_url_hash(item.url)
-            # Guard against duplicate hashes in the same batch, which can
-            # break a single Postgres upsert statement.
-            if url_hash in seen_hashes:
-                deduped_in_batch += 1
-                continue
-            seen_hashes.add(url_hash)
-            is_new = url_hash not in existing_hashes
-            if is_new:
-                new_count += 1
-            pub_at = item.published_at.isoformat() if item.published_at else None
-            upsert_data.append({
-                "url_hash": url_hash,
-                "source_id": source_id,
-                "dimension": dimension,
-                "group_name": group,
-                "url": item.url,
-                "title": item.title,
-                "author": item.author,
-                "published_at": pub_at,
-                "content": item.content,
-                "content_html": item.content_html,
-                "content_hash": item.content_hash,
-                "tags": _normalize_tags(item.tags),
-                "extra": item.extra or {},
-                "crawled_at": now_iso,
-                "is_new": is_new,
-            })
-        if upsert_data:
-            await client.table("articles").upsert(
-                upsert_data,
-                on_conflict="url_hash",
-                ignore_duplicates=False,
-            ).execute()
+    clustered = await near_dup_store.assign_clusters(rows)
+
+    retry: set[int] = set()
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        chunk_owners = set(owners[start:start + UPSERT_CHUNK_SIZE])
+        try:
+            await _upsert_articles(client, rows[start:start + UPSERT_CHUNK_SIZE])
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "DB upsert chunk failed for %s: %s",
+                ", ".join(str(batch[idx][1].get("id", "unknown")) for idx in sorted(chunk_owners)),
+                exc,
+            )
+            retry.update(chunk_owners)
+
+    # A failed chunk only costs its own sources: retry each of them alone so one
+    # bad row does not drop the summaries of every other source in the batch.
+    failed: set[int] = set(retry) if len(pending) == 1 else set()
+    for idx in sorted(retry - failed):
+        source_rows = [row for row, owner in zip(rows, owners) if owner == idx]
+        try:
+            for start in range(0, len(source_rows), UPSERT_CHUNK_SIZE):
+                await _upsert_articles(client, source_rows[start:start + UPSERT_CHUNK_SIZE])
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("DB upsert failed for %s: %s", batch[idx][1].get("id", "unknown"), exc)
+            failed.add(idx)
+    for idx in failed:
+        summaries[idx] = _empty_summary()
+
+    written = [row for row, owner in zip(rows, owners) if owner not in failed]
+    if clustered and written:
+        await near_dup_store.index_signatures(written)
+
+    for idx, source_config, _ in pending:
+        if idx in failed:
+            continue
         logger.info(
             "Upserted %d items (%d new) to DB for source %s",
-            len(upsert_data),
-            new_count,
-            source_id,
+            summaries[idx]["upserted"],
+            summaries[idx]["new"],
+            source_config.get("id", "unknown"),
         )
-        return {
-            "upserted": len(upsert_data),
-            "new": new_count,
-            "deduped_in_batch": deduped_in_batch,
-        }
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("DB upsert failed for %s: %s", source_id, exc)
-        return {"upserted": 0, "new": 0, "deduped_in_batch": 0}
+    return summaries
@@ -0,0 +1,199 @@
+"""Multi-keyword matching with an Aho-Corasick automaton.
+
+Crawler keyword filters test every item against every ``keyword_filter`` and
+``keyword_blacklist`` entry. ``KeywordMatcher`` compiles a keyword list once
+and finds all of its keywords in a single pass over the text.
+
+Matching is substring matching, like ``kw in text``, so Chinese keywords need
+no word boundaries. With ``whole_word=True``, a keyword that starts or ends
+with an ASCII letter or digit must not be glued to another ASCII letter or
+digit at that edge ("AI" matches "AI芯片" and "Open AI", not "TRAIN").
+
+Matchers are immutable; ``get_matcher`` caches one per keyword list, so each
+source's filter is compiled once per process.
+"""
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache
+
+
+def _is_ascii_word(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    return "[" + "".join(re.escape(ch) for ch in sorted(set(chars))) + "]"
+
+
+class KeywordMatcher:
+    """Compiled keyword set; ``search`` / ``find_all`` scan the text once."""
+
+    __slots__ = (
+        "keywords",
+        "case_sensitive",
+        "whole_word",
+        "_goto",
+        "_fail",
+        "_out",
+        "_lengths",
+        "_edges",
+        "_has_empty",
+        "_seek",
+    )
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        *,
+        case_sensitive: bool = True,
+        whole_word: bool = False,
+    ) -> None:
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(keywords))
+        self.case_sensitive = case_sensitive
+        self.whole_word = whole_word
+        # "" is a substring of every text, as with ``"" in text``.
+        self._has_empty = "" in self.keywords
+
+        patterns = [kw if case_sensitive else kw.lower() for kw in self.keywords]
+        self._lengths = [len(p) for p in patterns]
+        # Which edges of each keyword need an ASCII word boundary.
+        self._edges = [
+            (
+                whole_word and bool(p) and _is_ascii_word(p[0]),
+                whole_word and bool(p) and _is_ascii_word(p[-1]),
+            )
+            for p in patterns
+        ]
+
+        goto: list[dict[str, int]] = [{}]
+        out: list[list[int]] = [[]]
+        for index, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt].extend(out[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [tuple(o) for o in out]
+        # From the root state, skip straight to the next position that can
+        # start a keyword: a C-level regex scan instead of one loop step per
+        # char. The class pair over first and second characters is a cheap
+        # over-approximation of "some keyword starts here".
+        self._seek = None
+        if goto[0]:
+            pattern = _char_class(goto[0])
+            if all(len(p) > 1 for p in patterns if p):
+                pattern += _char_class(p[1] for p in patterns if p)
+            self._seek = re.compile(pattern)
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords)} keywords, whole_word={self.whole_word})"
+
+    def _matches(self, text: str, first_only: bool) -> dict[int, int]:
+        """Keyword index -> end offset (exclusive) of its first occurrence."""
+        found: dict[int, int] = {}
+        if not text or self._seek is None:
+            return found
+        if not self.case_sensitive:
+            text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        seek = self._seek.search
+        check_edges = self.whole_word
+        length = len(text)
+        state = 0
+        pos = 0
+        while pos < length:
+            if state == 0:
+                hit = seek(text, pos)
+                if hit is None:
+                    break
+                pos = hit.start()
+            ch = text[pos]
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            if out[state]:
+                for index in out[state]:
+                    if index in found:
+                        continue
+                    if check_edges:
+                        left, right = self._edges[index]
+                        start = pos - self._lengths[index] + 1
+                        if left and start > 0 and _is_ascii_word(text[start - 1]):
+                            continue
+                        if right and pos + 1 < length and _is_ascii_word(text[pos + 1]):
+                            continue
+                    found[index] = pos + 1
+                    if first_only:
+                        return found
+            pos += 1
+        return found
+
+    def search(self, text: str | None) -> bool:
+        """True when ``text`` contains any keyword."""
+        if self._has_empty:
+            return True
+        return bool(self._matches(text or "", first_only=True))
+
+    def find_all(self, text: str | None) -> list[str]:
+        """Every keyword found in ``text``, in keyword-list order."""
+        found = self._matches(text or "", first_only=False)
+        return [kw for i, kw in enumerate(self.keywords) if i in found or kw == ""]
+
+    def find_positions(self, text: str | None) -> dict[str, int]:
+        """Keyword -> end offset of its first occurrence in ``text``.
+
+        A keyword occurs in ``text[:n]`` exactly when its offset is <= n, so
+        one scan answers prefix queries too.
+        """
+        found = self._matches(text or "", first_only=False)
+        positions = {self.keywords[i]: end for i, end in found.items()}
+        if self._has_empty:
+            positions[""] = 0
+        return positions
+
+
+@lru_cache(maxsize=512)
+def _cached_matcher(
+    keywords: tuple[str, ...], case_sensitive: bool, whole_word: bool
+) -> KeywordMatcher:
+    return KeywordMatcher(keywords, case_sensitive=case_sensitive, whole_word=whole_word)
+
+
+def get_matcher(
+    keywords: Iterable[str] | None,
+    *,
+    case_sensitive: bool = True,
+    whole_word: bool = False,
+) -> KeywordMatcher:
+    """Shared compiled matcher for a keyword list (empty list = never matches)."""
+    return _cached_matcher(tuple(keywords or ()), case_sensitive, whole_word)
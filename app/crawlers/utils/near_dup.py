@@ -0,0 +1,112 @@
+"""Near-duplicate article signatures (64-bit SimHash with banded LSH keys).
+
+The same notice is often republished by several ministries and universities
+under different URLs, so ``compute_url_hash`` sees distinct articles. A
+SimHash over character 4-grams of the normalized text maps such copies to
+signatures a few bits apart.
+
+For sub-linear lookup the signature is cut into ``SIMHASH_BANDS`` 16-bit
+bands. Two signatures within ``MAX_DISTANCE`` bits differ in at most that
+many bands, so with ``MAX_DISTANCE + 1`` bands they share at least one band
+exactly: candidates are found by equality on (band, value) and verified by
+Hamming distance.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+MAX_DISTANCE = SIMHASH_BANDS - 1
+SHINGLE_SIZE = 4
+# Shorter texts (titles only, list stubs) collide too easily to cluster.
+MIN_TEXT_CHARS = 120
+# Long articles: the opening is enough to identify a republished copy.
+MAX_TEXT_CHARS = 20_000
+
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+# Byte values with bit ``i`` set, for summing per-bit weights.
+_BYTES_WITH_BIT = [tuple(v for v in range(256) if v >> bit & 1) for bit in range(8)]
+
+
+def normalize_text(text: str) -> str:
+    """NFKC, lowercase, and drop whitespace/punctuation (CJK-safe)."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return _NON_WORD_RE.sub("", text)
+
+
+def simhash64(text: str) -> int | None:
+    """Unsigned 64-bit SimHash of ``text``; None when too short to be meaningful."""
+    normalized = normalize_text(text)[:MAX_TEXT_CHARS]
+    if len(normalized) < MIN_TEXT_CHARS:
+        return None
+    shingles = Counter(
+        normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)
+    )
+    # Weights per (byte position, byte value): 8 updates per shingle instead
+    # of 64, then each bit is summed over the 256 values of its byte.
+    byte_weights = [[0] * 256 for _ in range(8)]
+    for shingle, weight in shingles.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        for position, value in enumerate(digest):
+            byte_weights[position][value] += weight
+    total = sum(shingles.values())
+    signature = 0
+    for position, weights in enumerate(byte_weights):
+        for bit, values in enumerate(_BYTES_WITH_BIT):
+            if 2 * sum(weights[value] for value in values) > total:
+                signature |= 1 << (position * 8 + bit)
+    return signature
+
+
+def article_simhash(title: str | None, content: str | None) -> int | None:
+    return simhash64(f"{title or ''}\n{content or ''}")
+
+
+def simhash_bands(signature: int) -> list[tuple[int, int]]:
+    """(band index, band value) LSH keys for a signature."""
+    mask = (1 << BAND_BITS) - 1
+    return [(band, signature >> (band * BAND_BITS) & mask) for band in range(SIMHASH_BANDS)]
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def to_signed64(value: int) -> int:
+    """Store unsigned signatures in a Postgres BIGINT."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def from_signed64(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def collapse_near_duplicates(articles: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Keep one article per near-duplicate cluster, preserving order.
+
+    Articles sharing a ``canonical_url_hash`` are one cluster; the canonical
+    article itself is kept when present, otherwise the first member. Rows
+    without a cluster pass through unchanged.
+    """
+    kept: dict[str, int] = {}
+    result: list[dict[str, Any]] = []
+    for row in articles:
+        cluster = row.get("canonical_url_hash")
+        if not cluster:
+            result.append(row)
+            continue
+        index = kept.get(cluster)
+        if index is None:
+            kept[cluster] = len(result)
+            result.append(row)
+        elif row.get("url_hash") == cluster:
+            # The canonical article replaces an earlier member of its cluster.
+            result[index] = row
+    return result
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, AsyncGenerator
@@ -9,6 +10,8 @@ from typing import Any, AsyncGenerator
 from playwright.async_api import Browser, Page, Playwright, async_playwright
 
 from app.config import settings
+from app.crawlers.utils.timing import add_timing
+from app.utils.metrics import PLAYWRIGHT_CONTEXT_WAIT_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,11 @@ _pw: Playwright | None = None
 _browser: Browser | None = None
 _lock = asyncio.Lock()
 _context_semaphore = asyncio.Semaphore(settings.PLAYWRIGHT_MAX_CONTEXTS)
+_contexts_in_use = 0
+
+
+def contexts_in_use() -> int:
+    return _contexts_in_use
 
 
 def _is_target_closed_error(exc: Exception) -> bool:
@@ -61,6 +69,19 @@ async def _get_browser() -> Browser:
     return _browser
 
 
+@asynccontextmanager
+async def _context_slot() -> AsyncGenerator[None, None]:
+    global _contexts_in_use
+    wait_started = time.perf_counter()
+    async with _context_semaphore:
+        PLAYWRIGHT_CONTEXT_WAIT_SECONDS.observe(time.perf_counter() - wait_started)
+        _contexts_in_use += 1
+        try:
+            yield
+        finally:
+            _contexts_in_use -= 1
+
+
 @asynccontextmanager
 async def get_page(
     *,
@@ -72,7 +93,8 @@ async def get_page(
 
     Limits concurrent contexts to PLAYWRIGHT_MAX_CONTEXTS to avoid resource exhaustion.
     """
-    async with _context_semaphore:
+    setup_started = time.perf_counter()
+    async with _context_slot():
         browser = await _get_browser()
         context_kwargs = {
             "user_agent": (
@@ -100,6 +122,7 @@ async def get_page(
         page: Page | None = None
         try:
             page = await context.new_page()
+            add_timing("browser_setup", time.perf_counter() - setup_started)
             yield page
         finally:
             if save_storage_state and storage_state_path:
@@ -18,6 +18,7 @@ import os
 import httpx
 
 from app.services.llm.llm_call_tracker import get_tracker
+from app.services.llm.llm_transport import post_chat_completion
 
 logger = logging.getLogger(__name__)
 
@@ -105,79 +106,80 @@ async def extract_faculty_fields_with_llm(
 
     # Call LLM
     try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=10.0)) as client:
-            response = await client.post(
-                api_url,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {api_key}",
-                },
-                json={
-                    "model": llm_model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": (
-                                "你是一个数据提取助手。"
-                                "从学术网页中提取结构化信息，"
-                                "只返回有效的 JSON，不要包含任何解释或 markdown 格式。"
-                            ),
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt,
-                        },
-                    ],
-                    "temperature": 0,
-                    "max_tokens": max_tokens,
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-            resp_content = result["choices"][0]["message"]["content"]
-
-            # Track token usage
-            usage = result.get("usage", {})
-            input_tokens = int(usage.get("prompt_tokens", 0) or 0)
-            output_tokens = int(usage.get("completion_tokens", 0) or 0)
-            logger.debug(
-                "LLM extraction: input=%d tokens, output=%d tokens",
-                input_tokens,
-                output_tokens,
-            )
-
-            tracker.log_call(
-                model=llm_model,
-                provider=llm_provider,
-                prompt=prompt,
-                system_prompt=(
-                    "你是一个数据提取助手。从学术网页中提取结构化信息，只返回有效的 JSON，不要包含任何解释或 markdown 格式。"
-                ),
-                response_text=str(resp_content),
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                stage=stage,
-                article_id=article_id,
-                article_title=article_title or raw_name or None,
-                source_id=source_id,
-                dimension=dimension,
-                success=True,
-                provider_cost_usd=_extract_provider_cost_usd(result),
-            )
-
-            # Parse JSON response
-            resp_content = resp_content.strip()
-            if resp_content.startswith("```json"):
-                resp_content = resp_content[7:]
-            if resp_content.startswith("```"):
-                resp_content = resp_content[3:]
-            if resp_content.endswith("```"):
-                resp_content = resp_content[:-3]
-            resp_content = resp_content.strip()
-
-            extracted = json.loads(resp_content)
-            logger.debug("LLM extracted fields: %s", list(extracted.keys()))
-            return extracted
+        response = await post_chat_completion(
+            llm_provider,
+            api_url,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            },
+            payload={
+                "model": llm_model,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": (
+                            "你是一个数据提取助手。"
+                            "从学术网页中提取结构化信息，"
+                            "只返回有效的 JSON，不要包含任何解释或 markdown 格式。"
+                        ),
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt,
+                    },
+                ],
+                "temperature": 0,
+                "max_tokens": max_tokens,
+            },
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+        result = response.json()
+        resp_content = result["choices"][0]["message"]["content"]
+
+        # Track token usage
+        usage = result.get("usage", {})
+        input_tokens = int(usage.get("prompt_tokens", 0) or 0)
+        output_tokens = int(usage.get("completion_tokens", 0) or 0)
+        logger.debug(
+            "LLM extraction: input=%d tokens, output=%d tokens",
+            input_tokens,
+            output_tokens,
+        )
+
+        tracker.log_call(
+            model=llm_model,
+            provider=llm_provider,
+            prompt=prompt,
+            system_prompt=(
+                "你是一个数据提取助手。从学术网页中提取结构化信息，"
+                "只返回有效的 JSON，不要包含任何解释或 markdown 格式。"
+            ),
+            response_text=str(resp_content),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            stage=stage,
+            article_id=article_id,
+            article_title=article_title or raw_name or None,
+            source_id=source_id,
+            dimension=dimension,
+            success=True,
+            provider_cost_usd=_extract_provider_cost_usd(result),
+        )
+
+        # Parse JSON response
+        resp_content = resp_content.strip()
+        if resp_content.startswith("```json"):
+            resp_content = resp_content[7:]
+        if resp_content.startswith("```"):
+            resp_content = resp_content[3:]
+        if resp_content.endswith("```"):
+            resp_content = resp_content[:-3]
+        resp_content = resp_content.strip()
+
+        extracted = json.loads(resp_content)
+        logger.debug("LLM extracted fields: %s", list(extracted.keys()))
+        return extracted
 
     except json.JSONDecodeError as e:
         logger.warning("Failed to parse LLM JSON response: %s", e)
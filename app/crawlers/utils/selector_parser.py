@@ -18,6 +18,7 @@ from app.utils.date_parsing import (
     extract_datetime_from_url,
     parse_datetime_text,
 )
+from app.crawlers.utils.content_filter import should_keep_item
 from app.crawlers.utils.dedup import compute_content_hash
 from app.crawlers.utils.html_sanitizer import sanitize_html
 from app.crawlers.utils.image_extractor import extract_images
@@ -120,6 +121,7 @@ def parse_list_items(
     base_url: str,
     keyword_filter: list[str] | None = None,
     keyword_blacklist: list[str] | None = None,
+    keyword_whole_word: bool = False,
 ) -> list[RawListItem]:
     """Parse a list page and extract title, link, and date for each item.
 
@@ -157,12 +159,10 @@ def parse_list_items(
             continue
         url = urljoin(base_url, raw_link)
 
-        # Keyword filtering
-        if keyword_filter and not any(kw in title for kw in keyword_filter):
-            continue
-
-        # Blacklist filtering (drop if title contains any blacklist keyword)
-        if keyword_blacklist and any(bw in title for bw in keyword_blacklist):
+        # Keyword filtering (whitelist, then blacklist on the title)
+        if not should_keep_item(
+            title, keyword_filter, keyword_blacklist, whole_word=keyword_whole_word
+        ):
             continue
 
         published_at = extract_date(el, selectors)
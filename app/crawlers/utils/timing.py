@@ -0,0 +1,103 @@
+"""Per-stage timing spans for one crawl run.
+
+``BaseCrawler.run`` binds a flat ``{stage: seconds}`` dict to the running
+task (a ContextVar, so tasks spawned by the crawler share it) and the layers
+below add to it without any plumbing:
+
+- ``rate_limit_wait``  domain semaphore + per-domain delay (http_client)
+- ``fetch``            HTTP request time including retries (http_client)
+- ``browser_setup``    Playwright context acquisition (playwright_pool)
+- ``parse``            remaining ``fetch_and_parse`` time (fetch/wait excluded;
+                       for browser crawlers this includes page navigation)
+- ``filter``           keyword filtering in ``BaseCrawler``
+- ``persist``          article/paper persistence (json_storage)
+
+HTTP details come from httpx trace events and are summed over requests:
+``http_requests``, ``http_connect`` (TCP connect, which includes DNS since
+httpcore resolves inside connect_tcp), ``http_tls``, ``http_ttfb`` (request
+sent to response headers) and ``http_body_bytes`` (bytes on the wire).
+
+Stage values are cumulative: requests running concurrently inside one crawl
+can add up to more than the crawl's wall time.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_current: ContextVar[dict[str, float] | None] = ContextVar("crawl_timings", default=None)
+
+# Timings keys whose values are not seconds.
+COUNTER_KEYS = frozenset({"http_requests", "http_body_bytes"})
+
+
+def current_timings() -> dict[str, float] | None:
+    return _current.get()
+
+
+@contextmanager
+def collect_timings(timings: dict[str, float]) -> Iterator[dict[str, float]]:
+    """Route spans recorded inside the block (and its child tasks) to ``timings``."""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def add_timing(key: str, value: float, timings: dict[str, float] | None = None) -> None:
+    target = timings if timings is not None else _current.get()
+    if target is None:
+        return
+    target[key] = target.get(key, 0.0) + value
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Add the block's wall time to ``stage`` of the bound timings, if any."""
+    if _current.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_timing(stage, time.perf_counter() - started)
+
+
+def http_trace(timings: dict[str, float]) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+    """httpx ``trace`` extension that records connect/TLS/TTFB into ``timings``."""
+    marks: dict[str, float] = {}
+
+    async def trace(event_name: str, info: dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if event_name.endswith(".started"):
+            marks[event_name[: -len(".started")]] = now
+            return
+        if not event_name.endswith(".complete"):
+            return
+        name = event_name[: -len(".complete")]
+        if name == "connection.connect_tcp":
+            add_timing("http_connect", now - marks.pop(name, now), timings)
+        elif name == "connection.start_tls":
+            add_timing("http_tls", now - marks.pop(name, now), timings)
+        elif name.endswith(".receive_response_headers"):
+            protocol = name.split(".", 1)[0]
+            sent = marks.pop(f"{protocol}.send_request_headers", None)
+            if sent is not None:
+                add_timing("http_ttfb", now - sent, timings)
+
+    return trace
+
+
+def rounded_timings(timings: dict[str, float] | None) -> dict[str, float] | None:
+    """Compact copy for persistence: seconds rounded to ms, counters as ints."""
+    if not timings:
+        return None
+    return {
+        key: int(value) if key in COUNTER_KEYS else round(float(value), 3)
+        for key, value in sorted(timings.items())
+    }
@@ -96,6 +96,11 @@ class _PgTableQuery:
             self._filters.append((f"{col} <> {{}}", [value]))
         return self
 
+    def in_(self, column: str, values: list[Any]):
+        items = list(values or [])
+        self._filters.append(_in_filter(column, items) if items else ("FALSE", []))
+        return self
+
     def ilike(self, column: str, value: str):
         self._filters.append((f"{_quote_ident(column)} ILIKE {{}}", [value]))
         return self
@@ -406,6 +411,23 @@ def _is_temporal_column(column: str) -> bool:
     return normalized.endswith("_date") or normalized.endswith("_at")
 
 
+def _in_filter(column: str, items: list[Any]) -> tuple[str, list[Any]]:
+    """``column = ANY(...)`` with the values passed as one jsonb parameter.
+
+    The pool proxy JSON-encodes list parameters on secondary event loops, so
+    a plain array parameter only works on the primary loop's pool. Integer
+    lists are cast back to bigint so integer columns keep their index.
+    """
+    element = "::bigint" if all(
+        isinstance(v, int) and not isinstance(v, bool) for v in items
+    ) else ""
+    return (
+        f"{_quote_ident(column)} = ANY(ARRAY("
+        f"SELECT jsonb_array_elements_text({{}}::jsonb){element}))",
+        [json.dumps(items, ensure_ascii=False, default=str)],
+    )
+
+
 def _coerce_comparison_value(column: str, value: Any) -> Any:
     if not isinstance(value, str) or not _is_temporal_column(column):
         return value
@@ -610,6 +632,30 @@ async def init_client(
     raise RuntimeError(f"Unsupported DB backend: {selected}")
 
 
+async def init_database_from_settings() -> None:
+    """Initialize pool + client from settings the way the API lifespan does.
+
+    Used by processes that run outside the API (crawl workers, executors).
+    """
+    backend = settings.DB_BACKEND.strip().lower()
+    if backend in {"postgres", "postgresql", "local"}:
+        from app.db.pool import init_pool
+
+        if settings.POSTGRES_DSN:
+            await init_pool(dsn=settings.POSTGRES_DSN)
+        else:
+            await init_pool(
+                host=settings.POSTGRES_HOST,
+                port=settings.POSTGRES_PORT,
+                user=settings.POSTGRES_USER,
+                password=settings.POSTGRES_PASSWORD,
+                database=settings.POSTGRES_DB,
+            )
+        await init_client(backend="postgres")
+        return
+    await init_client(settings.SUPABASE_URL, settings.SUPABASE_KEY, backend="supabase")
+
+
 async def close_client() -> None:
     """Close and reset global client."""
     global _client, _backend
@@ -0,0 +1,113 @@
+"""Cross-process cache invalidation over Postgres LISTEN/NOTIFY.
+
+With several uvicorn workers each process keeps its own in-memory caches.
+Modules register a local invalidator under a cache name; ``invalidate_cache``
+clears it in this process and NOTIFYs every other process listening on the
+same database so they clear theirs too.
+
+    register_cache_invalidator("institution_hierarchy", _hierarchy_cache.clear)
+    invalidate_cache("institution_hierarchy")
+
+Without a running listener (CLI scripts, tests, Supabase backend) only the
+local invalidators run.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from collections.abc import Callable
+from typing import Any
+
+from app.db.pool import connect_dedicated
+
+logger = logging.getLogger(__name__)
+
+CACHE_INVALIDATION_CHANNEL = "app_cache_invalidation"
+
+_ORIGIN = f"{socket.gethostname()}:{os.getpid()}"
+_invalidators: dict[str, list[Callable[[], Any]]] = {}
+_listener_conn: Any | None = None
+_pending_publishes: set[asyncio.Task] = set()
+
+
+def register_cache_invalidator(name: str, callback: Callable[[], Any]) -> None:
+    """Register a local callback run whenever cache ``name`` is invalidated anywhere."""
+    callbacks = _invalidators.setdefault(name, [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+def _run_local(name: str) -> None:
+    for callback in _invalidators.get(name, []):
+        try:
+            callback()
+        except Exception:  # noqa: BLE001
+            logger.exception("Cache invalidator for %s failed", name)
+
+
+def invalidate_cache(name: str) -> None:
+    """Clear cache ``name`` here and broadcast the invalidation to other processes."""
+    _run_local(name)
+    if _listener_conn is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(publish_cache_invalidation(name))
+    _pending_publishes.add(task)
+    task.add_done_callback(_pending_publishes.discard)
+
+
+async def publish_cache_invalidation(name: str) -> None:
+    conn = _listener_conn
+    if conn is None or conn.is_closed():
+        return
+    payload = json.dumps({"cache": name, "origin": _ORIGIN})
+    try:
+        await conn.execute("SELECT pg_notify($1, $2)", CACHE_INVALIDATION_CHANNEL, payload)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Failed to broadcast invalidation of %s: %s", name, e)
+
+
+def _on_notification(_conn: Any, _pid: int, _channel: str, payload: str) -> None:
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        return
+    if message.get("origin") == _ORIGIN:
+        return
+    name = str(message.get("cache") or "")
+    if name:
+        logger.debug("Cache %s invalidated by %s", name, message.get("origin"))
+        _run_local(name)
+
+
+async def start_cache_invalidation_listener() -> bool:
+    """LISTEN for invalidations from other processes; returns False if unavailable."""
+    global _listener_conn
+    if _listener_conn is not None:
+        return True
+    try:
+        conn = await connect_dedicated()
+        await conn.add_listener(CACHE_INVALIDATION_CHANNEL, _on_notification)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Cache invalidation listener unavailable: %s", e)
+        return False
+    _listener_conn = conn
+    return True
+
+
+async def stop_cache_invalidation_listener() -> None:
+    global _listener_conn
+    if _pending_publishes:
+        await asyncio.gather(*_pending_publishes, return_exceptions=True)
+    conn, _listener_conn = _listener_conn, None
+    if conn is not None and not conn.is_closed():
+        try:
+            await conn.close()
+        except Exception:  # noqa: BLE001
+            pass
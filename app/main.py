@@ -1,20 +1,25 @@
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from scalar_fastapi import get_scalar_api_reference
 
 from app.api.academic_monitor import router as academic_monitor_router
+from app.api.responses import DEFAULT_RESPONSE_CLASS
 from app.api.router import api_router, legacy_v1_router
-from app.console_api import console_api_app
 from app.config import BASE_DIR, settings
+from app.console_api import console_api_app
 from app.db.client import close_client, init_client
 from app.db.pool import close_pool, init_pool
 from app.scheduler.manager import SchedulerManager, load_all_source_configs
+from app.services.llm.llm_transport import close_llm_clients
+from app.utils.metrics import MetricsMiddleware, render_metrics
 
 logging.basicConfig(
     level=logging.INFO,
@@ -239,6 +244,38 @@ def _latest_social_kol_scheduled_utc(now_utc: datetime) -> datetime | None:
     return None
 
 
+async def _run_startup_catchups(scheduler: SchedulerManager) -> None:
+    """Trigger initial/catch-up runs that the scheduler's cron windows missed."""
+    if not settings.STARTUP_CRAWL_ENABLED:
+        return
+    try:
+        needs_initial = await _check_needs_initial_data()
+        if needs_initial:
+            logger.info(
+                "Processed data missing — triggering initial pipeline"
+            )
+            await scheduler.trigger_pipeline()
+        elif _check_needs_today_briefing_backfill():
+            logger.info(
+                "Today's briefing cache missing after scheduled pipeline window"
+                " — triggering catch-up pipeline"
+            )
+            await scheduler.trigger_pipeline()
+    except Exception as e:
+        logger.warning("Initial data check failed: %s", e)
+
+    # Catch-up social KOL crawl if today's scheduled run was missed.
+    try:
+        if await _check_needs_today_social_kol_backfill():
+            logger.info(
+                "Social KOL crawl appears missing after the latest scheduled X window — "
+                "triggering catch-up crawl for twitter_ai_kol_international"
+            )
+            await scheduler.trigger_source("twitter_ai_kol_international")
+    except Exception as e:
+        logger.warning("Social KOL catch-up check failed: %s", e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage startup and shutdown of scheduler and other resources."""
@@ -300,53 +337,49 @@ async def lifespan(app: FastAPI):
             source_configs=load_all_source_configs(),
             mark_missing_unsupported=True,
         )
-        logger.info(
-            "Source catalog synced: upserted=%d, marked_unsupported=%d, deleted_missing=%d",
-            sync_result.get("upserted", 0),
-            sync_result.get("marked_unsupported", 0),
-            sync_result.get("deleted_missing", 0),
-        )
+        if sync_result.get("skipped"):
+            logger.info("Source catalog unchanged since last sync, skipped")
+        else:
+            logger.info(
+                "Source catalog synced: upserted=%d, marked_unsupported=%d, deleted_missing=%d",
+                sync_result.get("upserted", 0),
+                sync_result.get("marked_unsupported", 0),
+                sync_result.get("deleted_missing", 0),
+            )
     except Exception as e:
         logger.warning("Source catalog sync failed: %s", e)
 
     # Step 1: Validate dependencies
     startup_issues = await _validate_startup()
 
-    # Step 2: Start scheduler
-    scheduler = SchedulerManager()
-    try:
-        await scheduler.start()
-    except Exception as e:
-        logger.error("Scheduler failed to start: %s", e)
-        scheduler = None
+    # Step 2: Start scheduler. With leader election each uvicorn worker competes
+    # for a Postgres advisory lock and only the holder runs the scheduler (and
+    # the Step 3 catch-ups); without it this process runs it directly.
+    scheduler: SchedulerManager | None = None
+    election = None
+    use_election = (
+        db_ready
+        and settings.SCHEDULER_LEADER_ELECTION
+        and settings.DB_BACKEND.strip().lower() in {"postgres", "postgresql", "local"}
+    )
+    if use_election:
+        from app.db.notify import start_cache_invalidation_listener
+        from app.scheduler.leader import SchedulerLeaderElection
 
-    # Step 3: Initial data population (if fresh install)
-    if scheduler and settings.STARTUP_CRAWL_ENABLED:
+        await start_cache_invalidation_listener()
+        election = SchedulerLeaderElection(on_elected=_run_startup_catchups)
+        await election.start()
+    else:
+        scheduler = SchedulerManager()
         try:
-            needs_initial = await _check_needs_initial_data()
-            if needs_initial:
-                logger.info(
-                    "Processed data missing — triggering initial pipeline"
-                )
-                await scheduler.trigger_pipeline()
-            elif _check_needs_today_briefing_backfill():
-                logger.info(
-                    "Today's briefing cache missing after scheduled pipeline window — triggering catch-up pipeline"
-                )
-                await scheduler.trigger_pipeline()
+            await scheduler.start()
         except Exception as e:
-            logger.warning("Initial data check failed: %s", e)
+            logger.error("Scheduler failed to start: %s", e)
+            scheduler = None
 
-        # Step 3.5: Catch-up social KOL crawl if today's scheduled run was missed.
-        try:
-            if await _check_needs_today_social_kol_backfill():
-                logger.info(
-                    "Social KOL crawl appears missing after the latest scheduled X window — "
-                    "triggering catch-up crawl for twitter_ai_kol_international"
-                )
-                await scheduler.trigger_source("twitter_ai_kol_international")
-        except Exception as e:
-            logger.warning("Social KOL catch-up check failed: %s", e)
+        # Step 3: Initial data population (if fresh install)
+        if scheduler:
+            await _run_startup_catchups(scheduler)
 
     # Step 4: Build scholar institutions data (only if missing)
     try:
@@ -370,6 +403,13 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    if election:
+        from app.db.notify import stop_cache_invalidation_listener
+
+        await election.stop()
+        await stop_cache_invalidation_listener()
+
+    await close_llm_clients()
     await close_client()
     await close_pool()
 
@@ -431,6 +471,7 @@ app = FastAPI(
         "name": "Internal Use",
     },
     lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS,
     # Keep default /docs (Swagger UI) and add Scalar at /scalar
     docs_url="/swagger",
     redoc_url=None,
@@ -444,6 +485,9 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["Content-Disposition"],
 )
+if settings.METRICS_ENABLED:
+    # Outermost, so /console-api and static mounts are timed too.
+    app.add_middleware(MetricsMiddleware)
 
 
 # Register API routes
@@ -463,7 +507,6 @@ app.include_router(
 app.mount("/console-api", console_api_app)
 
 # Mount static files for frontend UI
-from pathlib import Path
 frontend_dir = Path(__file__).parent.parent / "frontend"
 if frontend_dir.exists():
     app.mount("/ui", StaticFiles(directory=str(frontend_dir), html=True), name="ui")
@@ -471,7 +514,9 @@ if frontend_dir.exists():
 
 console_frontend_dir = Path(__file__).parent.parent / "crawler-console" / "dist"
 if console_frontend_dir.exists():
-    app.mount("/console", StaticFiles(directory=str(console_frontend_dir), html=True), name="console")
+    app.mount(
+        "/console", StaticFiles(directory=str(console_frontend_dir), html=True), name="console"
+    )
     logger.info("Crawler console mounted at /console")
 
 
@@ -489,6 +534,13 @@ async def root():
     }
 
 
+if settings.METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 # ---------------------------------------------------------------------------
 # Scalar API Reference — modern, beautiful API documentation UI
 # ---------------------------------------------------------------------------
@@ -0,0 +1,277 @@
+"""Adaptive per-source crawl intervals learned from observed change frequency.
+
+With ``SCHEDULE_MODE=adaptive`` (or ``schedule: adaptive`` on a source) a
+source's fixed 2h/4h/daily/weekly trigger is replaced by an interval derived
+from its history over the last ``ADAPTIVE_SCHEDULE_HISTORY_DAYS``:
+
+1. distinct ``articles.published_at`` hours (publish events), or, when the
+   source has too few dated items,
+2. crawls in ``crawl_logs`` that found ``items_new > 0``.
+
+The crawl interval is half the mean gap between those events (so a new item
+waits on average at most a quarter of its gap), rounded down to a fixed
+ladder and clamped to per-source / global min-max bounds. Sources that
+produced nothing in the window go to the max bound. Sources with an explicit
+``cron`` or ``schedule_mode: fixed`` keep their fixed trigger.
+
+Each interval bucket is spread evenly over its period from a fixed anchor
+(the Unix epoch), so restarts keep the same slots and jobs no longer pile up
+at 06:00.
+"""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_LADDER_HOURS: tuple[float, ...] = (2, 3, 4, 6, 8, 12, 24, 48, 72, 168, 336, 720)
+MIN_PUBLISH_EVENTS = 3
+
+# Period implied by the fixed schedule keys in manager._make_trigger.
+_FIXED_SCHEDULE_HOURS = {
+    "2h": 2.0,
+    "4h": 4.0,
+    "daily": 24.0,
+    "daily_bj_4": 24.0,
+    "weekly": 168.0,
+    "monthly": 720.0,
+    "adaptive": 24.0,
+}
+
+
+@dataclass
+class SourceCadence:
+    """History used to estimate one source's change frequency."""
+
+    source_id: str
+    crawls: int = 0
+    crawls_with_new: int = 0
+    first_crawl_at: datetime | None = None
+    published: list[datetime] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class AdaptivePlan:
+    source_id: str
+    interval_hours: float
+    offset_seconds: float
+    reason: str
+
+    def trigger(self, anchor: datetime) -> IntervalTrigger:
+        return IntervalTrigger(
+            hours=self.interval_hours,
+            start_date=anchor + timedelta(seconds=self.offset_seconds),
+            timezone=timezone.utc,
+        )
+
+
+def uses_adaptive_schedule(config: dict[str, Any]) -> bool:
+    if isinstance(config.get("cron"), dict) and config.get("cron"):
+        return False
+    if str(config.get("schedule_mode") or "").strip().lower() == "fixed":
+        return False
+    schedule_key = str(config.get("schedule", "daily")).strip().lower()
+    if schedule_key == "adaptive":
+        return True
+    return (
+        settings.SCHEDULE_MODE.strip().lower() == "adaptive"
+        and schedule_key in _FIXED_SCHEDULE_HOURS
+    )
+
+
+def fixed_interval_hours(config: dict[str, Any]) -> float:
+    schedule_key = str(config.get("schedule", "daily")).strip().lower()
+    return _FIXED_SCHEDULE_HOURS.get(schedule_key, 24.0)
+
+
+def _bounds(config: dict[str, Any]) -> tuple[float, float]:
+    def _num(key: str, default: float) -> float:
+        try:
+            return float(config.get(key) or default)
+        except (TypeError, ValueError):
+            return default
+
+    min_hours = max(1.0, _num("adaptive_min_hours", settings.ADAPTIVE_SCHEDULE_MIN_HOURS))
+    max_hours = max(min_hours, _num("adaptive_max_hours", settings.ADAPTIVE_SCHEDULE_MAX_HOURS))
+    return min_hours, max_hours
+
+
+def _snap_to_ladder(hours: float, min_hours: float, max_hours: float) -> float:
+    candidates = [h for h in INTERVAL_LADDER_HOURS if min_hours <= h <= max_hours]
+    if not candidates:
+        return min(max(hours, min_hours), max_hours)
+    below = [h for h in candidates if h <= hours]
+    return below[-1] if below else candidates[0]
+
+
+def estimate_interval_hours(
+    cadence: SourceCadence,
+    *,
+    now: datetime,
+    history_days: int,
+    min_hours: float,
+    max_hours: float,
+    default_hours: float,
+) -> tuple[float, str]:
+    """Return (interval_hours, reason) for one source; pure so it can be unit-tested."""
+    window_hours = history_days * 24.0
+    window_start = now - timedelta(hours=window_hours)
+
+    # Items published in the same hour (or date-only items) are one event.
+    events = {
+        p.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        for p in cadence.published
+        if window_start <= p <= now
+    }
+    if len(events) >= MIN_PUBLISH_EVENTS:
+        gap_hours = window_hours / len(events)
+        reason = f"{len(events)} publish events/{history_days}d"
+    elif cadence.crawls_with_new > 0:
+        observed = window_hours
+        if cadence.first_crawl_at is not None:
+            since_first = (now - cadence.first_crawl_at).total_seconds() / 3600
+            observed = min(window_hours, max(1.0, since_first))
+        gap_hours = observed / cadence.crawls_with_new
+        reason = f"{cadence.crawls_with_new}/{cadence.crawls} crawls with new items"
+    elif cadence.crawls > 0 or events:
+        return max_hours, f"no new items in {history_days}d"
+    else:
+        snapped = _snap_to_ladder(default_hours, min_hours, max_hours)
+        return snapped, "no history; fixed schedule"
+
+    return _snap_to_ladder(gap_hours / 2.0, min_hours, max_hours), reason
+
+
+def spread_offsets(plans: dict[str, float]) -> dict[str, float]:
+    """Evenly phase sources that share an interval across that interval (seconds)."""
+    buckets: dict[float, list[str]] = defaultdict(list)
+    for source_id, hours in plans.items():
+        buckets[hours].append(source_id)
+    offsets: dict[str, float] = {}
+    for hours, source_ids in buckets.items():
+        period = hours * 3600.0
+        ordered = sorted(source_ids)
+        for i, source_id in enumerate(ordered):
+            offsets[source_id] = period * i / len(ordered)
+    return offsets
+
+
+SCHEDULE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def schedule_anchor() -> datetime:
+    """Fixed phase origin so every restart and every day lands on the same slots."""
+    return SCHEDULE_EPOCH
+
+
+async def load_source_cadences(
+    source_ids: list[str],
+    *,
+    history_days: int,
+    now: datetime | None = None,
+) -> dict[str, SourceCadence]:
+    from app.services.stores.crawl_log_store import get_crawl_cadence_stats
+
+    current = now or datetime.now(timezone.utc)
+    since = current - timedelta(days=history_days)
+    wanted = set(source_ids)
+    cadences = {sid: SourceCadence(source_id=sid) for sid in source_ids}
+
+    stats = await get_crawl_cadence_stats(since=since, source_ids=source_ids)
+    for source_id, entry in stats.items():
+        cadence = cadences.get(source_id)
+        if cadence is None:
+            continue
+        cadence.crawls = int(entry["crawls"])
+        cadence.crawls_with_new = int(entry["crawls_with_new"])
+        cadence.first_crawl_at = _as_datetime(entry["first_crawl_at"])
+
+    try:
+        from app.db.client import get_client
+
+        client = get_client()
+        res = await (
+            client.table("articles")
+            .select("source_id,published_at")
+            .gte("published_at", since)
+            .in_("source_id", list(wanted))
+            .execute()
+        )
+        for row in res.data or []:
+            cadence = cadences.get(str(row.get("source_id") or ""))
+            published = _as_datetime(row.get("published_at"))
+            if cadence is not None and published is not None:
+                cadence.published.append(published)
+    except RuntimeError:
+        pass
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Adaptive scheduling: published_at history unavailable: %s", exc)
+
+    return cadences
+
+
+async def plan_adaptive_schedules(
+    configs: list[dict[str, Any]],
+    *,
+    now: datetime | None = None,
+) -> dict[str, AdaptivePlan]:
+    """Compute interval + phase for every adaptive source in ``configs``."""
+    adaptive = [c for c in configs if uses_adaptive_schedule(c)]
+    if not adaptive:
+        return {}
+    current = now or datetime.now(timezone.utc)
+    history_days = max(1, int(settings.ADAPTIVE_SCHEDULE_HISTORY_DAYS))
+    cadences = await load_source_cadences(
+        [c["id"] for c in adaptive], history_days=history_days, now=current
+    )
+
+    intervals: dict[str, float] = {}
+    reasons: dict[str, str] = {}
+    for config in adaptive:
+        min_hours, max_hours = _bounds(config)
+        hours, reason = estimate_interval_hours(
+            cadences[config["id"]],
+            now=current,
+            history_days=history_days,
+            min_hours=min_hours,
+            max_hours=max_hours,
+            default_hours=fixed_interval_hours(config),
+        )
+        intervals[config["id"]] = hours
+        reasons[config["id"]] = reason
+
+    offsets = spread_offsets(intervals)
+    plans = {
+        sid: AdaptivePlan(sid, intervals[sid], offsets[sid], reasons[sid]) for sid in intervals
+    }
+
+    fixed_per_day = sum(24.0 / fixed_interval_hours(c) for c in adaptive)
+    adaptive_per_day = sum(24.0 / p.interval_hours for p in plans.values())
+    logger.info(
+        "Adaptive schedule: %d sources, ~%.0f crawls/day (fixed schedule: ~%.0f)",
+        len(plans),
+        adaptive_per_day,
+        fixed_per_day,
+    )
+    return plans
+
+
+def _as_datetime(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, str) and value:
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
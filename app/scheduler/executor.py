@@ -0,0 +1,480 @@
+"""Out-of-process crawl executor.
+
+Crawls, the daily/policy pipelines and the monthly leadership crawl are CPU
+and I/O heavy (Playwright, HTML parsing, large JSON writes). With
+``CRAWL_EXECUTOR_PROCESSES > 0`` the API hands them to a pool of child
+processes (``python -m app.scheduler.executor``) instead of running them on
+the uvicorn event loop.
+
+IPC is newline-delimited JSON over the child's stdin/stdout:
+
+  parent -> child  {"id": 1, "op": "crawl_job", "params": {...}}
+  child -> parent  {"id": 1, "type": "progress", "event": "stage", "data": {...}}
+                   {"id": 1, "type": "result", "ok": true, "value": ...}
+                   {"id": 1, "type": "result", "ok": false, "error": "..."}
+
+Inside the child the real stdout is redirected to stderr, so prints and logs
+from crawlers land on the API console without corrupting the channel.
+Code running in either process can call ``report_progress()``; it streams to
+the caller's ``on_progress`` callback when executed out of process and is a
+no-op otherwise.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import itertools
+import json
+import logging
+import os
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from app.config import BASE_DIR, settings
+from app.utils.metrics import PIPELINE_STAGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[str, dict[str, Any]], None]
+
+# Lines can carry whole crawl results (items_dict), so allow large frames.
+_STREAM_LIMIT = 256 * 1024 * 1024
+
+_progress_sink: contextvars.ContextVar[ProgressCallback | None] = contextvars.ContextVar(
+    "crawl_executor_progress_sink", default=None
+)
+
+
+class CrawlExecutorError(RuntimeError):
+    """Raised when an out-of-process crawl op fails or its process dies."""
+
+
+def report_progress(event: str, **data: Any) -> None:
+    """Stream a progress event to whoever submitted the current executor op."""
+    sink = _progress_sink.get()
+    if sink is None:
+        return
+    try:
+        sink(event, data)
+    except Exception:  # noqa: BLE001
+        logger.debug("Dropping progress event %s", event, exc_info=True)
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return (json.dumps(message, ensure_ascii=False, default=_json_default) + "\n").encode(
+        "utf-8"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+
+class _ExecutorProcess:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.proc: asyncio.subprocess.Process | None = None
+        self.pending: dict[int, tuple[asyncio.Future, ProgressCallback | None]] = {}
+        self._reader: asyncio.Task | None = None
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self) -> None:
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "app.scheduler.executor",
+            str(self.index),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=str(BASE_DIR),
+            limit=_STREAM_LIMIT,
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+        logger.info("Crawl executor #%d started (pid=%d)", self.index, self.proc.pid)
+
+    async def send(
+        self,
+        request_id: int,
+        op: str,
+        params: dict[str, Any],
+        on_progress: ProgressCallback | None,
+    ) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = (future, on_progress)
+        assert self.proc is not None and self.proc.stdin is not None
+        try:
+            async with self._write_lock:
+                self.proc.stdin.write(_encode({"id": request_id, "op": op, "params": params}))
+                await self.proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self.pending.pop(request_id, None)
+            raise CrawlExecutorError(f"Crawl executor #{self.index} is gone: {e}") from e
+        return future
+
+    async def _read_loop(self) -> None:
+        assert self.proc is not None and self.proc.stdout is not None
+        try:
+            while True:
+                line = await self.proc.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    logger.warning("Crawl executor #%d sent a malformed frame", self.index)
+                    continue
+                self._dispatch(message)
+        finally:
+            returncode = await self.proc.wait()
+            error = CrawlExecutorError(
+                f"Crawl executor #{self.index} exited (code={returncode})"
+            )
+            for future, _ in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            if self.pending:
+                logger.error("%s with %d op(s) in flight", error, len(self.pending))
+            self.pending.clear()
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        entry = self.pending.get(message.get("id"))
+        if entry is None:
+            return
+        future, on_progress = entry
+        if message.get("type") == "progress":
+            if on_progress is not None:
+                try:
+                    on_progress(str(message.get("event") or ""), message.get("data") or {})
+                except Exception:  # noqa: BLE001
+                    logger.exception("Crawl executor progress callback failed")
+            return
+        self.pending.pop(message["id"], None)
+        if future.done():
+            return
+        if message.get("ok"):
+            future.set_result(message.get("value"))
+        else:
+            future.set_exception(CrawlExecutorError(str(message.get("error") or "unknown error")))
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        if self.proc is None:
+            return
+        if self.alive and self.proc.stdin is not None:
+            self.proc.stdin.close()  # EOF: the child cancels in-flight ops and exits
+            try:
+                await asyncio.wait_for(self.proc.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.proc.kill()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class CrawlExecutorPool:
+    """A fixed-size pool of executor child processes; ops go to the least busy one."""
+
+    def __init__(self, processes: int) -> None:
+        self._procs = [_ExecutorProcess(i) for i in range(max(1, processes))]
+        self._ids = itertools.count(1)
+        self._spawn_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        for proc in self._procs:
+            await proc.start()
+
+    async def stop(self) -> None:
+        await asyncio.gather(*(p.stop() for p in self._procs), return_exceptions=True)
+
+    @property
+    def in_flight(self) -> int:
+        return sum(len(p.pending) for p in self._procs)
+
+    async def submit(
+        self,
+        op: str,
+        params: dict[str, Any] | None = None,
+        *,
+        on_progress: ProgressCallback | None = None,
+    ) -> Any:
+        """Run ``op`` in a child process and return its JSON-decoded result."""
+        async with self._spawn_lock:
+            proc = min(self._procs, key=lambda p: (not p.alive, len(p.pending)))
+            if not proc.alive:
+                logger.warning("Restarting crawl executor #%d", proc.index)
+                await proc.start()
+        future = await proc.send(next(self._ids), op, params or {}, on_progress)
+        return await future
+
+
+_executor: CrawlExecutorPool | None = None
+
+
+def get_crawl_executor() -> CrawlExecutorPool | None:
+    """Return the running executor pool, or None when crawls run in-process."""
+    return _executor
+
+
+async def start_crawl_executor() -> CrawlExecutorPool | None:
+    global _executor
+    if _executor is not None or settings.CRAWL_EXECUTOR_PROCESSES <= 0:
+        return _executor
+    pool = CrawlExecutorPool(settings.CRAWL_EXECUTOR_PROCESSES)
+    await pool.start()
+    _executor = pool
+    return pool
+
+
+async def stop_crawl_executor() -> None:
+    global _executor
+    pool, _executor = _executor, None
+    if pool is not None:
+        await pool.stop()
+
+
+async def dispatch_crawl_job(
+    source_config: dict[str, Any],
+    *,
+    bypass_circuit: bool = False,
+) -> dict[str, Any] | None:
+    """APScheduler entry point: run execute_crawl_job in the executor pool."""
+    pool = get_crawl_executor()
+    if pool is None:
+        from app.scheduler.jobs import execute_crawl_job
+
+        result = await execute_crawl_job(source_config, bypass_circuit=bypass_circuit)
+        return _crawl_result_summary(result)
+    return await pool.submit(
+        "crawl_job",
+        {"source_config": source_config, "bypass_circuit": bypass_circuit},
+    )
+
+
+async def dispatch_daily_pipeline() -> None:
+    await _dispatch_pipeline("daily_pipeline", record_last=True)
+
+
+async def dispatch_policy_refresh_pipeline() -> None:
+    await _dispatch_pipeline("policy_refresh_pipeline", record_last=False)
+
+
+async def dispatch_university_leadership_monthly_job() -> None:
+    pool = get_crawl_executor()
+    if pool is None:
+        from app.scheduler.jobs import execute_university_leadership_monthly_job
+
+        await execute_university_leadership_monthly_job()
+        return
+    await pool.submit("university_leadership_monthly")
+
+
+async def _dispatch_pipeline(op: str, *, record_last: bool) -> None:
+    from app.scheduler import pipeline as pipeline_module
+
+    pool = get_crawl_executor()
+    if pool is None:
+        func = (
+            pipeline_module.execute_daily_pipeline
+            if op == "daily_pipeline"
+            else pipeline_module.execute_policy_refresh_pipeline
+        )
+        await func()
+        return
+
+    def _on_progress(event: str, data: dict[str, Any]) -> None:
+        if event == "stage":
+            logger.info(
+                "Pipeline [%s] stage %s: %s", op, data.get("name"), data.get("status")
+            )
+            # The stage ran in the child, so record its duration in this
+            # process's registry, which is the one /metrics serves.
+            if data.get("duration_seconds") is not None:
+                PIPELINE_STAGE_SECONDS.observe(
+                    float(data["duration_seconds"]), data.get("name"), data.get("status")
+                )
+
+    payload = await pool.submit(op, on_progress=_on_progress)
+    if record_last and isinstance(payload, dict):
+        await pipeline_module.record_pipeline_result(
+            pipeline_module.PipelineResult.from_dict(payload)
+        )
+
+
+def _crawl_result_summary(result: Any) -> dict[str, Any] | None:
+    if result is None:
+        return None
+    return {
+        "source_id": result.source_id,
+        "status": result.status.value,
+        "items_total": result.items_total,
+        "items_new": result.items_new,
+        "error_message": result.error_message,
+        "duration_seconds": result.duration_seconds,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Child side
+# ---------------------------------------------------------------------------
+
+
+async def _op_crawl_job(params: dict[str, Any]) -> Any:
+    from app.scheduler.jobs import execute_crawl_job
+
+    return _crawl_result_summary(
+        await execute_crawl_job(
+            params["source_config"],
+            bypass_circuit=bool(params.get("bypass_circuit")),
+        )
+    )
+
+
+async def _op_daily_pipeline(params: dict[str, Any]) -> Any:
+    from app.scheduler.pipeline import execute_daily_pipeline
+
+    return (await execute_daily_pipeline()).to_dict()
+
+
+async def _op_policy_refresh_pipeline(params: dict[str, Any]) -> Any:
+    from app.scheduler.pipeline import execute_policy_refresh_pipeline
+
+    return (await execute_policy_refresh_pipeline()).to_dict()
+
+
+async def _op_university_leadership_monthly(params: dict[str, Any]) -> Any:
+    from app.scheduler.jobs import execute_university_leadership_monthly_job
+
+    await execute_university_leadership_monthly_job()
+    return None
+
+
+async def _op_control_crawl_source(params: dict[str, Any]) -> Any:
+    from app.services.crawler_control_service import crawl_source_for_control_job
+
+    return await crawl_source_for_control_job(
+        params["source_config"],
+        export_format=params.get("export_format") or "json",
+    )
+
+
+_OPS: dict[str, Callable[[dict[str, Any]], Awaitable[Any]]] = {
+    "crawl_job": _op_crawl_job,
+    "daily_pipeline": _op_daily_pipeline,
+    "policy_refresh_pipeline": _op_policy_refresh_pipeline,
+    "university_leadership_monthly": _op_university_leadership_monthly,
+    "control_crawl_source": _op_control_crawl_source,
+}
+
+
+async def _child_main(index: int, out: Any) -> None:
+    from app.db.client import close_client, init_database_from_settings
+    from app.db.pool import close_pool
+    from app.services.llm.llm_transport import close_llm_clients
+    from app.services.stores.crawl_telemetry import (
+        close_crawl_telemetry,
+        flush_crawl_telemetry,
+    )
+
+    try:
+        await init_database_from_settings()
+    except Exception as e:  # noqa: BLE001
+        # Stores fall back to local JSON, same as an API started without DB.
+        logger.warning("Crawl executor #%d: database init failed: %s", index, e)
+
+    def _write(message: dict[str, Any]) -> None:
+        out.write(_encode(message))
+        out.flush()
+
+    async def _handle(request: dict[str, Any]) -> None:
+        request_id = request.get("id")
+
+        def _sink(event: str, data: dict[str, Any]) -> None:
+            _write({"id": request_id, "type": "progress", "event": event, "data": data})
+
+        _progress_sink.set(_sink)
+        op = _OPS.get(str(request.get("op")))
+        try:
+            if op is None:
+                raise ValueError(f"Unknown executor op: {request.get('op')}")
+            value = await op(request.get("params") or {})
+            # The parent reads crawl logs / source state right after the result.
+            await flush_crawl_telemetry()
+            _write({"id": request_id, "type": "result", "ok": True, "value": value})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # noqa: BLE001
+            logger.exception("Executor op %s failed", request.get("op"))
+            _write(
+                {
+                    "id": request_id,
+                    "type": "result",
+                    "ok": False,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            )
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=_STREAM_LIMIT)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    tasks: set[asyncio.Task] = set()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+            except ValueError:
+                logger.warning("Crawl executor #%d got a malformed frame", index)
+                continue
+            # Each task runs in its own context copy, so progress sinks don't leak.
+            task = asyncio.create_task(_handle(request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await close_crawl_telemetry()
+        try:
+            from app.crawlers.utils.playwright_pool import close_browser
+
+            await close_browser()
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to close Playwright: %s", e)
+        await close_llm_clients()
+        await close_client()
+        await close_pool()
+
+
+if __name__ == "__main__":
+    child_index = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    # Keep the protocol on the original stdout; everything else goes to stderr.
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"%(asctime)s [%(levelname)s] [executor-{child_index}] %(name)s: %(message)s",
+    )
+    # Run via the imported module, not __main__, so report_progress() calls from
+    # pipeline/crawler code see the same progress context variable.
+    from app.scheduler import executor as _executor_module
+
+    asyncio.run(_executor_module._child_main(child_index, protocol_out))
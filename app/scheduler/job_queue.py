@@ -0,0 +1,324 @@
+"""Durable Postgres crawl job queue for multi-node crawl workers.
+
+When ``CRAWL_EXECUTION_MODE=queue`` the API's SchedulerManager only enqueues
+one ``crawl_jobs`` row per due source; any number of ``python -m app.worker``
+processes claim rows with ``SELECT ... FOR UPDATE SKIP LOCKED``, hold a
+time-bounded lease renewed by heartbeats, and either complete the job or
+reschedule it with exponential backoff. Leases left behind by crashed workers
+expire and become claimable again.
+
+DB table: crawl_jobs
+  id BIGSERIAL PRIMARY KEY
+  source_id VARCHAR(128) NOT NULL
+  dimension VARCHAR(64)
+  priority INTEGER NOT NULL DEFAULT 0      -- higher runs first
+  status VARCHAR(16) NOT NULL              -- queued | running | succeeded | dead
+  attempts INTEGER NOT NULL DEFAULT 0
+  max_attempts INTEGER NOT NULL
+  run_after TIMESTAMPTZ NOT NULL           -- not claimable before this time
+  lease_owner VARCHAR(128)
+  lease_expires_at TIMESTAMPTZ
+  heartbeat_at TIMESTAMPTZ
+  last_error TEXT
+  enqueued_by VARCHAR(32)                  -- scheduler | manual
+  created_at / updated_at / started_at / finished_at TIMESTAMPTZ
+
+At most one queued-or-running job exists per source (partial unique index),
+mirroring APScheduler's ``coalesce=True, max_instances=1`` job defaults.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from typing import Any
+
+from app.config import settings
+from app.db.pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_DEAD = "dead"
+
+# Manual triggers from the API/console jump ahead of scheduled work.
+MANUAL_PRIORITY_BOOST = 1000
+_MAX_BACKOFF_SECONDS = 6 * 3600
+
+_SCHEMA_READY = False
+_SCHEMA_LOCK = asyncio.Lock()
+
+
+async def ensure_crawl_job_tables() -> None:
+    global _SCHEMA_READY
+    if _SCHEMA_READY:
+        return
+    async with _SCHEMA_LOCK:
+        if _SCHEMA_READY:
+            return
+        pool = get_pool()
+        await pool.execute(
+            """
+            CREATE TABLE IF NOT EXISTS crawl_jobs (
+                id BIGSERIAL PRIMARY KEY,
+                source_id VARCHAR(128) NOT NULL,
+                dimension VARCHAR(64),
+                priority INTEGER NOT NULL DEFAULT 0,
+                status VARCHAR(16) NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                run_after TIMESTAMPTZ NOT NULL DEFAULT now(),
+                lease_owner VARCHAR(128),
+                lease_expires_at TIMESTAMPTZ,
+                heartbeat_at TIMESTAMPTZ,
+                last_error TEXT,
+                enqueued_by VARCHAR(32),
+                created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                started_at TIMESTAMPTZ,
+                finished_at TIMESTAMPTZ
+            )
+            """
+        )
+        await pool.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_crawl_jobs_active_source "
+            "ON crawl_jobs(source_id) WHERE status IN ('queued', 'running')"
+        )
+        await pool.execute(
+            "CREATE INDEX IF NOT EXISTS idx_crawl_jobs_claimable "
+            "ON crawl_jobs(priority DESC, run_after) WHERE status = 'queued'"
+        )
+        await pool.execute(
+            "CREATE INDEX IF NOT EXISTS idx_crawl_jobs_lease "
+            "ON crawl_jobs(lease_expires_at) WHERE status = 'running'"
+        )
+        _SCHEMA_READY = True
+
+
+def resolve_job_priority(source_config: dict[str, Any]) -> int:
+    """Queue priority (higher runs first) for a source.
+
+    ``queue_priority`` in YAML wins outright. Otherwise the dimension value from
+    CRAWL_QUEUE_DIMENSION_PRIORITIES is used, with the catalog ``priority``
+    (1 = most important, default 2) breaking ties inside a dimension.
+    """
+    explicit = source_config.get("queue_priority")
+    if isinstance(explicit, int) and not isinstance(explicit, bool):
+        return explicit
+    dimension = str(source_config.get("dimension") or "").strip()
+    base = int(settings.CRAWL_QUEUE_DIMENSION_PRIORITIES.get(dimension, 0))
+    try:
+        catalog_priority = int(source_config.get("priority") or 2)
+    except (TypeError, ValueError):
+        catalog_priority = 2
+    return base - catalog_priority
+
+
+def compute_retry_backoff(attempts: int) -> float:
+    """Exponential backoff with jitter for the given (1-based) attempt count."""
+    base = max(1.0, float(settings.CRAWL_QUEUE_RETRY_BASE_SECONDS))
+    delay = min(_MAX_BACKOFF_SECONDS, base * (2 ** max(0, attempts - 1)))
+    return delay + random.uniform(0, base)
+
+
+async def enqueue_crawl_job(
+    source_config: dict[str, Any],
+    *,
+    priority_boost: int = 0,
+    enqueued_by: str = "scheduler",
+) -> int | None:
+    """Insert a queued job for this source; returns its id, or None if one is already pending."""
+    await ensure_crawl_job_tables()
+    source_id = str(source_config["id"])
+    job_id = await get_pool().fetchval(
+        """
+        INSERT INTO crawl_jobs (source_id, dimension, priority, max_attempts, enqueued_by)
+        VALUES ($1, $2, $3, $4, $5)
+        ON CONFLICT (source_id) WHERE status IN ('queued', 'running') DO NOTHING
+        RETURNING id
+        """,
+        source_id,
+        source_config.get("dimension"),
+        resolve_job_priority(source_config) + priority_boost,
+        max(1, int(settings.CRAWL_QUEUE_MAX_ATTEMPTS)),
+        enqueued_by,
+    )
+    if job_id is None:
+        logger.debug("Crawl job already pending for %s; enqueue skipped", source_id)
+    return job_id
+
+
+async def enqueue_scheduled_crawl(source_config: dict[str, Any]) -> None:
+    """APScheduler entry point used instead of execute_crawl_job in queue mode."""
+    job_id = await enqueue_crawl_job(source_config)
+    if job_id is not None:
+        logger.info("Enqueued crawl job %d: %s", job_id, source_config["id"])
+
+
+async def claim_crawl_jobs(
+    worker_id: str,
+    limit: int,
+    *,
+    lease_seconds: float | None = None,
+) -> list[dict[str, Any]]:
+    """Lease up to ``limit`` due jobs (highest priority first) for ``worker_id``.
+
+    Running jobs whose lease has expired are reclaimed as if queued; those that
+    already used every attempt are marked dead instead of being retried.
+    """
+    if limit <= 0:
+        return []
+    await ensure_crawl_job_tables()
+    lease = float(lease_seconds or settings.CRAWL_QUEUE_LEASE_SECONDS)
+    pool = get_pool()
+    await pool.execute(
+        """
+        UPDATE crawl_jobs
+        SET status = 'dead',
+            last_error = COALESCE(last_error, 'lease expired'),
+            lease_owner = NULL,
+            lease_expires_at = NULL,
+            finished_at = now(),
+            updated_at = now()
+        WHERE status = 'running'
+          AND lease_expires_at < now()
+          AND attempts >= max_attempts
+        """
+    )
+    rows = await pool.fetch(
+        """
+        WITH picked AS (
+            SELECT id
+            FROM crawl_jobs
+            WHERE (status = 'queued' AND run_after <= now())
+               OR (status = 'running' AND lease_expires_at < now())
+            ORDER BY priority DESC, run_after ASC, id ASC
+            LIMIT $2
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE crawl_jobs AS j
+        SET status = 'running',
+            lease_owner = $1,
+            lease_expires_at = now() + make_interval(secs => $3),
+            heartbeat_at = now(),
+            attempts = j.attempts + 1,
+            started_at = now(),
+            updated_at = now()
+        FROM picked
+        WHERE j.id = picked.id
+        RETURNING j.*
+        """,
+        worker_id,
+        int(limit),
+        lease,
+    )
+    return [dict(r) for r in rows]
+
+
+async def heartbeat_crawl_jobs(
+    worker_id: str,
+    job_ids: list[int],
+    *,
+    lease_seconds: float | None = None,
+) -> set[int]:
+    """Extend leases still owned by ``worker_id``; returns the ids that were renewed."""
+    if not job_ids:
+        return set()
+    lease = float(lease_seconds or settings.CRAWL_QUEUE_LEASE_SECONDS)
+    rows = await get_pool().fetch(
+        """
+        UPDATE crawl_jobs
+        SET heartbeat_at = now(),
+            lease_expires_at = now() + make_interval(secs => $3),
+            updated_at = now()
+        WHERE id IN (SELECT jsonb_array_elements_text($1::jsonb)::bigint)
+          AND lease_owner = $2
+          AND status = 'running'
+        RETURNING id
+        """,
+        json.dumps([int(i) for i in job_ids]),
+        worker_id,
+        lease,
+    )
+    return {int(r["id"]) for r in rows}
+
+
+async def complete_crawl_job(worker_id: str, job_id: int) -> bool:
+    status = await get_pool().execute(
+        """
+        UPDATE crawl_jobs
+        SET status = 'succeeded',
+            lease_owner = NULL,
+            lease_expires_at = NULL,
+            last_error = NULL,
+            finished_at = now(),
+            updated_at = now()
+        WHERE id = $1 AND lease_owner = $2 AND status = 'running'
+        """,
+        job_id,
+        worker_id,
+    )
+    return status.endswith(" 1")
+
+
+async def fail_crawl_job(
+    worker_id: str,
+    job_id: int,
+    error: str,
+    *,
+    retryable: bool = True,
+) -> str | None:
+    """Requeue with backoff, or mark dead when attempts are exhausted.
+
+    Returns the job's new status, or None if the lease was lost meanwhile.
+    """
+    pool = get_pool()
+    attempts = await pool.fetchval(
+        "SELECT attempts FROM crawl_jobs WHERE id = $1 AND lease_owner = $2",
+        job_id,
+        worker_id,
+    )
+    if attempts is None:
+        return None
+    new_status = await pool.fetchval(
+        """
+        UPDATE crawl_jobs
+        SET status = CASE
+                WHEN $4 AND attempts < max_attempts THEN 'queued'
+                ELSE 'dead'
+            END,
+            run_after = CASE
+                WHEN $4 AND attempts < max_attempts
+                THEN now() + make_interval(secs => $5)
+                ELSE run_after
+            END,
+            finished_at = CASE
+                WHEN $4 AND attempts < max_attempts THEN NULL
+                ELSE now()
+            END,
+            last_error = $3,
+            lease_owner = NULL,
+            lease_expires_at = NULL,
+            updated_at = now()
+        WHERE id = $1 AND lease_owner = $2 AND status = 'running'
+        RETURNING status
+        """,
+        job_id,
+        worker_id,
+        (error or "")[:2000],
+        retryable,
+        compute_retry_backoff(int(attempts)),
+    )
+    return new_status
+
+
+async def get_crawl_queue_stats() -> dict[str, int]:
+    """Job counts by status, for health/console views."""
+    await ensure_crawl_job_tables()
+    rows = await get_pool().fetch(
+        "SELECT status, COUNT(*)::bigint AS n FROM crawl_jobs GROUP BY status"
+    )
+    return {str(r["status"]): int(r["n"]) for r in rows}
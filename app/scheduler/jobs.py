@@ -4,45 +4,120 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
-from app.crawlers.base import CrawlStatus
+from app.crawlers.base import CrawlResult, CrawlStatus
 from app.crawlers.registry import CrawlerRegistry
+from app.crawlers.utils.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_OPEN,
+    probe_source,
+    source_circuit_state,
+)
 from app.crawlers.utils.json_storage import save_crawl_result_json
-from app.services.stores.crawl_log_store import append_crawl_log
-from app.services.stores.source_state import update_source_state
+from app.services.stores.crawl_telemetry import get_crawl_telemetry
+from app.services.stores.source_state import get_source_state
 
 logger = logging.getLogger(__name__)
 
 
-async def execute_crawl_job(source_config: dict[str, Any]) -> None:
-    """Execute a crawl for a single source. Called by APScheduler."""
+async def _gate_source_circuit(
+    source_config: dict[str, Any], now: datetime
+) -> CrawlResult | None:
+    """Apply the source circuit breaker; a returned result means do not crawl."""
     source_id = source_config["id"]
-    logger.info("Starting crawl: %s", source_id)
+    state = await get_source_state(source_id)
+    circuit, next_probe_at = source_circuit_state(
+        state.get("consecutive_failures"), state.get("last_crawl_at"), now=now
+    )
+    if circuit == CIRCUIT_CLOSED:
+        return None
+    if circuit == CIRCUIT_OPEN:
+        message = f"Circuit open until {next_probe_at.isoformat() if next_probe_at else '?'}"
+        logger.info("Skipping crawl: %s | %s", source_id, message)
+        return CrawlResult(
+            source_id=source_id,
+            status=CrawlStatus.SKIPPED,
+            error_message=message,
+            started_at=now,
+            finished_at=now,
+        )
+
+    error = await probe_source(source_config)
+    if error is None:
+        logger.info("Circuit half-open for %s: probe answered, crawling", source_id)
+        return None
+
+    finished = datetime.now(timezone.utc)
+    result = CrawlResult(
+        source_id=source_id,
+        status=CrawlStatus.FAILED,
+        error_message=f"Circuit probe failed: {error}",
+        started_at=now,
+        finished_at=finished,
+        duration_seconds=(finished - now).total_seconds(),
+    )
+    logger.warning("Circuit stays open for %s: %s", source_id, result.error_message)
+    await get_crawl_telemetry().record_crawl_outcome(
+        source_id,
+        status=result.status.value,
+        error_message=result.error_message,
+        started_at=result.started_at,
+        finished_at=result.finished_at,
+        duration_seconds=result.duration_seconds,
+        timings=result.timings,
+    )
+    return result
+
 
+async def execute_crawl_job(
+    source_config: dict[str, Any],
+    *,
+    bypass_circuit: bool = False,
+) -> CrawlResult | None:
+    """Execute a crawl for a single source. Called by APScheduler or app.worker.
+
+    Returns the crawl result, or None if the crawler could not be created.
+    While the source's circuit breaker is open the result is SKIPPED (or
+    FAILED if the half-open probe fails); manual triggers pass
+    ``bypass_circuit=True``.
+    """
+    source_id = source_config["id"]
     now = datetime.now(timezone.utc)
+    if not bypass_circuit:
+        gated = await _gate_source_circuit(source_config, now)
+        if gated is not None:
+            return gated
+
+    logger.info("Starting crawl: %s", source_id)
     crawler_class = str(source_config.get("crawler_class") or "").strip().lower()
 
     try:
         crawler = CrawlerRegistry.create_crawler(source_config)
     except Exception as e:
         logger.error("Failed to create crawler for %s: %s", source_id, e)
-        await append_crawl_log(
-            source_id=source_id,
+        await get_crawl_telemetry().record_crawl_outcome(
+            source_id,
             status=CrawlStatus.FAILED.value,
             error_message=f"Crawler creation failed: {e}",
             started_at=now,
             finished_at=now,
         )
-        await update_source_state(source_id, last_crawl_at=now)
-        return
+        return None
 
     result = await crawler.run()
 
-    # For Twitter KOL source, also ingest into unified social_posts/social_accounts tables.
-    if crawler_class == "twitter_kol":
+    # For Twitter KOL source, also ingest the crawler's fetched bundle into the
+    # unified social_posts/social_accounts tables (no second API fetch).
+    social_bundle = getattr(crawler, "social_bundle", None)
+    if crawler_class == "twitter_kol" and social_bundle is not None:
         try:
-            from app.services.external.social_kol_service import crawl_and_ingest_twitter_source
+            from app.services.external.social_kol_service import (
+                ingest_twitter_bundle,
+                select_ingest_cohort,
+            )
 
-            social_result = await crawl_and_ingest_twitter_source(source_config)
+            social_result = await ingest_twitter_bundle(
+                select_ingest_cohort(social_bundle, source_config)
+            )
             logger.info(
                 "Social ingest complete: %s | users=%d | posts_upserted=%d | skipped=%d",
                 source_id,
@@ -59,30 +134,19 @@ async def execute_crawl_job(source_config: dict[str, Any]) -> None:
     except Exception as e:
         logger.warning("Failed to persist crawl result for %s: %s", source_id, e)
 
-    # Log the crawl result
-    await append_crawl_log(
-        source_id=source_id,
+    # Queue the crawl log row and source runtime state (flushed in batches)
+    await get_crawl_telemetry().record_crawl_outcome(
+        source_id,
         status=result.status.value,
         items_total=result.items_total,
         items_new=result.items_new,
         error_message=result.error_message,
         started_at=result.started_at,
-        finished_at=result.finished_at,
+        finished_at=result.finished_at or datetime.now(timezone.utc),
         duration_seconds=result.duration_seconds,
+        timings=result.timings,
     )
 
-    # Update source runtime state
-    finished = result.finished_at or datetime.now(timezone.utc)
-    if result.status in (CrawlStatus.SUCCESS, CrawlStatus.NO_NEW_CONTENT):
-        await update_source_state(
-            source_id,
-            last_crawl_at=finished,
-            last_success_at=finished,
-            reset_failures=True,
-        )
-    else:
-        await update_source_state(source_id, last_crawl_at=finished)
-
     logger.info(
         "Crawl complete: %s | status=%s | new=%d/%d | duration=%.1fs",
         source_id,
@@ -91,6 +155,7 @@ async def execute_crawl_job(source_config: dict[str, Any]) -> None:
         result.items_total,
         result.duration_seconds,
     )
+    return result
 
 
 async def execute_university_leadership_monthly_job() -> None:
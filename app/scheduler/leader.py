@@ -0,0 +1,197 @@
+"""Scheduler leader election via a Postgres advisory lock.
+
+Every uvicorn worker runs a ``SchedulerLeaderElection``. The one holding the
+session-level advisory lock runs the SchedulerManager; the others only serve
+HTTP. When the leader's process or DB session dies, Postgres releases the
+lock and a follower takes over on its next attempt.
+
+Followers expose a ``SchedulerCommandProxy`` through ``get_scheduler_manager()``
+so manual triggers hitting any worker are forwarded to the leader with
+``NOTIFY scheduler_commands``. The leader's pipeline results are shared
+through ``pipeline_result_store``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.config import settings
+from app.db.pool import connect_dedicated, get_pool
+from app.scheduler.manager import (
+    SchedulerManager,
+    is_schedulable_source,
+    load_all_source_configs,
+    set_remote_scheduler,
+)
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary but fixed: every API process must use the same key.
+SCHEDULER_LOCK_KEY = 0x5A47_4349_5343_4844  # "ZGCISCHD"
+COMMAND_CHANNEL = "scheduler_commands"
+
+_ORIGIN = f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def leader_is_running() -> bool:
+    """Whether some worker currently holds the scheduler lock in this database."""
+    return bool(
+        await get_pool().fetchval(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM pg_locks
+                WHERE locktype = 'advisory' AND granted
+                  AND database = (SELECT oid FROM pg_database WHERE datname = current_database())
+                  AND classid = $1::bigint::oid AND objid = $2::bigint::oid AND objsubid = 1
+            )
+            """,
+            SCHEDULER_LOCK_KEY >> 32,
+            SCHEDULER_LOCK_KEY & 0xFFFF_FFFF,
+        )
+    )
+
+
+class SchedulerCommandProxy:
+    """Stand-in for SchedulerManager on follower workers; forwards triggers to the leader."""
+
+    def __init__(self) -> None:
+        self._source_configs = [
+            cfg for cfg in load_all_source_configs() if is_schedulable_source(cfg)
+        ]
+
+    async def trigger_pipeline(self) -> None:
+        await self._send({"action": "trigger_pipeline"})
+        logger.info("Forwarded daily pipeline trigger to scheduler leader")
+
+    async def trigger_source(self, source_id: str) -> None:
+        if not any(c["id"] == source_id for c in self._source_configs):
+            raise ValueError(f"Source not found: {source_id}")
+        await self._send({"action": "trigger_source", "source_id": source_id})
+        logger.info("Forwarded crawl trigger for %s to scheduler leader", source_id)
+
+    @property
+    def source_configs(self) -> list[dict[str, Any]]:
+        return self._source_configs
+
+    async def _send(self, command: dict[str, Any]) -> None:
+        payload = json.dumps({**command, "origin": _ORIGIN})
+        await get_pool().execute("SELECT pg_notify($1, $2)", COMMAND_CHANNEL, payload)
+
+
+class SchedulerLeaderElection:
+    def __init__(
+        self,
+        *,
+        on_elected: Callable[[SchedulerManager], Awaitable[None]] | None = None,
+        retry_seconds: float | None = None,
+    ) -> None:
+        self._on_elected = on_elected
+        self._interval = max(1.0, float(retry_seconds or settings.SCHEDULER_LEADER_RETRY_SECONDS))
+        self._manager: SchedulerManager | None = None
+        self._task: asyncio.Task | None = None
+        self._command_tasks: set[asyncio.Task] = set()
+
+    @property
+    def is_leader(self) -> bool:
+        return self._manager is not None
+
+    async def start(self) -> None:
+        set_remote_scheduler(SchedulerCommandProxy())
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        set_remote_scheduler(None)
+
+    async def _run(self) -> None:
+        announced_follower = False
+        while True:
+            conn = None
+            try:
+                conn = await connect_dedicated()
+                while not await conn.fetchval(
+                    "SELECT pg_try_advisory_lock($1)", SCHEDULER_LOCK_KEY
+                ):
+                    if not announced_follower:
+                        logger.info("Scheduler leader is another worker; serving HTTP only")
+                        announced_follower = True
+                    await asyncio.sleep(self._interval)
+                await self._lead(conn)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Scheduler leader election error: %s", e)
+            finally:
+                await self._step_down()
+                if conn is not None and not conn.is_closed():
+                    try:
+                        await conn.close()  # releases the advisory lock
+                    except Exception:  # noqa: BLE001
+                        pass
+            announced_follower = False
+            await asyncio.sleep(self._interval)
+
+    async def _lead(self, conn: Any) -> None:
+        manager = SchedulerManager()
+        self._manager = manager
+        await manager.start()
+        set_remote_scheduler(None)
+        await conn.add_listener(COMMAND_CHANNEL, self._on_command)
+        logger.info("This worker (%s) is now the scheduler leader", _ORIGIN)
+
+        if self._on_elected is not None:
+            try:
+                await self._on_elected(manager)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Scheduler leader startup hook failed: %s", e)
+
+        # Holding the lock is tied to this session: if it can no longer answer
+        # a trivial query, assume the lock is gone and step down.
+        while True:
+            await asyncio.sleep(self._interval)
+            await conn.execute("SELECT 1", timeout=self._interval)
+
+    async def _step_down(self) -> None:
+        manager, self._manager = self._manager, None
+        if manager is None:
+            return
+        logger.warning("Stepping down as scheduler leader")
+        try:
+            await manager.stop()
+        except Exception as e:  # noqa: BLE001
+            logger.error("Scheduler failed to stop cleanly: %s", e)
+        set_remote_scheduler(SchedulerCommandProxy())
+
+    def _on_command(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            command = json.loads(payload)
+        except ValueError:
+            return
+        task = asyncio.get_running_loop().create_task(self._handle_command(command))
+        self._command_tasks.add(task)
+        task.add_done_callback(self._command_tasks.discard)
+
+    async def _handle_command(self, command: dict[str, Any]) -> None:
+        manager = self._manager
+        if manager is None:
+            return
+        action = command.get("action")
+        try:
+            if action == "trigger_pipeline":
+                await manager.trigger_pipeline()
+            elif action == "trigger_source":
+                await manager.trigger_source(str(command.get("source_id") or ""))
+            else:
+                logger.warning("Unknown scheduler command: %s", action)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "Scheduler command %s from %s failed: %s", action, command.get("origin"), e
+            )
@@ -4,21 +4,29 @@ import logging
 import random
 from typing import Any
 
-import yaml
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import settings
+from app.scheduler.adaptive import plan_adaptive_schedules, schedule_anchor
+from app.scheduler.source_catalog import get_source_catalog
 
 logger = logging.getLogger(__name__)
 
 # Module-level reference for access from API routes
 _scheduler_manager: SchedulerManager | None = None
+# On follower workers (see app.scheduler.leader) triggers go through this proxy.
+_remote_scheduler: Any | None = None
 
 
 def get_scheduler_manager() -> SchedulerManager | None:
-    return _scheduler_manager
+    return _scheduler_manager or _remote_scheduler
+
+
+def set_remote_scheduler(proxy: Any | None) -> None:
+    global _remote_scheduler
+    _remote_scheduler = proxy
 
 
 def _make_trigger(config: dict[str, Any]) -> IntervalTrigger | CronTrigger | None:
@@ -35,6 +43,8 @@ def _make_trigger(config: dict[str, Any]) -> IntervalTrigger | CronTrigger | Non
         "daily_bj_4": lambda: CronTrigger(hour=4, minute=0, timezone="Asia/Shanghai"),
         "weekly": lambda: CronTrigger(day_of_week="mon", hour=3),
         "monthly": lambda: CronTrigger(day=1, hour=2),
+        # Placeholder until app.scheduler.adaptive has a plan for the source.
+        "adaptive": lambda: CronTrigger(hour=6, minute=0),
     }
     factory = mapping.get(schedule_key)
     return factory() if factory else None
@@ -62,44 +72,12 @@ def is_schedulable_source(config: dict[str, Any]) -> bool:
 
 
 def load_all_source_configs() -> list[dict[str, Any]]:
-    """Load all YAML source config files and return a flat list."""
-    all_sources: list[dict[str, Any]] = []
-    sources_dir = settings.SOURCES_DIR
-    if not sources_dir.exists():
-        logger.warning("Sources directory not found: %s", sources_dir)
-        return all_sources
-
-    for yaml_file in sorted(sources_dir.rglob("*.yaml")):
-        if not yaml_file.is_file():
-            continue
-        with open(yaml_file) as f:
-            data = yaml.safe_load(f)
-        if data is None:
-            continue
-
-        dimension = data.get("dimension", yaml_file.stem)
-        dimension_name = data.get("dimension_name")
-        dimension_description = data.get("description")
-        default_keywords = data.get("default_keyword_filter", [])
-        default_blacklist = data.get("default_keyword_blacklist", [])
-
-        for source in data.get("sources", []):
-            source.setdefault("dimension", dimension)
-            source.setdefault("dimension_name", dimension_name)
-            source.setdefault("dimension_description", dimension_description)
-            source.setdefault("source_file", yaml_file.name)
-            source.setdefault(
-                "source_file_path",
-                yaml_file.relative_to(sources_dir).as_posix(),
-            )
-            if "keyword_filter" not in source:
-                source["keyword_filter"] = default_keywords
-            if "keyword_blacklist" not in source:
-                source["keyword_blacklist"] = default_blacklist
-            all_sources.append(source)
+    """Return a flat list of all YAML source configs (fresh mutable copies).
 
-    logger.info("Loaded %d source configs from %s", len(all_sources), sources_dir)
-    return all_sources
+    Parsing is cached per file in app.scheduler.source_catalog; read-only
+    callers should use get_source_catalog() directly.
+    """
+    return get_source_catalog().mutable_configs()
 
 
 class SchedulerManager:
@@ -108,6 +86,7 @@ class SchedulerManager:
             job_defaults={"coalesce": True, "max_instances": 1}
         )
         self._source_configs: list[dict[str, Any]] = []
+        self._adaptive_plans: dict[str, Any] = {}
 
     async def start(self) -> None:
         global _scheduler_manager
@@ -117,14 +96,56 @@ class SchedulerManager:
             cfg for cfg in load_all_source_configs() if is_schedulable_source(cfg)
         ]
 
-        # Import job function here to avoid circular imports
-        from app.scheduler.jobs import execute_crawl_job
+        # Import job functions here to avoid circular imports. The dispatch_*
+        # wrappers run the work in executor child processes when
+        # CRAWL_EXECUTOR_PROCESSES > 0, otherwise on this event loop.
+        from app.scheduler.executor import (
+            dispatch_crawl_job,
+            dispatch_daily_pipeline,
+            dispatch_policy_refresh_pipeline,
+            dispatch_university_leadership_monthly_job,
+            start_crawl_executor,
+        )
+
+        try:
+            await start_crawl_executor()
+        except Exception as e:
+            logger.error("Crawl executor failed to start; crawling in-process: %s", e)
+
+        # In queue mode this process only enqueues; `python -m app.worker` crawls.
+        crawl_job_func = dispatch_crawl_job
+        if self.queue_mode:
+            from app.scheduler.job_queue import enqueue_scheduled_crawl, ensure_crawl_job_tables
+
+            await ensure_crawl_job_tables()
+            crawl_job_func = enqueue_scheduled_crawl
+
+        self._adaptive_plans = await self._plan_adaptive_schedules()
+        adaptive_anchor = schedule_anchor()
 
         for config in self._source_configs:
             if not config.get("is_enabled", True):
                 continue
 
             schedule_key = config.get("schedule", "daily")
+            plan = self._adaptive_plans.get(config["id"])
+            if plan is not None:
+                # Adaptive plans are already phase-spread; no random jitter.
+                self.scheduler.add_job(
+                    crawl_job_func,
+                    trigger=plan.trigger(adaptive_anchor),
+                    id=f"crawl_{config['id']}",
+                    kwargs={"source_config": config},
+                    replace_existing=True,
+                )
+                logger.debug(
+                    "Registered crawl job: crawl_%s (adaptive every %sh: %s)",
+                    config["id"],
+                    plan.interval_hours,
+                    plan.reason,
+                )
+                continue
+
             trigger = _make_trigger(config)
             if trigger is None:
                 logger.warning(
@@ -140,7 +161,7 @@ class SchedulerManager:
 
             job_id = f"crawl_{config['id']}"
             self.scheduler.add_job(
-                execute_crawl_job,
+                crawl_job_func,
                 trigger=trigger,
                 id=job_id,
                 kwargs={"source_config": config},
@@ -150,14 +171,8 @@ class SchedulerManager:
             logger.debug("Registered crawl job: %s (schedule=%s)", job_id, schedule_key)
 
         # Register daily pipeline job (5 stages)
-        from app.scheduler.jobs import execute_university_leadership_monthly_job
-        from app.scheduler.pipeline import (
-            execute_daily_pipeline,
-            execute_policy_refresh_pipeline,
-        )
-
         self.scheduler.add_job(
-            execute_university_leadership_monthly_job,
+            dispatch_university_leadership_monthly_job,
             trigger=CronTrigger(day=1, hour=2, minute=30),
             id="monthly_university_leadership_full",
             replace_existing=True,
@@ -165,7 +180,7 @@ class SchedulerManager:
         )
 
         self.scheduler.add_job(
-            execute_daily_pipeline,
+            dispatch_daily_pipeline,
             trigger=CronTrigger(
                 hour=settings.PIPELINE_CRON_HOUR,
                 minute=settings.PIPELINE_CRON_MINUTE,
@@ -176,20 +191,30 @@ class SchedulerManager:
         )
 
         self.scheduler.add_job(
-            execute_policy_refresh_pipeline,
+            dispatch_policy_refresh_pipeline,
             trigger=_make_policy_refresh_trigger(),
             id="policy_refresh_pipeline",
             replace_existing=True,
             misfire_grace_time=1800,
         )
 
+        if self._adaptive_plans:
+            self.scheduler.add_job(
+                self.refresh_adaptive_schedules,
+                trigger=CronTrigger(hour=0, minute=17),
+                id="adaptive_schedule_refresh",
+                replace_existing=True,
+                misfire_grace_time=3600,
+            )
+
         self.scheduler.start()
         enabled_count = len(
             [c for c in self._source_configs if c.get("is_enabled", True)]
         )
         logger.info(
-            "Scheduler started with %d source jobs + monthly leadership full crawl + "
+            "Scheduler started (%s mode) with %d source jobs + monthly leadership full crawl + "
             "daily pipeline (%02d:%02d UTC) + policy refresh at %s:%02d %s",
+            "queue" if self.queue_mode else "inprocess",
             enabled_count,
             settings.PIPELINE_CRON_HOUR,
             settings.PIPELINE_CRON_MINUTE,
@@ -202,14 +227,22 @@ class SchedulerManager:
         global _scheduler_manager
         self.scheduler.shutdown(wait=False)
         _scheduler_manager = None
+
+        from app.scheduler.executor import stop_crawl_executor
+
+        await stop_crawl_executor()
+
+        from app.services.stores.crawl_telemetry import close_crawl_telemetry
+
+        await close_crawl_telemetry()
         logger.info("Scheduler stopped")
 
     async def trigger_pipeline(self) -> None:
         """Manually trigger the full daily pipeline."""
-        from app.scheduler.pipeline import execute_daily_pipeline
+        from app.scheduler.executor import dispatch_daily_pipeline
 
         self.scheduler.add_job(
-            execute_daily_pipeline,
+            dispatch_daily_pipeline,
             id="manual_pipeline",
             replace_existing=True,
         )
@@ -221,11 +254,65 @@ class SchedulerManager:
         if config is None:
             raise ValueError(f"Source not found: {source_id}")
 
-        from app.scheduler.jobs import execute_crawl_job
+        if self.queue_mode:
+            from app.scheduler.job_queue import MANUAL_PRIORITY_BOOST, enqueue_crawl_job
+
+            job_id = await enqueue_crawl_job(
+                config,
+                priority_boost=MANUAL_PRIORITY_BOOST,
+                enqueued_by="manual",
+            )
+            logger.info(
+                "Manually enqueued crawl for source: %s (job=%s)",
+                source_id,
+                job_id if job_id is not None else "already pending",
+            )
+            return
 
-        self.scheduler.add_job(execute_crawl_job, kwargs={"source_config": config})
+        from app.scheduler.executor import dispatch_crawl_job
+
+        # Manual runs ignore the source circuit breaker.
+        self.scheduler.add_job(
+            dispatch_crawl_job,
+            kwargs={"source_config": config, "bypass_circuit": True},
+        )
         logger.info("Manually triggered crawl for source: %s", source_id)
 
+    async def _plan_adaptive_schedules(self) -> dict[str, Any]:
+        enabled = [c for c in self._source_configs if c.get("is_enabled", True)]
+        try:
+            return await plan_adaptive_schedules(enabled)
+        except Exception as e:
+            logger.error("Adaptive scheduling unavailable; using fixed schedules: %s", e)
+            return {}
+
+    async def refresh_adaptive_schedules(self) -> int:
+        """Re-estimate adaptive intervals and reschedule sources whose plan changed."""
+        plans = await self._plan_adaptive_schedules()
+        if not plans:
+            return 0
+        anchor = schedule_anchor()
+        changed = 0
+        for source_id, plan in plans.items():
+            previous = self._adaptive_plans.get(source_id)
+            if previous is not None and (
+                previous.interval_hours,
+                previous.offset_seconds,
+            ) == (plan.interval_hours, plan.offset_seconds):
+                continue
+            job_id = f"crawl_{source_id}"
+            if self.scheduler.get_job(job_id) is None:
+                continue
+            self.scheduler.reschedule_job(job_id, trigger=plan.trigger(anchor))
+            changed += 1
+        self._adaptive_plans = plans
+        logger.info("Adaptive schedule refresh: %d source jobs rescheduled", changed)
+        return changed
+
+    @property
+    def queue_mode(self) -> bool:
+        return settings.CRAWL_EXECUTION_MODE.strip().lower() == "queue"
+
     @property
     def source_configs(self) -> list[dict[str, Any]]:
         return self._source_configs
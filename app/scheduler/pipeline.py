@@ -57,6 +57,25 @@ class PipelineResult:
             return (self.finished_at - self.started_at).total_seconds()
         return 0.0
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PipelineResult:
+        """Rebuild a result from ``to_dict()`` output (e.g. from an executor process)."""
+        finished_at = data.get("finished_at")
+        return cls(
+            started_at=datetime.fromisoformat(data["started_at"]),
+            finished_at=datetime.fromisoformat(finished_at) if finished_at else None,
+            stages=[
+                StageResult(
+                    name=s["name"],
+                    status=s.get("status", "unknown"),
+                    duration_seconds=float(s.get("duration_seconds") or 0.0),
+                    summary=s.get("summary") or {},
+                    error=s.get("error"),
+                )
+                for s in data.get("stages", [])
+            ],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "status": self.status,
@@ -87,14 +106,45 @@ def get_last_pipeline_result() -> PipelineResult | None:
     return _last_pipeline_result
 
 
+def set_last_pipeline_result(result: PipelineResult) -> None:
+    """Record a pipeline run that executed in another process."""
+    global _last_pipeline_result
+    _last_pipeline_result = result
+
+
+async def record_pipeline_result(result: PipelineResult) -> None:
+    """Remember ``result`` here and in the DB, where follower workers read it."""
+    from app.services.stores.pipeline_result_store import save_pipeline_result
+
+    set_last_pipeline_result(result)
+    await save_pipeline_result("daily", result.to_dict(), result.finished_at)
+
+
+async def load_last_pipeline_result() -> PipelineResult | None:
+    """The latest daily run on any worker, falling back to this process's memory."""
+    from app.services.stores.pipeline_result_store import load_pipeline_result
+
+    stored = await load_pipeline_result("daily")
+    if stored is not None:
+        try:
+            return PipelineResult.from_dict(stored)
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Ignoring unreadable stored pipeline result: %s", exc)
+    return _last_pipeline_result
+
+
 # ---------------------------------------------------------------------------
 # Stage runner
 # ---------------------------------------------------------------------------
 
 async def _run_stage(name: str, func, **kwargs) -> StageResult:
     """Run a pipeline stage with timing and error isolation."""
+    from app.scheduler.executor import report_progress
+    from app.utils.metrics import PIPELINE_STAGE_SECONDS
+
     stage = StageResult(name=name, status="running")
     stage.started_at = datetime.now(timezone.utc)
+    report_progress("stage", name=name, status=stage.status)
     logger.info("=" * 70)
     logger.info("  Pipeline Stage: %s", name)
     logger.info("=" * 70)
@@ -113,6 +163,13 @@ async def _run_stage(name: str, func, **kwargs) -> StageResult:
             stage.finished_at - stage.started_at
         ).total_seconds()
         logger.info("  Duration: %.1fs", stage.duration_seconds)
+        PIPELINE_STAGE_SECONDS.observe(stage.duration_seconds, name, stage.status)
+        report_progress(
+            "stage",
+            name=name,
+            status=stage.status,
+            duration_seconds=round(stage.duration_seconds, 1),
+        )
     return stage
 
 
@@ -338,8 +395,6 @@ async def execute_daily_pipeline() -> PipelineResult:
     Called by APScheduler daily. Each stage runs sequentially.
     If crawling fails, processing stages still run on existing data.
     """
-    global _last_pipeline_result
-
     from app.config import settings
     from app.services.llm.llm_service import has_llm_provider_configured
 
@@ -426,7 +481,7 @@ async def execute_daily_pipeline() -> PipelineResult:
     pipeline.stages.append(briefing_stage)
 
     pipeline.finished_at = datetime.now(timezone.utc)
-    _last_pipeline_result = pipeline
+    await record_pipeline_result(pipeline)
 
     logger.info("=" * 70)
     logger.info(
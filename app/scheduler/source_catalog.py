@@ -0,0 +1,206 @@
+"""Process-wide compiled source catalog.
+
+Parsing every YAML file under ``sources/`` takes most of a second, and the
+catalog is read by the scheduler, pipelines, API handlers and scripts. The
+catalog here keeps the parsed sources per file, keyed by (mtime, size), so a
+call only re-parses files that actually changed, and exposes read-only views
+with prebuilt indexes:
+
+    catalog = get_source_catalog()
+    catalog.get("gov_cn_zhengce")            # one source, or None
+    catalog.by_dimension["universities"]     # tuple of sources
+    catalog.by_crawl_method / by_crawler_class / by_group
+
+Views are ``MappingProxyType`` objects with lists frozen to tuples, so shared
+configs cannot be mutated by accident. Callers that hand a config to a
+crawler (or otherwise need to change it) use ``load_all_source_configs()``,
+which returns fresh mutable copies.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from types import MappingProxyType
+from typing import Any
+
+import yaml
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def freeze_config(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+
+def thaw_config(value: Any) -> Any:
+    """Inverse of freeze_config: a fresh, mutable deep copy."""
+    if isinstance(value, Mapping):
+        return {key: thaw_config(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_config(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class _ParsedFile:
+    mtime_ns: int
+    size: int
+    sources: tuple[Mapping[str, Any], ...]
+
+
+def _parse_source_file(yaml_file: Path, sources_dir: Path) -> list[dict[str, Any]]:
+    with open(yaml_file) as f:
+        data = yaml.safe_load(f)
+    if data is None:
+        return []
+
+    dimension = data.get("dimension", yaml_file.stem)
+    dimension_name = data.get("dimension_name")
+    dimension_description = data.get("description")
+    default_keywords = data.get("default_keyword_filter", [])
+    default_blacklist = data.get("default_keyword_blacklist", [])
+
+    sources: list[dict[str, Any]] = []
+    for source in data.get("sources", []):
+        source.setdefault("dimension", dimension)
+        source.setdefault("dimension_name", dimension_name)
+        source.setdefault("dimension_description", dimension_description)
+        source.setdefault("source_file", yaml_file.name)
+        source.setdefault(
+            "source_file_path",
+            yaml_file.relative_to(sources_dir).as_posix(),
+        )
+        if "keyword_filter" not in source:
+            source["keyword_filter"] = default_keywords
+        if "keyword_blacklist" not in source:
+            source["keyword_blacklist"] = default_blacklist
+        sources.append(source)
+    return sources
+
+
+def _index(
+    configs: tuple[Mapping[str, Any], ...], key: str
+) -> Mapping[str, tuple[Mapping[str, Any], ...]]:
+    grouped: dict[str, list[Mapping[str, Any]]] = {}
+    for config in configs:
+        value = config.get(key)
+        if value is None or value == "":
+            continue
+        grouped.setdefault(str(value), []).append(config)
+    return MappingProxyType({name: tuple(items) for name, items in grouped.items()})
+
+
+class SourceCatalog:
+    """Immutable snapshot of all configured sources with lookup indexes."""
+
+    def __init__(self, configs: tuple[Mapping[str, Any], ...], signature: tuple = ()) -> None:
+        self.configs = configs
+        self.signature = signature
+        by_id: dict[str, Mapping[str, Any]] = {}
+        for config in configs:
+            source_id = str(config.get("id") or "").strip()
+            if source_id:
+                # Same first-wins rule as scanning the flat list.
+                by_id.setdefault(source_id, config)
+        self.by_id: Mapping[str, Mapping[str, Any]] = MappingProxyType(by_id)
+        self.by_dimension = _index(configs, "dimension")
+        self.by_crawl_method = _index(configs, "crawl_method")
+        self.by_crawler_class = _index(configs, "crawler_class")
+        self.by_group = _index(configs, "group")
+
+    def __len__(self) -> int:
+        return len(self.configs)
+
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
+        return iter(self.configs)
+
+    def get(self, source_id: str) -> Mapping[str, Any] | None:
+        return self.by_id.get(source_id)
+
+    def mutable_configs(self) -> list[dict[str, Any]]:
+        """Fresh mutable copies of every source, in catalog order."""
+        return [thaw_config(config) for config in self.configs]
+
+
+_lock = Lock()
+_files: dict[Path, _ParsedFile] = {}
+_sources_dir: Path | None = None
+_catalog: SourceCatalog | None = None
+
+
+def get_source_catalog() -> SourceCatalog:
+    """Return the current catalog, re-parsing only YAML files whose mtime/size changed."""
+    global _catalog, _sources_dir
+    sources_dir = Path(settings.SOURCES_DIR)
+    with _lock:
+        if _sources_dir != sources_dir:
+            _files.clear()
+            _catalog = None
+            _sources_dir = sources_dir
+
+        if not sources_dir.exists():
+            logger.warning("Sources directory not found: %s", sources_dir)
+            _files.clear()
+            _catalog = SourceCatalog(())
+            return _catalog
+
+        signature: list[tuple[str, int, int]] = []
+        seen: set[Path] = set()
+        reparsed = 0
+        for yaml_file in sorted(sources_dir.rglob("*.yaml")):
+            if not yaml_file.is_file():
+                continue
+            stat = yaml_file.stat()
+            seen.add(yaml_file)
+            signature.append((str(yaml_file), stat.st_mtime_ns, stat.st_size))
+            cached = _files.get(yaml_file)
+            if cached is not None and (cached.mtime_ns, cached.size) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                continue
+            _files[yaml_file] = _ParsedFile(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                sources=tuple(
+                    freeze_config(source)
+                    for source in _parse_source_file(yaml_file, sources_dir)
+                ),
+            )
+            reparsed += 1
+        for stale in set(_files) - seen:
+            del _files[stale]
+
+        key = tuple(signature)
+        if _catalog is not None and _catalog.signature == key:
+            return _catalog
+
+        configs = tuple(
+            source for path, _, _ in signature for source in _files[Path(path)].sources
+        )
+        _catalog = SourceCatalog(configs, key)
+        logger.info(
+            "Loaded %d source configs from %s (%d files parsed)",
+            len(configs),
+            sources_dir,
+            reparsed,
+        )
+        return _catalog
+
+
+def invalidate_source_catalog() -> None:
+    """Drop the cache; the next access re-parses every file."""
+    global _catalog
+    with _lock:
+        _files.clear()
+        _catalog = None
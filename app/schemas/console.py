@@ -351,3 +351,46 @@ class ConsoleSourceLogsResponse(BaseModel):
     source_id: str
     logs: list[CrawlLogResponse] = Field(default_factory=list)
 
+
+
+class ConsoleStageTiming(BaseModel):
+    """Aggregated duration of one crawl stage over recent runs."""
+
+    stage: str
+    runs: int = 0
+    avg_seconds: float = 0.0
+    p95_seconds: float = 0.0
+    max_seconds: float = 0.0
+    share: float = 0.0
+
+
+class ConsoleSourceTimingsResponse(BaseModel):
+    """Per-stage timing breakdown for one source."""
+
+    source_id: str
+    runs: int = 0
+    avg_duration_seconds: float = 0.0
+    stages: list[ConsoleStageTiming] = Field(default_factory=list)
+    http: dict[str, float] = Field(default_factory=dict)
+
+
+class ConsoleSlowRun(BaseModel):
+    """One crawl run in the top-N slowest list."""
+
+    source_id: str
+    source_name: str | None = None
+    dimension: str | None = None
+    status: str
+    started_at: datetime | None = None
+    duration_seconds: float | None = None
+    stage_seconds: float = 0.0
+    slowest_stage: str | None = None
+    timings: dict[str, float] = Field(default_factory=dict)
+
+
+class ConsoleSlowRunsResponse(BaseModel):
+    """Top-N slowest crawl runs within a time window."""
+
+    hours: int
+    stage: str | None = None
+    items: list[ConsoleSlowRun] = Field(default_factory=list)
@@ -25,6 +25,11 @@ class CrawlLogResponse(BaseModel):
     duration_seconds: float | None = Field(
         default=None, description="耗时（秒）", examples=[3.45]
     )
+    timings: dict[str, float] | None = Field(
+        default=None,
+        description="分阶段耗时（秒）与 HTTP 指标，如 fetch / parse / persist / http_ttfb",
+        examples=[{"fetch": 2.1, "parse": 0.8, "persist": 0.4, "http_requests": 3}],
+    )
 
 
 class CrawlHealthResponse(BaseModel):
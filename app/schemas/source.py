@@ -92,6 +92,13 @@ class SourceResponse(BaseModel):
     health_status: Literal["healthy", "warning", "failing", "unknown"] = Field(
         default="unknown", description="健康状态（基于连续失败次数与爬取记录）"
     )
+    circuit_state: Literal["closed", "open", "half_open"] = Field(
+        default="closed",
+        description="熔断状态：closed 正常调度 / open 定时任务跳过 / half_open 下次先探测",
+    )
+    circuit_next_probe_at: datetime | None = Field(
+        default=None, description="熔断打开时，下次允许探测的时间"
+    )
     is_supported: bool = Field(
         default=True, description="是否仍在当前配置清单中（用于识别过期/下线信源）"
     )
@@ -133,6 +140,7 @@ class SourceFacetsResponse(BaseModel):
     source_platforms: list[SourceFacetItem] = Field(default_factory=list)
     schedules: list[SourceFacetItem] = Field(default_factory=list)
     health_statuses: list[SourceFacetItem] = Field(default_factory=list)
+    circuit_states: list[SourceFacetItem] = Field(default_factory=list)
     taxonomy_domains: list[SourceFacetItem] = Field(default_factory=list)
     taxonomy_tracks: list[SourceFacetItem] = Field(default_factory=list)
     taxonomy_scopes: list[SourceFacetItem] = Field(default_factory=list)
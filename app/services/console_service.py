@@ -15,6 +15,7 @@ from zoneinfo import ZoneInfo
 import httpx
 
 from app.config import BASE_DIR
+from app.crawlers.utils.timing import COUNTER_KEYS
 from app.scheduler.manager import get_scheduler_manager
 from app.schemas.console import (
     ConsoleApiRecentCall,
@@ -30,13 +31,21 @@ from app.schemas.console import (
     ConsoleOverviewResponse,
     ConsoleRecentRun,
     ConsoleServerMetrics,
+    ConsoleSlowRun,
+    ConsoleSlowRunsResponse,
     ConsoleSourceLogsResponse,
+    ConsoleSourceTimingsResponse,
+    ConsoleStageTiming,
     ConsoleTodayStats,
 )
 from app.services import crawl_service, source_service
 from app.services.crawler_control_service import get_control_service
 from app.services.llm.llm_call_tracker import CALLS_LOG_FILE, PRICING_MAP
-from app.services.stores.crawl_log_store import get_crawl_logs, get_crawl_logs_since
+from app.services.stores.crawl_log_store import (
+    get_crawl_logs,
+    get_crawl_logs_since,
+    get_slowest_crawl_logs,
+)
 from app.services.stores.crawl_runtime_store import get_crawl_runtime_state
 
 CONSOLE_TIMEZONE = ZoneInfo("Asia/Shanghai")
@@ -345,6 +354,122 @@ async def get_console_daily_trend(*, days: int = 7) -> list[ConsoleDailyTrendPoi
     return points
 
 
+def _log_timings(log: dict[str, Any]) -> dict[str, float]:
+    raw = log.get("timings")
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except json.JSONDecodeError:
+            return {}
+    if not isinstance(raw, dict):
+        return {}
+    timings: dict[str, float] = {}
+    for key, value in raw.items():
+        try:
+            timings[str(key)] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return timings
+
+
+def _is_stage_key(key: str) -> bool:
+    return not key.startswith("http_")
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+async def get_console_source_timings(
+    source_id: str, *, limit: int = 50
+) -> ConsoleSourceTimingsResponse:
+    source = await source_service.get_source(source_id)
+    if source is None:
+        raise ValueError(f"Source not found: {source_id}")
+    logs = await get_crawl_logs(source_id=source_id, limit=limit)
+    timed = [(log, _log_timings(log)) for log in logs]
+    timed = [(log, timings) for log, timings in timed if timings]
+    if not timed:
+        return ConsoleSourceTimingsResponse(source_id=source_id)
+
+    per_stage: dict[str, list[float]] = defaultdict(list)
+    http_totals: dict[str, float] = defaultdict(float)
+    for _, timings in timed:
+        for key, value in timings.items():
+            if _is_stage_key(key):
+                per_stage[key].append(value)
+            else:
+                http_totals[key] += value
+
+    runs = len(timed)
+    avg_duration = mean(float(log.get("duration_seconds") or 0.0) for log, _ in timed)
+    stages = [
+        ConsoleStageTiming(
+            stage=stage,
+            runs=len(values),
+            avg_seconds=round(sum(values) / runs, 3),
+            p95_seconds=round(_percentile(values, 0.95), 3),
+            max_seconds=round(max(values), 3),
+            share=round(sum(values) / runs / avg_duration, 4) if avg_duration > 0 else 0.0,
+        )
+        for stage, values in per_stage.items()
+    ]
+    stages.sort(key=lambda item: (-item.avg_seconds, item.stage))
+    http = {
+        key: round(total / runs, 1 if key in COUNTER_KEYS else 3)
+        for key, total in sorted(http_totals.items())
+    }
+    return ConsoleSourceTimingsResponse(
+        source_id=source_id,
+        runs=runs,
+        avg_duration_seconds=round(avg_duration, 3),
+        stages=stages,
+        http=http,
+    )
+
+
+async def get_console_slowest_runs(
+    *, hours: int = 24, limit: int = 20, stage: str | None = None
+) -> ConsoleSlowRunsResponse:
+    safe_hours = max(1, min(hours, 24 * 30))
+    since = datetime.now(timezone.utc) - timedelta(hours=safe_hours)
+    logs = await get_slowest_crawl_logs(since=since, limit=max(1, limit), stage=stage)
+
+    items: list[ConsoleSlowRun] = []
+    for log in logs:
+        timings = _log_timings(log)
+        if stage:
+            value = timings.get(stage, 0.0)
+        else:
+            value = float(log.get("duration_seconds") or 0.0)
+        source_id = str(log.get("source_id") or "")
+        source = await source_service.get_source(source_id) or {}
+        stage_values = {k: v for k, v in timings.items() if _is_stage_key(k)}
+        items.append(
+            ConsoleSlowRun(
+                source_id=source_id,
+                source_name=source.get("name"),
+                dimension=source.get("dimension"),
+                status=str(log.get("status") or "unknown"),
+                started_at=_parse_dt(log.get("started_at")),
+                duration_seconds=(
+                    float(log.get("duration_seconds"))
+                    if log.get("duration_seconds") is not None
+                    else None
+                ),
+                stage_seconds=round(value, 3),
+                slowest_stage=(
+                    max(stage_values, key=stage_values.__getitem__) if stage_values else None
+                ),
+                timings=timings,
+            )
+        )
+    return ConsoleSlowRunsResponse(hours=safe_hours, stage=stage, items=items)
+
+
 async def get_console_server_metrics() -> ConsoleServerMetrics:
     disk_usage = shutil.disk_usage("/")
     try:
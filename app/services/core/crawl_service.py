@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from app.scheduler.manager import load_all_source_configs
+from app.scheduler.source_catalog import get_source_catalog
 from app.schemas.crawl_log import CrawlHealthResponse
 from app.services.stores.crawl_log_store import get_crawl_logs as _get_logs
 from app.services.stores.crawl_log_store import get_recent_log_stats
@@ -17,7 +17,7 @@ async def get_crawl_logs(
 
 async def get_crawl_health() -> CrawlHealthResponse:
     """Aggregate crawl health statistics from YAML configs + source state + logs."""
-    configs = load_all_source_configs()
+    configs = get_source_catalog().configs
     states = await get_all_source_states()
 
     total_sources = len(configs)
@@ -27,8 +27,7 @@ from app.services.core.institution.storage import (
     fetch_institution_by_id,
     upsert_institution,
 )
-from app.services.stores.crawl_log_store import append_crawl_log
-from app.services.stores.source_state import update_source_state
+from app.services.stores.crawl_telemetry import flush_crawl_telemetry, get_crawl_telemetry
 
 logger = logging.getLogger(__name__)
 
@@ -775,6 +774,7 @@ async def run_university_leadership_full_crawl(
         items_new: int = 0,
         error_message: str | None = None,
         duration_seconds: float = 0.0,
+        timings: dict[str, float] | None = None,
     ) -> None:
         log_status = (
             CrawlStatus.NO_NEW_CONTENT.value
@@ -782,8 +782,8 @@ async def run_university_leadership_full_crawl(
             else status
         )
 
-        await append_crawl_log(
-            source_id=source_id,
+        await get_crawl_telemetry().record_crawl_outcome(
+            source_id,
             status=log_status,
             items_total=items_total,
             items_new=items_new,
@@ -791,18 +791,9 @@ async def run_university_leadership_full_crawl(
             started_at=started_at,
             finished_at=finished_at,
             duration_seconds=duration_seconds,
+            timings=timings,
         )
 
-        if log_status in (CrawlStatus.SUCCESS.value, CrawlStatus.NO_NEW_CONTENT.value):
-            await update_source_state(
-                source_id,
-                last_crawl_at=finished_at,
-                last_success_at=finished_at,
-                reset_failures=True,
-            )
-        else:
-            await update_source_state(source_id, last_crawl_at=finished_at)
-
     async def _run_one(source_config: dict[str, Any]) -> dict[str, Any]:
         source_id = _normalize_str(source_config.get("id"))
         source_name = _normalize_str(source_config.get("name"))
@@ -856,6 +847,7 @@ async def run_university_leadership_full_crawl(
                     items_new=result.items_new,
                     error_message=error_message,
                     duration_seconds=result.duration_seconds,
+                    timings=result.timings,
                 )
                 return {
                     "source_id": source_id,
@@ -881,6 +873,7 @@ async def run_university_leadership_full_crawl(
                     items_new=0,
                     error_message=json_sync_error,
                     duration_seconds=result.duration_seconds,
+                    timings=result.timings,
                 )
                 return {
                     "source_id": source_id,
@@ -912,6 +905,7 @@ async def run_university_leadership_full_crawl(
                     items_new=0,
                     error_message=json_sync_error,
                     duration_seconds=result.duration_seconds,
+                    timings=result.timings,
                 )
                 return {
                     "source_id": source_id,
@@ -936,6 +930,7 @@ async def run_university_leadership_full_crawl(
                 items_new=payload["leader_count"],
                 error_message=json_sync_error,
                 duration_seconds=result.duration_seconds,
+                timings=result.timings,
             )
 
             return {
@@ -955,6 +950,7 @@ async def run_university_leadership_full_crawl(
 
     run_started = datetime.now(timezone.utc)
     results = await asyncio.gather(*[_run_one(cfg) for cfg in leadership_configs])
+    await flush_crawl_telemetry()
     run_finished = datetime.now(timezone.utc)
 
     success_sources = sum(1 for r in results if r.get("status") not in {"failed"})
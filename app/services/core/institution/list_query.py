@@ -10,6 +10,7 @@ from collections import defaultdict
 from time import monotonic
 from typing import Any
 
+from app.db.notify import invalidate_cache, register_cache_invalidator
 from app.schemas.institution import InstitutionListResponse
 from app.services.core.institution.classification import (
     normalize_org_type,
@@ -40,9 +41,12 @@ _hierarchy_cache: dict[
 ] = {}
 
 
+register_cache_invalidator("institution_hierarchy", _hierarchy_cache.clear)
+
+
 def invalidate_hierarchy_cache() -> None:
-    """Invalidate in-process hierarchy cache after institution writes."""
-    _hierarchy_cache.clear()
+    """Invalidate the hierarchy cache after institution writes, in every API worker."""
+    invalidate_cache("institution_hierarchy")
 
 
 def _normalize_name(value: Any) -> str:
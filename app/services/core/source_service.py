@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import math
+import time
 from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
 from app.api.deprecation import get_deprecation_items
+from app.config import settings
+from app.crawlers.utils.circuit_breaker import source_circuit_state
 from app.schemas.article import ArticleSearchParams
 from app.schemas.common import PaginatedResponse
 from app.services.core import article_service
@@ -16,7 +20,9 @@ from app.services.core.source_catalog_meta import (
 )
 from app.services.stores.source_state import (
     get_all_source_states,
+    get_source_states_stamp,
     set_enabled_override,
+    source_state_version,
 )
 
 
@@ -72,6 +78,10 @@ def _normalize_source_state_row(row: dict[str, Any]) -> dict[str, Any]:
         row.get("last_crawl_at"),
         row.get("consecutive_failures", 0),
     )
+    circuit_state, circuit_next_probe_at = source_circuit_state(
+        row.get("consecutive_failures", 0),
+        row.get("last_crawl_at"),
+    )
     taxonomy = build_source_taxonomy(
         {
             "dimension": row.get("dimension"),
@@ -110,6 +120,8 @@ def _normalize_source_state_row(row: dict[str, Any]) -> dict[str, Any]:
         ),
         "dimension_description": row.get("dimension_description"),
         "health_status": health_status,
+        "circuit_state": circuit_state,
+        "circuit_next_probe_at": circuit_next_probe_at,
         "is_supported": bool(row.get("is_supported", True)),
         "is_enabled_overridden": override is not None,
         **taxonomy,
@@ -152,6 +164,23 @@ def _filter_sources(
     source_platform_filter = _normalize_text(source_platform)
     schedule_filter = _normalize_text(schedule)
     keyword_filter = _normalize_text(keyword)
+    if not (
+        dimension_filters
+        or group_filters
+        or tag_filters
+        or health_filters
+        or taxonomy_domain_filters
+        or taxonomy_track_filters
+        or taxonomy_scope_filters
+        or method_filter
+        or source_type_filter
+        or source_platform_filter
+        or schedule_filter
+        or keyword_filter
+        or is_enabled is not None
+    ):
+        # Unfiltered: hand back the same list so snapshot indexes can be reused.
+        return items, {}
 
     filtered: list[dict[str, Any]] = []
     for item in items:
@@ -296,6 +325,7 @@ def _build_facets(items: list[dict[str, Any]]) -> dict[str, Any]:
     source_platform_counts: Counter[str] = Counter()
     schedule_counts: Counter[str] = Counter()
     health_counts: Counter[str] = Counter()
+    circuit_counts: Counter[str] = Counter()
     taxonomy_domain_counts: Counter[str] = Counter()
     taxonomy_domain_labels: dict[str, str | None] = {}
     taxonomy_track_counts: Counter[str] = Counter()
@@ -329,6 +359,9 @@ def _build_facets(items: list[dict[str, Any]]) -> dict[str, Any]:
         health = str(item.get("health_status", ""))
         if health:
             health_counts[health] += 1
+        circuit = str(item.get("circuit_state", ""))
+        if circuit:
+            circuit_counts[circuit] += 1
         taxonomy_domain = str(item.get("taxonomy_domain", ""))
         if taxonomy_domain:
             taxonomy_domain_counts[taxonomy_domain] += 1
@@ -386,13 +419,77 @@ def _build_facets(items: list[dict[str, Any]]) -> dict[str, Any]:
         "source_platforms": to_facet(source_platform_counts),
         "schedules": to_facet(schedule_counts),
         "health_statuses": to_facet(health_counts),
+        "circuit_states": to_facet(circuit_counts),
         "taxonomy_domains": to_facet(taxonomy_domain_counts, taxonomy_domain_labels),
         "taxonomy_tracks": to_facet(taxonomy_track_counts, taxonomy_track_labels),
         "taxonomy_scopes": to_facet(taxonomy_scope_counts, taxonomy_scope_labels),
     }
 
 
-async def _load_merged_sources() -> list[dict[str, Any]]:
+@dataclass
+class _CatalogSnapshot:
+    """Normalized source rows plus precomputed facets and sort orders."""
+
+    items: list[dict[str, Any]]
+    by_id: dict[str, dict[str, Any]]
+    version: int
+    stamp: str | None
+    built_at: float
+    checked_at: float
+    _facets: dict[str, Any] | None = None
+    _sorted: dict[tuple[str, str], list[dict[str, Any]]] = field(default_factory=dict)
+
+    @property
+    def facets(self) -> dict[str, Any]:
+        if self._facets is None:
+            self._facets = _build_facets(self.items)
+        return self._facets
+
+    def sorted_items(self, sort_by: str, order: str) -> list[dict[str, Any]]:
+        key = (_normalize_text(sort_by) or "dimension_priority", _normalize_text(order))
+        cached = self._sorted.get(key)
+        if cached is None:
+            cached = _sort_sources(self.items, sort_by=sort_by, order=order)
+            self._sorted[key] = cached
+        return cached
+
+
+_snapshot: _CatalogSnapshot | None = None
+
+
+def invalidate_source_catalog_snapshot() -> None:
+    global _snapshot
+    _snapshot = None
+
+
+async def _get_catalog_snapshot() -> _CatalogSnapshot:
+    """Return the materialized catalog, rebuilding it only when states changed.
+
+    Writes from this process bump source_state_version(); writes from other
+    processes (executor children, queue workers) are noticed through a cheap
+    stamp query at most every SOURCE_CATALOG_RECHECK_SECONDS. Snapshots older
+    than SOURCE_CATALOG_MAX_AGE_SECONDS are rebuilt anyway, because circuit
+    state depends on the current time.
+    """
+    global _snapshot
+    now = time.monotonic()
+    version = source_state_version()
+    snapshot = _snapshot
+    stamp: str | None = None
+    if (
+        snapshot is not None
+        and snapshot.version == version
+        and now - snapshot.built_at < settings.SOURCE_CATALOG_MAX_AGE_SECONDS
+    ):
+        if now - snapshot.checked_at < settings.SOURCE_CATALOG_RECHECK_SECONDS:
+            return snapshot
+        stamp = await get_source_states_stamp()
+        if stamp is not None and stamp == snapshot.stamp:
+            snapshot.checked_at = now
+            return snapshot
+    else:
+        stamp = await get_source_states_stamp()
+
     states = await get_all_source_states()
     items: list[dict[str, Any]] = []
     for row in states.values():
@@ -402,7 +499,27 @@ async def _load_merged_sources() -> list[dict[str, Any]]:
         if not normalized.get("is_supported", True):
             continue
         items.append(normalized)
-    return items
+    snapshot = _CatalogSnapshot(
+        items=items,
+        by_id={item["id"]: item for item in items},
+        version=version,
+        stamp=stamp,
+        built_at=now,
+        checked_at=now,
+    )
+    _snapshot = snapshot
+    return snapshot
+
+
+def _sorted_view(
+    snapshot: _CatalogSnapshot,
+    filtered: list[dict[str, Any]],
+    sort_by: str,
+    order: str,
+) -> list[dict[str, Any]]:
+    if filtered is snapshot.items:
+        return snapshot.sorted_items(sort_by, order)
+    return _sort_sources(filtered, sort_by=sort_by, order=order)
 
 
 async def list_sources(
@@ -430,9 +547,9 @@ async def list_sources(
     sort_by: str = "dimension_priority",
     order: str = "asc",
 ) -> list[dict[str, Any]]:
-    merged_sources = await _load_merged_sources()
+    snapshot = await _get_catalog_snapshot()
     filtered, _ = _filter_sources(
-        merged_sources,
+        snapshot.items,
         dimension=dimension,
         dimensions=dimensions,
         group=group,
@@ -454,7 +571,7 @@ async def list_sources(
         health_statuses=health_statuses,
         keyword=keyword,
     )
-    return _sort_sources(filtered, sort_by=sort_by, order=order)
+    return list(_sorted_view(snapshot, filtered, sort_by, order))
 
 
 async def list_source_facets(
@@ -480,9 +597,9 @@ async def list_source_facets(
     health_statuses: str | None = None,
     keyword: str | None = None,
 ) -> dict[str, Any]:
-    merged_sources = await _load_merged_sources()
+    snapshot = await _get_catalog_snapshot()
     filtered, _ = _filter_sources(
-        merged_sources,
+        snapshot.items,
         dimension=dimension,
         dimensions=dimensions,
         group=group,
@@ -504,6 +621,8 @@ async def list_source_facets(
         health_statuses=health_statuses,
         keyword=keyword,
     )
+    if filtered is snapshot.items:
+        return snapshot.facets
     return _build_facets(filtered)
 
 
@@ -535,10 +654,10 @@ async def list_sources_catalog(
     page_size: int = 100,
     include_facets: bool = True,
 ) -> dict[str, Any]:
-    merged_sources = await _load_merged_sources()
-    total_sources = len(merged_sources)
+    snapshot = await _get_catalog_snapshot()
+    total_sources = len(snapshot.items)
     filtered, applied_filters = _filter_sources(
-        merged_sources,
+        snapshot.items,
         dimension=dimension,
         dimensions=dimensions,
         group=group,
@@ -560,7 +679,7 @@ async def list_sources_catalog(
         health_statuses=health_statuses,
         keyword=keyword,
     )
-    sorted_items = _sort_sources(filtered, sort_by=sort_by, order=order)
+    sorted_items = _sorted_view(snapshot, filtered, sort_by, order)
 
     safe_page = max(1, page)
     safe_page_size = max(1, min(page_size, 500))
@@ -580,22 +699,18 @@ async def list_sources_catalog(
         "page_size": safe_page_size,
         "total_pages": total_pages,
         "items": page_items,
-        "facets": _build_facets(sorted_items) if include_facets else None,
+        "facets": (
+            (snapshot.facets if filtered is snapshot.items else _build_facets(sorted_items))
+            if include_facets
+            else None
+        ),
         "applied_filters": applied_filters,
     }
 
 
 async def get_source(source_id: str) -> dict[str, Any] | None:
-    states = await get_all_source_states()
-    row = states.get(source_id)
-    if not row:
-        return None
-    normalized = _normalize_source_state_row(row)
-    if not normalized:
-        return None
-    if not normalized.get("is_supported", True):
-        return None
-    return normalized
+    item = (await _get_catalog_snapshot()).by_id.get(source_id)
+    return dict(item) if item is not None else None
 
 
 async def update_source(source_id: str, is_enabled: bool) -> dict[str, Any] | None:
@@ -19,9 +19,9 @@ from app.config import BASE_DIR
 from app.crawlers.base import CrawlStatus
 from app.crawlers.registry import create_crawler
 from app.crawlers.utils.json_storage import save_crawl_result_json
+from app.scheduler.executor import CrawlExecutorError, get_crawl_executor
 from app.scheduler.manager import load_all_source_configs
-from app.services.stores.crawl_log_store import append_crawl_log
-from app.services.stores.source_state import update_source_state
+from app.services.stores.crawl_telemetry import flush_crawl_telemetry, get_crawl_telemetry
 from app.services.talent_scout import export_talent_scout_workbook
 
 logger = logging.getLogger(__name__)
@@ -296,116 +296,37 @@ class CrawlerControlService:
                     )
 
                     try:
-                        crawler = create_crawler(config)
-                        result = await crawler.run()
-
-                        items_dict = [dataclasses.asdict(item) for item in result.items]
-                        db_upserted = 0
-                        db_new = 0
-                        db_deduped_in_batch = 0
+                        outcome = await _crawl_source(config, job["export_format"])
+                        items_dict = outcome["items_dict"]
                         if job["export_format"] in ("json", "csv"):
                             job["all_results"].extend(items_dict)
 
-                        if job["export_format"] == "database":
-                            db_stats = await save_crawl_result_json(result, config)
-                            if db_stats:
-                                db_upserted = int(db_stats.get("upserted", 0) or 0)
-                                db_new = int(db_stats.get("new", 0) or 0)
-                                db_deduped_in_batch = int(db_stats.get("deduped_in_batch", 0) or 0)
-                                logger.info(
-                                    "Job %s persisted source=%s upserted=%d new=%d dedup_batch=%d",
-                                    job_id,
-                                    source_id,
-                                    db_upserted,
-                                    db_new,
-                                    db_deduped_in_batch,
-                                )
-
-                        await append_crawl_log(
-                            source_id=source_id,
-                            status=result.status.value,
-                            items_total=result.items_total,
-                            items_new=result.items_new,
-                            error_message=result.error_message,
-                            started_at=result.started_at,
-                            finished_at=result.finished_at,
-                            duration_seconds=result.duration_seconds,
-                        )
-
-                        finished = result.finished_at or datetime.now(timezone.utc)
-                        if result.status in (CrawlStatus.SUCCESS, CrawlStatus.NO_NEW_CONTENT):
-                            await update_source_state(
+                        raised = outcome.pop("raised", False)
+                        if raised:
+                            logger.error(
+                                "Failed to crawl %s in job %s: %s",
                                 source_id,
-                                last_crawl_at=finished,
-                                last_success_at=finished,
-                                reset_failures=True,
+                                job_id,
+                                outcome["error_message"],
                             )
+                            message = f"抓取失败: {outcome['error_message']}"
                         else:
-                            await update_source_state(source_id, last_crawl_at=finished)
-
-                        self._append_activity(
-                            job,
-                            source_id=source_id,
-                            phase="finished",
-                            status=result.status.value,
-                            message=(
-                                f"抓取完成: items={int(result.items_total or 0)} "
-                                f"db_new={db_new} db_upserted={db_upserted}"
-                            ),
-                            items_total=int(result.items_total or 0),
-                            db_upserted=db_upserted,
-                            db_new=db_new,
-                            db_deduped_in_batch=db_deduped_in_batch,
-                        )
-
-                        return {
-                            "source_id": source_id,
-                            "source_name": str(config.get("name") or source_id),
-                            "status": result.status.value,
-                            "items_total": int(result.items_total or 0),
-                            "items_dict": items_dict,
-                            "db_upserted": db_upserted,
-                            "db_new": db_new,
-                            "db_deduped_in_batch": db_deduped_in_batch,
-                            "executed_at": finished,
-                            "error_message": result.error_message,
-                            "skipped": False,
-                        }
-                    except Exception as exc:  # noqa: BLE001
-                        logger.error("Failed to crawl %s in job %s: %s", source_id, job_id, exc)
-                        now = datetime.now(timezone.utc)
-                        await append_crawl_log(
-                            source_id=source_id,
-                            status=CrawlStatus.FAILED.value,
-                            error_message=str(exc),
-                            started_at=now,
-                            finished_at=now,
-                        )
-                        await update_source_state(source_id, last_crawl_at=now)
+                            message = (
+                                f"抓取完成: items={outcome['items_total']} "
+                                f"db_new={outcome['db_new']} db_upserted={outcome['db_upserted']}"
+                            )
                         self._append_activity(
                             job,
                             source_id=source_id,
                             phase="finished",
-                            status=CrawlStatus.FAILED.value,
-                            message=f"抓取失败: {exc}",
-                            items_total=0,
-                            db_upserted=0,
-                            db_new=0,
-                            db_deduped_in_batch=0,
+                            status=outcome["status"],
+                            message=message,
+                            items_total=outcome["items_total"],
+                            db_upserted=outcome["db_upserted"],
+                            db_new=outcome["db_new"],
+                            db_deduped_in_batch=outcome["db_deduped_in_batch"],
                         )
-                        return {
-                            "source_id": source_id,
-                            "source_name": str(config.get("name") or source_id),
-                            "status": CrawlStatus.FAILED.value,
-                            "items_total": 0,
-                            "items_dict": [],
-                            "db_upserted": 0,
-                            "db_new": 0,
-                            "db_deduped_in_batch": 0,
-                            "executed_at": now,
-                            "error_message": str(exc),
-                            "skipped": False,
-                        }
+                        return outcome
                     finally:
                         async with state_lock:
                             running_sources.discard(source_id)
@@ -467,6 +388,7 @@ class CrawlerControlService:
             job["status"] = "failed"
             job["error_message"] = str(exc)
         finally:
+            await flush_crawl_telemetry()
             job["current_source"] = None
             job["running_sources"] = []
             job["finished_at"] = datetime.now(timezone.utc)
@@ -693,6 +615,125 @@ def get_control_service() -> CrawlerControlService:
     return _control_service
 
 
+async def _crawl_source(config: dict[str, Any], export_format: str) -> dict[str, Any]:
+    """Crawl one source for a manual job, in an executor process when one is running."""
+    executor = get_crawl_executor()
+    if executor is None:
+        return await crawl_source_for_control_job(config, export_format=export_format)
+    try:
+        outcome = await executor.submit(
+            "control_crawl_source",
+            {"source_config": config, "export_format": export_format},
+        )
+    except CrawlExecutorError as exc:
+        # The child died or failed outside the crawl, so nothing was recorded there.
+        now = await _record_failed_crawl(config, exc)
+        return _failed_source_outcome(config, exc, executed_at=now)
+    executed_at = outcome.get("executed_at")
+    if isinstance(executed_at, str):
+        outcome["executed_at"] = datetime.fromisoformat(executed_at)
+    return outcome
+
+
+async def crawl_source_for_control_job(
+    config: dict[str, Any],
+    *,
+    export_format: str,
+) -> dict[str, Any]:
+    """Run one source's crawl, persistence and bookkeeping; returns the source outcome.
+
+    Kept free of job state so it can run inside an executor child process.
+    """
+    source_id = str(config.get("id") or "")
+    try:
+        crawler = create_crawler(config)
+        result = await crawler.run()
+
+        items_dict = [dataclasses.asdict(item) for item in result.items]
+        db_upserted = 0
+        db_new = 0
+        db_deduped_in_batch = 0
+        if export_format == "database":
+            db_stats = await save_crawl_result_json(result, config)
+            if db_stats:
+                db_upserted = int(db_stats.get("upserted", 0) or 0)
+                db_new = int(db_stats.get("new", 0) or 0)
+                db_deduped_in_batch = int(db_stats.get("deduped_in_batch", 0) or 0)
+                logger.info(
+                    "Persisted source=%s upserted=%d new=%d dedup_batch=%d",
+                    source_id,
+                    db_upserted,
+                    db_new,
+                    db_deduped_in_batch,
+                )
+
+        finished = result.finished_at or datetime.now(timezone.utc)
+        await get_crawl_telemetry().record_crawl_outcome(
+            source_id,
+            status=result.status.value,
+            items_total=result.items_total,
+            items_new=result.items_new,
+            error_message=result.error_message,
+            started_at=result.started_at,
+            finished_at=finished,
+            duration_seconds=result.duration_seconds,
+            timings=result.timings,
+        )
+
+        return {
+            "source_id": source_id,
+            "source_name": str(config.get("name") or source_id),
+            "status": result.status.value,
+            "items_total": int(result.items_total or 0),
+            "items_dict": items_dict,
+            "db_upserted": db_upserted,
+            "db_new": db_new,
+            "db_deduped_in_batch": db_deduped_in_batch,
+            "executed_at": finished,
+            "error_message": result.error_message,
+            "skipped": False,
+        }
+    except Exception as exc:  # noqa: BLE001
+        now = await _record_failed_crawl(config, exc)
+        return _failed_source_outcome(config, exc, executed_at=now)
+
+
+async def _record_failed_crawl(config: dict[str, Any], exc: Exception) -> datetime:
+    """Write the crawl log and source state for a crawl that raised; returns its time."""
+    now = datetime.now(timezone.utc)
+    await get_crawl_telemetry().record_crawl_outcome(
+        str(config.get("id") or ""),
+        status=CrawlStatus.FAILED.value,
+        error_message=str(exc),
+        started_at=now,
+        finished_at=now,
+    )
+    return now
+
+
+def _failed_source_outcome(
+    config: dict[str, Any],
+    exc: Exception,
+    *,
+    executed_at: datetime | None = None,
+) -> dict[str, Any]:
+    source_id = str(config.get("id") or "")
+    return {
+        "source_id": source_id,
+        "source_name": str(config.get("name") or source_id),
+        "status": CrawlStatus.FAILED.value,
+        "items_total": 0,
+        "items_dict": [],
+        "db_upserted": 0,
+        "db_new": 0,
+        "db_deduped_in_batch": 0,
+        "executed_at": executed_at or datetime.now(timezone.utc),
+        "error_message": str(exc),
+        "skipped": False,
+        "raised": True,
+    }
+
+
 def _load_grouped_crawl_limits() -> dict[str, int]:
     """Load grouped crawl concurrency limits from yaml with safe defaults."""
     defaults = {
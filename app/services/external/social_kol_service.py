@@ -1,6 +1,7 @@
 """Unified social KOL storage service (cross-platform ready)."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 from datetime import datetime, timezone
@@ -157,7 +158,7 @@ def _load_twitter_accounts(
         username = _clean_username(item.get("username"))
         if not username:
             continue
-        item_cohort = str(item.get("cohort") or "").strip().lower() or "core"
+        item_cohort = _account_cohort(item)
         if cohort_key != "all" and item_cohort != cohort_key:
             continue
         parsed.append(
@@ -176,11 +177,14 @@ def _load_twitter_accounts(
     return list(dedup.values())
 
 
+def _account_cohort(account: dict[str, Any]) -> str:
+    return str(account.get("cohort") or "").strip().lower() or "core"
+
+
 async def _fetch_twitter_user_posts(
     client: httpx.AsyncClient,
     *,
     username: str,
-    max_posts: int,
     include_replies: bool,
 ) -> dict[str, Any] | None:
     resp = await client.get(
@@ -201,7 +205,6 @@ async def _fetch_twitter_user_posts(
         raw_tweets = data_block.get("tweets", [])
         if isinstance(raw_tweets, list):
             tweets = [x for x in raw_tweets if isinstance(x, dict)]
-    tweets = tweets[:max_posts]
 
     author = (tweets[0].get("author") or {}) if tweets else {}
     matched_username = _clean_username(author.get("userName") or username)
@@ -214,93 +217,148 @@ async def _fetch_twitter_user_posts(
     }
 
 
-async def crawl_and_ingest_twitter_source(source_config: dict[str, Any]) -> SocialIngestResponse:
-    """Fetch twitterapi.io data by source YAML config and ingest into social tables."""
+async def fetch_twitter_source_bundle(
+    source_config: dict[str, Any],
+    *,
+    accounts: list[dict[str, Any]] | None = None,
+) -> SocialTwitterIngestRequest:
+    """Fetch latest posts for every configured account as one ingest payload.
+
+    This is the single twitterapi.io fetch for a twitter_kol source: the
+    TwitterKOLCrawler builds its article items from it and
+    ``ingest_twitter_bundle`` writes it to the social tables. Accounts are
+    fetched concurrently, bounded by ``twitter_fetch_concurrency`` (YAML) or
+    ``TWITTER_FETCH_CONCURRENCY``.
+
+    Each account keeps the whole fetched page: ingest stores the first
+    ``max_posts_per_user`` posts and the crawler picks its own original
+    tweets. ``crawl_accounts_cohort`` only narrows the accounts loaded from
+    ``twitter_accounts_file``; explicit ``accounts`` are fetched as given
+    (see ``select_ingest_cohort``).
+    """
     platform = "x"
-    accounts_file = str(source_config.get("twitter_accounts_file") or "").strip()
-    if not accounts_file:
-        raise ValueError("twitter_accounts_file is not configured")
     if not settings.TWITTER_API_KEY:
         raise RuntimeError("TWITTER_API_KEY is not configured")
 
-    cohort = str(source_config.get("crawl_accounts_cohort") or "all").strip().lower()
-    max_posts = max(1, int(source_config.get("max_tweets_per_account", DEFAULT_POSTS_PER_USER) or 3))
+    cohort = _cohort_key(source_config)
+    max_posts = max(
+        1, int(source_config.get("max_tweets_per_account", DEFAULT_POSTS_PER_USER) or 3)
+    )
     include_replies = bool(source_config.get("include_replies", True))
     reply_limit = max(0, int(source_config.get("max_replies_per_post", 5) or 5))
     timeout = float(source_config.get("twitter_request_timeout_seconds", 45) or 45)
+    concurrency = max(
+        1,
+        int(source_config.get("twitter_fetch_concurrency") or settings.TWITTER_FETCH_CONCURRENCY),
+    )
 
-    accounts = _load_twitter_accounts(accounts_file=accounts_file, cohort=cohort)
-    if not accounts:
-        logger.warning("Twitter KOL social ingest: no accounts selected for cohort=%s", cohort)
-        return SocialIngestResponse(
-            platform=platform,
-            users=0,
-            kol_accounts_upserted=0,
-            accounts_upserted=0,
-            posts_upserted=0,
-            skipped_posts=0,
-        )
+    if accounts is None:
+        accounts_file = str(source_config.get("twitter_accounts_file") or "").strip()
+        if not accounts_file:
+            raise ValueError("twitter_accounts_file is not configured")
+        accounts = _load_twitter_accounts(accounts_file=accounts_file, cohort=cohort)
 
     headers = {"x-api-key": settings.TWITTER_API_KEY, "Accept": "application/json"}
     users: list[dict[str, Any]] = []
     failed: list[dict[str, Any]] = []
 
-    async def _run_fetch(proxy: str | None, target_accounts: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-        ok: list[dict[str, Any]] = []
-        fail: list[dict[str, Any]] = []
-        async with httpx.AsyncClient(timeout=timeout, headers=headers, proxy=proxy) as client:
-            for account in target_accounts:
-                username = account["username"]
+    async def _run_fetch(
+        proxy: str | None, target_accounts: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch_one(
+            client: httpx.AsyncClient, account: dict[str, Any]
+        ) -> dict[str, Any] | None:
+            async with semaphore:
                 try:
                     block = await _fetch_twitter_user_posts(
                         client,
-                        username=username,
-                        max_posts=max_posts,
+                        username=account["username"],
                         include_replies=include_replies,
                     )
-                    if not block:
-                        fail.append(account)
-                        continue
-                    block["category"] = account.get("category")
-                    block["cohort"] = account.get("cohort")
-                    ok.append(block)
-                except Exception:
-                    fail.append(account)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("Twitter fetch failed for @%s: %s", account["username"], exc)
+                    return None
+            if not block:
+                return None
+            block["configured_name"] = account.get("name")
+            block["category"] = account.get("category")
+            block["cohort"] = account.get("cohort")
+            block["tags"] = account.get("tags") or []
+            return block
+
+        async with httpx.AsyncClient(timeout=timeout, headers=headers, proxy=proxy) as client:
+            blocks = await asyncio.gather(*(_fetch_one(client, a) for a in target_accounts))
+        ok = [block for block in blocks if block]
+        fail = [a for a, block in zip(target_accounts, blocks, strict=True) if not block]
         return ok, fail
 
-    ok1, fail1 = await _run_fetch(settings.TWITTER_API_PROXY or None, accounts)
-    users.extend(ok1)
-    failed.extend(fail1)
+    if accounts:
+        ok1, fail1 = await _run_fetch(settings.TWITTER_API_PROXY or None, accounts)
+        users.extend(ok1)
+        failed.extend(fail1)
+
+        # 代理失败时自动降级直连重试，提升稳定性。
+        if failed and settings.TWITTER_API_PROXY:
+            ok2, fail2 = await _run_fetch(None, failed)
+            users.extend(ok2)
+            failed = fail2
+    else:
+        logger.warning("Twitter KOL fetch: no accounts selected for cohort=%s", cohort)
 
-    # 代理失败时自动降级直连重试，提升稳定性。
-    if failed and settings.TWITTER_API_PROXY:
-        ok2, fail2 = await _run_fetch(None, failed)
-        users.extend(ok2)
-        failed = fail2
+    if failed:
+        logger.warning("Twitter KOL fetch: %d/%d accounts failed", len(failed), len(accounts))
 
-    fetched_at_utc = datetime.now(timezone.utc).isoformat()
-    payload = SocialTwitterIngestRequest.model_validate(
+    return SocialTwitterIngestRequest.model_validate(
         {
             "platform": platform,
-            "fetched_at_utc": fetched_at_utc,
+            "fetched_at_utc": datetime.now(timezone.utc).isoformat(),
             "max_posts_per_user": max_posts,
             "top_replies_per_post": reply_limit,
             "include_replies": include_replies,
             "users": users,
         }
     )
+
+
+def _cohort_key(source_config: dict[str, Any]) -> str:
+    return str(source_config.get("crawl_accounts_cohort") or "all").strip().lower()
+
+
+def select_ingest_cohort(
+    bundle: SocialTwitterIngestRequest, source_config: dict[str, Any]
+) -> SocialTwitterIngestRequest:
+    """The users of a crawler bundle that ``crawl_accounts_cohort`` selects for ingest."""
+    cohort = _cohort_key(source_config)
+    if cohort == "all":
+        return bundle
+    users = [user for user in bundle.users if _account_cohort(user) == cohort]
+    return bundle.model_copy(update={"users": users})
+
+
+async def crawl_and_ingest_twitter_source(source_config: dict[str, Any]) -> SocialIngestResponse:
+    """Fetch twitterapi.io data by source YAML config and ingest into social tables."""
+    payload = await fetch_twitter_source_bundle(source_config)
     result = await ingest_twitter_bundle(payload)
     logger.info(
-        "Twitter KOL social ingest done: users=%d failed=%d posts_upserted=%d skipped=%d",
-        len(users),
-        len(failed),
+        "Twitter KOL social ingest done: users=%d posts_upserted=%d skipped=%d",
+        len(payload.users),
         result.posts_upserted,
         result.skipped_posts,
     )
     return result
 
 
-async def _upsert_account(
+# Rows per multi-row INSERT when ingesting a bundle.
+_INGEST_CHUNK_SIZE = 200
+
+
+def _chunks(items: list[Any], size: int = _INGEST_CHUNK_SIZE) -> list[list[Any]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _build_account_row(
     *,
     platform: str,
     username: str,
@@ -323,7 +381,7 @@ async def _upsert_account(
         return None
 
     now_iso = _now_iso()
-    row = {
+    return {
         "platform": platform,
         "username": clean,
         "username_normalized": normalized,
@@ -344,39 +402,45 @@ async def _upsert_account(
         "updated_at": now_iso,
     }
 
-    db = get_client()
-    res = await (
-        db.table("social_accounts")
-        .upsert(row, on_conflict="platform,username_normalized")
-        .execute()
-    )
-    if res.data:
-        return dict(res.data[0])
-
-    fallback = await (
-        db.table("social_accounts")
-        .select("*")
-        .eq("platform", platform)
-        .eq("username_normalized", normalized)
-        .limit(1)
-        .execute()
-    )
-    if fallback.data:
-        return dict(fallback.data[0])
-    return None
-
 
-async def _post_exists(platform: str, external_post_id: str) -> bool:
-    db = get_client()
-    res = await (
-        db.table("social_posts")
-        .select("id")
-        .eq("platform", platform)
-        .eq("external_post_id", external_post_id)
-        .limit(1)
-        .execute()
-    )
-    return bool(res.data)
+async def _upsert_accounts(db: Any, platform: str, rows: list[dict[str, Any]]) -> dict[str, int]:
+    """Upsert account rows in chunks; return username_normalized -> account id."""
+    ids: dict[str, int] = {}
+    for chunk in _chunks(rows):
+        res = await (
+            db.table("social_accounts")
+            .upsert(chunk, on_conflict="platform,username_normalized")
+            .execute()
+        )
+        for row in res.data or []:
+            ids[str(row["username_normalized"])] = int(row["id"])
+
+    missing = [row["username_normalized"] for row in rows if row["username_normalized"] not in ids]
+    for chunk in _chunks(missing):
+        res = await (
+            db.table("social_accounts")
+            .select("id,username_normalized")
+            .eq("platform", platform)
+            .in_("username_normalized", chunk)
+            .execute()
+        )
+        for row in res.data or []:
+            ids[str(row["username_normalized"])] = int(row["id"])
+    return ids
+
+
+async def _existing_post_ids(db: Any, platform: str, external_ids: list[str]) -> set[str]:
+    existing: set[str] = set()
+    for chunk in _chunks(external_ids):
+        res = await (
+            db.table("social_posts")
+            .select("external_post_id")
+            .eq("platform", platform)
+            .in_("external_post_id", chunk)
+            .execute()
+        )
+        existing.update(str(row["external_post_id"]) for row in res.data or [])
+    return existing
 
 
 def _build_post_row(
@@ -448,7 +512,12 @@ def _build_post_row(
 
 
 async def ingest_twitter_bundle(payload: SocialTwitterIngestRequest) -> SocialIngestResponse:
-    """Ingest twitterapi.io aggregated payload into unified tables."""
+    """Ingest twitterapi.io aggregated payload into unified tables.
+
+    Set-based: accounts are upserted in chunks, known posts are filtered with
+    one lookup per chunk, and new posts go in with ``INSERT ... ON CONFLICT
+    (platform, external_post_id) DO NOTHING RETURNING``.
+    """
     platform = (payload.platform or "x").strip().lower()
     users = payload.users or []
     max_posts_per_user = max(1, int(payload.max_posts_per_user or DEFAULT_POSTS_PER_USER))
@@ -468,18 +537,23 @@ async def ingest_twitter_bundle(payload: SocialTwitterIngestRequest) -> SocialIn
 
     account_keys_seen: set[tuple[str, str]] = set()
     kol_account_keys_seen: set[tuple[str, str]] = set()
-    posts_inserted = 0
     skipped_posts = 0
 
     crawled_at = _parse_time(payload.fetched_at_utc) if payload.fetched_at_utc else _now_iso()
 
+    # Pass 1: collect account rows. Later rows for the same account win, which
+    # matches the final state of the former one-upsert-per-post loop.
+    account_rows: dict[str, dict[str, Any]] = {}
+    # (post author key, raw post, author fields) in payload order
+    pending_posts: list[tuple[str, dict[str, Any], dict[str, Any]]] = []
+
     for user in users:
         query_username = _clean_username(user.get("query_username"))
         matched_username = _clean_username(user.get("matched_username")) or query_username
         kol_norm = _norm_username(matched_username)
         display_name = user.get("display_name")
 
-        kol_account = await _upsert_account(
+        kol_row = _build_account_row(
             platform=platform,
             username=matched_username,
             display_name=display_name,
@@ -491,7 +565,8 @@ async def ingest_twitter_bundle(payload: SocialTwitterIngestRequest) -> SocialIn
                 "matched_username": matched_username,
             },
         )
-        if kol_account and kol_norm:
+        if kol_row and kol_norm:
+            account_rows[kol_row["username_normalized"]] = kol_row
             key = (platform, kol_norm)
             account_keys_seen.add(key)
             kol_account_keys_seen.add(key)
@@ -515,7 +590,7 @@ async def ingest_twitter_bundle(payload: SocialTwitterIngestRequest) -> SocialIn
                 skipped_posts += 1
                 continue
 
-            post_author_account = await _upsert_account(
+            author_row = _build_account_row(
                 platform=platform,
                 username=post_author_username,
                 display_name=post_author.get("name") or display_name,
@@ -531,36 +606,64 @@ async def ingest_twitter_bundle(payload: SocialTwitterIngestRequest) -> SocialIn
                 metadata={"ingested_from": "twitter_bundle"},
                 raw_profile=post_author,
             )
+            if author_row:
+                account_rows[post_author_norm] = author_row
             account_keys_seen.add((platform, post_author_norm))
             if post_author_norm in kol_usernames:
                 kol_account_keys_seen.add((platform, post_author_norm))
 
-            row = _build_post_row(
-                platform=platform,
-                raw=raw_post,
-                account_id=(int(post_author_account["id"]) if post_author_account else None),
-                author_username=post_author_username,
-                author_display_name=post_author.get("name") or display_name,
-                author_platform_user_id=(
-                    str(post_author.get("id")) if post_author.get("id") else None
-                ),
-                is_kol_author=(post_author_norm in kol_usernames),
-                crawled_at=crawled_at,
-                include_replies=include_replies,
-                top_replies_per_post=top_replies_per_post,
+            pending_posts.append(
+                (
+                    post_author_norm,
+                    raw_post,
+                    {
+                        "author_username": post_author_username,
+                        "author_display_name": post_author.get("name") or display_name,
+                        "author_platform_user_id": (
+                            str(post_author.get("id")) if post_author.get("id") else None
+                        ),
+                    },
+                )
             )
-            if not row:
-                skipped_posts += 1
-                continue
 
-            # 去重：重复帖子直接跳过，不重复写入
-            exists = await _post_exists(platform, row["external_post_id"])
-            if exists:
-                skipped_posts += 1
-                continue
+    account_ids = await _upsert_accounts(db, platform, list(account_rows.values()))
 
-            await db.table("social_posts").insert(row).execute()
-            posts_inserted += 1
+    # Pass 2: build post rows, dropping duplicates within the payload.
+    post_rows: list[dict[str, Any]] = []
+    seen_post_ids: set[str] = set()
+    for author_norm, raw_post, author_fields in pending_posts:
+        row = _build_post_row(
+            platform=platform,
+            raw=raw_post,
+            account_id=account_ids.get(author_norm),
+            is_kol_author=(author_norm in kol_usernames),
+            crawled_at=crawled_at,
+            include_replies=include_replies,
+            top_replies_per_post=top_replies_per_post,
+            **author_fields,
+        )
+        if not row or row["external_post_id"] in seen_post_ids:
+            skipped_posts += 1
+            continue
+        seen_post_ids.add(row["external_post_id"])
+        post_rows.append(row)
+
+    # 去重：重复帖子直接跳过，不重复写入
+    existing = await _existing_post_ids(db, platform, [r["external_post_id"] for r in post_rows])
+    new_rows = [row for row in post_rows if row["external_post_id"] not in existing]
+    skipped_posts += len(post_rows) - len(new_rows)
+
+    posts_inserted = 0
+    for chunk in _chunks(new_rows):
+        res = await (
+            db.table("social_posts")
+            .upsert(chunk, on_conflict="platform,external_post_id", ignore_duplicates=True)
+            .execute()
+        )
+        inserted = len(res.data or [])
+        posts_inserted += inserted
+        # Rows inserted concurrently by another ingest since the lookup.
+        skipped_posts += len(chunk) - inserted
 
     return SocialIngestResponse(
         platform=platform,
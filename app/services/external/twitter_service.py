@@ -117,7 +117,7 @@ class TwitterClient:
         raw_tweets = tweets_data.get("tweets", [])
         next_cursor = tweets_data.get("next_cursor")
 
-        tweets = [self._parse_tweet(t) for t in raw_tweets if t.get("type") == "tweet"]
+        tweets = [self.parse_tweet(t) for t in raw_tweets if t.get("type") == "tweet"]
         return tweets, next_cursor
 
     async def search_tweets(
@@ -146,7 +146,7 @@ class TwitterClient:
         raw_tweets = data.get("tweets", [])
         next_cursor = data.get("next_cursor")
 
-        tweets = [self._parse_tweet(t) for t in raw_tweets if t.get("type") == "tweet"]
+        tweets = [self.parse_tweet(t) for t in raw_tweets if t.get("type") == "tweet"]
         return tweets, next_cursor
 
     async def get_user_info(self, username: str) -> TwitterUser | None:
@@ -177,7 +177,7 @@ class TwitterClient:
             created_at=user_data.get("createdAt", ""),
         )
 
-    def _parse_tweet(self, raw: dict[str, Any]) -> Tweet:
+    def parse_tweet(self, raw: dict[str, Any]) -> Tweet:
         """Parse raw API tweet into normalized Tweet dataclass."""
         author = raw.get("author", {})
 
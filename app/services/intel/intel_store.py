@@ -1,9 +1,21 @@
-"""JSON I/O and deduplication utilities for processed intel data."""
+"""JSON I/O and deduplication utilities for processed intel data.
+
+Processed files are parsed once and cached per path; every read re-validates
+the cache with one ``stat`` (mtime + size), so a pipeline run that rewrites a
+file is picked up on the next request. The cached ``IntelDocument`` builds
+secondary indexes (item positions by field value) and derived views lazily,
+once per file version, so API filters become index lookups instead of full
+scans. Cached data is shared between requests and must not be mutated.
+"""
 from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+import os
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock
+from typing import Any, TypeVar
 
 from app.config import BASE_DIR
 
@@ -13,18 +25,169 @@ PROCESSED_BASE = BASE_DIR / "data" / "processed"
 
 _EMPTY_RESPONSE: dict[str, Any] = {"generated_at": None, "item_count": 0, "items": []}
 
+T = TypeVar("T")
 
-def load_intel_json(module: str, filename: str) -> dict[str, Any]:
-    """Load ``data/processed/{module}/{filename}``, returning empty response on failure."""
+
+class IntelDocument:
+    """A parsed intel output file plus lazily built indexes over its items."""
+
+    __slots__ = ("data", "items", "_keys", "_indexes", "_derived", "_lock")
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        *,
+        keys: dict[str, Callable[[Any], Any]] | None = None,
+    ) -> None:
+        """``keys`` maps index names to value functions for computed indexes
+        (default: ``item.get(name)``)."""
+        self.data = data
+        items = data.get("items")
+        self.items: list[Any] = items if isinstance(items, list) else []
+        self._keys = keys or {}
+        self._indexes: dict[str, dict[Any, list[int]]] = {}
+        self._derived: dict[str, Any] = {}
+        self._lock = Lock()
+
+    @property
+    def generated_at(self) -> Any:
+        return self.data.get("generated_at")
+
+    def index(self, name: str) -> dict[Any, list[int]]:
+        """Item positions (ascending) per value of field ``name``."""
+        index = self._indexes.get(name)
+        if index is None:
+            get = self._keys.get(name) or (lambda item: item.get(name))
+            index = {}
+            for pos, item in enumerate(self.items):
+                index.setdefault(get(item), []).append(pos)
+            self._indexes[name] = index
+        return index
+
+    def positions(self, **criteria: Any) -> list[int] | None:
+        """Positions of items whose fields equal the given values.
+
+        ``None`` criteria are ignored; a set/frozenset value matches any of
+        its members. Returns None when no criterion applies (all items).
+        """
+        selected: list[int] | None = None
+        for name, wanted in criteria.items():
+            if wanted is None:
+                continue
+            index = self.index(name)
+            if isinstance(wanted, (set, frozenset)):
+                found = sorted({pos for value in wanted for pos in index.get(value, ())})
+            else:
+                found = index.get(wanted, [])
+            if selected is None:
+                selected = found
+            else:
+                keep = set(found)
+                selected = [pos for pos in selected if pos in keep]
+            if not selected:
+                return []
+        return selected
+
+    def select(self, **criteria: Any) -> list[Any]:
+        """Items matching ``positions(**criteria)``, in file order."""
+        selected = self.positions(**criteria)
+        if selected is None:
+            return self.items
+        return [self.items[pos] for pos in selected]
+
+    def derived(self, name: str, build: Callable[[IntelDocument], T]) -> T:
+        """``build(self)``, computed once per file version."""
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._derived:
+                self._derived[name] = build(self)
+            return self._derived[name]
+
+
+_EMPTY_DOCUMENT = IntelDocument(_EMPTY_RESPONSE)
+
+# path -> ((mtime_ns, size), document)
+_cache: dict[Path, tuple[tuple[int, int], IntelDocument]] = {}
+_cache_lock = Lock()
+
+
+def load_intel_document(module: str, filename: str) -> IntelDocument:
+    """Cached ``data/processed/{module}/{filename}`` (empty document on failure)."""
     path = PROCESSED_BASE / module / filename
-    if not path.exists():
-        return dict(_EMPTY_RESPONSE)
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        logger.warning("Failed to load %s: %s", path, e)
+        stat = os.stat(path)
+    except OSError:
+        _cache.pop(path, None)
+        return _EMPTY_DOCUMENT
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            # Not cached: a file caught mid-write is retried next request.
+            logger.warning("Failed to load %s: %s", path, e)
+            return _EMPTY_DOCUMENT
+        document = IntelDocument(data if isinstance(data, dict) else {"items": data})
+        _cache[path] = (stamp, document)
+        return document
+
+
+def intel_generation(module: str, *filenames: str) -> tuple:
+    """(filename, mtime_ns, size) of each processed file; None stamps for missing ones.
+
+    Changes whenever a pipeline run rewrites one of the files, which makes it
+    the data generation for response caches and ETags.
+    """
+    stamps = []
+    for filename in filenames:
+        try:
+            stat = os.stat(PROCESSED_BASE / module / filename)
+        except OSError:
+            stamps.append((filename, None, None))
+        else:
+            stamps.append((filename, stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+def load_intel_json(module: str, filename: str) -> dict[str, Any]:
+    """Load ``data/processed/{module}/{filename}``, returning empty response on failure.
+
+    The dict is the cached parse; treat it as read-only.
+    """
+    document = load_intel_document(module, filename)
+    if document is _EMPTY_DOCUMENT:
         return dict(_EMPTY_RESPONSE)
+    return document.data
+
+
+def paginate(
+    items: list[Any], *, generated_at: Any, limit: int, offset: int
+) -> dict[str, Any]:
+    """Standard paged list response over already filtered items."""
+    total = len(items)
+    paged_items = items[offset:offset + limit]
+    next_offset = offset + limit if (offset + len(paged_items)) < total else None
+    return {
+        "generated_at": generated_at,
+        "item_count": total,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "has_more": next_offset is not None,
+        "next_offset": next_offset,
+        "items": paged_items,
+    }
+
 
 
 def get_intel_stats(*modules_and_files: tuple[str, str]) -> dict[str, Any]:
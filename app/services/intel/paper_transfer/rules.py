@@ -1,6 +1,8 @@
 """Rule-based paper pre-classification using title/abstract keyword signals."""
 from __future__ import annotations
 
+from app.services.intel.rule_engine import compile_rules
+
 # Positive signals: engineering / applied work
 APPLIED_KEYWORDS = [
     "system",
@@ -87,6 +89,13 @@ TIER2_KEYWORDS = [
     "数字孪生",
 ]
 
+_RULES = compile_rules({
+    "applied": APPLIED_KEYWORDS,
+    "theoretical": THEORETICAL_KEYWORDS,
+    "tier1": TIER1_KEYWORDS,
+    "tier2": TIER2_KEYWORDS,
+})
+
 
 def classify_paper_by_rules(title: str, abstract: str | None) -> dict:
     """Classify a paper by keyword signals in its title and abstract.
@@ -96,10 +105,10 @@ def classify_paper_by_rules(title: str, abstract: str | None) -> dict:
         commercialization_tier: 1 | 2 | 3
         matched_signals: list[str] — all matched keywords
     """
-    text = (title + " " + (abstract or "")).lower()
+    scan = _RULES.scan(title + " " + (abstract or ""))
 
-    applied_hits = [kw for kw in APPLIED_KEYWORDS if kw in text]
-    theory_hits = [kw for kw in THEORETICAL_KEYWORDS if kw in text]
+    applied_hits = scan.hits("applied")
+    theory_hits = scan.hits("theoretical")
 
     if applied_hits and len(applied_hits) >= len(theory_hits):
         content_type = "applied"
@@ -108,8 +117,8 @@ def classify_paper_by_rules(title: str, abstract: str | None) -> dict:
     else:
         content_type = "mixed"
 
-    tier1_hits = [kw for kw in TIER1_KEYWORDS if kw in text]
-    tier2_hits = [kw for kw in TIER2_KEYWORDS if kw in text]
+    tier1_hits = scan.hits("tier1")
+    tier2_hits = scan.hits("tier2")
 
     if tier1_hits:
         tier = 1
@@ -11,10 +11,10 @@ import re
 from datetime import datetime
 from typing import Any
 
+from app.services.intel.rule_engine import RuleScan, compile_rules
 from app.services.intel.shared import (
     clamp_score,
     compute_importance,
-    keyword_score,
 )
 
 logger = logging.getLogger(__name__)
@@ -91,6 +91,20 @@ DEPARTMENT_MAP: list[tuple[str, str]] = [
 # University patterns
 UNIVERSITY_RE = re.compile(r"([\u4e00-\u9fa5]{2,8}(?:大学|学院|研究院))")
 
+# Relevance keywords plus the literal triggers of the change regexes: one
+# scan scores the article and tells which regexes can match at all.
+_RULES = compile_rules({
+    "match": KEYWORDS_PERSONNEL,
+    "triggers": ["任命", "免去"],
+})
+
+
+def _scan_article(article: dict[str, Any]) -> tuple[RuleScan, str, str]:
+    """Cached rule scan of title + newline + content, plus title and content."""
+    title = article.get("title") or ""
+    content = article.get("content") or ""
+    return _RULES.scan(f"{title}\n{content}"), title, content
+
 
 def _infer_department(position: str) -> str | None:
     """Infer department from position text."""
@@ -114,8 +128,10 @@ def extract_changes(article: dict[str, Any]) -> list[dict[str, Any]]:
     Returns list of dicts with keys:
         name, action, position, department, date, source_article_id
     """
-    content = article.get("content") or ""
-    title = article.get("title") or ""
+    scan, title, content = _scan_article(article)
+    triggers = scan.hits("triggers")
+    if not triggers:
+        return []
     text = f"{title}\n{content}"
     url_hash = article.get("url_hash", "")
 
@@ -131,7 +147,10 @@ def extract_changes(article: dict[str, Any]) -> list[dict[str, Any]]:
     changes: list[dict[str, Any]] = []
     seen: set[tuple[str, str, str]] = set()  # (name, action, position) dedup
 
-    for m in APPOINTMENT_RE.finditer(text):
+    appointments = APPOINTMENT_RE.finditer(text) if "任命" in triggers else ()
+    dismissals = DISMISSAL_RE.finditer(text) if "免去" in triggers else ()
+
+    for m in appointments:
         name = m.group(1).strip()
         position = m.group(2).strip()
         # Clean up stray whitespace/newlines in position
@@ -148,7 +167,7 @@ def extract_changes(article: dict[str, Any]) -> list[dict[str, Any]]:
                 "source_article_id": url_hash,
             })
 
-    for m in DISMISSAL_RE.finditer(text):
+    for m in dismissals:
         name = m.group(1).strip()
         position = m.group(2).strip()
         position = re.sub(r"\s+", "", position)
@@ -169,10 +188,8 @@ def extract_changes(article: dict[str, Any]) -> list[dict[str, Any]]:
 
 def compute_match_score(article: dict[str, Any]) -> int:
     """Compute matchScore for a personnel article (0-100)."""
-    title = article.get("title", "")
-    content = (article.get("content") or "")[:3000]
-    text = f"{title}\n{content}"
-    score = keyword_score(text, KEYWORDS_PERSONNEL)
+    scan, title, content = _scan_article(article)
+    score = scan.score("match", limit=len(title) + 1 + min(len(content), 3000))
     return clamp_score(score)
 
 
@@ -3,13 +3,12 @@
 Instead of reading a static pre-processed JSON file, this module:
 1. Reads ALL personnel articles from database on each call
 2. Applies the rules engine (fast regex) to extract appointment/dismissal records
-3. Merges with cached LLM enrichments from data/processed/personnel_intel/_enriched/
+3. Merges with cached LLM enrichments from the intel enrichment store
 4. Returns the complete, always-up-to-date dataset
 """
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import re
 from datetime import datetime
@@ -17,7 +16,8 @@ from functools import lru_cache
 from typing import Any
 
 from app.config import BASE_DIR
-from app.scheduler.manager import load_all_source_configs
+from app.scheduler.source_catalog import get_source_catalog
+from app.services.intel.intel_store import IntelDocument, load_intel_document, paginate
 from app.services.intel.personnel.rules import (
     change_id,
     compute_match_score,
@@ -25,6 +25,7 @@ from app.services.intel.personnel.rules import (
 )
 from app.services.intel.personnel.source_scope import filter_personnel_scoped_articles
 from app.services.intel.shared import article_date, parse_source_filter
+from app.services.stores.intel_enrichment_store import EnrichmentStore
 from app.services.stores.json_reader import get_articles
 
 logger = logging.getLogger(__name__)
@@ -32,26 +33,21 @@ logger = logging.getLogger(__name__)
 PROCESSED_DIR = BASE_DIR / "data" / "processed" / "personnel_intel"
 ENRICHED_DIR = PROCESSED_DIR / "_enriched"
 
+_enrichment_store = EnrichmentStore("personnel", ENRICHED_DIR, payload_key="enriched_changes")
+
 
 # ---------------------------------------------------------------------------
 # Cached LLM enrichments
 # ---------------------------------------------------------------------------
 
-def _load_enriched_cache() -> dict[str, dict[str, Any]]:
-    """Load all cached LLM enrichments from _enriched/ directory, keyed by change ID."""
+async def _load_enriched_cache() -> dict[str, dict[str, Any]]:
+    """Load all cached LLM enrichments, keyed by change ID."""
     cache: dict[str, dict[str, Any]] = {}
-    if not ENRICHED_DIR.exists():
-        return cache
-    for path in ENRICHED_DIR.glob("*.json"):
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            for item in data.get("enriched_changes", []):
-                cid = item.get("id", "")
-                if cid:
-                    cache[cid] = item
-        except (json.JSONDecodeError, KeyError, OSError) as e:
-            logger.warning("Skipping invalid enriched file %s: %s", path.name, e)
+    for _, enriched_changes in await _enrichment_store.load_all():
+        for item in enriched_changes:
+            cid = item.get("id", "")
+            if cid:
+                cache[cid] = item
     return cache
 
 
@@ -83,9 +79,7 @@ _TITLE_DEPT_RE = re.compile(
 @lru_cache(maxsize=1)
 def _personnel_source_name_map() -> dict[str, str]:
     mapping: dict[str, str] = {}
-    for source in load_all_source_configs():
-        if source.get("dimension") != "personnel":
-            continue
+    for source in get_source_catalog().by_dimension.get("personnel", ()):
         source_id = source.get("id", "")
         if source_id:
             mapping[source_id] = source.get("name", source_id)
@@ -156,7 +150,7 @@ async def _compute_live_changes() -> list[dict[str, Any]]:
             raw_changes.append((cid, change, article))
 
     # Load cached LLM enrichments
-    enrichment_cache = _load_enriched_cache()
+    enrichment_cache = await _load_enriched_cache()
 
     # Merge: use cached LLM data if available, otherwise default
     items: list[dict[str, Any]] = []
@@ -262,18 +256,11 @@ def get_personnel_feed(
     offset: int = 0,
 ) -> dict[str, Any]:
     """Read feed.json and apply optional filters."""
-    from app.services.intel.shared import load_intel_json
-
-    data = load_intel_json("personnel_intel", "feed.json")
-    items = data.get("items", [])
+    doc = load_intel_document("personnel_intel", "feed.json")
 
-    # 应用信源筛选（优先筛选，减少后续处理量）
+    # 信源、重要性走索引，其余条件只扫描命中的条目
     source_filter = parse_source_filter(source_id, source_ids, source_name, source_names)
-    if source_filter:
-        items = [i for i in items if i.get("source_id") in source_filter]
-
-    if importance:
-        items = [i for i in items if i.get("importance") == importance]
+    items = doc.select(source_id=source_filter or None, importance=importance or None)
     if min_match_score is not None:
         items = [i for i in items if (i.get("matchScore") or 0) >= min_match_score]
     if keyword:
@@ -286,19 +273,7 @@ def get_personnel_feed(
             or any(kw in c.get("position", "").lower() for c in i.get("changes", []))
         ]
 
-    total = len(items)
-    paged_items = items[offset:offset + limit]
-    next_offset = offset + limit if (offset + len(paged_items)) < total else None
-    return {
-        "generated_at": data.get("generated_at"),
-        "item_count": total,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "has_more": next_offset is not None,
-        "next_offset": next_offset,
-        "items": paged_items,
-    }
+    return paginate(items, generated_at=doc.generated_at, limit=limit, offset=offset)
 
 
 def get_personnel_changes(
@@ -309,16 +284,12 @@ def get_personnel_changes(
     offset: int = 0,
 ) -> dict[str, Any]:
     """Read changes.json and apply optional filters."""
-    from app.services.intel.shared import load_intel_json
-
-    data = load_intel_json("personnel_intel", "changes.json")
-    items = data.get("items", [])
+    doc = load_intel_document("personnel_intel", "changes.json")
+    items = doc.select(action=action or None)
 
     if department:
         dept_lower = department.lower()
         items = [i for i in items if dept_lower in (i.get("department") or "").lower()]
-    if action:
-        items = [i for i in items if i.get("action") == action]
     if keyword:
         kw = keyword.lower()
         items = [
@@ -328,39 +299,28 @@ def get_personnel_changes(
             or kw in (i.get("department") or "").lower()
         ]
 
-    total = len(items)
-    paged_items = items[offset:offset + limit]
-    next_offset = offset + limit if (offset + len(paged_items)) < total else None
-    return {
-        "generated_at": data.get("generated_at"),
-        "item_count": total,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "has_more": next_offset is not None,
-        "next_offset": next_offset,
-        "items": paged_items,
-    }
+    return paginate(items, generated_at=doc.generated_at, limit=limit, offset=offset)
 
 
 def get_personnel_stats() -> dict[str, Any]:
     """Get summary statistics about personnel data."""
-    from app.services.intel.shared import load_intel_json
+    feed_doc = load_intel_document("personnel_intel", "feed.json")
+    changes_doc = load_intel_document("personnel_intel", "changes.json")
+
+    return {
+        "total_articles": feed_doc.data.get("item_count", 0),
+        "total_changes": changes_doc.data.get("item_count", 0),
+        "by_department": dict(changes_doc.derived("by_department", _count_by_department)),
+        "generated_at": feed_doc.generated_at,
+    }
 
-    feed_data = load_intel_json("personnel_intel", "feed.json")
-    changes_data = load_intel_json("personnel_intel", "changes.json")
 
+def _count_by_department(doc: IntelDocument) -> dict[str, int]:
     dept_counts: dict[str, int] = {}
-    for item in changes_data.get("items", []):
+    for item in doc.items:
         dept = item.get("department") or "其他"
         dept_counts[dept] = dept_counts.get(dept, 0) + 1
-
-    return {
-        "total_articles": feed_data.get("item_count", 0),
-        "total_changes": changes_data.get("item_count", 0),
-        "by_department": dept_counts,
-        "generated_at": feed_data.get("generated_at"),
-    }
+    return dept_counts
 
 
 # ---------------------------------------------------------------------------
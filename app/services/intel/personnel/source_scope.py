@@ -6,14 +6,14 @@ from __future__ import annotations
 
 from functools import lru_cache
 
-from app.scheduler.manager import load_all_source_configs
+from app.scheduler.source_catalog import get_source_catalog
 
 
 @lru_cache(maxsize=1)
 def get_personnel_source_ids() -> set[str]:
     """Return allowed source IDs for personnel intel from personnel.yaml only."""
     ids: set[str] = set()
-    for source in load_all_source_configs():
+    for source in get_source_catalog():
         if source.get("source_file") != "personnel.yaml":
             continue
         sid = str(source.get("id") or "").strip()
@@ -1,14 +1,44 @@
-"""Shared pipeline utilities — hash tracking, JSON output."""
+"""Shared pipeline utilities — hash tracking, DB watermarks, JSON output."""
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from datetime import datetime, timezone
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
+from app.services.stores import intel_watermark_store
+from app.services.stores.json_reader import get_articles, get_stored_article_ids
+
 logger = logging.getLogger(__name__)
 
+# Columns the rule processors read; content_html, custom_fields, simhash etc.
+# are never loaded.
+ARTICLE_COLUMNS = (
+    "url_hash",
+    "source_id",
+    "dimension",
+    "group_name",
+    "url",
+    "title",
+    "author",
+    "published_at",
+    "content",
+    "content_hash",
+    "tags",
+    "extra",
+    "crawled_at",
+    "canonical_url_hash",
+)
+
+# Re-read this much before the watermark: a crawl batch shares one
+# crawled_at and may commit after a newer batch was already processed.
+WATERMARK_OVERLAP = timedelta(minutes=10)
+
 
 class HashTracker:
     """Incremental processing tracker using a JSON file of url_hashes.
@@ -25,26 +55,33 @@ class HashTracker:
         self._hashes_file = hashes_file
         self._processed_dir = processed_dir
 
-    def load(self) -> set[str]:
+    def load(self, *, version: str | None = None) -> set[str]:
+        """Tracked hashes; empty when they were saved under another ``version``.
+
+        Files written without a version (before versioning) are accepted.
+        """
         if not self._hashes_file.exists():
             return set()
         try:
             with open(self._hashes_file, encoding="utf-8") as f:
                 data = json.load(f)
-            return set(data.get("hashes", []))
         except (json.JSONDecodeError, OSError):
             return set()
+        saved_version = data.get("version")
+        if version is not None and saved_version is not None and saved_version != version:
+            return set()
+        return set(data.get("hashes", []))
 
-    def save(self, hashes: set[str]) -> None:
+    def save(self, hashes: set[str], *, version: str | None = None) -> None:
         self._processed_dir.mkdir(parents=True, exist_ok=True)
+        payload: dict[str, Any] = {
+            "hashes": sorted(hashes),
+            "last_run": datetime.now(timezone.utc).isoformat(),
+        }
+        if version is not None:
+            payload["version"] = version
         with open(self._hashes_file, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "hashes": sorted(hashes),
-                    "last_run": datetime.now(timezone.utc).isoformat(),
-                },
-                f, ensure_ascii=False, indent=2,
-            )
+            json.dump(payload, f, ensure_ascii=False, indent=2)
 
 
 def save_output_json(
@@ -70,5 +107,118 @@ def save_output_json(
     if extra:
         payload.update(extra)
 
-    with open(processed_dir / filename, "w", encoding="utf-8") as f:
+    # Write-then-rename: API readers cache by mtime and never see a partial file.
+    path = processed_dir / filename
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
+    tmp.replace(path)
+
+
+# ---------------------------------------------------------------------------
+# Watermark-driven incremental loading
+# ---------------------------------------------------------------------------
+
+
+def rules_version(*modules: ModuleType, source_scope: Iterable[str] = ()) -> str:
+    """Fingerprint of the rules / prompt modules a processor's output depends on.
+
+    Any edit to these files, or to the set of source ids the processor keeps
+    (``source_scope``), changes the version and invalidates the processor's
+    watermark, so no manual version bump is needed.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())
+    for source_id in sorted(source_scope):
+        digest.update(b"\0" + source_id.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class ArticleDelta:
+    """Articles to (re)process and the watermark they advance to.
+
+    ``full`` is True when whole dimensions were loaded (first run, ``force``,
+    a rules/prompt change, or no DB): the processor rebuilds its state from
+    scratch instead of merging. ``dimensions`` are the ones loaded, for ``prune``.
+    """
+
+    processor: str
+    version: str
+    full: bool
+    articles: list[dict[str, Any]] = field(default_factory=list)
+    watermark: datetime | None = None
+    dimensions: tuple[str, ...] = ()
+
+    def observe(self, rows: Iterable[dict[str, Any]]) -> None:
+        for row in rows:
+            self.articles.append(row)
+            crawled = _parse_timestamp(row.get("crawled_at"))
+            if crawled is not None and (self.watermark is None or crawled > self.watermark):
+                self.watermark = crawled
+
+    async def prune(self, records: dict[str, Any]) -> int:
+        """Drop records (keyed by url_hash) whose article is no longer stored.
+
+        A full load already holds every stored article; an incremental one
+        looks up just the records' ids.
+        """
+        if self.full:
+            live = {str(a.get("url_hash") or "") for a in self.articles}
+        else:
+            live = await get_stored_article_ids(records, self.dimensions)
+        stale = [key for key in records if key not in live]
+        for key in stale:
+            del records[key]
+        if stale:
+            logger.info("%s: pruned %d deleted articles", self.processor, len(stale))
+        return len(stale)
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def load_article_delta(
+    processor: str,
+    dimensions: Iterable[str],
+    *,
+    version: str,
+    force: bool = False,
+) -> ArticleDelta:
+    """Load articles crawled since ``processor``'s watermark (all if none)."""
+    since = None if force else await intel_watermark_store.get_watermark(processor, version)
+    delta = ArticleDelta(
+        processor=processor, version=version, full=since is None, dimensions=tuple(dimensions)
+    )
+    crawled_since = since - WATERMARK_OVERLAP if since is not None else None
+    for dim in delta.dimensions:
+        delta.observe(
+            await get_articles(dim, crawled_since=crawled_since, columns=ARTICLE_COLUMNS)
+        )
+    if since is not None and (delta.watermark is None or delta.watermark < since):
+        delta.watermark = since
+    logger.info(
+        "%s: loaded %d articles (%s)",
+        processor,
+        len(delta.articles),
+        "full" if delta.full else f"crawled since {crawled_since.isoformat()}",
+    )
+    return delta
+
+
+async def commit_watermark(delta: ArticleDelta) -> None:
+    """Advance the watermark once the delta's results are persisted."""
+    if delta.watermark is not None:
+        await intel_watermark_store.set_watermark(
+            delta.processor, delta.watermark, delta.version
+        )
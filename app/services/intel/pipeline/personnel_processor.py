@@ -12,10 +12,25 @@ import logging
 from typing import Any
 
 from app.config import BASE_DIR
+from app.crawlers.utils.near_dup import collapse_near_duplicates
+from app.services.intel import scoring
+from app.services.intel.personnel import llm as personnel_llm
+from app.services.intel.personnel import rules as personnel_rules
 from app.services.intel.personnel.rules import change_id, enrich_by_rules
-from app.services.intel.personnel.source_scope import filter_personnel_scoped_articles
-from app.services.intel.pipeline.base import HashTracker, save_output_json
+from app.services.intel.personnel.source_scope import (
+    filter_personnel_scoped_articles,
+    get_personnel_source_ids,
+)
+from app.services.intel.pipeline.base import (
+    ARTICLE_COLUMNS,
+    HashTracker,
+    commit_watermark,
+    load_article_delta,
+    rules_version,
+    save_output_json,
+)
 from app.services.intel.shared import article_date
+from app.services.stores.intel_enrichment_store import EnrichmentStore
 from app.services.stores.json_reader import get_articles
 
 logger = logging.getLogger(__name__)
@@ -32,6 +47,7 @@ ENRICHED_DIR = PROCESSED_DIR / "_enriched"
 
 _hash_tracker = HashTracker(PROCESSED_DIR / "_processed_hashes.json", PROCESSED_DIR)
 _enrich_tracker = HashTracker(PROCESSED_DIR / "_enriched_hashes.json", PROCESSED_DIR)
+_enrichment_store = EnrichmentStore("personnel", ENRICHED_DIR, payload_key="enriched_changes")
 
 
 # ---------------------------------------------------------------------------
@@ -57,6 +73,17 @@ def _build_feed_item(article: dict, enrichment: dict) -> dict:
     }
 
 
+def _load_feed_items() -> dict[str, dict] | None:
+    """Current feed.json items by article id, or None when there is no feed."""
+    path = PROCESSED_DIR / "feed.json"
+    try:
+        with open(path, encoding="utf-8") as f:
+            items = json.load(f)["items"]
+    except (json.JSONDecodeError, KeyError, OSError):
+        return None
+    return {item["id"]: item for item in items if item.get("id")}
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -67,10 +94,22 @@ async def process_personnel_pipeline(
 ) -> dict[str, Any]:
     """Run personnel processing pipeline (rules only, no LLM).
 
+    Articles crawled since the last run are merged into the existing
+    feed.json; the feed is rebuilt from the whole dimension on ``force``, on
+    the first run and after a rules change.
+
     Returns summary dict for the pipeline orchestrator.
     """
-    articles = await get_articles(DIMENSION)
-    articles = filter_personnel_scoped_articles(articles)
+    version = rules_version(
+        personnel_rules, scoring, source_scope=get_personnel_source_ids()
+    )
+    feed_by_id = None if force else _load_feed_items()
+    delta = await load_article_delta(
+        "personnel", [DIMENSION], version=version, force=force or feed_by_id is None
+    )
+    if delta.full:
+        feed_by_id = {}
+    articles = filter_personnel_scoped_articles(delta.articles)
     logger.info("Personnel pipeline: loaded %d articles", len(articles))
 
     # Deduplicate by url_hash
@@ -81,6 +120,16 @@ async def process_personnel_pipeline(
         if h and h not in seen:
             seen.add(h)
             unique.append(a)
+    unique = collapse_near_duplicates(unique)
+    # Near duplicates of an article already in the feed stay out of it.
+    unique = [
+        a for a in unique
+        if not (
+            a.get("canonical_url_hash")
+            and a["canonical_url_hash"] != a.get("url_hash")
+            and a["canonical_url_hash"] in feed_by_id
+        )
+    ]
 
     # Filter already-processed (incremental)
     processed_hashes = set() if force else _hash_tracker.load()
@@ -103,20 +152,21 @@ async def process_personnel_pipeline(
                 new_count += 1
         _hash_tracker.save(processed_hashes)
 
-    # Rebuild output files from ALL unique articles
-    feed_items: list[dict] = []
-    all_changes: list[dict] = []
+    # Merge (re)crawled articles into the feed; changes.json is derived from it
     for article in unique:
-        enrichment = enrich_by_rules(article)
-        feed_items.append(_build_feed_item(article, enrichment))
-        all_changes.extend(enrichment.get("changes", []))
-
-    feed_items.sort(key=lambda x: x.get("date", ""), reverse=True)
+        feed_by_id[article.get("url_hash", "")] = _build_feed_item(
+            article, enrich_by_rules(article)
+        )
+    await delta.prune(feed_by_id)
+    feed_items = sorted(feed_by_id.values(), key=lambda x: x.get("date", ""), reverse=True)
+    all_changes = [change for item in feed_items for change in item.get("changes", [])]
     all_changes.sort(key=lambda x: x.get("date", ""), reverse=True)
 
     save_output_json(PROCESSED_DIR, "feed.json", feed_items)
     save_output_json(PROCESSED_DIR, "changes.json", all_changes)
 
+    await commit_watermark(delta)
+
     logger.info(
         "Personnel output: %d feed items, %d changes",
         len(feed_items), len(all_changes),
@@ -127,6 +177,7 @@ async def process_personnel_pipeline(
         "unique": len(unique),
         "new_processed": new_count,
         "previously_processed": len(processed_hashes) - new_count,
+        "full_reload": delta.full,
         "feed_items": len(feed_items),
         "changes_extracted": len(all_changes),
     }
@@ -136,39 +187,27 @@ async def process_personnel_pipeline(
 # LLM enrichment helpers
 # ---------------------------------------------------------------------------
 
-
-
-def _save_enriched_article(article: dict, enriched_changes: list[dict]) -> None:
-    ENRICHED_DIR.mkdir(parents=True, exist_ok=True)
-    url_hash = article.get("url_hash", "unknown")
-    out = {
-        "article": {
-            "url_hash": url_hash,
-            "title": article.get("title"),
-            "url": article.get("url"),
-            "published_at": article.get("published_at"),
-            "source_id": article.get("source_id"),
-            "source_name": article.get("source_name"),
-        },
-        "enriched_changes": enriched_changes,
+async def _save_enriched_article(
+    article: dict, enriched_changes: list[dict], *, version: str | None = None,
+) -> None:
+    stored_article = {
+        "url_hash": article.get("url_hash", "unknown"),
+        "title": article.get("title"),
+        "url": article.get("url"),
+        "published_at": article.get("published_at"),
+        "source_id": article.get("source_id"),
+        "source_name": article.get("source_name"),
+        "content_hash": article.get("content_hash"),
     }
-    path = ENRICHED_DIR / f"{url_hash}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    await _enrichment_store.put_many([(stored_article, enriched_changes)], version=version)
 
 
-def _load_all_enriched_changes() -> list[dict]:
-    if not ENRICHED_DIR.exists():
-        return []
-    all_changes: list[dict] = []
-    for path in ENRICHED_DIR.glob("*.json"):
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            all_changes.extend(data.get("enriched_changes", []))
-        except (json.JSONDecodeError, KeyError, OSError) as e:
-            logger.warning("Skipping invalid enriched file %s: %s", path.name, e)
-    return all_changes
+async def _load_all_enriched_changes() -> list[dict]:
+    return [
+        change
+        for _, enriched_changes in await _enrichment_store.load_all()
+        for change in enriched_changes
+    ]
 
 
 def _build_enriched_change(
@@ -215,7 +254,7 @@ async def process_personnel_llm_enrichment(
         enrich_changes_batch,
     )
 
-    articles = await get_articles(DIMENSION)
+    articles = await get_articles(DIMENSION, columns=ARTICLE_COLUMNS)
     articles = filter_personnel_scoped_articles(articles)
 
     # Deduplicate
@@ -226,6 +265,7 @@ async def process_personnel_llm_enrichment(
         if h and h not in seen:
             seen.add(h)
             unique.append(a)
+    unique = collapse_near_duplicates(unique)
 
     # Extract changes via rules for all articles with changes
     articles_with_changes: list[tuple[dict, list[dict]]] = []
@@ -245,8 +285,9 @@ async def process_personnel_llm_enrichment(
     if not articles_with_changes:
         return {"skipped": True, "reason": "no changes to enrich"}
 
-    # Filter already-enriched (incremental)
-    enriched_hashes = _enrich_tracker.load()
+    # Filter already-enriched (incremental; a prompt change re-enriches all)
+    llm_version = rules_version(personnel_llm)
+    enriched_hashes = _enrich_tracker.load(version=llm_version)
     new_articles = [
         (a, c) for a, c in articles_with_changes
         if a.get("url_hash", "") not in enriched_hashes
@@ -272,7 +313,7 @@ async def process_personnel_llm_enrichment(
                     _build_enriched_change(change, article, enrich)
                     for change, enrich in zip(changes, enrichments)
                 ]
-                _save_enriched_article(article, enriched)
+                await _save_enriched_article(article, enriched, version=llm_version)
                 h = article.get("url_hash", "")
                 if h:
                     enriched_hashes.add(h)
@@ -280,10 +321,10 @@ async def process_personnel_llm_enrichment(
 
         tasks = [_enrich_one(a, c) for a, c in new_articles]
         await asyncio.gather(*tasks)
-        _enrich_tracker.save(enriched_hashes)
+        _enrich_tracker.save(enriched_hashes, version=llm_version)
 
     # Rebuild enriched_feed.json from all cached enriched data
-    all_enriched = _load_all_enriched_changes()
+    all_enriched = await _load_all_enriched_changes()
     all_enriched.sort(
         key=lambda x: (
             0 if x.get("group") == "action" else 1,
@@ -6,15 +6,24 @@ Self-contained hash tracking and output logic (no imports from scripts/).
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Any
 
 from app.config import BASE_DIR, settings
-from app.services.intel.pipeline.base import HashTracker, save_output_json
+from app.crawlers.utils.near_dup import collapse_near_duplicates
+from app.services.intel import scoring
+from app.services.intel.pipeline.base import (
+    HashTracker,
+    commit_watermark,
+    load_article_delta,
+    rules_version,
+    save_output_json,
+)
+from app.services.intel.policy import llm as policy_llm
+from app.services.intel.policy import rules as policy_rules
 from app.services.intel.policy.rules import enrich_by_rules
 from app.services.intel.shared import article_date
-from app.services.stores.json_reader import get_articles
+from app.services.stores.intel_enrichment_store import EnrichmentStore
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +39,7 @@ FEED_MIN_SCORE = 20  # Minimum matchScore for articles to appear in feed output
 ENRICHED_DIR = PROCESSED_DIR / "_enriched"
 
 _hash_tracker = HashTracker(PROCESSED_DIR / "_processed_hashes.json", PROCESSED_DIR)
+_enrichment_store = EnrichmentStore("policy", ENRICHED_DIR, payload_key="llm")
 _source_name_by_id: dict[str, str] | None = None
 
 
@@ -37,41 +47,32 @@ _source_name_by_id: dict[str, str] | None = None
 # Enriched cache I/O
 # ---------------------------------------------------------------------------
 
-def _save_enriched(article: dict, enrichment: dict) -> None:
-    ENRICHED_DIR.mkdir(parents=True, exist_ok=True)
-    url_hash = article.get("url_hash", "unknown")
-    out = {
-        "article": {
-            "url_hash": url_hash,
-            "title": article.get("title"),
-            "url": article.get("url"),
-            "published_at": article.get("published_at"),
-            "source_id": article.get("source_id"),
-            "source_name": article.get("source_name"),
-            "dimension": article.get("dimension"),
-            "group": article.get("group"),
-            "tags": article.get("tags", []),
-            "content": article.get("content"),
-        },
-        "llm": enrichment,
+def _enriched_article(article: dict) -> dict:
+    """Article fields kept with its enrichment (what the output builders read)."""
+    return {
+        "url_hash": article.get("url_hash", "unknown"),
+        "title": article.get("title"),
+        "url": article.get("url"),
+        "published_at": article.get("published_at"),
+        "source_id": article.get("source_id"),
+        "source_name": article.get("source_name"),
+        "dimension": article.get("dimension"),
+        "group": article.get("group"),
+        "tags": article.get("tags", []),
+        "content": article.get("content"),
+        "content_hash": article.get("content_hash"),
     }
-    path = ENRICHED_DIR / f"{url_hash}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
 
 
-def _load_all_enriched() -> list[tuple[dict, dict]]:
-    if not ENRICHED_DIR.exists():
-        return []
-    results: list[tuple[dict, dict]] = []
-    for path in ENRICHED_DIR.glob("*.json"):
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            results.append((data["article"], data["llm"]))
-        except (json.JSONDecodeError, KeyError, OSError) as e:
-            logger.warning("Skipping invalid enriched file %s: %s", path.name, e)
-    return results
+async def _save_enriched(items: list[tuple[dict, dict]], *, version: str | None = None) -> None:
+    await _enrichment_store.put_many(
+        ((_enriched_article(article), enrichment) for article, enrichment in items),
+        version=version,
+    )
+
+
+async def _load_all_enriched() -> list[tuple[dict, dict]]:
+    return await _enrichment_store.load_all()
 
 
 # ---------------------------------------------------------------------------
@@ -85,13 +86,12 @@ def _article_date(a: dict) -> str:
 def _get_source_name_by_id() -> dict[str, str]:
     global _source_name_by_id
     if _source_name_by_id is None:
-        from app.scheduler.manager import load_all_source_configs
+        from app.scheduler.source_catalog import get_source_catalog
 
         _source_name_by_id = {
-            str(config.get("id", "")).strip(): str(config.get("name", "")).strip()
-            for config in load_all_source_configs()
-            if str(config.get("id", "")).strip()
-            and str(config.get("name", "")).strip()
+            source_id: str(config.get("name", "")).strip()
+            for source_id, config in get_source_catalog().by_id.items()
+            if str(config.get("name", "")).strip()
         }
     return _source_name_by_id
 
@@ -234,12 +234,14 @@ async def process_policy_pipeline(
     """
     logger.info("开始处理政策智能数据...")
 
-    # Load raw articles from all relevant dimensions
-    all_articles: list[dict] = []
-    for dim in DIMENSIONS:
-        articles = await get_articles(dim)
-        logger.info("  从 %s 加载 %d 篇文章", dim, len(articles))
-        all_articles.extend(articles)
+    # Only articles crawled since the last run; everything after a rules or
+    # prompt change (the hash file is then reset too).
+    version = rules_version(policy_rules, policy_llm, scoring)
+    processed_hashes = set() if force else _hash_tracker.load(version=version)
+    delta = await load_article_delta(
+        "policy", DIMENSIONS, version=version, force=force or not processed_hashes
+    )
+    all_articles = delta.articles
 
     # Deduplicate by url_hash
     seen: set[str] = set()
@@ -249,15 +251,30 @@ async def process_policy_pipeline(
         if h and h not in seen:
             seen.add(h)
             unique_articles.append(a)
-
-    # Filter already-processed (incremental)
-    processed_hashes = set() if force else _hash_tracker.load()
-    new_articles = [
-        a for a in unique_articles if a.get("url_hash", "") not in processed_hashes
-    ]
+    unique_articles = collapse_near_duplicates(unique_articles)
+
+    # New articles, plus recrawled ones whose content changed. Members of a
+    # near-duplicate cluster whose canonical article is already scored are
+    # skipped, as the full-dimension collapse would have done.
+    stored = await _enrichment_store.get_many(
+        a.get("url_hash", "") for a in unique_articles
+        if a.get("url_hash", "") in processed_hashes
+    )
+    new_articles = []
+    for a in unique_articles:
+        h = a.get("url_hash", "")
+        cluster = a.get("canonical_url_hash")
+        if cluster and cluster != h and cluster in processed_hashes:
+            continue
+        if h not in processed_hashes:
+            new_articles.append(a)
+            continue
+        stored_hash = stored[h][0].get("content_hash") if h in stored else None
+        if stored_hash and a.get("content_hash") and stored_hash != a["content_hash"]:
+            new_articles.append(a)
 
     logger.info(
-        "  去重后 %d 篇，新增 %d 篇（已处理 %d 篇）",
+        "  去重后 %d 篇，新增或变更 %d 篇（已处理 %d 篇）",
         len(unique_articles), len(new_articles), len(processed_hashes),
     )
 
@@ -270,30 +287,34 @@ async def process_policy_pipeline(
         else:
             pbar = new_articles
 
+        scored: list[tuple[dict, dict]] = []
         for article in pbar:
-            rules_result = enrich_by_rules(article)
-            _save_enriched(article, rules_result)
+            scored.append((article, enrich_by_rules(article)))
             h = article.get("url_hash", "")
             if h:
                 new_hashes.add(h)
+        await _save_enriched(scored, version=version)
 
-        all_hashes = processed_hashes | new_hashes
-        _hash_tracker.save(all_hashes)
+        _hash_tracker.save(processed_hashes | new_hashes, version=version)
         logger.info("  ✓ 完成 %d 篇新文章评分", len(new_hashes))
+    elif delta.full:
+        _hash_tracker.save(processed_hashes, version=version)
 
     # Rebuild output files from all enriched data for configured policy dimensions.
     all_enriched = [
         (a, llm)
-        for a, llm in _load_all_enriched()
+        for a, llm in await _load_all_enriched()
         if a.get("dimension") in DIMENSIONS
     ]
     feed_count, opp_count = _rebuild_output_files(all_enriched)
+    await commit_watermark(delta)
 
     return {
         "total_raw": len(all_articles),
         "unique": len(unique_articles),
         "new_processed": len(new_hashes),
         "previously_processed": len(processed_hashes),
+        "full_reload": delta.full,
         "total_enriched": len(all_enriched),
         "feed_items": feed_count,
         "opportunities": opp_count,
@@ -307,7 +328,7 @@ async def process_policy_llm_enrichment(
 ) -> dict[str, Any]:
     """Tier 2: LLM enrichment for high-scoring policy articles.
 
-    Reads existing rule-based results from _enriched/ directory, filters those
+    Reads existing rule-based results from the enrichment store, filters those
     not yet LLM-enriched and above threshold, calls enrich_article_lite(), and
     rebuilds output files.
 
@@ -317,8 +338,9 @@ async def process_policy_llm_enrichment(
 
     if threshold is None:
         threshold = settings.LLM_THRESHOLD
+    llm_version = rules_version(policy_llm)
 
-    all_enriched = _load_all_enriched()
+    all_enriched = await _load_all_enriched()
     if not all_enriched:
         return {"skipped": True, "reason": "no enriched articles to process"}
 
@@ -358,7 +380,7 @@ async def process_policy_llm_enrichment(
         async with sem:
             try:
                 result = await enrich_article_lite(article, tier1)
-                _save_enriched(article, result)
+                await _save_enriched([(article, result)], version=llm_version)
                 llm_count += 1
                 return True
             except LLMError as e:
@@ -374,7 +396,7 @@ async def process_policy_llm_enrichment(
 
     # Rebuild output files with updated enrichments
     if llm_count > 0:
-        all_enriched = _load_all_enriched()
+        all_enriched = await _load_all_enriched()
         _rebuild_output_files(all_enriched)
 
     return {
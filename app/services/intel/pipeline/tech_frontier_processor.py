@@ -9,6 +9,7 @@ Output:
     topics.json          — 8 topics with embedded signals, news, KOL voices
     opportunities.json   — detected opportunities
     stats.json           — KPI metrics
+    _article_index.json  — per-article classification (incremental state)
 """
 from __future__ import annotations
 
@@ -20,7 +21,17 @@ from datetime import datetime, timezone
 from typing import Any
 
 from app.config import BASE_DIR
-from app.services.intel.pipeline.base import HashTracker, save_output_json
+from app.crawlers.utils.near_dup import collapse_near_duplicates
+from app.services.intel import scoring
+from app.services.intel.pipeline.base import (
+    ArticleDelta,
+    HashTracker,
+    commit_watermark,
+    load_article_delta,
+    rules_version,
+    save_output_json,
+)
+from app.services.intel.tech_frontier import rules as tech_rules
 from app.services.intel.tech_frontier.rules import (
     TOPICS_CONFIG,
     UNI_AI_INSTITUTE_SOURCES,
@@ -32,7 +43,6 @@ from app.services.intel.tech_frontier.rules import (
     is_kol_source,
     split_by_period,
 )
-from app.services.stores.json_reader import get_articles
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +51,7 @@ HAS_TQDM = importlib.util.find_spec("tqdm") is not None
 PROCESSED_DIR = BASE_DIR / "data" / "processed" / "tech_frontier"
 
 _hash_tracker = HashTracker(PROCESSED_DIR / "_processed_hashes.json", PROCESSED_DIR)
+ARTICLE_INDEX_FILE = PROCESSED_DIR / "_article_index.json"
 
 # Dimensions and source filters
 PRIMARY_DIMENSIONS = ["technology"]
@@ -63,36 +74,30 @@ FEED_MIN_SCORE = 20  # Minimum match_score for articles to appear in relatedNews
 # ---------------------------------------------------------------------------
 
 
-async def _load_all_articles() -> list[dict]:
-    """Load articles from all relevant dimensions and filter."""
-    articles: list[dict] = []
-
-    # 1. Technology dimension (all sources)
-    for dim in PRIMARY_DIMENSIONS:
-        articles.extend(await get_articles(dim))
-
-    # 2. Twitter (only tech-related sources)
-    twitter_articles = await get_articles(TWITTER_DIMENSION)
-    articles.extend(
-        a for a in twitter_articles
-        if a.get("source_id") in TWITTER_TECH_SOURCES
-    )
-
-    # 3. Industry dimension (all enabled sources)
-    articles.extend(await get_articles(INDUSTRY_DIMENSION))
-
-    # 4. Universities (only AI research institute sources)
-    uni_articles = await get_articles(UNIVERSITY_DIMENSION)
-    articles.extend(
-        a for a in uni_articles
-        if a.get("source_id") in UNI_AI_INSTITUTE_SOURCES
+async def _load_article_delta(*, version: str, force: bool) -> ArticleDelta:
+    """Load articles crawled since the last run from all relevant dimensions."""
+    delta = await load_article_delta(
+        "tech_frontier",
+        [*PRIMARY_DIMENSIONS, TWITTER_DIMENSION, INDUSTRY_DIMENSION, UNIVERSITY_DIMENSION],
+        version=version,
+        force=force,
     )
-
-    return articles
+    # Twitter: only tech-related sources; universities: only AI research
+    # institute sources. Technology and industry: all sources.
+    delta.articles = [
+        a for a in delta.articles
+        if not (
+            (a.get("dimension") == TWITTER_DIMENSION
+             and a.get("source_id") not in TWITTER_TECH_SOURCES)
+            or (a.get("dimension") == UNIVERSITY_DIMENSION
+                and a.get("source_id") not in UNI_AI_INSTITUTE_SOURCES)
+        )
+    ]
+    return delta
 
 
 def _deduplicate(articles: list[dict]) -> list[dict]:
-    """Deduplicate by url_hash, keeping first occurrence."""
+    """Deduplicate by url_hash, then keep one article per near-duplicate cluster."""
     seen: set[str] = set()
     unique: list[dict] = []
     for a in articles:
@@ -100,7 +105,7 @@ def _deduplicate(articles: list[dict]) -> list[dict]:
         if h and h not in seen:
             seen.add(h)
             unique.append(a)
-    return unique
+    return collapse_near_duplicates(unique)
 
 
 # ---------------------------------------------------------------------------
@@ -108,33 +113,71 @@ def _deduplicate(articles: list[dict]) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+def _classify(article: dict) -> dict:
+    """Compact per-article record: everything the topic builders need.
+
+    Topic items are built here from the full article, so the record (and the
+    article index) never carries the article content.
+    """
+    source_id = article.get("source_id", "")
+    topics = []
+    for m in classify_article(article):
+        score = m["match_score"]
+        if is_kol_source(source_id):
+            item = build_kol_voice(article)
+        elif score >= FEED_MIN_SCORE:
+            item = build_topic_news(article, score)
+        else:
+            item = None
+        topics.append({"topic_id": m["topic_id"], "score": score, "item": item})
+    return {
+        "url_hash": article.get("url_hash", ""),
+        "dimension": article.get("dimension", ""),
+        "source_id": source_id,
+        "published_at": article.get("published_at"),
+        "topics": topics,
+        "opportunity": detect_opportunity(article),
+    }
+
+
+def _load_article_index(version: str) -> dict[str, dict] | None:
+    """Records of previously classified articles (None: missing or stale)."""
+    try:
+        with open(ARTICLE_INDEX_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+    if data.get("version") != version:
+        return None
+    return data.get("records")
+
+
+def _save_article_index(records: dict[str, dict], version: str) -> None:
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+    with open(ARTICLE_INDEX_FILE, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "records": records}, f, ensure_ascii=False)
+
+
 def _process_articles(
-    articles: list[dict],
+    records: list[dict],
 ) -> tuple[list[dict], list[dict], dict]:
-    """Process articles into topics and opportunities.
+    """Build topics and opportunities from classified article records.
 
     Returns (topics_list, opportunities_list, stats_dict).
     """
     now_iso = datetime.now(timezone.utc).isoformat()
 
-    # Classify all articles → topic assignments
-    topic_articles: dict[str, list[tuple[dict, int]]] = defaultdict(list)
+    # Group classified articles by topic
+    topic_articles: dict[str, list[tuple[dict, dict]]] = defaultdict(list)
     all_opportunities: list[dict] = []
     dimension_counts: dict[str, int] = defaultdict(int)
 
-    for article in articles:
-        dim = article.get("dimension", "")
-        dimension_counts[dim] += 1
-
-        # Classify into topics
-        matches = classify_article(article)
-        for m in matches:
-            topic_articles[m["topic_id"]].append((article, m["match_score"]))
-
-        # Detect opportunities
-        opp = detect_opportunity(article)
-        if opp:
-            all_opportunities.append(opp)
+    for record in records:
+        dimension_counts[record.get("dimension", "")] += 1
+        for match in record["topics"]:
+            topic_articles[match["topic_id"]].append((record, match))
+        if record.get("opportunity"):
+            all_opportunities.append(record["opportunity"])
 
     # Deduplicate opportunities by ID
     seen_opp: set[str] = set()
@@ -154,8 +197,7 @@ def _process_articles(
         topic_counts[topic_id] = len(matched)
 
         # Split into time periods for heat calculation
-        matched_articles = [a for a, _ in matched]
-        current, previous = split_by_period(matched_articles, days=7)
+        current, previous = split_by_period([r for r, _ in matched], days=7)
 
         heat_trend, heat_label = compute_heat(len(current), len(previous))
 
@@ -164,17 +206,14 @@ def _process_articles(
         kol_voices: list[dict] = []
 
         # Sort by match score descending
-        matched_sorted = sorted(matched, key=lambda x: x[1], reverse=True)
+        matched_sorted = sorted(matched, key=lambda x: x[1]["score"], reverse=True)
 
-        for article, score in matched_sorted:
-            source_id = article.get("source_id", "")
-
-            if is_kol_source(source_id):
+        for record, match in matched_sorted:
+            if is_kol_source(record.get("source_id", "")):
                 if len(kol_voices) < MAX_KOL_PER_TOPIC:
-                    kol_voices.append(build_kol_voice(article))
-            else:
-                if score >= FEED_MIN_SCORE and len(related_news) < MAX_NEWS_PER_TOPIC:
-                    related_news.append(build_topic_news(article, score))
+                    kol_voices.append(match["item"])
+            elif match["item"] is not None and len(related_news) < MAX_NEWS_PER_TOPIC:
+                related_news.append(match["item"])
 
         # Sort news by date descending
         related_news.sort(
@@ -220,7 +259,7 @@ def _process_articles(
             1 for o in unique_opps if o["priority"] == "紧急"
         ),
         "totalOpportunities": len(unique_opps),
-        "totalArticlesProcessed": len(articles),
+        "totalArticlesProcessed": len(records),
         "dimensionBreakdown": dict(dimension_counts),
         "topicBreakdown": topic_counts,
     }
@@ -244,12 +283,27 @@ async def process_tech_frontier_pipeline(
 
     Returns summary dict for the pipeline orchestrator.
     """
-    # Load articles from all dimensions
-    all_articles = await _load_all_articles()
+    # Articles crawled since the last run are classified and merged into the
+    # article index; a rules change or missing index reloads everything.
+    version = rules_version(
+        tech_rules, scoring, source_scope=TWITTER_TECH_SOURCES | UNI_AI_INSTITUTE_SOURCES
+    )
+    records = None if force else _load_article_index(version)
+    delta = await _load_article_delta(version=version, force=force or records is None)
+    if delta.full:
+        records = {}
+    all_articles = delta.articles
     logger.info("Tech frontier pipeline: loaded %d articles", len(all_articles))
 
-    # Deduplicate
-    unique = _deduplicate(all_articles)
+    # Deduplicate; near duplicates of an indexed article stay out
+    unique = [
+        a for a in _deduplicate(all_articles)
+        if not (
+            a.get("canonical_url_hash")
+            and a["canonical_url_hash"] != a.get("url_hash")
+            and a["canonical_url_hash"] in records
+        )
+    ]
     logger.info("Tech frontier pipeline: %d unique articles", len(unique))
 
     # Incremental hash tracking
@@ -273,8 +327,16 @@ async def process_tech_frontier_pipeline(
                 new_count += 1
         _hash_tracker.save(processed_hashes)
 
-    # Process ALL unique articles (not just new) to rebuild complete output
-    topics, opportunities, stats = _process_articles(unique)
+    for article in unique:
+        records[article.get("url_hash", "")] = _classify(article)
+    await delta.prune(records)
+    _save_article_index(records, version)
+
+    # Rebuild complete output from every indexed article, newest first
+    ordered = sorted(
+        records.values(), key=lambda r: r.get("published_at") or "", reverse=True
+    )
+    topics, opportunities, stats = _process_articles(ordered)
 
     # Write output files
     save_output_json(PROCESSED_DIR, "topics.json", topics)
@@ -285,6 +347,8 @@ async def process_tech_frontier_pipeline(
     with open(PROCESSED_DIR / "stats.json", "w", encoding="utf-8") as f:
         json.dump(stats, f, ensure_ascii=False, indent=2)
 
+    await commit_watermark(delta)
+
     logger.info(
         "Tech frontier output: %d topics, %d opportunities, %d total signals",
         len(topics),
@@ -296,6 +360,8 @@ async def process_tech_frontier_pipeline(
         "total_articles": len(all_articles),
         "unique": len(unique),
         "new_processed": new_count,
+        "indexed_articles": len(records),
+        "full_reload": delta.full,
         "topics": len(topics),
         "opportunities": len(opportunities),
         "weekly_signals": stats["weeklyNewSignals"],
@@ -19,6 +19,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from app.config import BASE_DIR
+from app.crawlers.utils.near_dup import collapse_near_duplicates
 from app.services.intel.pipeline.base import HashTracker, save_output_json
 from app.services.intel.shared import article_date
 from app.services.intel.university.filters import (
@@ -173,7 +174,7 @@ async def process_university_eco_pipeline(
     articles = await get_articles(DIMENSION)
     logger.info("University eco pipeline: loaded %d articles", len(articles))
 
-    unique = dedupe_university_articles(articles)
+    unique = collapse_near_duplicates(dedupe_university_articles(articles))
 
     # Filter out junk / pagination artifacts
     valid = [a for a in unique if _is_valid_article(a)]
@@ -8,6 +8,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from app.crawlers.utils.keyword_matcher import get_matcher
+from app.services.intel.rule_engine import RuleScan, compile_rules
 from app.services.intel.shared import (
     clamp_score,
     compute_days_left,
@@ -15,7 +17,6 @@ from app.services.intel.shared import (
     extract_deadline,
     extract_funding,
     extract_leader,
-    keyword_score,
 )
 
 logger = logging.getLogger(__name__)
@@ -119,6 +120,19 @@ AGENCY_MAP: dict[str, str] = {
 }
 
 
+_RULES = compile_rules({
+    "match": ALL_KEYWORDS,
+    "tags": [(kw, w) for kw, w in KEYWORDS_TIER_A + KEYWORDS_TIER_B if w >= 10],
+})
+
+
+def _scan_article(article: dict[str, Any]) -> tuple[RuleScan, str, str]:
+    """Cached rule scan of the title and first 3000 content chars, plus both."""
+    title = str(article.get("title", ""))
+    content = (article.get("content") or "")[:3000]
+    return _RULES.scan(f"{title}\n{content}"), title, content
+
+
 # ===================================================================
 # Public API
 # ===================================================================
@@ -126,11 +140,9 @@ AGENCY_MAP: dict[str, str] = {
 
 def compute_match_score(article: dict[str, Any]) -> int:
     """Compute keyword-based matchScore for an article (0-100)."""
-    title = article.get("title", "")
-    content = (article.get("content") or "")[:3000]
-    text = f"{title}\n{content}"
+    scan, _, _ = _scan_article(article)
 
-    score = keyword_score(text, ALL_KEYWORDS)
+    score = scan.score("match")
     source_id = article.get("source_id", "")
     score += SOURCE_SCORE_BONUS.get(source_id, 0)
 
@@ -146,8 +158,7 @@ def detect_opportunity(article: dict[str, Any]) -> bool:
     title = article.get("title", "")
     content = article.get("content") or ""
 
-    has_kw = any(kw in title for kw in OPPORTUNITY_TITLE_KW)
-    if not has_kw:
+    if not get_matcher(OPPORTUNITY_TITLE_KW).search(title):
         return False
 
     return bool(extract_funding(content)) or bool(extract_deadline(content))
@@ -155,14 +166,9 @@ def detect_opportunity(article: dict[str, Any]) -> bool:
 
 def extract_tags(article: dict[str, Any]) -> list[str]:
     """Extract keyword-based tags from title + content."""
-    title = article.get("title", "")
-    text = f"{title}\n{(article.get('content') or '')[:2000]}".lower()
-    tags: list[str] = []
-    high_kws = [(kw, w) for kw, w in KEYWORDS_TIER_A + KEYWORDS_TIER_B if w >= 10]
-    for kw, _ in high_kws:
-        if kw.lower() in text and kw not in tags:
-            tags.append(kw)
-    return tags[:6]
+    scan, title, content = _scan_article(article)
+    limit = len(title) + 1 + min(len(content), 2000)
+    return list(dict.fromkeys(scan.hits("tags", limit)))[:6]
 
 
 def get_agency(article: dict[str, Any]) -> str:
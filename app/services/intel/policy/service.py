@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.services.intel.intel_store import load_intel_document, paginate
 from app.services.intel.shared import load_intel_json, parse_source_filter
 
 MODULE = "policy_intel"
@@ -21,18 +22,15 @@ def get_policy_feed(
     offset: int = 0,
 ) -> dict[str, Any]:
     """Read feed.json and apply optional filters."""
-    data = load_intel_json(MODULE, "feed.json")
-    items = data.get("items", [])
+    doc = load_intel_document(MODULE, "feed.json")
 
-    # 应用信源筛选（优先筛选，减少后续处理量）
+    # 信源、分类、重要性走索引，其余条件只扫描命中的条目
     source_filter = parse_source_filter(source_id, source_ids, source_name, source_names)
-    if source_filter:
-        items = [i for i in items if i.get("source_id") in source_filter]
-
-    if category:
-        items = [i for i in items if i.get("category") == category]
-    if importance:
-        items = [i for i in items if i.get("importance") == importance]
+    items = doc.select(
+        source_id=source_filter or None,
+        category=category or None,
+        importance=importance or None,
+    )
     if min_match_score is not None:
         items = [i for i in items if (i.get("matchScore") or 0) >= min_match_score]
     if keyword:
@@ -45,19 +43,7 @@ def get_policy_feed(
             or any(kw in t.lower() for t in i.get("tags", []))
         ]
 
-    total = len(items)
-    paged_items = items[offset:offset + limit]
-    next_offset = offset + limit if (offset + len(paged_items)) < total else None
-    return {
-        "generated_at": data.get("generated_at"),
-        "item_count": total,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "has_more": next_offset is not None,
-        "next_offset": next_offset,
-        "items": paged_items,
-    }
+    return paginate(items, generated_at=doc.generated_at, limit=limit, offset=offset)
 
 
 def get_policy_opportunities(
@@ -67,27 +53,12 @@ def get_policy_opportunities(
     offset: int = 0,
 ) -> dict[str, Any]:
     """Read opportunities.json and apply optional filters."""
-    data = load_intel_json(MODULE, "opportunities.json")
-    items = data.get("items", [])
-
-    if status:
-        items = [i for i in items if i.get("status") == status]
+    doc = load_intel_document(MODULE, "opportunities.json")
+    items = doc.select(status=status or None)
     if min_match_score is not None:
         items = [i for i in items if (i.get("matchScore") or 0) >= min_match_score]
 
-    total = len(items)
-    paged_items = items[offset:offset + limit]
-    next_offset = offset + limit if (offset + len(paged_items)) < total else None
-    return {
-        "generated_at": data.get("generated_at"),
-        "item_count": total,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "has_more": next_offset is not None,
-        "next_offset": next_offset,
-        "items": paged_items,
-    }
+    return paginate(items, generated_at=doc.generated_at, limit=limit, offset=offset)
 
 
 def get_policy_stats() -> dict[str, Any]:
@@ -0,0 +1,123 @@
+"""Compiled keyword rule tables shared by the intel rules modules.
+
+Each rules module used to call ``keyword_score`` once per table (topics,
+news types, research types, ...), rescanning the article for every keyword
+of every table. ``compile_rules`` merges all tables of a module into one
+Aho-Corasick automaton; ``RuleSet.scan`` walks an article once and returns a
+``RuleScan`` that answers per-table hit lists and weighted scores.
+
+The scan records where each keyword first occurs, so rules that only look at
+a prefix of the same text (e.g. ``content[:500]``) are answered from the same
+scan via ``limit``. Scans are LRU-cached per rule set, so the several rule
+functions applied to one article share a single pass.
+
+Matching is case-insensitive substring matching, exactly like
+``keyword_score``.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+
+from app.crawlers.utils.keyword_matcher import KeywordMatcher
+
+RuleTable = Sequence[tuple[str, int]] | Sequence[str]
+
+SCAN_CACHE_SIZE = 256
+
+
+def _lower_keeping_offsets(text: str) -> str:
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A few characters (e.g. "İ") lower to two; keep them so offsets
+        # still index the original text.
+        lowered = "".join(
+            low if len(low := ch.lower()) == 1 else ch for ch in text
+        )
+    return lowered
+
+
+class RuleScan:
+    """Keyword hits of one text against a ``RuleSet``."""
+
+    __slots__ = ("_rules", "_ends")
+
+    def __init__(self, rules: RuleSet, ends: dict[str, int]) -> None:
+        self._rules = rules
+        self._ends = ends
+
+    def _found(self, keyword: str, limit: int | None) -> bool:
+        end = self._ends.get(keyword)
+        return end is not None and (limit is None or end <= limit)
+
+    def hits(self, table: str, limit: int | None = None) -> list[str]:
+        """Keywords of ``table`` present in the text (or its first ``limit`` chars).
+
+        Keywords are returned as spelled in the table, in table order.
+        """
+        return [
+            keyword
+            for keyword, key, _ in self._rules.entries(table)
+            if self._found(key, limit)
+        ]
+
+    def score(self, table: str, limit: int | None = None) -> int:
+        """Summed weights of the matched keywords — same as ``keyword_score``."""
+        return sum(
+            weight
+            for _, key, weight in self._rules.entries(table)
+            if self._found(key, limit)
+        )
+
+    def scores(
+        self, tables: Iterable[str] | None = None, limit: int | None = None
+    ) -> dict[str, int]:
+        """Per-table weighted scores (the hit vector of the whole rule set)."""
+        names = self._rules.tables if tables is None else tables
+        return {name: self.score(name, limit) for name in names}
+
+
+class RuleSet:
+    """Named keyword tables compiled into one automaton."""
+
+    def __init__(
+        self,
+        tables: Mapping[str, RuleTable],
+        *,
+        cache_size: int = SCAN_CACHE_SIZE,
+    ) -> None:
+        self._entries: dict[str, list[tuple[str, str, int]]] = {}
+        for name, table in tables.items():
+            entries = []
+            for item in table:
+                keyword, weight = (item, 1) if isinstance(item, str) else item
+                entries.append((keyword, keyword.lower(), weight))
+            self._entries[name] = entries
+        self.tables: tuple[str, ...] = tuple(self._entries)
+        self._matcher = KeywordMatcher(
+            key for entries in self._entries.values() for _, key, _ in entries
+        )
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+
+    def entries(self, table: str) -> list[tuple[str, str, int]]:
+        """(keyword, lowercased keyword, weight) rows of ``table``."""
+        return self._entries[table]
+
+    def _scan(self, text: str) -> RuleScan:
+        return RuleScan(self, self._matcher.find_positions(_lower_keeping_offsets(text)))
+
+
+def compile_rules(
+    tables: Mapping[str, RuleTable], *, cache_size: int = SCAN_CACHE_SIZE
+) -> RuleSet:
+    """Compile keyword tables ``{name: [(keyword, weight), ...]}``.
+
+    Plain keyword lists are accepted too (weight 1 per keyword).
+    """
+    return RuleSet(tables, cache_size=cache_size)
+
+
+@lru_cache(maxsize=256)
+def single_table(keywords: tuple[tuple[str, int], ...]) -> RuleSet:
+    """Compiled rule set for one ad-hoc table (backs ``keyword_score``)."""
+    return RuleSet({"keywords": keywords}, cache_size=0)
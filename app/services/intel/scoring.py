@@ -4,18 +4,18 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any
 
+from app.crawlers.utils.keyword_matcher import get_matcher
+from app.services.intel.rule_engine import single_table
+
 
 def keyword_score(text: str, keywords: list[tuple[str, int]]) -> int:
     """Scan *text* for keyword matches and accumulate weights.
 
     Returns raw (unclamped) score.  Caller should ``min(100, max(0, score))``.
+    Rules modules with several tables should compile them together with
+    ``rule_engine.compile_rules`` instead of calling this once per table.
     """
-    lower = text.lower()
-    score = 0
-    for kw, weight in keywords:
-        if kw.lower() in lower:
-            score += weight
-    return score
+    return single_table(tuple(keywords)).scan(text).score("keywords")
 
 
 def clamp_score(score: int, lo: int = 0, hi: int = 100) -> int:
@@ -48,7 +48,7 @@ def compute_importance(
         return "紧急"
     if match_score >= 70:
         return "重要"
-    if any(kw in title for kw in high_keywords):
+    if get_matcher(high_keywords).search(title):
         return "重要"
     if match_score >= 40:
         return "关注"
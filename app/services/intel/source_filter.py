@@ -74,3 +74,12 @@ def parse_source_filter(
             result.update(resolved_ids)
 
     return result if result else set()
+
+
+def source_names_generation(source_name: str | None, source_names: str | None) -> tuple:
+    """名称筛选所依赖的信源目录版本（无名称筛选时为空元组），用于响应缓存的数据代际。"""
+    if not (source_name or source_names):
+        return ()
+    from app.scheduler.source_catalog import get_source_catalog
+
+    return get_source_catalog().signature
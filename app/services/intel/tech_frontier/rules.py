@@ -8,11 +8,11 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from app.services.intel.rule_engine import RuleScan, compile_rules
 from app.services.intel.shared import (
     article_date,
     article_datetime,
     extract_deadline,
-    keyword_score,
 )
 
 # ---------------------------------------------------------------------------
@@ -233,24 +233,44 @@ _OPP_TYPE_KEYWORDS: list[tuple[str, list[tuple[str, int]]]] = [
 
 OPP_MATCH_THRESHOLD = 20  # minimum score to flag as opportunity
 
+# All topic / news type / opportunity tables in one automaton: one pass per
+# article serves classify_article, detect_news_type and detect_opportunity.
+_RULES = compile_rules({
+    **{f"topic:{t['id']}": t["keywords"] for t in TOPICS_CONFIG},
+    **{f"news:{name}": keywords for name, keywords in _NEWS_TYPE_KEYWORDS},
+    **{f"opp:{name}": keywords for name, keywords in _OPP_TYPE_KEYWORDS},
+})
+
 
 # ---------------------------------------------------------------------------
 # Core functions
 # ---------------------------------------------------------------------------
 
 
+def _scan_article(article: dict) -> tuple[RuleScan, str, str]:
+    """Rule scan of ``"{title} {content}"`` (cached), plus title and content.
+
+    Rules reading only ``content[:n]`` pass ``_prefix_limit(title, content, n)``.
+    """
+    title = article.get("title") or ""
+    content = article.get("content") or ""
+    return _RULES.scan(f"{title} {content}"), title, content
+
+
+def _prefix_limit(title: str, content: str, chars: int) -> int:
+    return len(title) + 1 + min(len(content), chars)
+
+
 def classify_article(article: dict) -> list[dict]:
     """Classify an article into matching topics.
 
     Returns list of ``{"topic_id": str, "match_score": int}`` for each match.
     """
-    title = article.get("title") or ""
-    content = article.get("content") or ""
-    text = f"{title} {content}"
+    scan, _, _ = _scan_article(article)
 
     matches: list[dict] = []
     for topic in TOPICS_CONFIG:
-        score = keyword_score(text, topic["keywords"])
+        score = scan.score(f"topic:{topic['id']}")
         if score >= TOPIC_MATCH_THRESHOLD:
             matches.append({"topic_id": topic["id"], "match_score": score})
     return matches
@@ -258,14 +278,13 @@ def classify_article(article: dict) -> list[dict]:
 
 def detect_news_type(article: dict) -> str:
     """Detect the news type of an article: 投融资 / 收购 / 政策 / 合作 / 新产品."""
-    title = article.get("title") or ""
-    content = (article.get("content") or "")[:500]
-    text = f"{title} {content}"
+    scan, title, content = _scan_article(article)
+    limit = _prefix_limit(title, content, 500)
 
     best_type = "新产品"  # default
     best_score = 0
-    for news_type, keywords in _NEWS_TYPE_KEYWORDS:
-        score = keyword_score(text, keywords)
+    for news_type, _ in _NEWS_TYPE_KEYWORDS:
+        score = scan.score(f"news:{news_type}", limit)
         if score > best_score:
             best_score = score
             best_type = news_type
@@ -286,14 +305,13 @@ def detect_opportunity(article: dict) -> dict | None:
 
     Returns opportunity dict or None.
     """
-    title = article.get("title") or ""
-    content = (article.get("content") or "")[:800]
-    text = f"{title} {content}"
+    scan, title, content = _scan_article(article)
+    limit = _prefix_limit(title, content, 800)
 
     best_type = ""
     best_score = 0
-    for opp_type, keywords in _OPP_TYPE_KEYWORDS:
-        score = keyword_score(text, keywords)
+    for opp_type, _ in _OPP_TYPE_KEYWORDS:
+        score = scan.score(f"opp:{opp_type}", limit)
         if score > best_score:
             best_score = score
             best_type = opp_type
@@ -301,7 +319,8 @@ def detect_opportunity(article: dict) -> dict | None:
     if best_score < OPP_MATCH_THRESHOLD:
         return None
 
-    deadline = extract_deadline(text)
+    content = content[:800]
+    deadline = extract_deadline(f"{title} {content}")
     priority = _compute_priority(best_score, deadline)
 
     return {
@@ -3,11 +3,39 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.services.intel.intel_store import IntelDocument, load_intel_document, paginate
 from app.services.intel.shared import load_intel_json, parse_source_filter
 
 MODULE = "tech_frontier"
 
 
+def _flatten_signals(doc: IntelDocument) -> IntelDocument:
+    """relatedNews and kolVoices of every topic, newest first.
+
+    Items of one topic keep their relative order among equal dates (stable
+    sort), so per-request filtering plus first-occurrence dedup gives the
+    same result as flattening, deduplicating and sorting on every request.
+    """
+    signals: list[dict] = []
+    for topic in doc.items:
+        tid = topic.get("id", "")
+        tname = topic.get("topic", "")
+        for kind, key in (("news", "relatedNews"), ("kol", "kolVoices")):
+            for entry in topic.get(key, []):
+                signals.append({
+                    "kind": kind,
+                    "data": entry,
+                    "parentTopicId": tid,
+                    "parentTopicName": tname,
+                    "date": entry.get("date", ""),
+                })
+    signals.sort(key=lambda s: s.get("date", ""), reverse=True)
+    return IntelDocument(
+        {"generated_at": doc.generated_at, "items": signals},
+        keys={"source_id": lambda s: s["data"].get("source_id")},
+    )
+
+
 def get_topics(
     *,
     heat_trend: str | None = None,
@@ -17,14 +45,8 @@ def get_topics(
     offset: int = 0,
 ) -> dict[str, Any]:
     """Get tech frontier topics with optional filters."""
-    data = load_intel_json(MODULE, "topics.json")
-    items = data.get("items", [])
-
-    if heat_trend:
-        items = [i for i in items if i.get("heatTrend") == heat_trend]
-
-    if our_status:
-        items = [i for i in items if i.get("ourStatus") == our_status]
+    doc = load_intel_document(MODULE, "topics.json")
+    items = doc.select(heatTrend=heat_trend or None, ourStatus=our_status or None)
 
     if keyword:
         kw = keyword.lower()
@@ -34,29 +56,14 @@ def get_topics(
             or any(kw in t.lower() for t in i.get("tags", []))
         ]
 
-    total = len(items)
-    paged_items = items[offset:offset + limit]
-    next_offset = offset + limit if (offset + len(paged_items)) < total else None
-
-    return {
-        "generated_at": data.get("generated_at"),
-        "item_count": total,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "has_more": next_offset is not None,
-        "next_offset": next_offset,
-        "items": paged_items,
-    }
+    return paginate(items, generated_at=doc.generated_at, limit=limit, offset=offset)
 
 
 def get_topic_detail(topic_id: str) -> dict[str, Any] | None:
     """Get a single topic by ID."""
-    data = load_intel_json(MODULE, "topics.json")
-    for item in data.get("items", []):
-        if item.get("id") == topic_id:
-            return item
-    return None
+    doc = load_intel_document(MODULE, "topics.json")
+    positions = doc.index("id").get(topic_id)
+    return doc.items[positions[0]] if positions else None
 
 
 def get_opportunities(
@@ -68,14 +75,8 @@ def get_opportunities(
     offset: int = 0,
 ) -> dict[str, Any]:
     """Get tech frontier opportunities with optional filters."""
-    data = load_intel_json(MODULE, "opportunities.json")
-    items = data.get("items", [])
-
-    if priority:
-        items = [i for i in items if i.get("priority") == priority]
-
-    if opp_type:
-        items = [i for i in items if i.get("type") == opp_type]
+    doc = load_intel_document(MODULE, "opportunities.json")
+    items = doc.select(priority=priority or None, type=opp_type or None)
 
     if keyword:
         kw = keyword.lower()
@@ -84,20 +85,7 @@ def get_opportunities(
             if kw in (i.get("name", "") + i.get("summary", "")).lower()
         ]
 
-    total = len(items)
-    paged_items = items[offset:offset + limit]
-    next_offset = offset + limit if (offset + len(paged_items)) < total else None
-
-    return {
-        "generated_at": data.get("generated_at"),
-        "item_count": total,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "has_more": next_offset is not None,
-        "next_offset": next_offset,
-        "items": paged_items,
-    }
+    return paginate(items, generated_at=doc.generated_at, limit=limit, offset=offset)
 
 
 def get_stats() -> dict[str, Any]:
@@ -135,52 +123,26 @@ def get_signals(
 
     Merges relatedNews and kolVoices from topics into a single time-sorted list.
     """
-    data = load_intel_json(MODULE, "topics.json")
-    topics = data.get("items", [])
+    doc = load_intel_document(MODULE, "topics.json")
+    signals = doc.derived("signals", _flatten_signals)
 
-    signals: list[dict] = []
-
-    for topic in topics:
-        tid = topic.get("id", "")
-        tname = topic.get("topic", "")
-
-        if topic_id and tid != topic_id:
-            continue
-
-        if signal_type != "kol":
-            for news in topic.get("relatedNews", []):
-                signals.append({
-                    "kind": "news",
-                    "data": news,
-                    "parentTopicId": tid,
-                    "parentTopicName": tname,
-                    "date": news.get("date", ""),
-                })
-
-        if signal_type != "news":
-            for kol in topic.get("kolVoices", []):
-                signals.append({
-                    "kind": "kol",
-                    "data": kol,
-                    "parentTopicId": tid,
-                    "parentTopicName": tname,
-                    "date": kol.get("date", ""),
-                })
+    kind = {"news": "news", "kol": "kol"}.get(signal_type or "")
+    source_filter = parse_source_filter(source_id, source_ids, source_name, source_names)
+    candidates = signals.select(
+        parentTopicId=topic_id or None,
+        kind=kind,
+        source_id=source_filter or None,
+    )
 
-    # Deduplicate by data.id
+    # Deduplicate by data.id (a news item can sit under several topics)
     seen: set[str] = set()
     unique: list[dict] = []
-    for s in signals:
+    for s in candidates:
         sid = s["data"].get("id", "")
         if sid and sid not in seen:
             seen.add(sid)
             unique.append(s)
 
-    # 应用信源筛选
-    source_filter = parse_source_filter(source_id, source_ids, source_name, source_names)
-    if source_filter:
-        unique = [s for s in unique if s["data"].get("source_id") in source_filter]
-
     # Keyword filter
     if keyword:
         kw = keyword.lower()
@@ -190,20 +152,4 @@ def get_signals(
             or kw in s["data"].get("summary", s["data"].get("statement", "")).lower()
         ]
 
-    # Sort by date descending
-    unique.sort(key=lambda s: s.get("date", ""), reverse=True)
-
-    total = len(unique)
-    paged_items = unique[offset:offset + limit]
-    next_offset = offset + limit if (offset + len(paged_items)) < total else None
-
-    return {
-        "generated_at": data.get("generated_at"),
-        "item_count": total,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "has_more": next_offset is not None,
-        "next_offset": next_offset,
-        "items": paged_items,
-    }
+    return paginate(unique, generated_at=doc.generated_at, limit=limit, offset=offset)
@@ -4,7 +4,7 @@ from __future__ import annotations
 from functools import lru_cache
 from urllib.parse import urlparse
 
-from app.scheduler.manager import load_all_source_configs
+from app.scheduler.source_catalog import get_source_catalog
 
 
 def _normalize_domain(value: str | None) -> str | None:
@@ -31,10 +31,7 @@ def _domain_matches(host: str, allowed_domains: set[str]) -> bool:
 @lru_cache(maxsize=1)
 def _allowed_domains_by_source() -> dict[str, set[str]]:
     domain_map: dict[str, set[str]] = {}
-    for config in load_all_source_configs():
-        if config.get("dimension") != "universities":
-            continue
-
+    for config in get_source_catalog().by_dimension.get("universities", ()):
         allowed: set[str] = set()
         for field in ("url", "base_url"):
             domain = _normalize_domain(config.get(field))
@@ -7,7 +7,9 @@ from __future__ import annotations
 
 import re
 
-from app.services.intel.shared import clamp_score, keyword_score
+from app.crawlers.utils.keyword_matcher import get_matcher
+from app.services.intel.rule_engine import RuleScan, compile_rules
+from app.services.intel.shared import clamp_score
 
 # ---------------------------------------------------------------------------
 # Research type keywords  (keyword, weight)
@@ -130,9 +132,44 @@ NEGATIVE_TITLE_PATTERNS: list[str] = [
     "习近平", "重点任务",
 ]
 
+# Content keyword → research field fallback (first match wins)
+FIELD_KEYWORDS: list[tuple[str, str]] = [
+    ("大模型", "大模型"), ("llm", "大模型"), ("gpt", "大模型"),
+    ("具身智能", "具身智能"), ("embodied", "具身智能"),
+    ("机器人", "机器人"), ("robot", "机器人"),
+    ("量子", "量子计算"), ("quantum", "量子计算"),
+    ("安全", "网络安全"), ("security", "网络安全"),
+    ("医学", "AI医学"), ("医疗", "AI医学"), ("drug", "AI制药"),
+    ("自动驾驶", "自动驾驶"), ("autonomous", "自动驾驶"),
+    ("视觉", "计算机视觉"), ("vision", "计算机视觉"),
+    ("自然语言", "自然语言处理"), ("nlp", "自然语言处理"),
+    ("教育", "AI教育"),
+    ("人工智能", "人工智能"), ("ai", "人工智能"),
+]
+_FIELD_BY_KEYWORD: dict[str, str] = {}
+for _kw, _field in FIELD_KEYWORDS:
+    _FIELD_BY_KEYWORD.setdefault(_kw, _field)
+
 # Min score to qualify as a research article
 MIN_RESEARCH_SCORE = 30
 
+# Type, influence and field tables in one automaton (one pass per article)
+_RULES = compile_rules({
+    "paper": KEYWORDS_PAPER,
+    "patent": KEYWORDS_PATENT,
+    "award": KEYWORDS_AWARD,
+    "high": KEYWORDS_HIGH_INFLUENCE,
+    "med": KEYWORDS_MED_INFLUENCE,
+    "field": [kw for kw, _ in FIELD_KEYWORDS],
+})
+
+
+def _scan_article(article: dict) -> tuple[RuleScan, str, str]:
+    """Cached rule scan of title + newline + content[:3000], plus both parts."""
+    title = article.get("title", "")
+    content = (article.get("content") or "")[:3000]
+    return _RULES.scan(f"{title}\n{content}"), title, content
+
 
 # ---------------------------------------------------------------------------
 # Core classification logic
@@ -151,17 +188,15 @@ def classify_article(article: dict) -> dict | None:
         return None
 
     # Guard: reject non-research articles by title pattern
-    for neg in NEGATIVE_TITLE_PATTERNS:
-        if neg in title:
-            return None
+    if get_matcher(NEGATIVE_TITLE_PATTERNS).search(title):
+        return None
 
-    content = (article.get("content") or "")[:3000]
-    text = f"{title}\n{content}"
+    scan, _, _ = _scan_article(article)
 
     # Score each type
-    paper_score = keyword_score(text, KEYWORDS_PAPER)
-    patent_score = keyword_score(text, KEYWORDS_PATENT)
-    award_score = keyword_score(text, KEYWORDS_AWARD)
+    paper_score = scan.score("paper")
+    patent_score = scan.score("patent")
+    award_score = scan.score("award")
 
     scores = sorted([paper_score, patent_score, award_score], reverse=True)
     best_score = scores[0]
@@ -184,8 +219,8 @@ def classify_article(article: dict) -> dict | None:
         rtype = "获奖"
 
     # Determine influence
-    high_score = keyword_score(text, KEYWORDS_HIGH_INFLUENCE)
-    med_score = keyword_score(text, KEYWORDS_MED_INFLUENCE)
+    high_score = scan.score("high")
+    med_score = scan.score("med")
 
     if high_score >= 25:
         influence = "高"
@@ -242,27 +277,12 @@ def _extract_field(article: dict) -> str:
             if key in tag_lower:
                 return field_name
 
-    # Fall back to content keyword scanning
-    title = article.get("title", "")
-    content = (article.get("content") or "")[:500]
-    text = f"{title} {content}".lower()
-
-    field_keywords = [
-        ("大模型", "大模型"), ("llm", "大模型"), ("gpt", "大模型"),
-        ("具身智能", "具身智能"), ("embodied", "具身智能"),
-        ("机器人", "机器人"), ("robot", "机器人"),
-        ("量子", "量子计算"), ("quantum", "量子计算"),
-        ("安全", "网络安全"), ("security", "网络安全"),
-        ("医学", "AI医学"), ("医疗", "AI医学"), ("drug", "AI制药"),
-        ("自动驾驶", "自动驾驶"), ("autonomous", "自动驾驶"),
-        ("视觉", "计算机视觉"), ("vision", "计算机视觉"),
-        ("自然语言", "自然语言处理"), ("nlp", "自然语言处理"),
-        ("教育", "AI教育"),
-        ("人工智能", "人工智能"), ("ai", "人工智能"),
-    ]
-    for kw, field_name in field_keywords:
-        if kw in text:
-            return field_name
+    # Fall back to content keyword scanning (title + first 500 content chars;
+    # field keywords contain no whitespace, so the separator does not matter)
+    scan, title, content = _scan_article(article)
+    hits = scan.hits("field", limit=len(title) + 1 + min(len(content), 500))
+    if hits:
+        return _FIELD_BY_KEYWORD[hits[0]]
 
     return "综合"
 
@@ -62,12 +62,10 @@ def _extract_thumbnail(item: dict[str, Any]) -> str | None:
 @lru_cache(maxsize=1)
 def _university_source_name_map() -> dict[str, str]:
     """Load source_id -> source_name mapping for universities dimension."""
-    from app.scheduler.manager import load_all_source_configs
+    from app.scheduler.source_catalog import get_source_catalog
 
     mapping: dict[str, str] = {}
-    for source in load_all_source_configs():
-        if source.get("dimension") != DIMENSION:
-            continue
+    for source in get_source_catalog().by_dimension.get(DIMENSION, ()):
         source_id = str(source.get("id") or "").strip()
         if not source_id:
             continue
@@ -188,7 +186,7 @@ def _sort_key(item: dict[str, Any]) -> tuple[bool, str, str]:
 
 async def get_overview() -> dict[str, Any]:
     """Build dashboard overview for the universities dimension."""
-    from app.scheduler.manager import load_all_source_configs
+    from app.scheduler.source_catalog import get_source_catalog
 
     articles = dedupe_university_articles(
         filter_university_articles(await get_articles(DIMENSION))
@@ -216,9 +214,7 @@ async def get_overview() -> dict[str, Any]:
             latest_crawl = crawled
 
     # Source counts from YAML
-    all_configs = load_all_source_configs()
-    uni_configs = [c for c in all_configs if c.get("dimension") == DIMENSION]
-    total_source_count = len(uni_configs)
+    total_source_count = len(get_source_catalog().by_dimension.get(DIMENSION, ()))
 
     # Active sources (those that produced data)
     active_sources: set[str] = set()
@@ -330,10 +326,9 @@ async def get_article_detail(url_hash: str) -> dict[str, Any] | None:
 
 async def get_sources(group: str | None = None) -> dict[str, Any]:
     """List university sources with their latest crawl metadata."""
-    from app.scheduler.manager import load_all_source_configs
+    from app.scheduler.source_catalog import get_source_catalog
 
-    all_configs = load_all_source_configs()
-    uni_configs = [c for c in all_configs if c.get("dimension") == DIMENSION]
+    uni_configs = list(get_source_catalog().by_dimension.get(DIMENSION, ()))
 
     if group:
         uni_configs = [c for c in uni_configs if c.get("group") == group]
@@ -1,4 +1,4 @@
-"""LLM services — API wrapper and usage tracking."""
-from app.services.llm import llm_call_tracker, llm_service
+"""LLM services — API wrapper, shared HTTP transport and usage tracking."""
+from app.services.llm import llm_call_tracker, llm_service, llm_transport
 
-__all__ = ["llm_call_tracker", "llm_service"]
+__all__ = ["llm_call_tracker", "llm_service", "llm_transport"]
@@ -157,6 +157,7 @@ class LLMCallTracker:
         }
 
         self._append_to_log(call_record)
+        self._observe_metrics(call_record)
         self._update_summary(
             model=model,
             input_tokens=input_tokens,
@@ -184,6 +185,18 @@ class LLMCallTracker:
                 error_message,
             )
 
+    @staticmethod
+    def _observe_metrics(call_record: dict[str, Any]) -> None:
+        from app.utils.metrics import LLM_REQUEST_SECONDS, LLM_REQUESTS, LLM_TOKENS  # noqa: PLC0415
+
+        provider = call_record["provider"]
+        LLM_REQUESTS.inc(provider, "success" if call_record["success"] else "failed")
+        LLM_TOKENS.inc(provider, "input", amount=call_record["input_tokens"] or 0)
+        LLM_TOKENS.inc(provider, "output", amount=call_record["output_tokens"] or 0)
+        duration_ms = call_record["duration_ms"]
+        if duration_ms is not None:
+            LLM_REQUEST_SECONDS.observe(float(duration_ms) / 1000, provider)
+
     @staticmethod
     def _calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float | None:
         """Calculate API cost in USD using local pricing table."""
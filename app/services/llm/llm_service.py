@@ -1,6 +1,7 @@
 """OpenRouter LLM service for business data enrichment."""
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import time
@@ -11,6 +12,7 @@ import httpx
 
 from app.config import settings
 from app.services.llm.llm_call_tracker import get_tracker
+from app.services.llm.llm_transport import post_chat_completion
 
 logger = logging.getLogger(__name__)
 
@@ -137,46 +139,33 @@ async def _call_provider_once(
     last_error: Exception | None = None
     for attempt in range(3):
         try:
-            async with httpx.AsyncClient(timeout=timeout_secs) as client:
-                resp = await client.post(
-                    api_url,
-                    json=payload,
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            # Pooled client + shared per-provider limiter; 429s are paced there.
+            resp = await post_chat_completion(
+                provider,
+                api_url,
+                headers=headers,
+                payload=payload,
+                timeout=timeout_secs,
+            )
+            data = resp.json()
 
-                choice = data.get("choices", [{}])[0]
-                content = choice.get("message", {}).get("content", "")
-                if not content:
-                    raise LLMError(
-                        f"Empty response from model {model} via provider {provider}"
-                    )
+            choice = data.get("choices", [{}])[0]
+            content = choice.get("message", {}).get("content", "")
+            if not content:
+                raise LLMError(
+                    f"Empty response from model {model} via provider {provider}"
+                )
 
-                usage = data.get("usage", {})
-                return content, usage, _extract_provider_cost_usd(data)
+            usage = data.get("usage", {})
+            return content, usage, _extract_provider_cost_usd(data)
 
         except httpx.HTTPStatusError as e:
-            last_error = e
-            if e.response.status_code == 429:
-                import asyncio
-
-                wait = 2**attempt
-                logger.warning(
-                    "%s rate limited, waiting %ds...",
-                    provider,
-                    wait,
-                )
-                await asyncio.sleep(wait)
-                continue
             raise LLMError(
                 f"{provider} HTTP {e.response.status_code}: {e.response.text}"
             ) from e
         except httpx.RequestError as e:
             last_error = e
             logger.warning("%s request error (attempt %d): %s", provider, attempt + 1, e)
-            import asyncio
-
             await asyncio.sleep(1)
             continue
 
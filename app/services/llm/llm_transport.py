@@ -0,0 +1,311 @@
+"""Shared LLM HTTP transport — pooled clients and per-provider rate limiting.
+
+Every chat-completion POST (``llm_service.call_llm`` used by the policy,
+personnel, tech_frontier, paper_transfer and briefing pipelines, plus the
+LLM scholar crawlers) goes through ``post_chat_completion``. Per provider the
+process keeps:
+
+- one keep-alive ``httpx.AsyncClient`` instead of a new connection per call;
+- a concurrency gate shared by all callers, capped at LLM_MAX_CONCURRENCY.
+  A 429 halves it, and each success grows it back by ``1/limit``;
+- token buckets for requests/minute and tokens/minute. Limits come from
+  settings and are tightened by the provider's rate-limit headers
+  (``x-ratelimit-*-requests`` / ``-tokens``, ``X-RateLimit-*``). An exhausted
+  window or a 429 with ``Retry-After`` pauses the whole provider instead of
+  every caller retrying on its own.
+
+State is per process and per event loop: scripts that call ``asyncio.run``
+more than once get fresh clients, and executor children keep their own
+limits.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.utils.metrics import LLM_RATE_LIMIT_WAIT_SECONDS, LLM_RATE_LIMITED
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_ATTEMPTS = 3
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset(value: str | None, now: float | None = None) -> float | None:
+    """Seconds until a rate-limit window resets.
+
+    Accepts plain seconds, Go-style durations ("6m0s", "20ms"), Unix epoch
+    seconds/milliseconds and HTTP dates (``Retry-After``).
+    """
+    if not value:
+        return None
+    value = value.strip()
+    wall = time.time() if now is None else now
+    try:
+        number = float(value)
+    except ValueError:
+        matches = _DURATION_RE.findall(value)
+        if matches and "".join(n + u for n, u in matches) == value:
+            return sum(float(n) * _DURATION_UNITS[u] for n, u in matches)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - wall)
+        except (TypeError, ValueError):
+            return None
+    if number > 1e12:  # epoch milliseconds
+        return max(0.0, number / 1000 - wall)
+    if number > 1e9:  # epoch seconds
+        return max(0.0, number - wall)
+    return max(0.0, number)
+
+
+def _header_float(headers: httpx.Headers, name: str) -> float | None:
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def estimate_tokens(payload: dict[str, Any]) -> int:
+    """Tokens a request may consume: prompt (about 2 chars per token) plus max_tokens."""
+    chars = sum(len(str(m.get("content") or "")) for m in payload.get("messages", []))
+    return chars // 2 + int(payload.get("max_tokens") or 0)
+
+
+class TokenBucket:
+    """Per-minute budget refilled continuously; a limit of 0 means unlimited."""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self.limit = float(per_minute)
+        self.level = self.limit
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self.limit > 0:
+            self.level = min(self.limit, self.level + (now - self._updated) * self.limit / 60)
+        self._updated = now
+
+    def set_limit(self, per_minute: float) -> None:
+        """Adopt a provider-reported limit when it is stricter than the current one."""
+        if per_minute <= 0 or (self.limit > 0 and per_minute >= self.limit):
+            return
+        self._refill()
+        self.limit = float(per_minute)
+        self.level = min(self.level, self.limit)
+
+    def set_remaining(self, remaining: float) -> None:
+        if self.limit <= 0:
+            return
+        self._refill()
+        self.level = min(self.level, remaining)
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` is available (0 when it is now)."""
+        if self.limit <= 0:
+            return 0.0
+        self._refill()
+        missing = min(amount, self.limit) - self.level
+        return max(0.0, missing * 60 / self.limit)
+
+    def take(self, amount: float) -> None:
+        """Consume ``amount``; negative amounts refund, debt is allowed."""
+        if self.limit <= 0:
+            return
+        self._refill()
+        self.level = min(self.limit, self.level - amount)
+
+
+class ProviderLimiter:
+    """Adaptive concurrency gate plus request/token buckets for one provider."""
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        max_concurrency: int,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency = float(self.max_concurrency)
+        self.requests = TokenBucket(requests_per_minute, clock)
+        self.tokens = TokenBucket(tokens_per_minute, clock)
+        self.paused_until = 0.0
+        self.in_flight = 0
+        self._clock = clock
+        self._slot_freed = asyncio.Condition()
+
+    def wait_time(self, tokens: int) -> float:
+        pause = max(0.0, self.paused_until - self._clock())
+        return max(pause, self.requests.delay(1), self.tokens.delay(tokens))
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait for a concurrency slot and request/token budget, then take them."""
+        started = time.perf_counter()
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self.in_flight < int(self.concurrency))
+            self.in_flight += 1
+        try:
+            while (wait := self.wait_time(tokens)) > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            await self.release()
+            raise
+        self.requests.take(1)
+        self.tokens.take(tokens)
+        LLM_RATE_LIMIT_WAIT_SECONDS.observe(time.perf_counter() - started, self.provider)
+
+    async def release(self) -> None:
+        async with self._slot_freed:
+            self.in_flight -= 1
+            self._slot_freed.notify_all()
+
+    def observe(self, headers: httpx.Headers) -> None:
+        """Tighten the buckets from the provider's rate-limit headers."""
+        for bucket, kind in ((self.requests, "requests"), (self.tokens, "tokens")):
+            limit = _header_float(headers, f"x-ratelimit-limit-{kind}")
+            remaining = _header_float(headers, f"x-ratelimit-remaining-{kind}")
+            if limit is not None:
+                bucket.set_limit(limit)
+            if remaining is not None:
+                bucket.set_remaining(remaining)
+                if remaining <= 0:
+                    self.pause(parse_reset(headers.get(f"x-ratelimit-reset-{kind}")))
+        # OpenRouter style: one window of unspecified length, reset as epoch ms.
+        remaining = _header_float(headers, "x-ratelimit-remaining")
+        if remaining is not None and remaining <= 0:
+            self.pause(parse_reset(headers.get("x-ratelimit-reset")))
+
+    def pause(self, seconds: float | None) -> None:
+        if seconds:
+            self.paused_until = max(self.paused_until, self._clock() + seconds)
+
+    def on_success(self) -> None:
+        self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+
+    def on_rate_limited(self, retry_after: float | None, attempt: int) -> None:
+        LLM_RATE_LIMITED.inc(self.provider)
+        self.concurrency = max(1.0, self.concurrency / 2)
+        self.pause(retry_after if retry_after is not None else 2.0**attempt)
+        logger.warning(
+            "%s rate limited; pausing %.1fs, concurrency now %d",
+            self.provider,
+            max(0.0, self.paused_until - self._clock()),
+            int(self.concurrency),
+        )
+
+
+def _provider_limits(provider: str) -> dict[str, int]:
+    limits = {
+        "max_concurrency": settings.LLM_MAX_CONCURRENCY,
+        "requests_per_minute": settings.LLM_REQUESTS_PER_MINUTE,
+        "tokens_per_minute": settings.LLM_TOKENS_PER_MINUTE,
+    }
+    limits.update(settings.LLM_PROVIDER_LIMITS.get(provider, {}))
+    return limits
+
+
+@dataclass
+class _ProviderState:
+    loop: asyncio.AbstractEventLoop
+    client: httpx.AsyncClient
+    limiter: ProviderLimiter
+
+
+_states: dict[str, _ProviderState] = {}
+
+
+def _new_client(max_concurrency: int) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=DEFAULT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=max_concurrency * 2,
+            max_keepalive_connections=max_concurrency,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+
+def _state(provider: str) -> _ProviderState:
+    loop = asyncio.get_running_loop()
+    state = _states.get(provider)
+    if state is None or state.loop is not loop:
+        limits = _provider_limits(provider)
+        state = _ProviderState(
+            loop=loop,
+            client=_new_client(max(1, limits["max_concurrency"])),
+            limiter=ProviderLimiter(provider, **limits),
+        )
+        _states[provider] = state
+    return state
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    return _state(provider).limiter
+
+
+async def post_chat_completion(
+    provider: str,
+    url: str,
+    *,
+    headers: dict[str, str],
+    payload: dict[str, Any],
+    timeout: float | httpx.Timeout | None = None,
+) -> httpx.Response:
+    """POST a chat completion through the provider's pooled client and limiter.
+
+    429s are retried here (up to RATE_LIMIT_ATTEMPTS) after pausing the
+    provider; any other error status raises ``httpx.HTTPStatusError`` and
+    transport failures raise ``httpx.RequestError`` as before.
+    """
+    state = _state(provider)
+    limiter = state.limiter
+    estimate = estimate_tokens(payload)
+    for attempt in range(RATE_LIMIT_ATTEMPTS):
+        await limiter.acquire(estimate)
+        try:
+            response = await state.client.post(
+                url,
+                json=payload,
+                headers=headers,
+                timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
+            )
+        finally:
+            await limiter.release()
+        limiter.observe(response.headers)
+        if response.status_code != 429:
+            break
+        limiter.on_rate_limited(parse_reset(response.headers.get("retry-after")), attempt)
+    response.raise_for_status()
+    limiter.on_success()
+    try:
+        usage = response.json().get("usage") or {}
+        # Settle the reservation against what the provider actually counted.
+        limiter.tokens.take(int(usage.get("total_tokens") or estimate) - estimate)
+    except (ValueError, AttributeError, TypeError):
+        pass
+    return response
+
+
+async def close_llm_clients() -> None:
+    """Close the pooled clients owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    for provider, state in list(_states.items()):
+        if state.loop is loop:
+            await state.client.aclose()
+            del _states[provider]
@@ -0,0 +1,307 @@
+"""Fuzzy paper deduplication for the paper warehouse (MinHash-LSH blocking).
+
+The same paper arrives from arXiv, OpenReview, DBLP and CVF with small title
+differences (case, punctuation, subtitles, LaTeX), so exact ``canonical_uid``
+matching stores one row per source. Here each paper gets a MinHash signature
+over character 3-grams of its normalized title plus tokens of its first
+authors, split into ``LSH_BANDS`` bands of ``LSH_ROWS`` rows. Papers sharing
+any band bucket are candidates (an index probe per band in
+``paper_lsh_bands``); candidates are then verified by ``match_score`` on
+title, authors, DOI and year before a merge.
+
+A merged source's ``canonical_uid`` is kept in ``paper_source_aliases``, so
+re-ingesting it resolves directly to the canonical paper.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Any
+
+import asyncpg
+
+LSH_BANDS = 8
+LSH_ROWS = 4
+NUM_PERM = LSH_BANDS * LSH_ROWS
+SHINGLE_SIZE = 3
+AUTHOR_TOKENS_FROM = 3
+MAX_CANDIDATES = 50
+
+TITLE_MIN_SIMILARITY = 0.9
+MERGE_MIN_SCORE = 0.85
+TITLE_WEIGHT = 0.7
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20260501)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z\u3400-\u9fff]+")
+_LATEX_RE = re.compile(r"\$[^$]*\$|\\[a-zA-Z]+")
+
+PAPER_DEDUP_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS paper_lsh_bands (
+        band SMALLINT NOT NULL,
+        bucket BIGINT NOT NULL,
+        paper_id TEXT NOT NULL,
+        PRIMARY KEY (band, bucket, paper_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_paper_lsh_bands_paper_id ON paper_lsh_bands(paper_id)",
+    """
+    CREATE TABLE IF NOT EXISTS paper_source_aliases (
+        alias_uid TEXT PRIMARY KEY,
+        paper_id TEXT NOT NULL,
+        source_id TEXT,
+        raw_id TEXT,
+        detail_url TEXT,
+        title TEXT,
+        match_score REAL,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_paper_source_aliases_paper_id "
+    "ON paper_source_aliases(paper_id)",
+)
+
+
+def normalize_title(title: Any) -> str:
+    text = unicodedata.normalize("NFKC", str(title or "")).lower()
+    text = _LATEX_RE.sub(" ", text)
+    return " ".join(_NON_ALNUM_RE.sub(" ", text).split())
+
+
+def author_tokens(authors: list[str] | None, limit: int | None = None) -> set[str]:
+    """Lowercased name tokens, order-insensitive ("Zhang, Wei" == "Wei Zhang")."""
+    tokens: set[str] = set()
+    for name in (authors or [])[:limit]:
+        tokens.update(
+            token for token in normalize_title(name).split() if len(token) > 1
+        )
+    return tokens
+
+
+def shingles(title: Any, authors: list[str] | None = None) -> set[str]:
+    normalized = normalize_title(title)
+    grams = {
+        normalized[i:i + SHINGLE_SIZE]
+        for i in range(max(len(normalized) - SHINGLE_SIZE + 1, 1))
+    }
+    grams.discard("")
+    grams.update(f"a:{token}" for token in author_tokens(authors, AUTHOR_TOKENS_FROM))
+    return grams
+
+
+def minhash(features: set[str]) -> list[int]:
+    signature = [_MERSENNE_PRIME] * NUM_PERM
+    for feature in features:
+        value = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for i, (a, b) in enumerate(_PERMUTATIONS):
+            hashed = (a * value + b) % _MERSENNE_PRIME
+            if hashed < signature[i]:
+                signature[i] = hashed
+    return signature
+
+
+def lsh_buckets(title: Any, authors: list[str] | None = None) -> list[tuple[int, int]]:
+    """(band, bucket) keys; empty for titles too short to block on."""
+    features = shingles(title, authors)
+    if len(features) < 4:
+        return []
+    signature = minhash(features)
+    keys = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(
+            b"".join(value.to_bytes(8, "big") for value in rows), digest_size=8
+        ).digest()
+        keys.append((band, int.from_bytes(digest, "big", signed=True)))
+    return keys
+
+
+def match_score(
+    incoming: dict[str, Any],
+    candidate: dict[str, Any],
+) -> float | None:
+    """Similarity in [0, 1] of two papers, or None when they must not merge.
+
+    Both dicts carry ``title``, ``authors``, ``doi`` and ``year``. Different
+    DOIs or years more than one apart veto the merge (preprint vs. camera
+    ready is usually the same or next year).
+    """
+    doi_a, doi_b = incoming.get("doi"), candidate.get("doi")
+    if doi_a and doi_b and doi_a != doi_b:
+        return None
+    year_a, year_b = incoming.get("year"), candidate.get("year")
+    if year_a and year_b and abs(int(year_a) - int(year_b)) > 1:
+        return None
+    title_a = normalize_title(incoming.get("title"))
+    title_b = normalize_title(candidate.get("title"))
+    if not title_a or not title_b:
+        return None
+    title_sim = SequenceMatcher(None, title_a, title_b).ratio()
+    if title_sim < TITLE_MIN_SIMILARITY:
+        return None
+    tokens_a = author_tokens(incoming.get("authors"))
+    tokens_b = author_tokens(candidate.get("authors"))
+    if not tokens_a or not tokens_b:
+        return title_sim
+    author_sim = len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+    return TITLE_WEIGHT * title_sim + (1 - TITLE_WEIGHT) * author_sim
+
+
+def _stored_authors(value: Any) -> list[str]:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return [value]
+    return [str(item) for item in value or [] if item]
+
+
+def _year(row: dict[str, Any]) -> int | None:
+    if row.get("venue_year"):
+        return int(row["venue_year"])
+    published = row.get("publication_date")
+    return published.year if published is not None else None
+
+
+# ---------------------------------------------------------------------------
+# DB helpers (run on the ingest connection, inside its transaction)
+# ---------------------------------------------------------------------------
+
+
+async def find_alias(conn: asyncpg.Connection, alias_uid: str) -> asyncpg.Record | None:
+    return await conn.fetchrow(
+        """
+        SELECT p.* FROM paper_source_aliases a
+        JOIN papers p ON p.paper_id = a.paper_id
+        WHERE a.alias_uid = $1
+        LIMIT 1
+        """,
+        alias_uid,
+    )
+
+
+async def find_fuzzy_match(
+    conn: asyncpg.Connection,
+    *,
+    title: str,
+    authors: list[str],
+    doi: str | None,
+    year: int | None,
+    exclude_paper_id: str | None = None,
+) -> tuple[asyncpg.Record, float] | None:
+    """Best verified near-duplicate among the LSH candidates, if any.
+
+    Candidates sharing the most bands are verified first; past
+    ``MAX_CANDIDATES`` the cut is stable (band count, then paper_id).
+    """
+    keys = lsh_buckets(title, authors)
+    if not keys:
+        return None
+    rows = await conn.fetch(
+        """
+        SELECT p.* FROM papers p
+        JOIN (
+            SELECT b.paper_id, count(*) AS shared_bands
+            FROM unnest($1::smallint[], $2::bigint[]) AS k(band, bucket)
+            JOIN paper_lsh_bands b ON b.band = k.band AND b.bucket = k.bucket
+            WHERE $4::text IS NULL OR b.paper_id <> $4
+            GROUP BY b.paper_id
+            ORDER BY shared_bands DESC, b.paper_id
+            LIMIT $3
+        ) c ON c.paper_id = p.paper_id
+        ORDER BY c.shared_bands DESC, p.paper_id
+        """,
+        [band for band, _ in keys],
+        [bucket for _, bucket in keys],
+        MAX_CANDIDATES,
+        exclude_paper_id,
+    )
+    incoming = {"title": title, "authors": authors, "doi": doi, "year": year}
+    best: tuple[asyncpg.Record, float] | None = None
+    for row in rows:
+        candidate = {
+            "title": row["title"],
+            "authors": _stored_authors(row["authors"]),
+            "doi": row["doi"],
+            "year": _year(dict(row)),
+        }
+        score = match_score(incoming, candidate)
+        if score is not None and score >= MERGE_MIN_SCORE and (best is None or score > best[1]):
+            best = (row, score)
+    return best
+
+
+async def find_stored_duplicate(
+    conn: asyncpg.Connection, row: asyncpg.Record
+) -> tuple[asyncpg.Record, float] | None:
+    """``find_fuzzy_match`` for a paper already in ``papers`` (never itself)."""
+    return await find_fuzzy_match(
+        conn,
+        title=row["title"],
+        authors=_stored_authors(row["authors"]),
+        doi=row["doi"],
+        year=_year(dict(row)),
+        exclude_paper_id=str(row["paper_id"]),
+    )
+
+
+def band_rows(paper_id: str, title: Any, authors: Any) -> list[tuple[int, int, str]]:
+    """paper_lsh_bands rows for one paper.
+
+    Titles too short to block on get a (-1, 0) sentinel row, so the backfill
+    scan does not revisit them.
+    """
+    keys = lsh_buckets(title, _stored_authors(authors)) or [(-1, 0)]
+    return [(band, bucket, paper_id) for band, bucket in keys]
+
+
+async def index_papers(conn: asyncpg.Connection, rows: list[tuple[int, int, str]]) -> None:
+    if rows:
+        await conn.executemany(
+            """
+            INSERT INTO paper_lsh_bands (band, bucket, paper_id)
+            VALUES ($1, $2, $3)
+            ON CONFLICT DO NOTHING
+            """,
+            rows,
+        )
+
+
+async def record_alias(
+    conn: asyncpg.Connection,
+    *,
+    alias_uid: str,
+    paper_id: str,
+    source_id: str | None,
+    raw_id: str | None,
+    detail_url: str | None,
+    title: str,
+    score: float | None,
+) -> None:
+    await conn.execute(
+        """
+        INSERT INTO paper_source_aliases (
+            alias_uid, paper_id, source_id, raw_id, detail_url, title, match_score
+        )
+        VALUES ($1, $2, $3, $4, $5, $6, $7)
+        ON CONFLICT (alias_uid) DO UPDATE SET paper_id = EXCLUDED.paper_id
+        """,
+        alias_uid,
+        paper_id,
+        source_id,
+        raw_id,
+        detail_url,
+        title,
+        score,
+    )
@@ -12,6 +12,7 @@ from uuid import uuid4
 
 import asyncpg
 
+from app.config import settings
 from app.schemas.paper import (
     PaperAffiliationMapping,
     PaperIngestPayload,
@@ -19,6 +20,7 @@ from app.schemas.paper import (
     PaperRecord,
     PaperSourceRef,
 )
+from app.services import paper_dedup
 
 _SCHEMA_READY = False
 _SCHEMA_LOCK = asyncio.Lock()
@@ -42,10 +44,19 @@ class PaperIngestSummary:
     updated_count: int = 0
     skipped_count: int = 0
     filtered_chinese_count: int = 0
+    # Near-duplicates merged into an existing paper (also counted as updated).
+    merged_count: int = 0
     paper_ids: list[str] = field(default_factory=list)
     error_message: str | None = None
 
 
+@dataclass(slots=True)
+class FuzzyDedupBackfillSummary:
+    indexed_count: int = 0
+    # Stored near-duplicates folded into another paper (row deleted, uid aliased).
+    merged_count: int = 0
+
+
 def _clean_text(value: Any) -> str:
     return str(value or "").replace("\x00", "").strip()
 
@@ -472,14 +483,60 @@ async def ensure_paper_tables(pool: asyncpg.Pool) -> None:
                 "CREATE INDEX IF NOT EXISTS idx_paper_ingest_runs_source_id "
                 "ON paper_ingest_runs(source_id, started_at DESC)"
             )
+            for statement in paper_dedup.PAPER_DEDUP_DDL:
+                await conn.execute(statement)
         _SCHEMA_READY = True
 
 
+def _payload_year(payload: PaperIngestPayload) -> int | None:
+    if payload.venue_year:
+        return int(payload.venue_year)
+    published = _to_datetime(payload.publication_date)
+    return published.year if published else None
+
+
+async def _find_near_duplicate(
+    conn: asyncpg.Connection,
+    payload: PaperIngestPayload,
+    canonical_uid: str,
+) -> tuple[asyncpg.Record | None, bool]:
+    """Resolve a paper without an exact match through its alias or LSH candidates.
+
+    Returns (paper, merged); ``merged`` is True only when this call matched a
+    new near-duplicate, not when an alias recorded earlier resolved it.
+    """
+    existing = await paper_dedup.find_alias(conn, canonical_uid)
+    if existing is not None or not settings.PAPER_FUZZY_DEDUP_ENABLED:
+        return existing, False
+    match = await paper_dedup.find_fuzzy_match(
+        conn,
+        title=payload.title,
+        authors=payload.authors,
+        doi=payload.doi,
+        year=_payload_year(payload),
+    )
+    if match is None:
+        return None, False
+    existing, score = match
+    await paper_dedup.record_alias(
+        conn,
+        alias_uid=canonical_uid,
+        paper_id=str(existing["paper_id"]),
+        source_id=payload.source.source_id,
+        raw_id=payload.raw_id,
+        detail_url=payload.detail_url,
+        title=payload.title,
+        score=score,
+    )
+    return existing, True
+
+
 async def _upsert_paper(
     conn: asyncpg.Connection,
     *,
     payload: PaperIngestPayload,
-) -> tuple[str, bool]:
+) -> tuple[str, bool, bool]:
+    """Insert or merge one paper; returns (paper_id, inserted, merged_near_duplicate)."""
     canonical_uid = build_canonical_uid(
         doi=payload.doi,
         source_id=payload.source.source_id,
@@ -507,6 +564,12 @@ async def _upsert_paper(
             """,
             payload.paper_id,
         )
+    merged = False
+    if existing is None:
+        existing, merged = await _find_near_duplicate(conn, payload, canonical_uid)
+        if existing is not None:
+            # The canonical paper keeps its uid; this source's uid is an alias.
+            canonical_uid = _clean_text(existing["canonical_uid"]) or canonical_uid
     if existing is None:
         row = await conn.fetchrow(
             """
@@ -560,7 +623,10 @@ async def _upsert_paper(
             payload.source.source_id,
         )
         assert row is not None
-        return str(row["paper_id"]), True
+        await paper_dedup.index_papers(
+            conn, paper_dedup.band_rows(str(row["paper_id"]), payload.title, payload.authors)
+        )
+        return str(row["paper_id"]), True, False
     assert existing is not None
     existing_source = PaperSourceRef(
         type=_clean_text(existing["source_type"]),
@@ -625,7 +691,7 @@ async def _upsert_paper(
         payload.track,
         source.source_id,
     )
-    return str(existing["paper_id"]), False
+    return str(existing["paper_id"]), False, merged
 
 
 async def _create_run(conn: asyncpg.Connection, source_id: str) -> str:
@@ -699,12 +765,13 @@ async def ingest_papers(
                     if title_contains_cjk(payload.title):
                         summary.filtered_chinese_count += 1
                         continue
-                    paper_id, inserted = await _upsert_paper(conn, payload=payload)
+                    paper_id, inserted, merged = await _upsert_paper(conn, payload=payload)
                     summary.paper_ids.append(paper_id)
                     if inserted:
                         summary.inserted_count += 1
                     else:
                         summary.updated_count += 1
+                    summary.merged_count += int(merged)
     except Exception as exc:  # noqa: BLE001
         summary.status = "failed"
         summary.error_message = str(exc)
@@ -717,6 +784,123 @@ async def ingest_papers(
     return summary
 
 
+async def _merge_stored_duplicate(
+    conn: asyncpg.Connection,
+    duplicate: asyncpg.Record,
+    canonical_id: str,
+    score: float,
+) -> None:
+    """Fold a stored near-duplicate into ``canonical_id``.
+
+    The canonical row keeps its values and only fills gaps from the
+    duplicate; the duplicate's uid and aliases now resolve to it.
+    """
+    duplicate_id = str(duplicate["paper_id"])
+    await conn.execute(
+        """
+        UPDATE papers AS p
+        SET
+            doi = COALESCE(p.doi, d.doi),
+            abstract = COALESCE(NULLIF(p.abstract, ''), d.abstract),
+            publication_date = COALESCE(p.publication_date, d.publication_date),
+            pdf_url = COALESCE(p.pdf_url, d.pdf_url),
+            venue = COALESCE(p.venue, d.venue),
+            venue_year = COALESCE(p.venue_year, d.venue_year),
+            updated_at = now()
+        FROM papers AS d
+        WHERE p.paper_id = $1 AND d.paper_id = $2
+        """,
+        canonical_id,
+        duplicate_id,
+    )
+    await conn.execute(
+        "UPDATE paper_source_aliases SET paper_id = $1 WHERE paper_id = $2",
+        canonical_id,
+        duplicate_id,
+    )
+    await paper_dedup.record_alias(
+        conn,
+        alias_uid=_clean_text(duplicate["canonical_uid"]),
+        paper_id=canonical_id,
+        source_id=_clean_text(duplicate["source_id"]) or None,
+        raw_id=_clean_text(duplicate["raw_id"]) or None,
+        detail_url=_clean_text(duplicate["detail_url"]) or None,
+        title=_clean_text(duplicate["title"]),
+        score=score,
+    )
+    await conn.execute("DELETE FROM paper_lsh_bands WHERE paper_id = $1", duplicate_id)
+    await conn.execute("DELETE FROM papers WHERE paper_id = $1", duplicate_id)
+
+
+async def backfill_fuzzy_dedup_index(
+    pool: asyncpg.Pool,
+    *,
+    batch_size: int = 2000,
+    merge: bool = True,
+) -> FuzzyDedupBackfillSummary:
+    """Add LSH bands for papers stored before fuzzy dedup, then merge duplicates.
+
+    The merge pass walks papers newest first and folds each one with a
+    verified near-duplicate into its best match, like a later ingest of it
+    would have been. ``merge=False`` only indexes.
+    """
+    await ensure_paper_tables(pool)
+    summary = FuzzyDedupBackfillSummary()
+    while True:
+        async with _acquire_conn(pool) as conn:
+            rows = await conn.fetch(
+                """
+                SELECT p.paper_id, p.title, p.authors FROM papers p
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM paper_lsh_bands b WHERE b.paper_id = p.paper_id
+                )
+                LIMIT $1
+                """,
+                batch_size,
+            )
+            if not rows:
+                break
+            await paper_dedup.index_papers(
+                conn,
+                [
+                    band
+                    for row in rows
+                    for band in paper_dedup.band_rows(
+                        str(row["paper_id"]), row["title"], row["authors"]
+                    )
+                ],
+            )
+        summary.indexed_count += len(rows)
+    if not merge:
+        return summary
+
+    cursor: tuple[datetime, str] | None = None
+    while True:
+        async with _acquire_conn(pool) as conn:
+            rows = await conn.fetch(
+                """
+                SELECT * FROM papers
+                WHERE $1::timestamptz IS NULL OR (ingested_at, paper_id) < ($1, $2)
+                ORDER BY ingested_at DESC, paper_id DESC
+                LIMIT $3
+                """,
+                cursor[0] if cursor else None,
+                cursor[1] if cursor else "",
+                batch_size,
+            )
+            if not rows:
+                return summary
+            for row in rows:
+                match = await paper_dedup.find_stored_duplicate(conn, row)
+                if match is None:
+                    continue
+                canonical, score = match
+                async with conn.transaction():
+                    await _merge_stored_duplicate(conn, row, str(canonical["paper_id"]), score)
+                summary.merged_count += 1
+        cursor = (rows[-1]["ingested_at"], str(rows[-1]["paper_id"]))
+
+
 def payload_from_crawled_item(
     item: Any,
     source_config: dict[str, Any],
@@ -3,7 +3,12 @@ from app.services.stores import (
     base_store,
     crawl_log_store,
     crawl_runtime_store,
+    intel_enrichment_store,
+    intel_watermark_store,
     json_reader,
+    near_dup_store,
+    pg_schema,
+    pipeline_result_store,
     scholar_annotation_store,
     snapshot_store,
     source_state,
@@ -14,7 +19,12 @@ __all__ = [
     "base_store",
     "crawl_log_store",
     "crawl_runtime_store",
+    "intel_enrichment_store",
+    "intel_watermark_store",
     "json_reader",
+    "near_dup_store",
+    "pg_schema",
+    "pipeline_result_store",
     "scholar_annotation_store",
     "snapshot_store",
     "source_state",
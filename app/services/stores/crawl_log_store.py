@@ -12,8 +12,11 @@ DB table: crawl_logs
   started_at TIMESTAMPTZ
   finished_at TIMESTAMPTZ
   duration_seconds FLOAT
+  timings JSONB              -- per-stage seconds, see app.crawlers.utils.timing
 
-JSON fallback: data/logs/{source_id}/crawl_logs.json
+JSON fallback: data/logs/{source_id}/crawl_logs.jsonl (append-only, one row
+per line; compacted to the newest MAX_LOGS_PER_SOURCE rows once it grows past
+COMPACT_BYTES). A legacy crawl_logs.json array is still read.
 """
 from __future__ import annotations
 
@@ -25,11 +28,14 @@ import time
 from typing import Any
 
 from app.config import BASE_DIR
+from app.crawlers.utils.timing import rounded_timings
 
 logger = logging.getLogger(__name__)
 
 LOGS_DIR = BASE_DIR / "data" / "logs"
 MAX_LOGS_PER_SOURCE = 100
+COMPACT_BYTES = 256 * 1024
+_INSERT_CHUNK_SIZE = 500
 
 
 # ---------------------------------------------------------------------------
@@ -37,25 +43,66 @@ MAX_LOGS_PER_SOURCE = 100
 # ---------------------------------------------------------------------------
 
 def _log_file(source_id: str) -> Path:
+    return LOGS_DIR / source_id / "crawl_logs.jsonl"
+
+
+def _legacy_log_file(source_id: str) -> Path:
     return LOGS_DIR / source_id / "crawl_logs.json"
 
 
 def _load_logs(source_id: str) -> list[dict[str, Any]]:
+    logs: list[dict[str, Any]] = []
+    legacy = _legacy_log_file(source_id)
+    if legacy.exists():
+        try:
+            with open(legacy, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                logs.extend(data)
+        except (json.JSONDecodeError, OSError):
+            pass
+
     path = _log_file(source_id)
-    if not path.exists():
-        return []
-    try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return []
+    if path.exists():
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        logs.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # torn last line after a crash
+        except OSError:
+            pass
+    return logs[-MAX_LOGS_PER_SOURCE:]
 
 
-def _save_logs(source_id: str, logs: list[dict[str, Any]]) -> None:
+def _append_logs_json(rows: list[dict[str, Any]]) -> None:
+    by_source: dict[str, list[dict[str, Any]]] = {}
+    for row in rows:
+        by_source.setdefault(row["source_id"], []).append(row)
+
+    for source_id, source_rows in by_source.items():
+        path = _log_file(source_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for row in source_rows:
+                f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+        if path.stat().st_size > COMPACT_BYTES:
+            _compact_logs(source_id)
+
+
+def _compact_logs(source_id: str) -> None:
+    logs = _load_logs(source_id)
     path = _log_file(source_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(logs, f, ensure_ascii=False, indent=2, default=str)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for row in logs:
+            f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+    tmp.replace(path)
+    _legacy_log_file(source_id).unlink(missing_ok=True)
 
 
 def _get_client():
@@ -63,11 +110,55 @@ def _get_client():
     return get_client()
 
 
+# None until checked; False when crawl_logs has no timings column and it
+# cannot be added (e.g. Supabase REST), in which case rows are sent without it.
+_timings_column: bool | None = None
+
+
+async def _ensure_timings_column(client: Any) -> bool:
+    global _timings_column
+    if _timings_column is not None:
+        return _timings_column
+    from app.db import client as db_client  # noqa: PLC0415
+
+    if isinstance(client, db_client.LocalPostgresClient):
+        from app.db.pool import get_pool  # noqa: PLC0415
+
+        try:
+            await get_pool().execute(
+                "ALTER TABLE crawl_logs ADD COLUMN IF NOT EXISTS timings JSONB"
+            )
+        except Exception as exc:  # noqa: BLE001
+            # No ALTER privilege: the insert below finds out whether the column exists.
+            logger.debug("Could not ensure crawl_logs.timings: %s", exc)
+        # Column types are cached per table by the query facade.
+        db_client._table_column_types.pop("crawl_logs", None)
+    _timings_column = True
+    return True
+
+
+def _without_timings(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [{k: v for k, v in row.items() if k != "timings"} for row in rows]
+
+
+def _decode_timings(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # jsonb comes back as text when the column was added after the facade
+    # cached crawl_logs column types (e.g. by another process).
+    for row in rows:
+        value = row.get("timings")
+        if isinstance(value, str):
+            try:
+                row["timings"] = json.loads(value)
+            except json.JSONDecodeError:
+                row["timings"] = None
+    return rows
+
+
 # ---------------------------------------------------------------------------
 # Public API  (all async — callers must await)
 # ---------------------------------------------------------------------------
 
-async def append_crawl_log(
+def build_crawl_log_row(
     source_id: str,
     *,
     status: str,
@@ -77,45 +168,108 @@ async def append_crawl_log(
     started_at: datetime | None = None,
     finished_at: datetime | None = None,
     duration_seconds: float = 0.0,
-) -> None:
-    started_dt = started_at
-    finished_dt = finished_at
-    row: dict[str, Any] = {
+    timings: dict[str, float] | None = None,
+) -> dict[str, Any]:
+    return {
         "source_id": source_id,
         "status": status,
         "items_total": items_total,
         "items_new": items_new,
         "error_message": error_message,
-        "started_at": started_dt,
-        "finished_at": finished_dt,
+        "started_at": started_at,
+        "finished_at": finished_at,
         "duration_seconds": duration_seconds,
+        "timings": rounded_timings(timings),
     }
+
+
+async def append_crawl_log(
+    source_id: str,
+    *,
+    status: str,
+    items_total: int = 0,
+    items_new: int = 0,
+    error_message: str | None = None,
+    started_at: datetime | None = None,
+    finished_at: datetime | None = None,
+    duration_seconds: float = 0.0,
+    timings: dict[str, float] | None = None,
+) -> None:
+    await append_crawl_logs(
+        [
+            build_crawl_log_row(
+                source_id,
+                status=status,
+                items_total=items_total,
+                items_new=items_new,
+                error_message=error_message,
+                started_at=started_at,
+                finished_at=finished_at,
+                duration_seconds=duration_seconds,
+                timings=timings,
+            )
+        ]
+    )
+
+
+async def _insert_chunk(client: Any, chunk: list[dict[str, Any]]) -> None:
+    try:
+        await client.table("crawl_logs").insert(chunk).execute()
+    except Exception as exc:
+        # Handle legacy schema where crawl_logs.id lacks auto-increment default.
+        if "null value in column \"id\"" not in str(exc):
+            raise
+        base_id = int(time.time_ns() // 1000)
+        with_ids = [dict(row, id=base_id + n) for n, row in enumerate(chunk)]
+        await client.table("crawl_logs").insert(with_ids).execute()
+
+
+async def append_crawl_logs(rows: list[dict[str, Any]]) -> None:
+    """Insert many crawl log rows (see build_crawl_log_row) with multi-row INSERTs."""
+    if not rows:
+        return
+    global _timings_column
+    inserted = 0
     try:
         client = _get_client()
-        try:
-            await client.table("crawl_logs").insert(row).execute()
-        except Exception as exc:
-            # Handle legacy schema where crawl_logs.id lacks auto-increment default.
-            if "null value in column \"id\"" not in str(exc):
-                raise
-            row_with_id = dict(row)
-            row_with_id["id"] = int(time.time_ns() // 1000)
-            await client.table("crawl_logs").insert(row_with_id).execute()
+        if not await _ensure_timings_column(client):
+            rows = _without_timings(rows)
+        for i in range(0, len(rows), _INSERT_CHUNK_SIZE):
+            chunk = rows[i:i + _INSERT_CHUNK_SIZE]
+            try:
+                await _insert_chunk(client, chunk)
+            except Exception as exc:
+                if "timings" not in str(exc) or not _timings_column:
+                    raise
+                logger.warning("crawl_logs has no timings column, storing rows without it")
+                _timings_column = False
+                rows = _without_timings(rows)
+                await _insert_chunk(client, rows[i:i + _INSERT_CHUNK_SIZE])
+            inserted = i + len(chunk)
         return
     except RuntimeError:
         pass
     except Exception as exc:
-        logger.warning("append_crawl_log DB failed, using JSON: %s", exc)
+        logger.warning(
+            "append_crawl_logs DB failed after %d of %d rows, using JSON: %s",
+            inserted, len(rows), exc,
+        )
 
-    # JSON fallback
-    logs = _load_logs(source_id)
-    row["started_at"] = started_dt.isoformat() if started_dt else None
-    row["finished_at"] = finished_dt.isoformat() if finished_dt else None
-    row["created_at"] = datetime.now(timezone.utc).isoformat()
-    logs.append(row)
-    if len(logs) > MAX_LOGS_PER_SOURCE:
-        logs = logs[-MAX_LOGS_PER_SOURCE:]
-    _save_logs(source_id, logs)
+    # JSON fallback, only for the rows the DB did not take
+    created_at = datetime.now(timezone.utc).isoformat()
+    json_rows = []
+    for row in rows[inserted:]:
+        started_dt = row.get("started_at")
+        finished_dt = row.get("finished_at")
+        json_rows.append(
+            {
+                **row,
+                "started_at": started_dt.isoformat() if started_dt else None,
+                "finished_at": finished_dt.isoformat() if finished_dt else None,
+                "created_at": created_at,
+            }
+        )
+    _append_logs_json(json_rows)
 
 
 async def get_crawl_logs(
@@ -130,7 +284,7 @@ async def get_crawl_logs(
         if source_id:
             query = query.eq("source_id", source_id)
         res = await query.execute()
-        return res.data or []
+        return _decode_timings(res.data or [])
     except RuntimeError:
         pass
     except Exception as exc:
@@ -169,7 +323,7 @@ async def get_crawl_logs_since(
         if source_id:
             query = query.eq("source_id", source_id)
         res = await query.execute()
-        return res.data or []
+        return _decode_timings(res.data or [])
     except RuntimeError:
         pass
     except Exception as exc:
@@ -190,6 +344,174 @@ async def get_crawl_logs_since(
     return filtered[:limit]
 
 
+def _stage_seconds(log: dict[str, Any], stage: str | None) -> float | None:
+    if not stage:
+        return float(log.get("duration_seconds") or 0.0)
+    timings = log.get("timings")
+    if not isinstance(timings, dict) or stage not in timings:
+        return None
+    try:
+        return float(timings[stage])
+    except (TypeError, ValueError):
+        return None
+
+
+async def get_slowest_crawl_logs(
+    *,
+    since: datetime,
+    limit: int = 20,
+    stage: str | None = None,
+) -> list[dict[str, Any]]:
+    """Crawl logs since ``since``, slowest first by duration or by one ``timings`` stage.
+
+    Ranked with ORDER BY ... LIMIT in the database; only the JSON fallback
+    (and a stage ranking over Supabase REST) sorts in Python.
+    """
+    try:
+        client = _get_client()
+        from app.db.client import LocalPostgresClient  # noqa: PLC0415
+
+        if isinstance(client, LocalPostgresClient):
+            from app.db.pool import get_pool  # noqa: PLC0415
+
+            if stage:
+                rows = await get_pool().fetch(
+                    """
+                    SELECT * FROM crawl_logs
+                    WHERE started_at >= $1 AND timings ? $2
+                    ORDER BY (timings->>$2)::float8 DESC NULLS LAST
+                    LIMIT $3
+                    """,
+                    since,
+                    stage,
+                    limit,
+                )
+            else:
+                rows = await get_pool().fetch(
+                    """
+                    SELECT * FROM crawl_logs
+                    WHERE started_at >= $1
+                    ORDER BY duration_seconds DESC NULLS LAST
+                    LIMIT $2
+                    """,
+                    since,
+                    limit,
+                )
+            return _decode_timings([dict(row) for row in rows])
+
+        if not stage:
+            res = await (
+                client.table("crawl_logs")
+                .select("*")
+                .gte("started_at", since)
+                .gt("duration_seconds", 0)
+                .order("duration_seconds", desc=True)
+                .limit(limit)
+                .execute()
+            )
+            return _decode_timings(res.data or [])
+    except RuntimeError:
+        pass
+    except Exception as exc:
+        logger.warning("get_slowest_crawl_logs DB failed, ranking recent logs: %s", exc)
+
+    ranked = [
+        (value, log)
+        for log in await get_crawl_logs_since(since=since, limit=10000)
+        if (value := _stage_seconds(log, stage)) is not None
+    ]
+    ranked.sort(key=lambda entry: entry[0], reverse=True)
+    return [log for _, log in ranked[:limit]]
+
+
+def _tally_cadence(
+    stats: dict[str, dict[str, Any]],
+    source_id: str,
+    items_new: Any,
+    started_at: Any,
+) -> None:
+    entry = stats.setdefault(
+        source_id, {"crawls": 0, "crawls_with_new": 0, "first_crawl_at": None}
+    )
+    entry["crawls"] += 1
+    if int(items_new or 0) > 0:
+        entry["crawls_with_new"] += 1
+    if started_at and (entry["first_crawl_at"] is None or started_at < entry["first_crawl_at"]):
+        entry["first_crawl_at"] = started_at
+
+
+async def get_crawl_cadence_stats(
+    *,
+    since: datetime,
+    source_ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    """Per-source crawl counts since ``since`` for adaptive scheduling.
+
+    Returns ``{source_id: {"crawls", "crawls_with_new", "first_crawl_at"}}``;
+    aggregated in SQL on local Postgres, from a projected select elsewhere.
+    """
+    stats: dict[str, dict[str, Any]] = {}
+    if not source_ids:
+        return stats
+    try:
+        client = _get_client()
+        from app.db.client import LocalPostgresClient  # noqa: PLC0415
+
+        if isinstance(client, LocalPostgresClient):
+            from app.db.pool import get_pool  # noqa: PLC0415
+
+            rows = await get_pool().fetch(
+                """
+                SELECT source_id,
+                       count(*) AS crawls,
+                       count(*) FILTER (WHERE items_new > 0) AS crawls_with_new,
+                       min(started_at) AS first_crawl_at
+                FROM crawl_logs
+                WHERE started_at >= $1
+                  AND source_id = ANY(ARRAY(SELECT jsonb_array_elements_text($2::jsonb)))
+                GROUP BY source_id
+                """,
+                since,
+                json.dumps(source_ids),
+            )
+            return {
+                row["source_id"]: {
+                    "crawls": row["crawls"],
+                    "crawls_with_new": row["crawls_with_new"],
+                    "first_crawl_at": row["first_crawl_at"],
+                }
+                for row in rows
+            }
+
+        res = await (
+            client.table("crawl_logs")
+            .select("source_id,items_new,started_at")
+            .gte("started_at", since)
+            .in_("source_id", source_ids)
+            .execute()
+        )
+        for row in res.data or []:
+            _tally_cadence(
+                stats,
+                str(row.get("source_id") or ""),
+                row.get("items_new"),
+                row.get("started_at"),
+            )
+        return stats
+    except RuntimeError:
+        pass
+    except Exception as exc:
+        logger.warning("get_crawl_cadence_stats DB failed, using JSON: %s", exc)
+
+    since_iso = since.isoformat()
+    for source_id in source_ids:
+        for log in _load_logs(source_id):
+            started = log.get("started_at") or ""
+            if started >= since_iso:
+                _tally_cadence(stats, source_id, log.get("items_new"), started)
+    return stats
+
+
 async def get_recent_log_stats(hours: int = 24) -> dict[str, int]:
     """Get crawl and article counts from the last N hours."""
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
@@ -0,0 +1,198 @@
+"""Buffered writer for crawl logs and source runtime state.
+
+Every finished crawl produces one crawl_logs row and one source_states
+transition. Writing them inline costs 2-3 DB round trips per source, which a
+1000-source full crawl pays serially. CrawlTelemetryWriter queues both and
+flushes them as one multi-row INSERT plus one batched state upsert, either
+every CRAWL_TELEMETRY_FLUSH_SECONDS, when CRAWL_TELEMETRY_MAX_BATCH rows are
+pending, or when a job calls flush_crawl_telemetry() at its end.
+
+Failure counters are merged per source in memory (a success resets, each
+failure adds one) and applied with an in-SQL increment, see
+apply_source_state_updates().
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from app.config import settings
+from app.services.stores.crawl_log_store import append_crawl_logs, build_crawl_log_row
+from app.services.stores.source_state import apply_source_state_updates
+
+logger = logging.getLogger(__name__)
+
+_SUCCESS_STATUSES = frozenset({"success", "no_new_content"})
+
+
+class CrawlTelemetryWriter:
+    def __init__(
+        self,
+        *,
+        flush_seconds: float | None = None,
+        max_batch: int | None = None,
+    ) -> None:
+        self._flush_seconds = flush_seconds
+        self._max_batch = max_batch
+        self._logs: list[dict[str, Any]] = []
+        self._states: dict[str, dict[str, Any]] = {}
+        self._flush_lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def flush_seconds(self) -> float:
+        if self._flush_seconds is not None:
+            return self._flush_seconds
+        return float(settings.CRAWL_TELEMETRY_FLUSH_SECONDS)
+
+    @property
+    def max_batch(self) -> int:
+        if self._max_batch is not None:
+            return self._max_batch
+        return max(1, int(settings.CRAWL_TELEMETRY_MAX_BATCH))
+
+    @property
+    def pending(self) -> int:
+        return len(self._logs) + len(self._states)
+
+    def record_log(self, source_id: str, **fields: Any) -> None:
+        """Queue a crawl_logs row (same keywords as append_crawl_log)."""
+        self._logs.append(build_crawl_log_row(source_id, **fields))
+
+    def record_state(
+        self,
+        source_id: str,
+        *,
+        last_crawl_at: datetime | None = None,
+        last_success_at: datetime | None = None,
+        reset_failures: bool = False,
+    ) -> None:
+        """Queue a source_states transition; failures count unless reset."""
+        entry = self._states.setdefault(
+            source_id,
+            {
+                "source_id": source_id,
+                "reset": False,
+                "delta": 0,
+                "last_crawl_at": None,
+                "last_success_at": None,
+            },
+        )
+        if reset_failures:
+            entry["reset"] = True
+            entry["delta"] = 0
+        else:
+            entry["delta"] += 1
+        if last_crawl_at is not None:
+            entry["last_crawl_at"] = last_crawl_at
+        if last_success_at is not None:
+            entry["last_success_at"] = last_success_at
+
+    async def record_crawl_outcome(
+        self,
+        source_id: str,
+        *,
+        status: str,
+        items_total: int = 0,
+        items_new: int = 0,
+        error_message: str | None = None,
+        started_at: datetime | None = None,
+        finished_at: datetime | None = None,
+        duration_seconds: float = 0.0,
+        timings: dict[str, float] | None = None,
+        log: bool = True,
+    ) -> None:
+        """Queue the log row and state transition for one finished crawl."""
+        if log:
+            self.record_log(
+                source_id,
+                status=status,
+                items_total=items_total,
+                items_new=items_new,
+                error_message=error_message,
+                started_at=started_at,
+                finished_at=finished_at,
+                duration_seconds=duration_seconds,
+                timings=timings,
+            )
+        succeeded = status in _SUCCESS_STATUSES
+        self.record_state(
+            source_id,
+            last_crawl_at=finished_at,
+            last_success_at=finished_at if succeeded else None,
+            reset_failures=succeeded,
+        )
+        if self.pending >= self.max_batch:
+            await self.flush()
+        else:
+            self._ensure_flusher()
+
+    async def flush(self) -> None:
+        """Write everything queued so far; safe to call concurrently."""
+        loop = asyncio.get_running_loop()
+        if self._flush_lock is None or self._lock_loop is not loop:
+            # New event loop (executor child, tests): locks do not carry over.
+            self._flush_lock = asyncio.Lock()
+            self._lock_loop = loop
+        async with self._flush_lock:
+            logs, self._logs = self._logs, []
+            states, self._states = list(self._states.values()), {}
+            if not logs and not states:
+                return
+            try:
+                await append_crawl_logs(logs)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Crawl log flush failed (%d rows): %s", len(logs), exc)
+            try:
+                await apply_source_state_updates(states)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Source state flush failed (%d rows): %s", len(states), exc)
+
+    async def close(self) -> None:
+        """Stop the background flusher and write what is left."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        await self.flush()
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._task = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            if not self.pending:
+                return
+            await self.flush()
+
+
+_writer: CrawlTelemetryWriter | None = None
+
+
+def get_crawl_telemetry() -> CrawlTelemetryWriter:
+    global _writer
+    if _writer is None:
+        _writer = CrawlTelemetryWriter()
+    return _writer
+
+
+async def flush_crawl_telemetry() -> None:
+    if _writer is not None:
+        await _writer.flush()
+
+
+async def close_crawl_telemetry() -> None:
+    if _writer is not None:
+        await _writer.close()
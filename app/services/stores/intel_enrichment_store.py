@@ -0,0 +1,223 @@
+"""Per-article intel enrichments (rules and LLM results) — backed by PostgreSQL.
+
+Falls back to one JSON file per article under the processor's ``_enriched/``
+directory when the DB pool is not initialised (Supabase SDK backend, tests).
+
+DB table (created on first use):
+  intel_enrichments
+    namespace       TEXT           processor, e.g. "policy", "personnel"
+    url_hash        TEXT           article the enrichment belongs to
+    content_hash    TEXT           articles.content_hash it was computed from
+    prompt_version  TEXT           rules/prompt fingerprint it was computed with
+    article         JSONB          article fields the output builders need
+    enrichment      JSONB          rules or LLM result
+    updated_at      TIMESTAMPTZ
+    PRIMARY KEY (namespace, url_hash)
+
+With a pool, existing ``_enriched/*.json`` files are imported on first use and
+moved to ``_enriched.migrated/``; files written later by the standalone
+scripts are picked up the same way.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from app.services.stores.pg_schema import PgSchema
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_DDL = """
+CREATE TABLE IF NOT EXISTS intel_enrichments (
+    namespace TEXT NOT NULL,
+    url_hash TEXT NOT NULL,
+    content_hash TEXT,
+    prompt_version TEXT,
+    article JSONB NOT NULL,
+    enrichment JSONB NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (namespace, url_hash)
+);
+"""
+
+PUT_CHUNK_SIZE = 500
+
+Enriched = tuple[dict[str, Any], Any]
+
+_schema = PgSchema(
+    _SCHEMA_DDL, unavailable="Intel enrichment table unavailable, using _enriched/ files"
+)
+
+
+def _json_value(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+class EnrichmentStore:
+    """Enrichments of one processor, keyed by article ``url_hash``.
+
+    Usage::
+
+        store = EnrichmentStore("policy", PROCESSED_DIR / "_enriched", payload_key="llm")
+        await store.put_many([(article, result)], version=rules_version)
+        for article, result in await store.load_all():
+            ...
+
+    ``payload_key`` is the key holding the enrichment in the per-article JSON
+    files (fallback and migration source).
+    """
+
+    def __init__(self, namespace: str, legacy_dir: Path, *, payload_key: str) -> None:
+        self.namespace = namespace
+        self._legacy_dir = legacy_dir
+        self._payload_key = payload_key
+
+    # -- backend selection --------------------------------------------------
+
+    async def _pool(self) -> Any | None:
+        """Pool with the table ready and legacy files imported, or None."""
+        pool = await _schema.pool()
+        if pool is None:
+            return None
+        if self._legacy_dir.exists():
+            await self._migrate_files(pool)
+        return pool
+
+    # -- JSON file fallback -------------------------------------------------
+
+    def _read_file(self, path: Path) -> Enriched | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data["article"], data[self._payload_key]
+        except (json.JSONDecodeError, KeyError, OSError) as e:
+            logger.warning("Skipping invalid enriched file %s: %s", path.name, e)
+            return None
+
+    def _write_file(self, article: dict[str, Any], enrichment: Any) -> None:
+        self._legacy_dir.mkdir(parents=True, exist_ok=True)
+        url_hash = article.get("url_hash", "unknown")
+        with open(self._legacy_dir / f"{url_hash}.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {"article": article, self._payload_key: enrichment},
+                f, ensure_ascii=False, indent=2,
+            )
+
+    async def _migrate_files(self, pool: Any) -> None:
+        paths = sorted(self._legacy_dir.glob("*.json"))
+        items = [item for item in map(self._read_file, paths) if item is not None]
+        if items:
+            if not await self._put_rows(pool, items, version=None):
+                return  # keep the files; retried on next use
+            logger.info(
+                "Imported %d %s enrichments from %s", len(items), self.namespace, self._legacy_dir
+            )
+        migrated_dir = self._legacy_dir.with_name(f"{self._legacy_dir.name}.migrated")
+        migrated_dir.mkdir(parents=True, exist_ok=True)
+        for path in paths:
+            try:
+                path.replace(migrated_dir / path.name)
+            except FileNotFoundError:
+                continue  # moved by another process migrating concurrently
+        try:
+            self._legacy_dir.rmdir()
+        except OSError:
+            pass  # something else lives there; checked again next time
+
+    # -- DB -----------------------------------------------------------------
+
+    async def _put_rows(self, pool: Any, items: list[Enriched], *, version: str | None) -> bool:
+        rows = [
+            {
+                "url_hash": article.get("url_hash", "unknown"),
+                "content_hash": article.get("content_hash"),
+                "prompt_version": version,
+                "article": article,
+                "enrichment": enrichment,
+            }
+            for article, enrichment in items
+        ]
+        try:
+            for start in range(0, len(rows), PUT_CHUNK_SIZE):
+                await pool.execute(
+                    """
+                    INSERT INTO intel_enrichments (
+                        namespace, url_hash, content_hash, prompt_version,
+                        article, enrichment, updated_at
+                    )
+                    SELECT $1, x.url_hash, x.content_hash, x.prompt_version,
+                           x.article, x.enrichment, now()
+                    FROM jsonb_to_recordset($2::jsonb) AS x(
+                        url_hash TEXT, content_hash TEXT, prompt_version TEXT,
+                        article JSONB, enrichment JSONB
+                    )
+                    ON CONFLICT (namespace, url_hash) DO UPDATE SET
+                        content_hash = EXCLUDED.content_hash,
+                        prompt_version = EXCLUDED.prompt_version,
+                        article = EXCLUDED.article,
+                        enrichment = EXCLUDED.enrichment,
+                        updated_at = now()
+                    """,
+                    self.namespace,
+                    json.dumps(rows[start:start + PUT_CHUNK_SIZE], ensure_ascii=False),
+                )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Saving %s enrichments failed: %s", self.namespace, exc)
+            return False
+        return True
+
+    # -- public API ---------------------------------------------------------
+
+    async def load_all(self) -> list[Enriched]:
+        """Every stored (article, enrichment) pair, in one query."""
+        pool = await self._pool()
+        if pool is None:
+            if not self._legacy_dir.exists():
+                return []
+            items = map(self._read_file, self._legacy_dir.glob("*.json"))
+            return [item for item in items if item is not None]
+        records = await pool.fetch(
+            "SELECT article, enrichment FROM intel_enrichments WHERE namespace = $1",
+            self.namespace,
+        )
+        return [(_json_value(r["article"]), _json_value(r["enrichment"])) for r in records]
+
+    async def get_many(self, url_hashes: Iterable[str]) -> dict[str, Enriched]:
+        """Stored (article, enrichment) per url_hash; missing hashes are absent."""
+        hashes = sorted(set(url_hashes))
+        if not hashes:
+            return {}
+        pool = await self._pool()
+        if pool is None:
+            found = {}
+            for url_hash in hashes:
+                path = self._legacy_dir / f"{url_hash}.json"
+                if path.exists() and (item := self._read_file(path)) is not None:
+                    found[url_hash] = item
+            return found
+        records = await pool.fetch(
+            """
+            SELECT url_hash, article, enrichment FROM intel_enrichments
+            WHERE namespace = $1
+              AND url_hash = ANY(ARRAY(SELECT jsonb_array_elements_text($2::jsonb)))
+            """,
+            self.namespace,
+            json.dumps(hashes),
+        )
+        return {
+            r["url_hash"]: (_json_value(r["article"]), _json_value(r["enrichment"]))
+            for r in records
+        }
+
+    async def put_many(self, items: Iterable[Enriched], *, version: str | None = None) -> None:
+        """Upsert (article, enrichment) pairs; ``version`` is the rules/prompt version."""
+        items = list(items)
+        if not items:
+            return
+        pool = await self._pool()
+        if pool is None or not await self._put_rows(pool, items, version=version):
+            for article, enrichment in items:
+                self._write_file(article, enrichment)
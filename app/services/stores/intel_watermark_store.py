@@ -0,0 +1,89 @@
+"""Per-processor watermarks for incremental intel processing.
+
+DB table (created on first use):
+  intel_watermarks
+    processor      TEXT PRIMARY KEY   e.g. "policy", "tech_frontier"
+    crawled_at     TIMESTAMPTZ        newest articles.crawled_at processed
+    rule_version   TEXT               rules/prompt fingerprint it was built with
+    updated_at     TIMESTAMPTZ
+
+A processor reads only articles crawled since its watermark, served by the
+``articles (dimension, crawled_at)`` index created alongside the table. A
+watermark written under another ``rule_version`` is ignored, so changing the
+rules or LLM prompts forces one full rebuild. Without a pool, or when the table cannot
+be created, there is never a watermark and processors load everything.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from app.services.stores.pg_schema import PgSchema
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_DDL = """
+CREATE TABLE IF NOT EXISTS intel_watermarks (
+    processor TEXT PRIMARY KEY,
+    crawled_at TIMESTAMPTZ,
+    rule_version TEXT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS idx_articles_dimension_crawled_at
+    ON articles (dimension, crawled_at);
+"""
+
+_schema = PgSchema(
+    _SCHEMA_DDL, unavailable="Intel watermarks unavailable, processing full dimensions"
+)
+
+
+async def get_watermark(processor: str, rule_version: str) -> datetime | None:
+    """Watermark of ``processor``, or None when absent, stale or unavailable."""
+    pool = await _schema.pool()
+    if pool is None:
+        return None
+    try:
+        row = await pool.fetchrow(
+            "SELECT crawled_at, rule_version FROM intel_watermarks WHERE processor = $1",
+            processor,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Intel watermark lookup failed for %s: %s", processor, exc)
+        return None
+    if row is None:
+        return None
+    if row["rule_version"] != rule_version:
+        logger.info(
+            "Intel watermark for %s built with rules %s (now %s); full rebuild",
+            processor, row["rule_version"], rule_version,
+        )
+        return None
+    return row["crawled_at"]
+
+
+async def set_watermark(
+    processor: str, crawled_at: datetime | None, rule_version: str
+) -> bool:
+    """Record that ``processor`` has processed everything up to ``crawled_at``."""
+    pool = await _schema.pool()
+    if pool is None:
+        return False
+    try:
+        await pool.execute(
+            """
+            INSERT INTO intel_watermarks (processor, crawled_at, rule_version, updated_at)
+            VALUES ($1, $2, $3, now())
+            ON CONFLICT (processor) DO UPDATE SET
+                crawled_at = EXCLUDED.crawled_at,
+                rule_version = EXCLUDED.rule_version,
+                updated_at = now()
+            """,
+            processor,
+            crawled_at,
+            rule_version,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Intel watermark update failed for %s: %s", processor, exc)
+        return False
+    return True
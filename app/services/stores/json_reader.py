@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Sequence
 from datetime import date, datetime, timezone
 from typing import Any
 
@@ -59,18 +60,41 @@ async def _fetch_db_rows_paged(
 # Public async API
 # ---------------------------------------------------------------------------
 
+async def _existing_article_columns(columns: Sequence[str]) -> str:
+    """Comma-joined projection, dropping columns this database does not have.
+
+    Optional columns (e.g. ``canonical_url_hash``) are created lazily, so a
+    fixed projection could otherwise fail on older databases.
+    """
+    try:
+        from app.db.client import _get_table_column_types  # noqa: PLC0415
+
+        known = await _get_table_column_types("articles")
+    except Exception:  # noqa: BLE001 - no pool (Supabase SDK backend): trust the list
+        known = {}
+    return ", ".join(c for c in columns if not known or c in known)
+
+
 async def get_articles(
     dimension: str,
     group: str | None = None,
     source_id: str | None = None,
     date_from: date | None = None,
     date_to: date | None = None,
+    *,
+    crawled_since: datetime | None = None,
+    columns: Sequence[str] | None = None,
 ) -> list[dict[str, Any]]:
-    """Fetch articles for a dimension from database."""
+    """Fetch articles for a dimension from database.
+
+    ``crawled_since`` restricts to rows (re)crawled at or after that time;
+    ``columns`` projects the select (default: all columns).
+    """
     client = _get_client()
+    select_cols = await _existing_article_columns(columns) if columns else "*"
 
     def _build_query():
-        query = client.table("articles").select("*").eq("dimension", dimension).order(
+        query = client.table("articles").select(select_cols).eq("dimension", dimension).order(
             "published_at", desc=True
         )
         if group is not None:
@@ -85,6 +109,8 @@ async def get_articles(
             query = query.lte("published_at", datetime(
                 date_to.year, date_to.month, date_to.day, 23, 59, 59, tzinfo=timezone.utc
             ).isoformat())
+        if crawled_since is not None:
+            query = query.gte("crawled_at", crawled_since.isoformat())
         return query
 
     rows = await _fetch_db_rows_paged(_build_query)
@@ -96,6 +122,31 @@ async def get_articles(
     return rows
 
 
+async def get_stored_article_ids(
+    url_hashes: Iterable[str],
+    dimensions: Sequence[str] = (),
+    *,
+    chunk_size: int = 500,
+) -> set[str]:
+    """The subset of ``url_hashes`` still in ``articles`` (within ``dimensions`` if given).
+
+    Looks the ids up by primary key, so checking a processor's records costs
+    no more than the records themselves, however large the dimensions are.
+    """
+    client = _get_client()
+    ids = sorted({str(h) for h in url_hashes if h})
+    found: set[str] = set()
+    for i in range(0, len(ids), chunk_size):
+        query = client.table("articles").select("url_hash").in_(
+            "url_hash", ids[i:i + chunk_size]
+        )
+        if dimensions:
+            query = query.in_("dimension", list(dimensions))
+        res = await query.execute()
+        found.update(str(row["url_hash"]) for row in res.data or [])
+    return found
+
+
 async def get_dimension_stats() -> dict[str, dict[str, Any]]:
     """Get statistics for all dimensions from database."""
     client = _get_client()
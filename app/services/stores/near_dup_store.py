@@ -0,0 +1,164 @@
+"""Near-duplicate article clusters — SimHash LSH bands in Postgres.
+
+DB objects (created on first use):
+  articles.simhash             BIGINT       64-bit signature (signed storage)
+  articles.canonical_url_hash  VARCHAR(64)  cluster representative; equals
+                                            url_hash for the representative
+  article_simhash_bands        (band, band_value, url_hash) primary key, so a
+                                candidate lookup is an index probe per band
+
+Clustering runs at ingest (``json_storage``) on the asyncpg pool. Without a
+pool, or when the schema cannot be created, articles are stored unclustered.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from app.config import settings
+from app.crawlers.utils.near_dup import (
+    MAX_DISTANCE,
+    article_simhash,
+    from_signed64,
+    hamming,
+    simhash_bands,
+    to_signed64,
+)
+from app.services.stores.pg_schema import PgSchema
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_DDL = """
+ALTER TABLE articles
+    ADD COLUMN IF NOT EXISTS simhash BIGINT,
+    ADD COLUMN IF NOT EXISTS canonical_url_hash VARCHAR(64);
+CREATE INDEX IF NOT EXISTS idx_articles_canonical_url_hash
+    ON articles (canonical_url_hash);
+CREATE TABLE IF NOT EXISTS article_simhash_bands (
+    band SMALLINT NOT NULL,
+    band_value INTEGER NOT NULL,
+    url_hash VARCHAR(64) NOT NULL,
+    PRIMARY KEY (band, band_value, url_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_article_simhash_bands_url_hash
+    ON article_simhash_bands (url_hash);
+"""
+
+def _forget_article_columns() -> None:
+    # The query facade caches column types per table.
+    from app.db import client as db_client  # noqa: PLC0415
+
+    db_client._table_column_types.pop("articles", None)
+
+
+_schema = PgSchema(
+    _SCHEMA_DDL,
+    unavailable="Near-duplicate index unavailable, storing articles unclustered",
+    after_ddl=_forget_article_columns,
+)
+
+
+async def _fetch_candidates(
+    pool: Any, keys: set[tuple[int, int]]
+) -> dict[tuple[int, int], list[tuple[str, int, str | None]]]:
+    """Stored articles per (band, value): [(url_hash, simhash, canonical_url_hash)]."""
+    if not keys:
+        return {}
+    records = await pool.fetch(
+        """
+        SELECT b.band, b.band_value, a.url_hash, a.simhash, a.canonical_url_hash
+        FROM jsonb_to_recordset($1::jsonb) AS k(band SMALLINT, band_value INTEGER)
+        JOIN article_simhash_bands b ON b.band = k.band AND b.band_value = k.band_value
+        JOIN articles a ON a.url_hash = b.url_hash
+        WHERE a.simhash IS NOT NULL
+        """,
+        json.dumps([{"band": band, "band_value": value} for band, value in sorted(keys)]),
+    )
+    found: dict[tuple[int, int], list[tuple[str, int, str | None]]] = {}
+    for r in records:
+        found.setdefault((r["band"], r["band_value"]), []).append(
+            (r["url_hash"], from_signed64(r["simhash"]), r["canonical_url_hash"])
+        )
+    return found
+
+
+async def assign_clusters(rows: list[dict[str, Any]]) -> bool:
+    """Set ``simhash`` and ``canonical_url_hash`` on article rows in place.
+
+    Each row joins the cluster of its nearest stored (or earlier in-batch)
+    article within ``MAX_DISTANCE`` bits, else starts its own. Returns False
+    (rows untouched) when clustering is disabled or unavailable.
+    """
+    if not settings.NEAR_DUP_ENABLED or not rows:
+        return False
+    pool = await _schema.pool()
+    if pool is None:
+        return False
+
+    signatures = [article_simhash(row.get("title"), row.get("content")) for row in rows]
+    keys = {key for sig in signatures if sig is not None for key in simhash_bands(sig)}
+    try:
+        index = await _fetch_candidates(pool, keys)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Near-duplicate lookup failed, storing articles unclustered: %s", exc)
+        return False
+
+    for row, signature in zip(rows, signatures):
+        url_hash = row["url_hash"]
+        row["simhash"] = to_signed64(signature) if signature is not None else None
+        row["canonical_url_hash"] = url_hash if signature is not None else None
+        if signature is None:
+            continue
+        best: tuple[int, str] | None = None
+        for key in simhash_bands(signature):
+            for other_hash, other_sig, other_canonical in index.get(key, ()):
+                if other_hash == url_hash:
+                    continue
+                distance = hamming(signature, other_sig)
+                if distance <= MAX_DISTANCE and (best is None or distance < best[0]):
+                    best = (distance, other_canonical or other_hash)
+        if best is not None:
+            row["canonical_url_hash"] = best[1]
+        # Later rows in the batch can join this one's cluster.
+        entry = (url_hash, signature, row["canonical_url_hash"])
+        for key in simhash_bands(signature):
+            index.setdefault(key, []).append(entry)
+    return True
+
+
+async def index_signatures(rows: list[dict[str, Any]]) -> None:
+    """Replace the LSH band entries of upserted rows (after the article write)."""
+    url_hashes = [row["url_hash"] for row in rows if "simhash" in row]
+    if not url_hashes:
+        return
+    bands = [
+        {"band": band, "band_value": value, "url_hash": row["url_hash"]}
+        for row in rows
+        if row.get("simhash") is not None
+        for band, value in simhash_bands(from_signed64(row["simhash"]))
+    ]
+    pool = await _schema.pool()
+    if pool is None:
+        return
+    try:
+        await pool.execute(
+            """
+            DELETE FROM article_simhash_bands
+            WHERE url_hash = ANY(ARRAY(SELECT jsonb_array_elements_text($1::jsonb)))
+            """,
+            json.dumps(url_hashes),
+        )
+        if bands:
+            await pool.execute(
+                """
+                INSERT INTO article_simhash_bands (band, band_value, url_hash)
+                SELECT band, band_value, url_hash
+                FROM jsonb_to_recordset($1::jsonb)
+                    AS x(band SMALLINT, band_value INTEGER, url_hash VARCHAR(64))
+                ON CONFLICT DO NOTHING
+                """,
+                json.dumps(bands),
+            )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Near-duplicate band index update failed: %s", exc)
@@ -0,0 +1,61 @@
+"""Lazily created Postgres tables for stores with a non-DB fallback.
+
+Stores that own a table (near-duplicate bands, intel watermarks, intel
+enrichments) create it on first use instead of requiring a migration, and
+degrade to their fallback when there is no pool or the DDL cannot run::
+
+    _schema = PgSchema(_SCHEMA_DDL, unavailable="Intel watermarks unavailable")
+
+    pool = await _schema.pool()
+    if pool is None:
+        return fallback()
+
+The DDL is attempted once per process; ``ready`` records the outcome.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class PgSchema:
+    """``CREATE ... IF NOT EXISTS`` DDL applied once, plus the pool to use it with."""
+
+    def __init__(
+        self,
+        ddl: str,
+        *,
+        unavailable: str,
+        after_ddl: Callable[[], None] | None = None,
+    ) -> None:
+        self._ddl = ddl
+        self._unavailable = unavailable
+        self._after_ddl = after_ddl
+        self.ready: bool | None = None
+
+    async def ensure(self, pool: Any) -> bool:
+        """Run the DDL on first call; False (with a warning) if it failed."""
+        if self.ready is not None:
+            return self.ready
+        try:
+            await pool.execute(self._ddl)
+            self.ready = True
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("%s: %s", self._unavailable, exc)
+            self.ready = False
+        if self._after_ddl is not None:
+            self._after_ddl()
+        return self.ready
+
+    async def pool(self) -> Any | None:
+        """The DB pool with the schema in place, or None to use the fallback."""
+        from app.db.pool import get_pool  # noqa: PLC0415
+
+        try:
+            pool = get_pool()
+        except RuntimeError:
+            return None
+        return pool if await self.ensure(pool) else None
@@ -0,0 +1,76 @@
+"""Last result of each scheduled pipeline, shared by every API worker.
+
+DB table (created on first use):
+  pipeline_results
+    pipeline      TEXT PRIMARY KEY   e.g. "daily"
+    result        JSONB              PipelineResult.to_dict() output
+    finished_at   TIMESTAMPTZ
+    updated_at    TIMESTAMPTZ
+
+Only the scheduler leader runs the pipeline, so follower workers read its
+outcome from here for ``/health/pipeline-status``. Without a pool, or when the
+table cannot be created, saving is a no-op and loading returns None.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from typing import Any
+
+from app.services.stores.pg_schema import PgSchema
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_DDL = """
+CREATE TABLE IF NOT EXISTS pipeline_results (
+    pipeline TEXT PRIMARY KEY,
+    result JSONB NOT NULL,
+    finished_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+"""
+
+_schema = PgSchema(_SCHEMA_DDL, unavailable="Pipeline results table unavailable")
+
+
+async def save_pipeline_result(
+    pipeline: str, result: dict[str, Any], finished_at: datetime | None
+) -> bool:
+    """Replace the stored result of ``pipeline``."""
+    pool = await _schema.pool()
+    if pool is None:
+        return False
+    try:
+        await pool.execute(
+            """
+            INSERT INTO pipeline_results (pipeline, result, finished_at, updated_at)
+            VALUES ($1, $2::jsonb, $3, now())
+            ON CONFLICT (pipeline) DO UPDATE SET
+                result = EXCLUDED.result,
+                finished_at = EXCLUDED.finished_at,
+                updated_at = now()
+            """,
+            pipeline,
+            json.dumps(result, ensure_ascii=False, default=str),
+            finished_at,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Saving %s pipeline result failed: %s", pipeline, exc)
+        return False
+    return True
+
+
+async def load_pipeline_result(pipeline: str) -> dict[str, Any] | None:
+    """Stored result of ``pipeline``, or None when absent or unavailable."""
+    pool = await _schema.pool()
+    if pool is None:
+        return None
+    try:
+        raw = await pool.fetchval(
+            "SELECT result::text FROM pipeline_results WHERE pipeline = $1", pipeline
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Loading %s pipeline result failed: %s", pipeline, exc)
+        return None
+    return json.loads(raw) if raw else None
@@ -8,6 +8,10 @@ DB table: snapshots
   updated_at TIMESTAMPTZ
 
 JSON fallback: data/state/snapshots/{source_id}.json
+
+Snapshot data keeps the page as ordered block hashes plus one text per
+distinct block (see SnapshotDiffCrawler); rows written before that carry
+``content_text`` instead and are migrated on the next crawl.
 """
 from __future__ import annotations
 
@@ -78,13 +82,15 @@ async def get_last_snapshot(source_id: str) -> dict[str, Any] | None:
 async def save_snapshot(
     source_id: str,
     content_hash: str,
-    content_text: str,
+    blocks: list[tuple[str, str]],
     diff_text: str | None = None,
 ) -> None:
+    """Store the latest snapshot; ``blocks`` is the page's ordered (hash, text) list."""
     now = datetime.now(timezone.utc).isoformat()
     payload: dict[str, Any] = {
         "content_hash": content_hash,
-        "content_text": content_text,
+        "block_hashes": [digest for digest, _ in blocks],
+        "blocks": dict(blocks),
         "diff_text": diff_text,
         "captured_at": now,
     }
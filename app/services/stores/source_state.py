@@ -39,6 +39,7 @@ State file (fallback): data/state/source_state.json
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from datetime import datetime, timezone
@@ -55,6 +56,20 @@ STATE_FILE = STATE_DIR / "source_state.json"
 
 _lock = Lock()  # used only for JSON fallback path
 
+# Bumped on every write from this process so read caches (the source catalog
+# snapshot in source_service) can refresh without polling; writes from other
+# processes are caught by get_source_states_stamp().
+_state_version = 0
+
+
+def source_state_version() -> int:
+    return _state_version
+
+
+def _bump_state_version() -> None:
+    global _state_version
+    _state_version += 1
+
 
 # ---------------------------------------------------------------------------
 # JSON fallback helpers
@@ -164,6 +179,32 @@ async def get_source_state(source_id: str) -> dict[str, Any]:
         return _load_state().get(source_id, {})
 
 
+async def get_source_states_stamp() -> str | None:
+    """Cheap change marker for source_states (row count + newest updated_at).
+
+    Returns None when it cannot be determined, which callers treat as changed.
+    """
+    try:
+        client = _get_client()
+        res = await (
+            client.table("source_states")
+            .select("updated_at", count="exact")
+            .order("updated_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+        newest = res.data[0].get("updated_at") if res.data else None
+        return f"db:{res.count}:{newest}"
+    except RuntimeError:
+        try:
+            return f"json:{STATE_FILE.stat().st_mtime_ns}"
+        except OSError:
+            return "json:missing"
+    except Exception as exc:
+        logger.warning("get_source_states_stamp DB failed: %s", exc)
+        return None
+
+
 async def get_all_source_states() -> dict[str, dict[str, Any]]:
     try:
         client = _get_client()
@@ -176,12 +217,158 @@ async def get_all_source_states() -> dict[str, dict[str, Any]]:
         return _load_state()
 
 
+# Catalog sync bookkeeping: the hash of the last synced catalog rows, so an
+# unchanged sources/ tree costs one lookup at startup instead of a full upsert.
+_CATALOG_SYNC_KEY = "source_states"
+_CATALOG_SYNC_DDL = """
+CREATE TABLE IF NOT EXISTS source_catalog_sync (
+    catalog VARCHAR(64) PRIMARY KEY,
+    content_hash VARCHAR(64) NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    synced_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+)
+"""
+
+
+def catalog_content_hash(rows: list[dict[str, Any]], *, mark_missing_unsupported: bool) -> str:
+    """Stable hash of the catalog rows (updated_at excluded)."""
+    payload = [
+        {key: value for key, value in row.items() if key != "updated_at"}
+        for row in sorted(rows, key=lambda row: row["source_id"])
+    ]
+    blob = json.dumps(
+        {"rows": payload, "mark_missing": mark_missing_unsupported},
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+async def _source_states_column_types() -> dict[str, str]:
+    from app.db.pool import get_pool  # noqa: PLC0415
+
+    records = await get_pool().fetch(
+        """
+        SELECT a.attname AS name, format_type(a.atttypid, a.atttypmod) AS type
+        FROM pg_attribute a
+        WHERE a.attrelid = 'source_states'::regclass AND a.attnum > 0 AND NOT a.attisdropped
+        """
+    )
+    return {str(r["name"]): str(r["type"]) for r in records}
+
+
+async def _sync_catalog_sql(
+    rows: list[dict[str, Any]],
+    supported_ids: set[str],
+    *,
+    mark_missing_unsupported: bool,
+    force: bool,
+) -> dict[str, Any]:
+    """Set-based catalog sync: one bulk upsert plus one DELETE for missing ids."""
+    from app.db.pool import get_pool  # noqa: PLC0415
+
+    pool = get_pool()
+    await pool.execute(_CATALOG_SYNC_DDL)
+    content_hash = catalog_content_hash(rows, mark_missing_unsupported=mark_missing_unsupported)
+    if not force:
+        stored = await pool.fetchrow(
+            """
+            SELECT c.content_hash, c.row_count,
+                   (SELECT COUNT(*) FROM source_states) AS current_rows
+            FROM source_catalog_sync c
+            WHERE c.catalog = $1
+            """,
+            _CATALOG_SYNC_KEY,
+        )
+        # The row count guards against the table having been emptied or edited.
+        if (
+            stored is not None
+            and stored["content_hash"] == content_hash
+            and (not mark_missing_unsupported or stored["current_rows"] == stored["row_count"])
+        ):
+            return {"upserted": 0, "marked_unsupported": 0, "deleted_missing": 0, "skipped": True}
+
+    column_types = await _source_states_column_types()
+    if "source_id" not in column_types:
+        raise RuntimeError("source_states.source_id column is missing")
+    columns = [col for col in rows[0] if col in column_types] if rows else []
+    schema_mode = (
+        "full"
+        if rows and len(columns) == len(rows[0])
+        else "minimal"
+        if set(columns) <= {"source_id", "updated_at"}
+        else "legacy"
+    )
+
+    if rows:
+        col_list = ", ".join(columns)
+        record_def = ", ".join(f"{col} {column_types[col]}" for col in columns)
+        assignments = ", ".join(f"{col} = EXCLUDED.{col}" for col in columns if col != "source_id")
+        conflict_sql = f"DO UPDATE SET {assignments}" if assignments else "DO NOTHING"
+        await pool.execute(
+            f"""
+            INSERT INTO source_states ({col_list})
+            SELECT {col_list} FROM jsonb_to_recordset($1::jsonb) AS x({record_def})
+            ON CONFLICT (source_id) {conflict_sql}
+            """,
+            json.dumps(
+                [{col: row.get(col) for col in columns} for row in rows],
+                ensure_ascii=False,
+                default=str,
+            ),
+        )
+
+    marked_unsupported = 0
+    deleted_missing = 0
+    if mark_missing_unsupported:
+        supported_sql = (
+            "is_supported" if "is_supported" in column_types else "FALSE AS is_supported"
+        )
+        deleted = await pool.fetch(
+            f"""
+            DELETE FROM source_states
+            WHERE source_id <> ALL(ARRAY(SELECT jsonb_array_elements_text($1::jsonb)))
+            RETURNING source_id, {supported_sql}
+            """,
+            json.dumps(sorted(supported_ids), ensure_ascii=False),
+        )
+        deleted_missing = len(deleted)
+        marked_unsupported = sum(1 for r in deleted if r["is_supported"] is not False)
+
+    await pool.execute(
+        """
+        INSERT INTO source_catalog_sync (catalog, content_hash, row_count, synced_at)
+        VALUES ($1, $2, $3, NOW())
+        ON CONFLICT (catalog) DO UPDATE SET
+            content_hash = EXCLUDED.content_hash,
+            row_count = EXCLUDED.row_count,
+            synced_at = EXCLUDED.synced_at
+        """,
+        _CATALOG_SYNC_KEY,
+        content_hash,
+        len(rows),
+    )
+    return {
+        "upserted": len(rows),
+        "marked_unsupported": marked_unsupported,
+        "deleted_missing": deleted_missing,
+        "schema_mode": schema_mode,
+    }
+
+
 async def sync_source_catalog_from_configs(
     source_configs: list[dict[str, Any]] | None = None,
     *,
     mark_missing_unsupported: bool = True,
+    force: bool = False,
 ) -> dict[str, Any]:
-    """Sync all configured sources into source_states as catalog metadata."""
+    """Sync all configured sources into source_states as catalog metadata.
+
+    On local PostgreSQL this is one bulk upsert plus one DELETE, and is skipped
+    entirely (``skipped=True``) when the catalog hash matches the last sync
+    unless ``force`` is set.
+    """
     if source_configs is None:
         from app.scheduler.manager import load_all_source_configs  # noqa: PLC0415
 
@@ -204,6 +391,19 @@ async def sync_source_catalog_from_configs(
 
     try:
         client = _get_client()
+        from app.db.client import LocalPostgresClient  # noqa: PLC0415
+
+        if isinstance(client, LocalPostgresClient):
+            result = await _sync_catalog_sql(
+                rows,
+                supported_ids,
+                mark_missing_unsupported=mark_missing_unsupported,
+                force=force,
+            )
+            if not result.get("skipped"):
+                _bump_state_version()
+            return {"total_configs": len(schedulable_configs), **result}
+
         used_minimal_schema = False
         used_legacy_schema = False
         if rows:
@@ -252,6 +452,7 @@ async def sync_source_catalog_from_configs(
                 used_minimal_schema = True
                 res = await client.table("source_states").select("source_id").execute()
 
+            missing_ids: list[str] = []
             for item in (res.data or []):
                 source_id = str(item.get("source_id") or "").strip()
                 if not source_id:
@@ -259,14 +460,17 @@ async def sync_source_catalog_from_configs(
                 if source_id not in supported_ids:
                     if (not used_minimal_schema) and item.get("is_supported", True):
                         marked_unsupported += 1
-                    await (
-                        client.table("source_states")
-                        .delete()
-                        .eq("source_id", source_id)
-                        .execute()
-                    )
-                    deleted_missing += 1
+                    missing_ids.append(source_id)
+            if missing_ids:
+                await (
+                    client.table("source_states")
+                    .delete()
+                    .in_("source_id", missing_ids)
+                    .execute()
+                )
+                deleted_missing = len(missing_ids)
 
+        _bump_state_version()
         return {
             "total_configs": len(schedulable_configs),
             "upserted": len(rows),
@@ -307,6 +511,7 @@ async def sync_source_catalog_from_configs(
                     deleted_missing += 1
 
         _save_state(state)
+        _bump_state_version()
         return {
             "total_configs": len(schedulable_configs),
             "upserted": len(rows),
@@ -315,66 +520,202 @@ async def sync_source_catalog_from_configs(
         }
 
 
-async def update_source_state(
+# Upsert one batch of runtime transitions in a single statement. Reset rows
+# overwrite the counter, the others add to it in SQL, so concurrent writers
+# never lose an increment (no read-modify-write round trip).
+_UPSERT_STATE_UPDATES_SQL = """
+WITH x AS (
+    SELECT * FROM jsonb_to_recordset($1::jsonb) AS x(
+        source_id text,
+        reset boolean,
+        delta int,
+        last_crawl_at timestamptz,
+        last_success_at timestamptz
+    )
+),
+reset_rows AS (
+    INSERT INTO source_states (
+        source_id, consecutive_failures, last_crawl_at, last_success_at, updated_at
+    )
+    SELECT source_id, LEAST(32767, delta), last_crawl_at, last_success_at, NOW()
+    FROM x WHERE reset
+    ON CONFLICT (source_id) DO UPDATE SET
+        consecutive_failures = EXCLUDED.consecutive_failures,
+        last_crawl_at = COALESCE(EXCLUDED.last_crawl_at, source_states.last_crawl_at),
+        last_success_at = COALESCE(EXCLUDED.last_success_at, source_states.last_success_at),
+        updated_at = NOW()
+    RETURNING 1
+)
+INSERT INTO source_states (
+    source_id, consecutive_failures, last_crawl_at, last_success_at, updated_at
+)
+SELECT source_id, LEAST(32767, delta), last_crawl_at, last_success_at, NOW()
+FROM x WHERE NOT reset
+ON CONFLICT (source_id) DO UPDATE SET
+    consecutive_failures = LEAST(
+        32767, COALESCE(source_states.consecutive_failures, 0) + EXCLUDED.consecutive_failures
+    ),
+    last_crawl_at = COALESCE(EXCLUDED.last_crawl_at, source_states.last_crawl_at),
+    last_success_at = COALESCE(EXCLUDED.last_success_at, source_states.last_success_at),
+    updated_at = NOW()
+"""
+
+
+def _state_update(
     source_id: str,
     *,
     last_crawl_at: datetime | None = None,
     last_success_at: datetime | None = None,
     consecutive_failures: int | None = None,
     reset_failures: bool = False,
-) -> None:
-    now = datetime.now(timezone.utc).isoformat()
+) -> dict[str, Any]:
+    """Translate update_source_state() arguments into a batch transition."""
+    if reset_failures:
+        reset, delta = True, 0
+    elif consecutive_failures is not None:
+        reset, delta = True, consecutive_failures
+    else:
+        reset, delta = False, 1
+    return {
+        "source_id": source_id,
+        "reset": reset,
+        "delta": delta,
+        "last_crawl_at": last_crawl_at,
+        "last_success_at": last_success_at,
+    }
 
-    try:
-        client = _get_client()
 
-        # Read current failures to increment if needed
-        res = await client.table("source_states").select("consecutive_failures").eq(
-            "source_id", source_id
-        ).execute()
-        current_failures: int = 0
-        if res.data:
-            current_failures = res.data[0].get("consecutive_failures") or 0
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+async def _apply_updates_sql(updates: list[dict[str, Any]]) -> None:
+    from app.db.pool import get_pool  # noqa: PLC0415
+
+    payload = [
+        {
+            **update,
+            "last_crawl_at": _isoformat(update.get("last_crawl_at")),
+            "last_success_at": _isoformat(update.get("last_success_at")),
+        }
+        for update in updates
+    ]
+    await get_pool().execute(_UPSERT_STATE_UPDATES_SQL, json.dumps(payload))
 
-        if reset_failures:
-            new_failures = 0
-        elif consecutive_failures is not None:
-            new_failures = consecutive_failures
-        else:
-            new_failures = current_failures + 1
 
+async def _apply_updates_facade(client: Any, updates: list[dict[str, Any]]) -> None:
+    now = datetime.now(timezone.utc).isoformat()
+    ids = [update["source_id"] for update in updates]
+    res = await client.table("source_states").select(
+        "source_id,consecutive_failures"
+    ).in_("source_id", ids).execute()
+    current = {
+        row["source_id"]: row.get("consecutive_failures") or 0 for row in (res.data or [])
+    }
+
+    rows: list[dict[str, Any]] = []
+    for update in updates:
+        source_id = update["source_id"]
+        base = 0 if update["reset"] else current.get(source_id, 0)
         row: dict[str, Any] = {
             "source_id": source_id,
-            "consecutive_failures": new_failures,
+            "consecutive_failures": base + update["delta"],
             "updated_at": now,
         }
-        if last_crawl_at is not None:
-            row["last_crawl_at"] = last_crawl_at.isoformat()
-        if last_success_at is not None:
-            row["last_success_at"] = last_success_at.isoformat()
+        if update.get("last_crawl_at") is not None:
+            row["last_crawl_at"] = update["last_crawl_at"].isoformat()
+        if update.get("last_success_at") is not None:
+            row["last_success_at"] = update["last_success_at"].isoformat()
+        rows.append(row)
+    # Rows missing optional keys must not null out existing timestamps, so
+    # group them by key set before upserting.
+    by_keys: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        by_keys.setdefault(tuple(sorted(row)), []).append(row)
+    for group in by_keys.values():
+        await client.table("source_states").upsert(group, on_conflict="source_id").execute()
+
+
+def merge_state_updates(updates: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Collapse transitions per source, preserving their combined effect."""
+    merged: dict[str, dict[str, Any]] = {}
+    for update in updates:
+        source_id = update["source_id"]
+        prev = merged.get(source_id)
+        if prev is None:
+            merged[source_id] = dict(update)
+            continue
+        if update["reset"]:
+            prev["reset"] = True
+            prev["delta"] = update["delta"]
+        else:
+            prev["delta"] += update["delta"]
+        for key in ("last_crawl_at", "last_success_at"):
+            if update.get(key) is not None:
+                prev[key] = update[key]
+    return list(merged.values())
+
+
+async def apply_source_state_updates(updates: list[dict[str, Any]]) -> None:
+    """Apply a batch of runtime transitions (see update_source_state).
+
+    Each update is ``{source_id, reset, delta, last_crawl_at, last_success_at}``:
+    the failure counter becomes ``(0 if reset else current) + delta`` and
+    timestamps are only written when given.
+    """
+    updates = merge_state_updates(updates)
+    if not updates:
+        return
 
-        await client.table("source_states").upsert(row, on_conflict="source_id").execute()
+    try:
+        client = _get_client()
+        from app.db.client import LocalPostgresClient  # noqa: PLC0415
+
+        if isinstance(client, LocalPostgresClient):
+            await _apply_updates_sql(updates)
+        else:
+            await _apply_updates_facade(client, updates)
+        _bump_state_version()
         return
     except RuntimeError:
         pass
     except Exception as exc:
-        logger.warning("update_source_state DB failed, using JSON: %s", exc)
+        logger.warning("apply_source_state_updates DB failed, using JSON: %s", exc)
 
     # JSON fallback
     with _lock:
         state = _load_state()
-        entry = state.setdefault(source_id, {})
-        if last_crawl_at:
-            entry["last_crawl_at"] = last_crawl_at.isoformat()
-        if last_success_at:
-            entry["last_success_at"] = last_success_at.isoformat()
-        if reset_failures:
-            entry["consecutive_failures"] = 0
-        elif consecutive_failures is not None:
-            entry["consecutive_failures"] = consecutive_failures
-        else:
-            entry["consecutive_failures"] = entry.get("consecutive_failures", 0) + 1
+        for update in updates:
+            entry = state.setdefault(update["source_id"], {})
+            if update.get("last_crawl_at"):
+                entry["last_crawl_at"] = update["last_crawl_at"].isoformat()
+            if update.get("last_success_at"):
+                entry["last_success_at"] = update["last_success_at"].isoformat()
+            base = 0 if update["reset"] else entry.get("consecutive_failures", 0)
+            entry["consecutive_failures"] = base + update["delta"]
         _save_state(state)
+    _bump_state_version()
+
+
+async def update_source_state(
+    source_id: str,
+    *,
+    last_crawl_at: datetime | None = None,
+    last_success_at: datetime | None = None,
+    consecutive_failures: int | None = None,
+    reset_failures: bool = False,
+) -> None:
+    await apply_source_state_updates(
+        [
+            _state_update(
+                source_id,
+                last_crawl_at=last_crawl_at,
+                last_success_at=last_success_at,
+                consecutive_failures=consecutive_failures,
+                reset_failures=reset_failures,
+            )
+        ]
+    )
 
 
 async def set_enabled_override(source_id: str, is_enabled: bool) -> None:
@@ -386,6 +727,7 @@ async def set_enabled_override(source_id: str, is_enabled: bool) -> None:
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
         await client.table("source_states").upsert(row, on_conflict="source_id").execute()
+        _bump_state_version()
         return
     except RuntimeError:
         pass
@@ -397,6 +739,7 @@ async def set_enabled_override(source_id: str, is_enabled: bool) -> None:
         entry = state.setdefault(source_id, {})
         entry["is_enabled_override"] = is_enabled
         _save_state(state)
+    _bump_state_version()
 
 
 async def get_enabled_override(source_id: str) -> bool | None:
@@ -0,0 +1,412 @@
+"""In-process metrics with Prometheus text exposition (served at /metrics).
+
+A deliberately small registry: counters, fixed-bucket histograms and
+callback gauges, aggregated in memory under one lock and rendered on scrape.
+Observing a value is a dict lookup, a bisect and a few integer adds, so the
+hooks are cheap enough for per-request and per-query use.
+
+All metric families live here so the exported surface is easy to audit:
+
+    crawler_http_requests_total{domain,status}     crawler HTTP attempts
+    crawler_http_request_seconds{domain}           per attempt, incl. body
+    crawler_domain_wait_seconds{domain}            domain semaphore + delay
+    crawler_stage_seconds{stage}                   BaseCrawler timings
+    playwright_contexts{state}                     in_use / limit
+    playwright_context_wait_seconds                waiting for a free context
+    db_pool_acquire_seconds                        asyncpg connection acquire
+    db_pool_connections{state}                     idle / in_use
+    db_query_seconds{table,operation}              per statement
+    db_query_errors_total{table,operation}
+    llm_requests_total{provider,status}
+    llm_request_seconds{provider}
+    llm_tokens_total{provider,direction}
+    llm_rate_limit_wait_seconds{provider}          shared limiter wait per call
+    llm_rate_limited_total{provider}               429 responses
+    pipeline_stage_seconds{stage,status}           daily pipeline stages
+    api_request_seconds{method,route,status}       route template, not path
+    api_payload_cache_total{result}                hit / miss / not_modified
+
+Values are per process: executor children and queue workers keep their own.
+"""
+from __future__ import annotations
+
+import math
+import re
+import sys
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+_lock = Lock()
+_registry: list[_Metric] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        _registry.append(self)
+
+    def _key(self, labels: tuple[Any, ...]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels}")
+        return tuple(str(value) for value in labels)
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        pass
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: Any, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        with _lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+    def reset(self) -> None:
+        with _lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [count per bucket (last = +Inf), sum, count]
+        self._values: dict[tuple[str, ...], list[Any]] = {}
+
+    def observe(self, value: float, *labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with _lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, *labels: Any) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def total(self, *labels: Any) -> float:
+        entry = self._values.get(self._key(labels))
+        return entry[1] if entry else 0.0
+
+    def samples(self) -> Iterable[str]:
+        with _lock:
+            items = [
+                (key, list(entry[0]), entry[1], entry[2]) for key, entry in self._values.items()
+            ]
+        for key, counts, total, count in sorted(items):
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield (
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+    def reset(self) -> None:
+        with _lock:
+            self._values.clear()
+
+
+class CallbackGauge(_Metric):
+    """Gauge read at scrape time from ``callback() -> {label values: value}``."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        callback: Callable[[], dict[tuple[str, ...], float]],
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback
+
+    def samples(self) -> Iterable[str]:
+        try:
+            values = self._callback()
+        except Exception:  # noqa: BLE001
+            return
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+def render_metrics() -> str:
+    return "\n".join(metric.render() for metric in _registry) + "\n"
+
+
+def reset_metrics() -> None:
+    for metric in _registry:
+        metric.reset()
+
+
+# ---------------------------------------------------------------------------
+# SQL statement classification for db_query_seconds
+# ---------------------------------------------------------------------------
+
+_IDENT = r'"?([A-Za-z_][\w$]*)"?(?:\."?([A-Za-z_][\w$]*)"?)?'
+_WRITE_RE = re.compile(
+    rf"\b(?:(insert)\s+into|(update)|(delete)\s+from)\s+{_IDENT}", re.IGNORECASE
+)
+_FROM_RE = re.compile(rf"\bfrom\s+{_IDENT}", re.IGNORECASE)
+_DDL_RE = re.compile(
+    rf"^\s*(create|alter|drop|truncate)\s+(?:\w+\s+)*?(?:table|index|view)\s+"
+    rf"(?:if\s+(?:not\s+)?exists\s+)?{_IDENT}",
+    re.IGNORECASE,
+)
+
+
+def _ident(groups: tuple[str | None, str | None]) -> str:
+    schema_or_name, name = groups
+    return (name or schema_or_name or "unknown").lower()
+
+
+@lru_cache(maxsize=4096)
+def classify_sql(query: str) -> tuple[str, str]:
+    """Return (table, operation) for a statement; CTEs report their main write."""
+    head = query.lstrip()
+    first = head.split(None, 1)[0].lower() if head else ""
+    if first in {"create", "alter", "drop", "truncate"}:
+        match = _DDL_RE.match(head)
+        return (_ident(match.groups()[1:]) if match else "unknown"), "ddl"
+    if first in {"insert", "update", "delete", "with"}:
+        match = _WRITE_RE.search(head)
+        if match:
+            operation = next(group for group in match.groups()[:3] if group).lower()
+            return _ident(match.groups()[3:]), operation
+    if first in {"select", "with"}:
+        match = _FROM_RE.search(head)
+        return (_ident(match.groups()) if match else "none"), "select"
+    return "unknown", first or "unknown"
+
+
+# ---------------------------------------------------------------------------
+# Metric families
+# ---------------------------------------------------------------------------
+
+CRAWLER_HTTP_REQUESTS = Counter(
+    "crawler_http_requests_total",
+    "Crawler HTTP attempts by domain and status code (or error class).",
+    ("domain", "status"),
+)
+CRAWLER_HTTP_SECONDS = Histogram(
+    "crawler_http_request_seconds",
+    "Crawler HTTP attempt duration including the response body.",
+    ("domain",),
+)
+CRAWLER_DOMAIN_WAIT_SECONDS = Histogram(
+    "crawler_domain_wait_seconds",
+    "Time spent waiting on the per-domain limiter before a request.",
+    ("domain",),
+)
+CRAWLER_STAGE_SECONDS = Histogram(
+    "crawler_stage_seconds",
+    "Per-crawl stage durations recorded by BaseCrawler (fetch, parse, ...).",
+    ("stage",),
+)
+PLAYWRIGHT_CONTEXT_WAIT_SECONDS = Histogram(
+    "playwright_context_wait_seconds",
+    "Time spent waiting for a free Playwright context slot.",
+)
+DB_POOL_ACQUIRE_SECONDS = Histogram(
+    "db_pool_acquire_seconds",
+    "asyncpg connection acquire latency.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_seconds",
+    "asyncpg statement duration by table and operation.",
+    ("table", "operation"),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_QUERY_ERRORS = Counter(
+    "db_query_errors_total",
+    "asyncpg statements that raised, by table and operation.",
+    ("table", "operation"),
+)
+LLM_REQUESTS = Counter(
+    "llm_requests_total",
+    "LLM calls by provider and outcome.",
+    ("provider", "status"),
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_request_seconds",
+    "LLM call latency by provider.",
+    ("provider",),
+    buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0),
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "LLM tokens by provider and direction (input/output).",
+    ("provider", "direction"),
+)
+LLM_RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "llm_rate_limit_wait_seconds",
+    "Time an LLM call waited for a provider slot and rate budget.",
+    ("provider",),
+    buckets=(0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+LLM_RATE_LIMITED = Counter(
+    "llm_rate_limited_total",
+    "LLM responses with HTTP 429, by provider.",
+    ("provider",),
+)
+PIPELINE_STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds",
+    "Daily pipeline stage durations.",
+    ("stage", "status"),
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0, 7200.0),
+)
+API_REQUEST_SECONDS = Histogram(
+    "api_request_seconds",
+    "API request latency by method, route template and status.",
+    ("method", "route", "status"),
+)
+API_PAYLOAD_CACHE = Counter(
+    "api_payload_cache_total",
+    "Pre-serialized API payload lookups (app.api.responses) by result.",
+    ("result",),
+)
+
+
+def _playwright_contexts() -> dict[tuple[str, ...], float]:
+    from app.config import settings  # noqa: PLC0415
+
+    # Only look at the pool if something imported it; importing it here
+    # would pull in Playwright for processes that never open a browser.
+    pool = sys.modules.get("app.crawlers.utils.playwright_pool")
+    return {
+        ("in_use",): float(pool.contexts_in_use() if pool is not None else 0),
+        ("limit",): float(settings.PLAYWRIGHT_MAX_CONTEXTS),
+    }
+
+
+def _db_pool_connections() -> dict[tuple[str, ...], float]:
+    from app.db import pool  # noqa: PLC0415
+
+    return {(state,): float(value) for state, value in pool.pool_usage().items()}
+
+
+CallbackGauge(
+    "playwright_contexts",
+    "Playwright browser contexts in use and the configured limit.",
+    ("state",),
+    _playwright_contexts,
+)
+CallbackGauge(
+    "db_pool_connections",
+    "asyncpg pool connections by state, summed over event-loop pools.",
+    ("state",),
+    _db_pool_connections,
+)
+
+
+# ---------------------------------------------------------------------------
+# Hooks
+# ---------------------------------------------------------------------------
+
+
+def observe_query(query: str, elapsed: float, failed: bool = False) -> None:
+    table, operation = classify_sql(query)
+    DB_QUERY_SECONDS.observe(elapsed, table, operation)
+    if failed:
+        DB_QUERY_ERRORS.inc(table, operation)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording api_request_seconds by route template."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = int(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None)
+            template = f"{scope.get('root_path', '')}{path}" if path else "unmatched"
+            API_REQUEST_SECONDS.observe(
+                time.perf_counter() - started, scope.get("method", ""), template, status
+            )
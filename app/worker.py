@@ -0,0 +1,214 @@
+"""Crawl worker: claims jobs from the Postgres crawl_jobs queue and runs them.
+
+Run one or more of these on any host that can reach the database while the API
+runs with ``CRAWL_EXECUTION_MODE=queue``:
+
+    python -m app.worker --concurrency 8 --worker-id crawler-a
+
+Each claimed job keeps its lease alive through a heartbeat task; SIGINT/SIGTERM
+stops claiming new jobs and waits for in-flight crawls to finish.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+from typing import Any
+
+from app.config import settings
+from app.crawlers.base import CrawlStatus
+from app.db.client import close_client, init_database_from_settings
+from app.db.pool import close_pool
+from app.scheduler.job_queue import (
+    claim_crawl_jobs,
+    complete_crawl_job,
+    ensure_crawl_job_tables,
+    fail_crawl_job,
+    heartbeat_crawl_jobs,
+)
+from app.scheduler.manager import is_schedulable_source, load_all_source_configs
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class CrawlWorker:
+    def __init__(self, worker_id: str, concurrency: int) -> None:
+        self.worker_id = worker_id
+        self.concurrency = max(1, concurrency)
+        self._configs: dict[str, dict[str, Any]] = {}
+        self._running: dict[int, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+        self._slot_freed = asyncio.Event()
+
+    def reload_source_configs(self) -> None:
+        self._configs = {
+            cfg["id"]: cfg for cfg in load_all_source_configs() if is_schedulable_source(cfg)
+        }
+
+    def stop(self) -> None:
+        if not self._stopping.is_set():
+            logger.info(
+                "Worker %s stopping; draining %d job(s)", self.worker_id, len(self._running)
+            )
+        self._stopping.set()
+        self._slot_freed.set()
+
+    async def run(self) -> None:
+        await ensure_crawl_job_tables()
+        self.reload_source_configs()
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        logger.info(
+            "Crawl worker %s started (concurrency=%d, sources=%d)",
+            self.worker_id,
+            self.concurrency,
+            len(self._configs),
+        )
+        try:
+            while not self._stopping.is_set():
+                free = self.concurrency - len(self._running)
+                claimed: list[dict[str, Any]] = []
+                if free > 0:
+                    try:
+                        claimed = await claim_crawl_jobs(self.worker_id, free)
+                    except Exception as e:  # noqa: BLE001
+                        logger.warning("Claiming crawl jobs failed: %s", e)
+                for job in claimed:
+                    job_id = int(job["id"])
+                    self._running[job_id] = asyncio.create_task(self._run_job(job))
+                self._slot_freed.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._slot_freed.wait()
+                        if len(self._running) >= self.concurrency
+                        else self._stopping.wait(),
+                        timeout=settings.CRAWL_QUEUE_POLL_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            if self._running:
+                await asyncio.gather(*self._running.values(), return_exceptions=True)
+        finally:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+        logger.info("Crawl worker %s stopped", self.worker_id)
+
+    async def _heartbeat_loop(self) -> None:
+        interval = max(1.0, float(settings.CRAWL_QUEUE_HEARTBEAT_SECONDS))
+        while True:
+            await asyncio.sleep(interval)
+            job_ids = list(self._running)
+            if not job_ids:
+                continue
+            try:
+                renewed = await heartbeat_crawl_jobs(self.worker_id, job_ids)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Crawl job heartbeat failed: %s", e)
+                continue
+            lost = set(job_ids) - renewed
+            if lost:
+                # Another worker may already be re-running these; the local
+                # crawl still finishes but its completion will be a no-op.
+                logger.warning("Lost lease on crawl job(s): %s", sorted(lost))
+
+    async def _run_job(self, job: dict[str, Any]) -> None:
+        from app.scheduler.jobs import execute_crawl_job
+
+        job_id = int(job["id"])
+        source_id = str(job["source_id"])
+        try:
+            config = self._configs.get(source_id)
+            if config is None:
+                self.reload_source_configs()
+                config = self._configs.get(source_id)
+            if config is None:
+                await fail_crawl_job(
+                    self.worker_id, job_id, f"Source not found: {source_id}", retryable=False
+                )
+                return
+
+            try:
+                result = await execute_crawl_job(
+                    config, bypass_circuit=job.get("enqueued_by") == "manual"
+                )
+            except Exception as e:  # noqa: BLE001
+                logger.exception("Crawl job %d (%s) raised", job_id, source_id)
+                status = await fail_crawl_job(self.worker_id, job_id, f"{type(e).__name__}: {e}")
+                logger.info("Crawl job %d (%s) -> %s", job_id, source_id, status)
+                return
+
+            if result is None:
+                # Crawler construction failed: a config problem, not transient.
+                await fail_crawl_job(
+                    self.worker_id, job_id, "Crawler creation failed", retryable=False
+                )
+                return
+            if result.status == CrawlStatus.FAILED:
+                status = await fail_crawl_job(
+                    self.worker_id, job_id, result.error_message or "crawl failed"
+                )
+                logger.info("Crawl job %d (%s) failed -> %s", job_id, source_id, status)
+                return
+            await complete_crawl_job(self.worker_id, job_id)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Crawl job %d bookkeeping failed: %s", job_id, e)
+        finally:
+            self._running.pop(job_id, None)
+            self._slot_freed.set()
+
+
+async def main(worker_id: str, concurrency: int) -> None:
+    await init_database_from_settings()
+    worker = CrawlWorker(worker_id, concurrency)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            pass
+
+    try:
+        await worker.run()
+    finally:
+        from app.services.stores.crawl_telemetry import close_crawl_telemetry
+
+        await close_crawl_telemetry()
+        try:
+            from app.crawlers.utils.playwright_pool import close_browser
+
+            await close_browser()
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to close Playwright: %s", e)
+        from app.services.llm.llm_transport import close_llm_clients
+
+        await close_llm_clients()
+        await close_client()
+        await close_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run crawl jobs from the crawl_jobs queue")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.CRAWL_QUEUE_WORKER_CONCURRENCY,
+        help="Max crawl jobs run at once by this worker",
+    )
+    parser.add_argument("--worker-id", default=None, help="Lease owner id (default host:pid)")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    asyncio.run(main(args.worker_id or default_worker_id(), args.concurrency))
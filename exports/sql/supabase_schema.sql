@@ -22,9 +22,18 @@ CREATE TABLE IF NOT EXISTS "articles" (
   "is_read" BOOLEAN DEFAULT FALSE NOT NULL,
   "importance" SMALLINT DEFAULT 0 NOT NULL,
   "custom_fields" JSONB NULL,
+  "simhash" BIGINT NULL,
+  "canonical_url_hash" VARCHAR(64) NULL,
   PRIMARY KEY ("url_hash")
 );
 
+CREATE TABLE IF NOT EXISTS "article_simhash_bands" (
+  "band" SMALLINT NOT NULL,
+  "band_value" INTEGER NOT NULL,
+  "url_hash" VARCHAR(64) NOT NULL,
+  PRIMARY KEY ("band", "band_value", "url_hash")
+);
+
 CREATE TABLE IF NOT EXISTS "crawl_logs" (
   "id" BIGINT NOT NULL,
   "source_id" VARCHAR(128) NOT NULL,
@@ -35,6 +44,7 @@ CREATE TABLE IF NOT EXISTS "crawl_logs" (
   "started_at" TIMESTAMPTZ NOT NULL,
   "finished_at" TIMESTAMPTZ NULL,
   "duration_seconds" DOUBLE PRECISION NULL,
+  "timings" JSONB NULL,
   PRIMARY KEY ("id")
 );
 
@@ -122,6 +132,25 @@ CREATE TABLE IF NOT EXISTS "intel_cache" (
   PRIMARY KEY ("id")
 );
 
+CREATE TABLE IF NOT EXISTS "intel_enrichments" (
+  "namespace" TEXT NOT NULL,
+  "url_hash" TEXT NOT NULL,
+  "content_hash" TEXT NULL,
+  "prompt_version" TEXT NULL,
+  "article" JSONB NOT NULL,
+  "enrichment" JSONB NOT NULL,
+  "updated_at" TIMESTAMPTZ DEFAULT now() NOT NULL,
+  PRIMARY KEY ("namespace", "url_hash")
+);
+
+CREATE TABLE IF NOT EXISTS "intel_watermarks" (
+  "processor" TEXT NOT NULL,
+  "crawled_at" TIMESTAMPTZ NULL,
+  "rule_version" TEXT NOT NULL,
+  "updated_at" TIMESTAMPTZ DEFAULT now() NOT NULL,
+  PRIMARY KEY ("processor")
+);
+
 CREATE TABLE IF NOT EXISTS "scholar_awards" (
   "id" BIGINT NOT NULL,
   "scholar_id" VARCHAR(64) NOT NULL,
@@ -17,6 +17,11 @@ async def main() -> None:
     parser = argparse.ArgumentParser(description="Backfill configured paper warehouse sources.")
     parser.add_argument("--source", action="append", help="Specific paper source ID to run")
     parser.add_argument("--dry-run", action="store_true", help="Parse and normalize without writing DB rows")
+    parser.add_argument(
+        "--index-dedup",
+        action="store_true",
+        help="Index papers stored before fuzzy dedup existed and merge their near-duplicates",
+    )
     args = parser.parse_args()
 
     from app.config import settings
@@ -33,6 +38,13 @@ async def main() -> None:
         database=settings.POSTGRES_DB,
     )
     try:
+        if args.index_dedup:
+            backfill = await paper_service.backfill_fuzzy_dedup_index(get_pool())
+            print(
+                f"indexed {backfill.indexed_count} papers for fuzzy dedup, "
+                f"merged {backfill.merged_count} near-duplicates"
+            )
+            return
         configs = [
             cfg
             for cfg in load_all_source_configs()
@@ -15,6 +15,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from dotenv import load_dotenv
 load_dotenv()
 
+from app.crawlers.utils.adaptive_concurrency import (  # noqa: E402
+    AdaptiveConcurrencyLimiter,
+    AdaptiveSettings,
+    classify_crawl_outcome,
+)
+
 # Only configure logging when run as a script (not imported by pipeline)
 if __name__ == "__main__":
     logging.basicConfig(
@@ -53,6 +59,14 @@ def _status_icon(status_value: str) -> str:
     }.get(status_value, "❓")
 
 
+_PERSISTENCE_DEFAULTS: dict[str, float] = {
+    "queue_size": 64,
+    "workers": 4,
+    "batch_size": 16,
+    "batch_timeout_seconds": 0.5,
+}
+
+
 def _load_crawl_concurrency_config() -> dict[str, object]:
     """
     Load the crawl_concurrency.yaml configuration file.
@@ -65,10 +79,11 @@ def _load_crawl_concurrency_config() -> dict[str, object]:
             {
                 'strategy': 'grouped' or 'fixed',
                 'grouped': {'static': 20, 'rss': 20, 'dynamic': 8, 'snapshot': 10},
-                'fixed': {'default': 12}
+                'fixed': {'default': 12},
+                'persistence': {'queue_size': 64, 'workers': 4, ...}
             }
     """
-    project_root = Path(__file__).resolve().parent.parent
+    project_root = Path(__file__).resolve().parents[2]
     config_path = project_root / "app" / "config" / "crawl_concurrency.yaml"
 
     # Default configuration (fallback if file doesn't exist)
@@ -83,6 +98,7 @@ def _load_crawl_concurrency_config() -> dict[str, object]:
         "fixed": {
             "default": 12,
         },
+        "persistence": dict(_PERSISTENCE_DEFAULTS),
     }
 
     if not config_path.exists():
@@ -101,6 +117,47 @@ def _load_crawl_concurrency_config() -> dict[str, object]:
     return defaults
 
 
+def _resolve_concurrency(
+    conc_config: dict[str, object],
+    strategy: str,
+    concurrency: int | None = None,
+) -> tuple[dict[str, int] | int, str]:
+    """Pick the per-method map (grouped) or single limit (fixed) and its description."""
+    if strategy == "grouped":
+        concurrency_map = conc_config.get("grouped")
+        if not isinstance(concurrency_map, dict):
+            concurrency_map = {"static": 20, "rss": 20, "dynamic": 8, "snapshot": 10}
+        strategy_desc = (
+            f"分组 (static/rss={concurrency_map.get('static', 20)}, "
+            f"dynamic={concurrency_map.get('dynamic', 8)}, "
+            f"snapshot={concurrency_map.get('snapshot', 10)})"
+        )
+        return concurrency_map, strategy_desc
+
+    fixed_config = conc_config.get("fixed")
+    if not isinstance(fixed_config, dict):
+        fixed_config = {}
+    conc_val = int(concurrency or fixed_config.get("default", 5))
+    return conc_val, f"固定 (并发={conc_val})"
+
+
+def _resolve_persistence_config(conc_config: dict[str, object]) -> dict[str, float]:
+    """Merge the ``persistence`` section over defaults, clamping to sane minimums."""
+    raw = conc_config.get("persistence")
+    merged = dict(_PERSISTENCE_DEFAULTS)
+    if isinstance(raw, dict):
+        for key in merged:
+            try:
+                merged[key] = type(merged[key])(raw.get(key, merged[key]))
+            except (TypeError, ValueError):
+                continue
+    merged["queue_size"] = max(1, int(merged["queue_size"]))
+    merged["workers"] = max(1, int(merged["workers"]))
+    merged["batch_size"] = max(1, int(merged["batch_size"]))
+    merged["batch_timeout_seconds"] = max(0.0, float(merged["batch_timeout_seconds"]))
+    return merged
+
+
 def _group_configs_by_method(configs: list[dict]) -> dict[str, list[dict]]:
     """
     Group source configurations by their crawl_method field.
@@ -120,19 +177,67 @@ def _group_configs_by_method(configs: list[dict]) -> dict[str, list[dict]]:
     return grouped
 
 
+def _build_method_limiters(
+    methods: list[str],
+    concurrency_map: dict[str, int],
+    adaptive: AdaptiveSettings | None = None,
+) -> dict[str, AdaptiveConcurrencyLimiter]:
+    """
+    Create one limiter per crawl method, using concurrency_map values as ceilings.
+
+    When adaptive is None (or disabled) each limiter is a fixed semaphore at its
+    configured value; otherwise it starts lower and moves under AIMD control.
+    """
+    settings = adaptive or AdaptiveSettings(enabled=False)
+    return {
+        # Get concurrency limit for this method, default to 5 if not specified
+        method: AdaptiveConcurrencyLimiter(
+            method, int(concurrency_map.get(method, 5)), settings,
+        )
+        for method in methods
+    }
+
+
+def _record_crawl_outcome(limiter: AdaptiveConcurrencyLimiter, record: dict) -> None:
+    """Feed one finished crawl's duration and failure class to its limiter."""
+    status = str(record.get("status") or "")
+    error = record.get("error")
+    limiter.record(
+        float(record.get("duration") or 0.0),
+        classify_crawl_outcome(status, error),
+        detail=f"{record.get('source_id')}: {error}" if error else None,
+    )
+
+
+def _collect_limiter_report(
+    limiters: dict[str, AdaptiveConcurrencyLimiter],
+) -> dict[str, object]:
+    decisions = sorted(
+        (d for limiter in limiters.values() for d in limiter.decisions),
+        key=lambda d: d["at"],
+    )
+    return {
+        "final_limits": {m: lim.limit for m, lim in limiters.items()},
+        "ceilings": {m: lim.ceiling for m, lim in limiters.items()},
+        "decisions": decisions,
+    }
+
+
 async def _run_grouped_concurrently(
     grouped: dict[str, list[dict]],
     concurrency_map: dict[str, int],
     pbar: object = None,
+    adaptive: AdaptiveSettings | None = None,
 ) -> list[dict]:
     """
     Run all crawl groups concurrently, with per-group concurrency control.
 
     This function orchestrates parallel execution of different crawl methods:
-    - Each crawl method (static, dynamic, rss, snapshot) gets its own Semaphore
+    - Each crawl method (static, dynamic, rss, snapshot) gets its own limiter
     - Within each group, tasks are limited by the concurrency value in concurrency_map
+      (a ceiling when adaptive control is enabled)
     - All groups run in parallel using asyncio.gather()
-    - NOTE: Semaphore is bound per-method via default parameter to ensure proper isolation
+    - NOTE: limiter is bound per-method via default parameter to ensure proper isolation
 
     Args:
         grouped: Dict mapping crawl method to list of source configs
@@ -140,25 +245,27 @@ async def _run_grouped_concurrently(
         concurrency_map: Dict mapping crawl method to max concurrent tasks
                         e.g. {'static': 20, 'dynamic': 8, 'snapshot': 10}
         pbar: Optional progress bar object (tqdm)
+        adaptive: Optional AIMD settings; None keeps fixed per-method limits
 
     Returns:
         list[dict]: Flattened list of crawl results from all groups
     """
     all_group_tasks = []
+    limiters = _build_method_limiters(list(grouped), concurrency_map, adaptive)
 
     for method, configs in grouped.items():
-        # Get concurrency limit for this method, default to 5 if not specified
-        max_concurrent = concurrency_map.get(method, 5)
-        semaphore = asyncio.Semaphore(max_concurrent)
+        limiter = limiters[method]
 
-        async def _crawl_with_semaphore(cfg, sem=semaphore):
-            """Acquire semaphore, run crawl, then release.
+        async def _crawl_with_semaphore(cfg, sem=limiter):
+            """Acquire limiter slot, run crawl, feed the outcome back, then release.
 
             Note: sem is bound at definition time (default parameter) to ensure
-            each iteration captures its own semaphore instance, not by reference.
+            each iteration captures its own limiter instance, not by reference.
             """
             async with sem:
-                return await _crawl_single_source(cfg, pbar)
+                record = await _crawl_single_source(cfg, pbar)
+                _record_crawl_outcome(sem, record)
+                return record
 
         # Create tasks for all configs in this group
         group_tasks = [_crawl_with_semaphore(cfg) for cfg in configs]
@@ -174,15 +281,53 @@ async def _run_grouped_concurrently(
 
 
 async def _crawl_single_source(config: dict, pbar=None) -> dict:
-    """爬取单个信源并返回结果字典"""
-    from app.crawlers.registry import CrawlerRegistry
+    """爬取单个信源、写入数据库并返回结果字典"""
     from app.crawlers.utils.json_storage import save_crawl_result_json
 
+    result, record = await _fetch_single_source(config, pbar)
+    if result is not None:
+        try:
+            await save_crawl_result_json(result, config)
+        except Exception as exc:
+            logging.warning("Failed to persist crawl result for %s: %s", config["id"], exc)
+    return record
+
+
+async def _fetch_single_source(config: dict, pbar=None) -> tuple[object | None, dict]:
+    """只爬取单个信源（不落库），返回 (CrawlResult | None, 结果字典)
+
+    熔断打开的信源不爬取（SKIPPED）；半开时先探测，探测失败已由熔断检查记录。
+    这类结果带 ``circuit_gated=True``，调用方不再重复记录。
+    """
+    from app.crawlers.registry import CrawlerRegistry
+    from app.scheduler.jobs import _gate_source_circuit
+
     source_id = config["id"]
     name = config.get("name", source_id)
     dim = config.get("dimension", "?")
     method = config.get("crawl_method", "?")
 
+    gated = await _gate_source_circuit(config, datetime.now(timezone.utc))
+    if gated is not None:
+        if pbar:
+            pbar.update(1)
+        return None, {
+            "source_id": source_id,
+            "name": name,
+            "dimension": dim,
+            "method": method,
+            "status": gated.status.value,
+            "items_total": 0,
+            "items_new": 0,
+            "items_with_content": 0,
+            "duration": gated.duration_seconds,
+            "error": gated.error_message,
+            "started_at": gated.started_at,
+            "finished_at": gated.finished_at,
+            "json_path": None,
+            "circuit_gated": True,
+        }
+
     try:
         crawler = CrawlerRegistry.create_crawler(config)
         result = await crawler.run()
@@ -192,16 +337,13 @@ async def _crawl_single_source(config: dict, pbar=None) -> dict:
             1 for item in result.items if item.content
         )
 
-        # 写入数据库
-        await save_crawl_result_json(result, config)
-
         status_str = result.status.value
 
         if pbar:
             pbar.set_postfix_str(f"{dim}/{source_id[:20]}")
             pbar.update(1)
 
-        return {
+        return result, {
             "source_id": source_id,
             "name": name,
             "dimension": dim,
@@ -211,6 +353,7 @@ async def _crawl_single_source(config: dict, pbar=None) -> dict:
             "items_new": result.items_new,
             "items_with_content": items_with_content,
             "duration": result.duration_seconds,
+            "timings": result.timings,
             "error": result.error_message,
             "started_at": result.started_at,
             "finished_at": result.finished_at,
@@ -221,7 +364,7 @@ async def _crawl_single_source(config: dict, pbar=None) -> dict:
         now = datetime.now(timezone.utc)
         if pbar:
             pbar.update(1)
-        return {
+        return None, {
             "source_id": source_id,
             "name": name,
             "dimension": dim,
@@ -238,6 +381,74 @@ async def _crawl_single_source(config: dict, pbar=None) -> dict:
         }
 
 
+async def _drain_batch(
+    queue: asyncio.Queue,
+    first: tuple | None,
+    batch_size: int,
+    batch_timeout: float,
+) -> tuple[list[tuple], bool]:
+    """Collect up to ``batch_size`` queued entries; returns (batch, saw_stop_sentinel)."""
+    if first is None:
+        return [], True
+    batch = [first]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + batch_timeout
+    while len(batch) < batch_size:
+        remaining = deadline - loop.time()
+        try:
+            if remaining <= 0:
+                entry = queue.get_nowait()
+            else:
+                entry = await asyncio.wait_for(queue.get(), timeout=remaining)
+        except (asyncio.QueueEmpty, asyncio.TimeoutError):
+            break
+        if entry is None:
+            return batch, True
+        batch.append(entry)
+    return batch, False
+
+
+async def _run_persistence_worker(
+    queue: asyncio.Queue,
+    on_persisted,
+    *,
+    batch_size: int,
+    batch_timeout: float,
+) -> None:
+    """Drain crawl results from ``queue`` and persist them in cross-source batches.
+
+    Each queue entry is ``(config, CrawlResult | None, record)``; ``None`` is the
+    stop sentinel. ``on_persisted(record)`` runs for every entry once its batch
+    has been written, so logs/state only reflect results that reached the DB path.
+    """
+    from app.crawlers.utils.json_storage import save_crawl_results_batch
+
+    stopping = False
+    while not stopping:
+        batch, stopping = await _drain_batch(
+            queue, await queue.get(), batch_size, batch_timeout,
+        )
+        if not batch:
+            break
+        to_save = [(result, cfg) for cfg, result, _ in batch if result is not None]
+        if to_save:
+            try:
+                await save_crawl_results_batch(to_save)
+            except Exception as exc:
+                logging.warning(
+                    "Batched persist failed for %d sources: %s", len(to_save), exc,
+                )
+        for _, _, record in batch:
+            try:
+                await on_persisted(record)
+            except Exception as exc:
+                logging.warning(
+                    "Post-persist bookkeeping failed for %s: %s",
+                    record.get("source_id"),
+                    exc,
+                )
+
+
 async def run_all(
     dimension_filter: str | None = None,
     concurrency: int | None = None,
@@ -249,9 +460,11 @@ async def run_all(
     from app.db.client import close_client, init_client
     from app.db.pool import init_pool
     from app.scheduler.manager import load_all_source_configs
-    from app.services.stores.crawl_log_store import append_crawl_log
     from app.services.stores.crawl_runtime_store import set_crawl_runtime_state
-    from app.services.stores.source_state import update_source_state
+    from app.services.stores.crawl_telemetry import (
+        flush_crawl_telemetry,
+        get_crawl_telemetry,
+    )
 
     # Ensure DB client is initialized so crawl results can be persisted.
     primary_exc: Exception | None = None
@@ -305,27 +518,12 @@ async def run_all(
     conc_config = _load_crawl_concurrency_config()
 
     # Determine execution strategy and concurrency settings
-    concurrency_map: dict[str, int] | int
-    if strategy == "grouped":
-        concurrency_map = conc_config.get("strategies", {}).get("grouped", {
-            "static": 20,
-            "rss": 20,
-            "dynamic": 8,
-            "snapshot": 10,
-        })
-        if isinstance(concurrency_map, dict):
-            strategy_desc = (
-                f"分组 (static/rss={concurrency_map.get('static', 20)}, "
-                f"dynamic={concurrency_map.get('dynamic', 8)}, "
-                f"snapshot={concurrency_map.get('snapshot', 10)})"
-            )
-        else:
-            strategy_desc = "分组 (默认)"
-    else:  # fixed
-        fixed_config = conc_config.get("strategies", {}).get("fixed", {})
-        conc_val = concurrency or fixed_config.get("default", 5)
-        concurrency_map = conc_val
-        strategy_desc = f"固定 (并发={conc_val})"
+    adaptive_settings = AdaptiveSettings.from_config(conc_config.get("adaptive"))
+    concurrency_map, strategy_desc = _resolve_concurrency(conc_config, strategy, concurrency)
+    if strategy == "grouped" and adaptive_settings.enabled:
+        strategy_desc += " · 自适应 AIMD (上述值为上限)"
+
+    persist_cfg = _resolve_persistence_config(conc_config)
 
     # 按维度分组统计
     dim_groups: dict[str, list[dict]] = {}
@@ -354,6 +552,10 @@ async def run_all(
     print("=" * 70)
     print(f"  全量爬取 — 共 {total} 个启用信源，{len(dim_groups)} 个维度")
     print(f"  策略: {strategy_desc}")
+    print(
+        f"  落库: 队列={persist_cfg['queue_size']}, 写入协程={persist_cfg['workers']}, "
+        f"批量={persist_cfg['batch_size']}"
+    )
     print("=" * 70)
     for dim, sources in sorted(dim_groups.items()):
         print(f"  {dim}: {len(sources)} 源")
@@ -373,88 +575,119 @@ async def run_all(
 
     completed_sources: list[str] = []
     failed_sources: list[str] = []
+    skipped_sources: list[str] = []
     running_total_items = 0
 
-    async def _crawl_with_source_id(cfg: dict, sem: asyncio.Semaphore | None = None):
-        if sem is None:
-            result = await _crawl_single_source(cfg, pbar)
+    persist_queue: asyncio.Queue = asyncio.Queue(maxsize=int(persist_cfg["queue_size"]))
+
+    limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    async def _crawl_and_enqueue(
+        cfg: dict,
+        sem: asyncio.Semaphore | AdaptiveConcurrencyLimiter,
+    ) -> None:
+        # Enqueue while still holding the slot: a full queue then throttles
+        # new fetches instead of piling up unsaved results in memory.
+        async with sem:
+            result, record = await _fetch_single_source(cfg, pbar)
+            if isinstance(sem, AdaptiveConcurrencyLimiter) and not record.get("circuit_gated"):
+                _record_crawl_outcome(sem, record)
+            await persist_queue.put((cfg, result, record))
+
+    async def _on_persisted(result: dict) -> None:
+        nonlocal running_total_items
+        source_id = str(result.get("source_id") or "")
+        results.append(result)
+        running_total_items += int(result.get("items_total") or 0)
+
+        status = str(result.get("status") or "")
+        result_started_at = result.get("started_at")
+        result_finished_at = result.get("finished_at")
+        if not isinstance(result_started_at, datetime):
+            result_started_at = datetime.now(timezone.utc)
+        if not isinstance(result_finished_at, datetime):
+            result_finished_at = datetime.now(timezone.utc)
+
+        # Keep console and source health snapshots in sync for script-based full runs.
+        # Circuit-gated sources were not crawled: skips leave the cooldown alone and
+        # failed probes were already recorded by the gate.
+        if not result.get("circuit_gated"):
+            await get_crawl_telemetry().record_crawl_outcome(
+                source_id,
+                status=status,
+                items_total=int(result.get("items_total") or 0),
+                items_new=int(result.get("items_new") or 0),
+                error_message=str(result.get("error") or "") or None,
+                started_at=result_started_at,
+                finished_at=result_finished_at,
+                duration_seconds=float(result.get("duration") or 0.0),
+                timings=result.get("timings"),
+            )
+
+        if status in ("success", "no_new_content"):
+            completed_sources.append(source_id)
+        elif status == "skipped":
+            skipped_sources.append(source_id)
         else:
-            async with sem:
-                result = await _crawl_single_source(cfg, pbar)
-        return str(cfg.get("id") or ""), result
+            failed_sources.append(source_id)
+
+        done_count = len(completed_sources) + len(failed_sources) + len(skipped_sources)
+        progress = (done_count / total) if total else 0.0
+        set_crawl_runtime_state(
+            is_running=True,
+            mode="full",
+            current_source=source_id,
+            requested_source_count=total,
+            completed_count=len(completed_sources),
+            failed_count=len(failed_sources),
+            completed_sources=completed_sources,
+            failed_sources=failed_sources,
+            total_items=running_total_items,
+            progress=progress,
+            started_at=run_started_at,
+            finished_at=None,
+        )
+
+    writer_count = int(persist_cfg["workers"])
+    writers = [
+        asyncio.create_task(
+            _run_persistence_worker(
+                persist_queue,
+                _on_persisted,
+                batch_size=int(persist_cfg["batch_size"]),
+                batch_timeout=float(persist_cfg["batch_timeout_seconds"]),
+            )
+        )
+        for _ in range(writer_count)
+    ]
 
     try:
-        # 并发爬取 - 根据策略选择执行方式
+        # 并发爬取 - 根据策略选择执行方式；落库由独立写入协程批量完成
         tasks: list[asyncio.Task] = []
         if strategy == "grouped":
             grouped = _group_configs_by_method(enabled)
             assert isinstance(concurrency_map, dict)
+            limiters = _build_method_limiters(
+                list(grouped), concurrency_map, adaptive_settings,
+            )
             for method, method_configs in grouped.items():
-                max_concurrent = int(concurrency_map.get(method, 5))
-                semaphore = asyncio.Semaphore(max_concurrent)
                 for cfg in method_configs:
                     tasks.append(
-                        asyncio.create_task(_crawl_with_source_id(cfg, semaphore))
+                        asyncio.create_task(_crawl_and_enqueue(cfg, limiters[method]))
                     )
         else:  # fixed
             assert isinstance(concurrency_map, int)
             semaphore = asyncio.Semaphore(concurrency_map)
             for cfg in enabled:
-                tasks.append(asyncio.create_task(_crawl_with_source_id(cfg, semaphore)))
-
-        for finished in asyncio.as_completed(tasks):
-            source_id, result = await finished
-            results.append(result)
-            running_total_items += int(result.get("items_total") or 0)
-
-            status = str(result.get("status") or "")
-            result_started_at = result.get("started_at")
-            result_finished_at = result.get("finished_at")
-            if not isinstance(result_started_at, datetime):
-                result_started_at = datetime.now(timezone.utc)
-            if not isinstance(result_finished_at, datetime):
-                result_finished_at = datetime.now(timezone.utc)
-
-            # Keep console and source health snapshots in sync for script-based full runs.
-            await append_crawl_log(
-                source_id=source_id,
-                status=status,
-                items_total=int(result.get("items_total") or 0),
-                items_new=int(result.get("items_new") or 0),
-                error_message=str(result.get("error") or "") or None,
-                started_at=result_started_at,
-                finished_at=result_finished_at,
-                duration_seconds=float(result.get("duration") or 0.0),
-            )
+                tasks.append(asyncio.create_task(_crawl_and_enqueue(cfg, semaphore)))
 
-            if status in ("success", "no_new_content"):
-                completed_sources.append(source_id)
-                await update_source_state(
-                    source_id,
-                    last_crawl_at=result_finished_at,
-                    last_success_at=result_finished_at,
-                    reset_failures=True,
-                )
-            else:
-                failed_sources.append(source_id)
-                await update_source_state(source_id, last_crawl_at=result_finished_at)
-
-            done_count = len(completed_sources) + len(failed_sources)
-            progress = (done_count / total) if total else 0.0
-            set_crawl_runtime_state(
-                is_running=True,
-                mode="full",
-                current_source=source_id,
-                requested_source_count=total,
-                completed_count=len(completed_sources),
-                failed_count=len(failed_sources),
-                completed_sources=completed_sources,
-                failed_sources=failed_sources,
-                total_items=running_total_items,
-                progress=progress,
-                started_at=run_started_at,
-                finished_at=None,
-            )
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for _ in writers:
+                await persist_queue.put(None)
+            await asyncio.gather(*writers)
+            await flush_crawl_telemetry()
     finally:
         set_crawl_runtime_state(
             is_running=False,
@@ -467,7 +700,7 @@ async def run_all(
             failed_sources=failed_sources,
             total_items=running_total_items,
             progress=(
-                (len(completed_sources) + len(failed_sources)) / total
+                (len(completed_sources) + len(failed_sources) + len(skipped_sources)) / total
                 if total
                 else 0.0
             ),
@@ -508,7 +741,7 @@ async def run_all(
         ds["total"] += 1
         if r["status"] in ("success", "no_new_content"):
             ds["success"] += 1
-        else:
+        elif r["status"] != "skipped":
             ds["failed"] += 1
         ds["items"] += r["items_total"]
         ds["content"] += r["items_with_content"]
@@ -536,8 +769,10 @@ async def run_all(
     total_success = sum(
         1 for r in results if r["status"] in ("success", "no_new_content")
     )
+    skipped = [r for r in results if r["status"] == "skipped"]
     total_failed = sum(
-        1 for r in results if r["status"] not in ("success", "no_new_content")
+        1 for r in results
+        if r["status"] not in ("success", "no_new_content", "skipped")
     )
     print("─" * sep_width)
     print(
@@ -548,7 +783,8 @@ async def run_all(
 
     # 失败列表
     failed = [
-        r for r in results if r["status"] not in ("success", "no_new_content")
+        r for r in results
+        if r["status"] not in ("success", "no_new_content", "skipped")
     ]
     if failed:
         print(f"\n🔴 失败信源 ({len(failed)}):")
@@ -556,6 +792,12 @@ async def run_all(
             err = (r["error"] or "unknown")[:80]
             print(f"  - {r['dimension']}/{r['source_id']}: {err}")
 
+    # 熔断跳过列表
+    if skipped:
+        print(f"\n⏸  熔断跳过 ({len(skipped)}):")
+        for r in skipped:
+            print(f"  - {r['dimension']}/{r['source_id']}: {r['error']}")
+
     # 零条目列表
     empty = [
         r for r in results
@@ -574,14 +816,29 @@ async def run_all(
         f"数据质量: {total_items} 条目, {total_content} 有内容 ({content_rate:.0f}%)"
     )
 
+    concurrency_report = _collect_limiter_report(limiters)
+    if adaptive_settings.enabled and limiters:
+        decisions = concurrency_report["decisions"]
+        print(f"\n🎛  自适应并发 ({len(decisions)} 次调整):")
+        for method in sorted(limiters):
+            lim = limiters[method]
+            print(f"  - {method}: 最终 {lim.limit}/{lim.ceiling}, 调整 {len(lim.decisions)} 次")
+        for d in decisions:
+            print(
+                f"    {d['at'][11:19]} {d['method']} {d['action']} "
+                f"{d['from']}→{d['to']} ({d['reason']})"
+            )
+
     return {
         "total_sources": total,
         "success": total_success,
         "failed": total_failed,
+        "skipped": len(skipped),
         "total_items": total_items,
         "total_with_content": total_content,
         "duration_seconds": round(total_duration, 1),
         "content_rate_pct": round(content_rate, 1),
+        "concurrency": concurrency_report,
     }
 
 
@@ -23,11 +23,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from app.config import BASE_DIR, settings  # noqa: E402
+from app.db.client import close_client, init_database_from_settings  # noqa: E402
+from app.db.pool import close_pool  # noqa: E402
 from app.services.intel.personnel.llm import (  # noqa: E402
     default_enrichment,
     enrich_changes_batch,
 )
 from app.services.intel.personnel.rules import change_id, enrich_by_rules  # noqa: E402
+from app.services.stores.intel_enrichment_store import EnrichmentStore  # noqa: E402
 from app.services.stores.json_reader import get_articles  # noqa: E402
 
 logging.basicConfig(
@@ -42,6 +45,9 @@ ENRICHED_DIR = PROCESSED_DIR / "_enriched"
 HASHES_FILE = PROCESSED_DIR / "_processed_hashes.json"
 ENRICH_HASHES_FILE = PROCESSED_DIR / "_enriched_hashes.json"
 
+# Same store as the pipeline processor, so both see every enrichment.
+_enrichment_store = EnrichmentStore("personnel", ENRICHED_DIR, payload_key="enriched_changes")
+
 
 # ---------------------------------------------------------------------------
 # Hash tracking
@@ -145,39 +151,26 @@ def build_enriched_change(
 # Enriched data cache I/O
 # ---------------------------------------------------------------------------
 
-def save_enriched_article(article: dict, enriched_changes: list[dict]) -> None:
-    """Save enriched results for one article to _enriched/ directory."""
-    ENRICHED_DIR.mkdir(parents=True, exist_ok=True)
-    url_hash = article.get("url_hash", "unknown")
-    out = {
-        "article": {
-            "url_hash": url_hash,
-            "title": article.get("title"),
-            "url": article.get("url"),
-            "published_at": article.get("published_at"),
-            "source_id": article.get("source_id"),
-            "source_name": article.get("source_name"),
-        },
-        "enriched_changes": enriched_changes,
+async def save_enriched_article(article: dict, enriched_changes: list[dict]) -> None:
+    """Store enriched results for one article (DB table, or _enriched/ files without a pool)."""
+    stored_article = {
+        "url_hash": article.get("url_hash", "unknown"),
+        "title": article.get("title"),
+        "url": article.get("url"),
+        "published_at": article.get("published_at"),
+        "source_id": article.get("source_id"),
+        "source_name": article.get("source_name"),
     }
-    path = ENRICHED_DIR / f"{url_hash}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    await _enrichment_store.put_many([(stored_article, enriched_changes)])
 
 
-def load_all_enriched() -> list[dict]:
-    """Load all enriched change records from _enriched/ directory."""
-    if not ENRICHED_DIR.exists():
-        return []
-    all_changes: list[dict] = []
-    for path in ENRICHED_DIR.glob("*.json"):
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            all_changes.extend(data.get("enriched_changes", []))
-        except (json.JSONDecodeError, KeyError, OSError) as e:
-            logger.warning("Skipping invalid enriched file %s: %s", path.name, e)
-    return all_changes
+async def load_all_enriched() -> list[dict]:
+    """Load all stored enriched change records."""
+    return [
+        change
+        for _, enriched_changes in await _enrichment_store.load_all()
+        for change in enriched_changes
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -396,7 +389,7 @@ async def main_with_enrich(args: argparse.Namespace) -> None:
                     build_enriched_change(c, article, default_enrichment())
                     for c in changes
                 ]
-                save_enriched_article(article, enriched)
+                await save_enriched_article(article, enriched)
                 h = article.get("url_hash", "")
                 if h:
                     enriched_hashes.add(h)
@@ -411,7 +404,7 @@ async def main_with_enrich(args: argparse.Namespace) -> None:
 
             results = await process_articles_llm(new_articles_with_changes)
             for article, enriched_changes in results:
-                save_enriched_article(article, enriched_changes)
+                await save_enriched_article(article, enriched_changes)
                 h = article.get("url_hash", "")
                 if h:
                     enriched_hashes.add(h)
@@ -419,7 +412,7 @@ async def main_with_enrich(args: argparse.Namespace) -> None:
         save_enriched_hashes(enriched_hashes)
 
     # Rebuild enriched_feed.json from all cached enriched data
-    all_enriched = load_all_enriched()
+    all_enriched = await load_all_enriched()
     logger.info("Total enriched changes for output: %d", len(all_enriched))
 
     # Sort: action group first, then by relevance descending
@@ -457,6 +450,19 @@ async def main_with_enrich(args: argparse.Namespace) -> None:
     logger.info("Done (with enrichment)!")
 
 
+async def _run(args: argparse.Namespace) -> None:
+    """Run the selected mode with the DB client and pool the stores use."""
+    await init_database_from_settings()
+    try:
+        if args.enrich:
+            await main_with_enrich(args)
+        else:
+            await main_rules_only(args)
+    finally:
+        await close_client()
+        await close_pool()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Process personnel data")
     parser.add_argument("--force", action="store_true", help="Reprocess all articles")
@@ -464,10 +470,7 @@ def main() -> None:
     parser.add_argument("--enrich", action="store_true", help="Enable LLM enrichment (Tier 2)")
     args = parser.parse_args()
 
-    if args.enrich:
-        asyncio.run(main_with_enrich(args))
-    else:
-        asyncio.run(main_rules_only(args))
+    asyncio.run(_run(args))
 
 
 if __name__ == "__main__":
@@ -29,6 +29,9 @@ from app.services.intel.policy.llm import (  # noqa: E402
     enrich_article_lite,
 )
 from app.services.intel.policy.rules import enrich_by_rules  # noqa: E402
+from app.db.client import close_client, init_database_from_settings  # noqa: E402
+from app.db.pool import close_pool  # noqa: E402
+from app.services.stores.intel_enrichment_store import EnrichmentStore  # noqa: E402
 from app.services.stores.json_reader import get_articles  # noqa: E402
 from app.services.llm.llm_service import LLMError  # noqa: E402
 
@@ -43,6 +46,9 @@ PROCESSED_DIR = BASE_DIR / "data" / "processed" / "policy_intel"
 ENRICHED_DIR = PROCESSED_DIR / "_enriched"
 HASHES_FILE = PROCESSED_DIR / "_processed_hashes.json"
 
+# Same store as the pipeline processor, so both see every enrichment.
+_enrichment_store = EnrichmentStore("policy", ENRICHED_DIR, payload_key="llm")
+
 
 # ---------------------------------------------------------------------------
 # Category / status helpers
@@ -239,43 +245,32 @@ async def process_articles_llm(
     return list(results)
 
 
-def save_enriched(article: dict, llm_result: dict) -> None:
-    """Save individual enriched result for debugging/incremental rebuild."""
-    ENRICHED_DIR.mkdir(parents=True, exist_ok=True)
-    url_hash = article.get("url_hash", "unknown")
-    out = {
-        "article": {
-            "url_hash": url_hash,
-            "title": article.get("title"),
-            "url": article.get("url"),
-            "published_at": article.get("published_at"),
-            "source_id": article.get("source_id"),
-            "source_name": article.get("source_name"),
-            "dimension": article.get("dimension"),
-            "group": article.get("group"),
-            "tags": article.get("tags", []),
-            "content": article.get("content"),
-        },
-        "llm": llm_result,
+def enriched_article(article: dict) -> dict:
+    """Article fields stored with its enrichment for incremental rebuilds."""
+    return {
+        "url_hash": article.get("url_hash", "unknown"),
+        "title": article.get("title"),
+        "url": article.get("url"),
+        "published_at": article.get("published_at"),
+        "source_id": article.get("source_id"),
+        "source_name": article.get("source_name"),
+        "dimension": article.get("dimension"),
+        "group": article.get("group"),
+        "tags": article.get("tags", []),
+        "content": article.get("content"),
     }
-    path = ENRICHED_DIR / f"{url_hash}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
 
 
-def load_all_enriched() -> list[tuple[dict, dict]]:
-    """Load all enriched article files from _enriched/ directory."""
-    if not ENRICHED_DIR.exists():
-        return []
-    results = []
-    for path in ENRICHED_DIR.glob("*.json"):
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            results.append((data["article"], data["llm"]))
-        except (json.JSONDecodeError, KeyError, OSError) as e:
-            logger.warning("Skipping invalid enriched file %s: %s", path.name, e)
-    return results
+async def save_enriched(items: list[tuple[dict, dict]]) -> None:
+    """Store enriched results (DB table, or _enriched/ files without a pool)."""
+    await _enrichment_store.put_many(
+        (enriched_article(article), llm_result) for article, llm_result in items
+    )
+
+
+async def load_all_enriched() -> list[tuple[dict, dict]]:
+    """Load every stored (article, enrichment) pair."""
+    return await _enrichment_store.load_all()
 
 
 def rebuild_output_files(all_enriched: list[tuple[dict, dict]]) -> None:
@@ -330,6 +325,16 @@ def rebuild_output_files(all_enriched: list[tuple[dict, dict]]) -> None:
 # Main
 # ---------------------------------------------------------------------------
 
+async def run() -> None:
+    """Run main() with the DB client and pool the article and enrichment stores use."""
+    await init_database_from_settings()
+    try:
+        await main()
+    finally:
+        await close_client()
+        await close_pool()
+
+
 async def main() -> None:
     parser = argparse.ArgumentParser(description="Process policy data through LLM enrichment")
     parser.add_argument("--force", action="store_true", help="Reprocess all articles")
@@ -468,9 +473,9 @@ async def main() -> None:
             final_results.append((article, final))
 
         # Save enriched + update hashes
+        await save_enriched(final_results)
         new_hashes: set[str] = set()
-        for article, enrichment in final_results:
-            save_enriched(article, enrichment)
+        for article, _ in final_results:
             h = article.get("url_hash", "")
             if h:
                 new_hashes.add(h)
@@ -489,7 +494,7 @@ async def main() -> None:
         logger.info("No new articles to process")
 
     # Rebuild output files from ALL enriched data
-    all_enriched = load_all_enriched()
+    all_enriched = await load_all_enriched()
     logger.info("Total enriched articles for output: %d", len(all_enriched))
     rebuild_output_files(all_enriched)
 
@@ -497,4 +502,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run())
@@ -61,14 +61,14 @@ async def main() -> None:
         # For dry-run, load data and show classification preview
         from app.services.intel.pipeline.tech_frontier_processor import (
             _deduplicate,
-            _load_all_articles,
+            _load_article_delta,
         )
         from app.services.intel.tech_frontier.rules import (
             TOPICS_CONFIG,
             classify_article,
         )
 
-        articles = _load_all_articles()
+        articles = (await _load_article_delta(version="dry-run", force=True)).articles
         unique = _deduplicate(articles)
         logger.info("Loaded %d articles (%d unique)", len(articles), len(unique))
 
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from app.config import settings
+from app.db.client import close_client
+from app.db.pool import close_pool, get_pool, init_pool
+
+
+@pytest.fixture()
+async def pg_pool():
+    """A fresh pool on the configured PostgreSQL; skips the test when it is unreachable."""
+    await close_client()
+    await close_pool()
+    try:
+        await init_pool(
+            host=settings.POSTGRES_HOST,
+            port=settings.POSTGRES_PORT,
+            user=settings.POSTGRES_USER,
+            password=settings.POSTGRES_PASSWORD,
+            database=settings.POSTGRES_DB,
+            min_size=1,
+            max_size=4,
+        )
+    except Exception as exc:  # noqa: BLE001
+        pytest.skip(f"PostgreSQL not reachable: {exc}")
+    try:
+        yield get_pool()
+    finally:
+        await close_client()
+        await close_pool()
+
+
+
+@pytest.fixture()
+def json_fallback_dirs(tmp_path, monkeypatch):
+    """Point the crawl log and source state JSON fallbacks at ``tmp_path``.
+
+    PG tests request it so that a missing table degrades into temporary files
+    instead of writing under the repository's ``data/``.
+    """
+    from app.services.stores import crawl_log_store, source_state  # noqa: PLC0415
+
+    monkeypatch.setattr(crawl_log_store, "LOGS_DIR", tmp_path / "logs")
+    monkeypatch.setattr(source_state, "STATE_DIR", tmp_path / "state")
+    monkeypatch.setattr(source_state, "STATE_FILE", tmp_path / "state" / "source_state.json")
+    return tmp_path
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from app.config import settings
+from app.scheduler import adaptive
+from app.scheduler.adaptive import SourceCadence, estimate_interval_hours, spread_offsets
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _estimate(cadence: SourceCadence, *, default_hours: float = 24.0) -> tuple[float, str]:
+    return estimate_interval_hours(
+        cadence,
+        now=NOW,
+        history_days=30,
+        min_hours=2,
+        max_hours=168,
+        default_hours=default_hours,
+    )
+
+
+def test_frequent_publisher_gets_short_interval_and_stale_source_gets_max():
+    busy = SourceCadence(
+        "busy",
+        published=[NOW - timedelta(hours=6 * i) for i in range(120)],  # every 6h
+    )
+    hours, reason = _estimate(busy)
+    assert hours == 3  # half the 6h gap
+    assert "publish events" in reason
+
+    stale = SourceCadence("stale", crawls=30, crawls_with_new=0)
+    assert _estimate(stale)[0] == 168
+
+
+def test_crawl_logs_used_when_published_at_is_sparse_and_no_history_keeps_fixed():
+    weekly = SourceCadence(
+        "weekly_news",
+        crawls=30,
+        crawls_with_new=4,
+        first_crawl_at=NOW - timedelta(days=30),
+    )
+    # 720h / 4 new = 180h gap -> 90h target -> rounded down to the 72h step.
+    assert _estimate(weekly)[0] == 72
+
+    assert _estimate(SourceCadence("fresh"), default_hours=4.0) == (4, "no history; fixed schedule")
+
+
+def test_same_hour_items_count_as_one_publish_event():
+    burst = SourceCadence(
+        "burst",
+        crawls=30,
+        crawls_with_new=1,
+        published=[NOW - timedelta(days=2, minutes=m) for m in range(0, 40, 5)],
+    )
+    hours, reason = _estimate(burst)
+    assert "crawls with new items" in reason
+    assert hours == 168
+
+
+def test_spread_offsets_phase_sources_evenly_within_each_interval():
+    offsets = spread_offsets({"a": 24, "b": 24, "c": 24, "d": 24, "x": 2})
+    assert [offsets[s] for s in "abcd"] == [0, 6 * 3600, 12 * 3600, 18 * 3600]
+    assert offsets["x"] == 0
+
+
+def test_uses_adaptive_schedule_respects_cron_and_fixed_pins(monkeypatch):
+    monkeypatch.setattr(settings, "SCHEDULE_MODE", "adaptive")
+    assert adaptive.uses_adaptive_schedule({"schedule": "daily"})
+    assert not adaptive.uses_adaptive_schedule({"schedule": "daily", "schedule_mode": "fixed"})
+    assert not adaptive.uses_adaptive_schedule({"cron": {"hour": 4}})
+
+    monkeypatch.setattr(settings, "SCHEDULE_MODE", "fixed")
+    assert not adaptive.uses_adaptive_schedule({"schedule": "daily"})
+    assert adaptive.uses_adaptive_schedule({"schedule": "adaptive"})
+
+
+async def test_plan_adaptive_schedules_combines_history(monkeypatch):
+    monkeypatch.setattr(settings, "SCHEDULE_MODE", "adaptive")
+
+    async def fake_load(source_ids, *, history_days, now):
+        return {
+            "a": SourceCadence("a", crawls=30, crawls_with_new=0),
+            "b": SourceCadence("b", crawls=30, crawls_with_new=0),
+            "c": SourceCadence("c"),
+        }
+
+    monkeypatch.setattr(adaptive, "load_source_cadences", fake_load)
+    plans = await adaptive.plan_adaptive_schedules(
+        [
+            {"id": "a", "schedule": "daily"},
+            {"id": "b", "schedule": "2h", "adaptive_max_hours": 48},
+            {"id": "c", "schedule": "4h"},
+            {"id": "pinned", "schedule": "daily", "cron": {"hour": 1}},
+        ],
+        now=NOW,
+    )
+
+    assert set(plans) == {"a", "b", "c"}
+    assert plans["a"].interval_hours == 168
+    assert plans["b"].interval_hours == 48
+    assert plans["c"].interval_hours == 4
+
+
+def test_schedule_anchor_is_fixed_across_days():
+    anchor = adaptive.schedule_anchor()
+    assert anchor == datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    plan = adaptive.AdaptivePlan("a", 24, 6 * 3600, "test")
+    fire = plan.trigger(anchor).get_next_fire_time(None, NOW)
+    assert (fire.hour, fire.minute) == (6, 0)
+
+
+async def test_load_source_cadences_aggregates_crawl_logs(tmp_path, monkeypatch):
+    from app.services.stores import crawl_log_store
+
+    monkeypatch.setattr(crawl_log_store, "LOGS_DIR", tmp_path)
+    rows = [
+        crawl_log_store.build_crawl_log_row(
+            source_id, status="success", items_new=new, started_at=NOW - timedelta(days=days)
+        )
+        for source_id, new, days in [
+            ("a", 0, 40),  # outside the window
+            ("a", 2, 9),
+            ("a", 0, 3),
+            ("b", 1, 1),
+            ("other", 5, 1),
+        ]
+    ]
+    await crawl_log_store.append_crawl_logs(rows)
+
+    cadences = await adaptive.load_source_cadences(["a", "b", "c"], history_days=30, now=NOW)
+    assert (cadences["a"].crawls, cadences["a"].crawls_with_new) == (2, 1)
+    assert cadences["a"].first_crawl_at == NOW - timedelta(days=9)
+    assert (cadences["b"].crawls, cadences["c"].crawls) == (1, 0)
+    assert set(cadences) == {"a", "b", "c"}
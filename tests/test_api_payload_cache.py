@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import responses
+from app.api.intel import policy
+from app.api.responses import PayloadCache
+from app.services.intel import intel_store
+from app.utils.metrics import API_PAYLOAD_CACHE
+
+
+@pytest.fixture()
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(intel_store, "PROCESSED_BASE", tmp_path)
+    monkeypatch.setattr(intel_store, "_cache", {})
+    monkeypatch.setattr(responses, "payload_cache", PayloadCache(8))
+    monkeypatch.setattr(policy, "payload_cache", responses.payload_cache)
+
+    app = FastAPI()
+    app.include_router(policy.router, prefix="/api/intel/policy")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _write_feed(tmp_path, items: list[dict], bump: int = 0) -> None:
+    path = tmp_path / "policy_intel" / "feed.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"generated_at": "g", "item_count": len(items), "items": items}),
+        encoding="utf-8",
+    )
+    if bump:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+def _policy(i: int) -> dict:
+    return {"id": str(i), "title": f"政策{i}", "category": "国家政策", "matchScore": i}
+
+
+def test_feed_is_served_from_cache_with_etag(client, tmp_path):
+    _write_feed(tmp_path, [_policy(1), _policy(2)])
+    hits = API_PAYLOAD_CACHE.value("hit")
+
+    first = client.get("/api/intel/policy/feed", params={"limit": 1})
+    assert first.status_code == 200
+    assert [i["id"] for i in first.json()["items"]] == ["1"]
+    # Validated through the response model, like a regular response_model route.
+    assert first.json()["items"][0]["tags"] == []
+
+    again = client.get("/api/intel/policy/feed", params={"limit": 1})
+    assert again.content == first.content
+    assert API_PAYLOAD_CACHE.value("hit") == hits + 1
+
+    etag = first.headers["etag"]
+    revalidated = client.get(
+        "/api/intel/policy/feed", params={"limit": 1}, headers={"If-None-Match": etag}
+    )
+    assert revalidated.status_code == 304 and revalidated.headers["etag"] == etag
+
+    _write_feed(tmp_path, [_policy(3)], bump=10**9)
+    changed = client.get(
+        "/api/intel/policy/feed", params={"limit": 1}, headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert [i["id"] for i in changed.json()["items"]] == ["3"]
+
+
+def test_cache_is_bounded_and_keyed_by_query(client, tmp_path):
+    _write_feed(tmp_path, [_policy(i) for i in range(20)])
+    for offset in range(10):
+        response = client.get("/api/intel/policy/feed", params={"limit": 1, "offset": offset})
+        assert response.json()["items"][0]["id"] == str(offset)
+    assert len(responses.payload_cache) == 8
+
+
+def test_etag_matching():
+    etag = responses.make_etag(("feed.json", 1, 2))
+    assert etag == responses.make_etag(("feed.json", 1, 2))
+    assert responses.etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert responses.etag_matches("*", etag)
+    assert not responses.etag_matches(None, etag)
+    assert not responses.etag_matches(responses.make_etag(("feed.json", 1, 3)), etag)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.crawlers.base import CrawlStatus
+from app.crawlers.utils import circuit_breaker, http_client
+from app.crawlers.utils.circuit_breaker import CircuitOpenError, source_circuit_state
+from app.scheduler import jobs
+from app.services.core.source_service import _build_facets, _normalize_source_state_row
+from app.services.stores import crawl_telemetry
+
+NOW = datetime(2026, 3, 1, 6, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _clean_domains():
+    circuit_breaker.reset_domain_circuits()
+    yield
+    circuit_breaker.reset_domain_circuits()
+
+
+def test_source_circuit_opens_after_threshold_and_cooldown_doubles():
+    assert source_circuit_state(2, NOW - timedelta(hours=1), now=NOW)[0] == "closed"
+
+    state, next_probe = source_circuit_state(3, NOW - timedelta(hours=1), now=NOW)
+    assert state == "open"
+    assert next_probe == NOW + timedelta(hours=11)
+    assert source_circuit_state(3, NOW - timedelta(hours=13), now=NOW)[0] == "half_open"
+
+    # One more failure doubles the cooldown to 24h.
+    assert source_circuit_state(4, NOW - timedelta(hours=13), now=NOW)[0] == "open"
+    assert source_circuit_state(20, NOW - timedelta(days=6), now=NOW)[0] == "open"
+    assert source_circuit_state(20, NOW - timedelta(days=8), now=NOW)[0] == "half_open"
+
+
+async def test_open_source_is_skipped_and_failed_probe_records_failure(monkeypatch):
+    state = {"consecutive_failures": 5, "last_crawl_at": datetime.now(timezone.utc).isoformat()}
+    logs: list[dict] = []
+    updates: list[dict] = []
+
+    async def fake_get_state(_source_id):
+        return state
+
+    async def fake_logs(rows):
+        logs.extend(rows)
+
+    async def fake_updates(rows):
+        updates.extend(rows)
+
+    def no_crawler(_config):
+        raise AssertionError("crawler must not be created while the circuit is open")
+
+    monkeypatch.setattr(jobs, "get_source_state", fake_get_state)
+    writer = crawl_telemetry.CrawlTelemetryWriter()
+    monkeypatch.setattr(crawl_telemetry, "append_crawl_logs", fake_logs)
+    monkeypatch.setattr(crawl_telemetry, "apply_source_state_updates", fake_updates)
+    monkeypatch.setattr(jobs, "get_crawl_telemetry", lambda: writer)
+    monkeypatch.setattr(jobs.CrawlerRegistry, "create_crawler", no_crawler)
+
+    result = await jobs.execute_crawl_job({"id": "dead_gov_site"})
+    await writer.flush()
+    assert result.status == CrawlStatus.SKIPPED
+    assert logs == [] and updates == []
+
+    state["last_crawl_at"] = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+
+    async def failing_probe(_config):
+        return "ConnectTimeout: timed out"
+
+    monkeypatch.setattr(jobs, "probe_source", failing_probe)
+    result = await jobs.execute_crawl_job({"id": "dead_gov_site"})
+    await writer.close()
+    assert result.status == CrawlStatus.FAILED
+    assert "probe failed" in result.error_message
+    assert logs[0]["status"] == "failed"
+    assert (updates[0]["reset"], updates[0]["delta"]) == (False, 1)
+
+
+async def test_run_all_fetch_skips_open_circuit_without_crawling(monkeypatch):
+    from scripts.crawl.run_all import _fetch_single_source
+
+    async def open_state(_source_id):
+        return {"consecutive_failures": 5, "last_crawl_at": datetime.now(timezone.utc)}
+
+    def no_crawler(_config):
+        raise AssertionError("crawler must not be created while the circuit is open")
+
+    monkeypatch.setattr(jobs, "get_source_state", open_state)
+    monkeypatch.setattr(jobs.CrawlerRegistry, "create_crawler", no_crawler)
+
+    result, record = await _fetch_single_source({"id": "dead_gov_site", "dimension": "x"})
+    assert result is None
+    assert record["status"] == "skipped" and record["circuit_gated"]
+    assert record["error"].startswith("Circuit open until")
+
+
+async def test_domain_circuit_stops_retry_budget_and_fails_fast(monkeypatch):
+    monkeypatch.setattr(settings, "CIRCUIT_BREAKER_DOMAIN_FAILURE_THRESHOLD", 2)
+    calls: list[str] = []
+
+    async def failing_get(self, url, **_kwargs):
+        calls.append(url)
+        raise httpx.ConnectTimeout("timed out")
+
+    async def no_sleep(_seconds):
+        return None
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", failing_get)
+    monkeypatch.setattr(http_client.asyncio, "sleep", no_sleep)
+
+    with pytest.raises(httpx.ConnectTimeout):
+        await http_client.fetch_page("https://dead.example.gov/list", max_retries=3)
+    assert len(calls) == 2  # stopped once the circuit opened
+
+    with pytest.raises(CircuitOpenError):
+        await http_client.fetch_page("https://dead.example.gov/other")
+    assert len(calls) == 2
+
+    # After the cooldown exactly one probe goes out; its failure re-opens the circuit.
+    monkeypatch.setattr(settings, "CIRCUIT_BREAKER_DOMAIN_OPEN_SECONDS", 0.0)
+    with pytest.raises(httpx.ConnectTimeout):
+        await http_client.fetch_page("https://dead.example.gov/list", max_retries=3)
+    assert len(calls) == 3
+    assert circuit_breaker.domain_circuit_snapshot()["dead.example.gov"]["failures"] == 3
+
+
+def test_catalog_exposes_circuit_state_facet():
+    last = datetime.now(timezone.utc).isoformat()
+    items = [
+        _normalize_source_state_row(
+            {"source_id": "ok", "consecutive_failures": 0, "last_crawl_at": last}
+        ),
+        _normalize_source_state_row(
+            {"source_id": "dead", "consecutive_failures": 4, "last_crawl_at": last}
+        ),
+    ]
+    assert items[1]["circuit_state"] == "open"
+    assert items[1]["circuit_next_probe_at"] is not None
+
+    facets = _build_facets(items)
+    assert {f["key"]: f["count"] for f in facets["circuit_states"]} == {"closed": 1, "open": 1}
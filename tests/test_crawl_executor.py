@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.scheduler import executor
+from app.scheduler.executor import CrawlExecutorError, CrawlExecutorPool, report_progress
+from app.scheduler.pipeline import PipelineResult, StageResult
+
+
+def test_report_progress_is_noop_without_sink_and_streams_with_one():
+    report_progress("stage", name="crawl_all")  # no sink: must not raise
+
+    events: list[tuple[str, dict]] = []
+    token = executor._progress_sink.set(lambda event, data: events.append((event, data)))
+    try:
+        report_progress("stage", name="crawl_all", status="running")
+    finally:
+        executor._progress_sink.reset(token)
+
+    assert events == [("stage", {"name": "crawl_all", "status": "running"})]
+
+
+def test_pipeline_result_round_trips_through_dict():
+    started = datetime(2026, 1, 1, 6, 0, tzinfo=timezone.utc)
+    result = PipelineResult(
+        started_at=started,
+        finished_at=datetime(2026, 1, 1, 6, 5, tzinfo=timezone.utc),
+        stages=[
+            StageResult(name="crawl_all", status="success", duration_seconds=200.0),
+            StageResult(name="process_policy", status="failed", error="boom"),
+        ],
+    )
+
+    restored = PipelineResult.from_dict(result.to_dict())
+
+    assert restored.to_dict() == result.to_dict()
+    assert restored.status == "partial_failure"
+
+
+async def test_executor_process_reports_op_errors_and_restarts_after_crash():
+    pool = CrawlExecutorPool(1)
+    await pool.start()
+    try:
+        with pytest.raises(CrawlExecutorError, match="Unknown executor op"):
+            await asyncio.wait_for(pool.submit("no_such_op"), timeout=60)
+
+        proc = pool._procs[0]
+        proc.proc.kill()
+        await asyncio.wait_for(proc._reader, timeout=10)
+        assert not proc.alive
+
+        # The next submit respawns the child.
+        with pytest.raises(CrawlExecutorError, match="Unknown executor op"):
+            await asyncio.wait_for(pool.submit("no_such_op"), timeout=60)
+        assert proc.alive
+    finally:
+        await pool.stop()
+
+
+async def test_control_crawl_records_executor_failures(monkeypatch):
+    from app.services import crawler_control_service
+    from app.services.stores import crawl_telemetry
+
+    class DeadExecutor:
+        async def submit(self, op, payload=None):
+            raise CrawlExecutorError("Crawl executor #0 is gone: killed")
+
+    logs: list[dict] = []
+    updates: list[dict] = []
+
+    async def fake_logs(rows):
+        logs.extend(rows)
+
+    async def fake_updates(rows):
+        updates.extend(rows)
+
+    writer = crawl_telemetry.CrawlTelemetryWriter()
+    monkeypatch.setattr(crawl_telemetry, "append_crawl_logs", fake_logs)
+    monkeypatch.setattr(crawl_telemetry, "apply_source_state_updates", fake_updates)
+    monkeypatch.setattr(crawler_control_service, "get_crawl_telemetry", lambda: writer)
+    monkeypatch.setattr(crawler_control_service, "get_crawl_executor", lambda: DeadExecutor())
+
+    outcome = await crawler_control_service._crawl_source({"id": "src"}, "database")
+    await writer.close()
+
+    assert outcome["status"] == "failed" and outcome["raised"]
+    assert [(row["source_id"], row["status"]) for row in logs] == [("src", "failed")]
+    assert "is gone" in logs[0]["error_message"]
+    assert [row["source_id"] for row in updates] == ["src"]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.config import settings
+from app.db.pool import get_pool
+from app.scheduler import job_queue
+from app.scheduler.job_queue import (
+    MANUAL_PRIORITY_BOOST,
+    claim_crawl_jobs,
+    complete_crawl_job,
+    enqueue_crawl_job,
+    fail_crawl_job,
+    heartbeat_crawl_jobs,
+    resolve_job_priority,
+)
+
+
+@pytest.fixture()
+async def queue_prefix(pg_pool):
+    job_queue._SCHEMA_READY = False
+    job_queue._SCHEMA_LOCK = asyncio.Lock()
+    await job_queue.ensure_crawl_job_tables()
+
+    prefix = f"pytest_queue_{uuid4().hex[:8]}_"
+    try:
+        yield prefix
+    finally:
+        await pg_pool.execute("DELETE FROM crawl_jobs WHERE source_id LIKE $1", f"{prefix}%")
+
+
+async def _only_prefixed(jobs: list[dict], prefix: str) -> list[dict]:
+    return [j for j in jobs if str(j["source_id"]).startswith(prefix)]
+
+
+def test_resolve_job_priority_uses_dimension_and_catalog_priority():
+    policy_p1 = resolve_job_priority({"dimension": "national_policy", "priority": 1})
+    policy_p2 = resolve_job_priority({"dimension": "national_policy"})
+    events = resolve_job_priority({"dimension": "events", "priority": 1})
+
+    assert policy_p1 > policy_p2 > events
+    assert resolve_job_priority({"dimension": "events", "queue_priority": 500}) == 500
+
+
+async def test_enqueue_dedupes_pending_jobs_per_source(queue_prefix):
+    cfg = {"id": f"{queue_prefix}a", "dimension": "technology"}
+
+    first = await enqueue_crawl_job(cfg)
+    second = await enqueue_crawl_job(cfg, priority_boost=MANUAL_PRIORITY_BOOST)
+
+    assert first is not None
+    assert second is None
+
+
+async def test_claim_orders_by_priority_and_skips_locked_rows(queue_prefix):
+    await enqueue_crawl_job({"id": f"{queue_prefix}low", "dimension": "events"})
+    await enqueue_crawl_job({"id": f"{queue_prefix}high", "dimension": "national_policy"})
+    await enqueue_crawl_job(
+        {"id": f"{queue_prefix}manual", "dimension": "events"},
+        priority_boost=MANUAL_PRIORITY_BOOST,
+        enqueued_by="manual",
+    )
+
+    batch_a, batch_b = await asyncio.gather(
+        claim_crawl_jobs("worker-a", 2),
+        claim_crawl_jobs("worker-b", 2),
+    )
+    claimed = await _only_prefixed(batch_a + batch_b, queue_prefix)
+    ids = [j["id"] for j in claimed]
+
+    assert len(ids) == 3
+    assert len(set(ids)) == 3  # no job leased twice
+
+    ordered = sorted(claimed, key=lambda j: -j["priority"])
+    assert [j["source_id"] for j in ordered] == [
+        f"{queue_prefix}manual",
+        f"{queue_prefix}high",
+        f"{queue_prefix}low",
+    ]
+    assert all(j["status"] == "running" and j["attempts"] == 1 for j in claimed)
+
+
+async def test_fail_requeues_with_backoff_then_dies(queue_prefix, monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_QUEUE_MAX_ATTEMPTS", 2)
+    cfg = {"id": f"{queue_prefix}flaky", "dimension": "industry"}
+    job_id = await enqueue_crawl_job(cfg)
+
+    [job] = await _only_prefixed(await claim_crawl_jobs("w", 50), queue_prefix)
+    assert await fail_crawl_job("w", job_id, "Server error '503'") == "queued"
+    # Backoff keeps it out of reach for now.
+    assert await _only_prefixed(await claim_crawl_jobs("w", 50), queue_prefix) == []
+
+    await get_pool().execute("UPDATE crawl_jobs SET run_after = now() WHERE id = $1", job_id)
+    [job] = await _only_prefixed(await claim_crawl_jobs("w", 50), queue_prefix)
+    assert job["attempts"] == 2
+    assert await fail_crawl_job("w", job_id, "Server error '503'") == "dead"
+
+
+async def test_heartbeat_and_expired_lease_reclaim(queue_prefix):
+    job_id = await enqueue_crawl_job({"id": f"{queue_prefix}slow", "dimension": "industry"})
+    await claim_crawl_jobs("crashed", 50, lease_seconds=30)
+
+    assert await heartbeat_crawl_jobs("crashed", [job_id]) == {job_id}
+    assert await heartbeat_crawl_jobs("someone-else", [job_id]) == set()
+
+    await get_pool().execute(
+        "UPDATE crawl_jobs SET lease_expires_at = now() - interval '1 second' WHERE id = $1",
+        job_id,
+    )
+    [job] = await _only_prefixed(await claim_crawl_jobs("rescuer", 50), queue_prefix)
+    assert job["lease_owner"] == "rescuer"
+    assert job["attempts"] == 2
+
+    # The original owner can no longer settle the job.
+    assert await complete_crawl_job("crashed", job_id) is False
+    assert await complete_crawl_job("rescuer", job_id) is True
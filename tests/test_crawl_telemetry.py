@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.db.client import init_client
+from app.services.stores import crawl_log_store, crawl_telemetry, source_state
+from app.services.stores.crawl_telemetry import CrawlTelemetryWriter
+
+T0 = datetime(2026, 3, 1, 6, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def sinks(monkeypatch):
+    written: dict[str, list] = {"logs": [], "states": []}
+
+    async def fake_logs(rows):
+        written["logs"].append(rows)
+
+    async def fake_states(rows):
+        written["states"].append(rows)
+
+    monkeypatch.setattr(crawl_telemetry, "append_crawl_logs", fake_logs)
+    monkeypatch.setattr(crawl_telemetry, "apply_source_state_updates", fake_states)
+    return written
+
+
+async def test_transitions_merge_per_source_and_flush_in_one_batch(sinks):
+    writer = CrawlTelemetryWriter(flush_seconds=60, max_batch=100)
+    t1, t2, t3 = T0, T0 + timedelta(hours=1), T0 + timedelta(hours=2)
+
+    await writer.record_crawl_outcome("a", status="failed", finished_at=t1)
+    await writer.record_crawl_outcome("a", status="success", finished_at=t2)
+    await writer.record_crawl_outcome("a", status="failed", finished_at=t3)
+    await writer.record_crawl_outcome("b", status="failed", finished_at=t1)
+    await writer.record_crawl_outcome("b", status="failed", finished_at=t2)
+    assert sinks["logs"] == []  # nothing written until flush
+
+    await writer.close()
+    assert [len(batch) for batch in sinks["logs"]] == [5]
+    assert sinks["states"] == [
+        [
+            {"source_id": "a", "reset": True, "delta": 1,
+             "last_crawl_at": t3, "last_success_at": t2},
+            {"source_id": "b", "reset": False, "delta": 2,
+             "last_crawl_at": t2, "last_success_at": None},
+        ]
+    ]
+
+
+async def test_writer_flushes_on_batch_size_and_interval(sinks):
+    writer = CrawlTelemetryWriter(flush_seconds=0.01, max_batch=4)
+    await writer.record_crawl_outcome("a", status="success", finished_at=T0)
+    await writer.record_crawl_outcome("b", status="success", finished_at=T0)
+    assert len(sinks["logs"]) == 1  # 2 log rows + 2 state rows reached max_batch
+
+    await writer.record_crawl_outcome("c", status="failed", finished_at=T0)
+    await asyncio.sleep(0.05)
+    assert [row["source_id"] for row in sinks["logs"][1]] == ["c"]
+    await writer.close()
+
+
+async def test_json_fallback_appends_and_keeps_newest_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl_log_store, "LOGS_DIR", tmp_path)
+    monkeypatch.setattr(crawl_log_store, "MAX_LOGS_PER_SOURCE", 3)
+    monkeypatch.setattr(crawl_log_store, "COMPACT_BYTES", 1_000)
+    legacy = tmp_path / "s1" / "crawl_logs.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text('[{"source_id": "s1", "status": "failed"}]', encoding="utf-8")
+
+    for i in range(2):
+        await crawl_log_store.append_crawl_logs(
+            [crawl_log_store.build_crawl_log_row("s1", status="success", items_new=i)]
+        )
+    path = crawl_log_store._log_file("s1")
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert [row["status"] for row in crawl_log_store._load_logs("s1")] == [
+        "failed", "success", "success",
+    ]
+
+    rows = [
+        crawl_log_store.build_crawl_log_row("s1", status="success", items_new=i)
+        for i in range(2, 12)
+    ]
+    await crawl_log_store.append_crawl_logs(rows)
+    # Past COMPACT_BYTES the file is rewritten with the newest rows only.
+    assert [row["items_new"] for row in crawl_log_store._load_logs("s1")] == [9, 10, 11]
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+    assert not legacy.exists()
+
+
+async def test_failed_chunk_falls_back_to_json_without_the_inserted_rows(tmp_path, monkeypatch):
+    inserted: list[list[int]] = []
+
+    async def flaky_insert(_client, chunk):
+        if inserted:
+            raise ValueError("connection reset")
+        inserted.append([row["items_new"] for row in chunk])
+
+    monkeypatch.setattr(crawl_log_store, "LOGS_DIR", tmp_path)
+    monkeypatch.setattr(crawl_log_store, "_INSERT_CHUNK_SIZE", 2)
+    monkeypatch.setattr(crawl_log_store, "_get_client", lambda: object())
+    monkeypatch.setattr(crawl_log_store, "_timings_column", True)
+    monkeypatch.setattr(crawl_log_store, "_insert_chunk", flaky_insert)
+
+    await crawl_log_store.append_crawl_logs(
+        [crawl_log_store.build_crawl_log_row("s1", status="success", items_new=i)
+         for i in range(5)]
+    )
+    assert inserted == [[0, 1]]
+    assert [row["items_new"] for row in crawl_log_store._load_logs("s1")] == [2, 3, 4]
+
+
+@pytest.fixture()
+async def pg_sources(pg_pool, json_fallback_dirs):
+    await init_client(backend="postgres")
+    prefix = f"pt_{uuid4().hex[:8]}"
+    try:
+        yield prefix
+    finally:
+        await pg_pool.execute("DELETE FROM source_states WHERE source_id LIKE $1", f"{prefix}%")
+        await pg_pool.execute("DELETE FROM crawl_logs WHERE source_id LIKE $1", f"{prefix}%")
+
+
+async def test_failure_counter_is_incremented_in_sql(pg_sources):
+    a, b = f"{pg_sources}_a", f"{pg_sources}_b"
+    await source_state.update_source_state(a, last_crawl_at=T0, consecutive_failures=2)
+
+    # Concurrent batches must not lose increments.
+    fail = [{"source_id": a, "reset": False, "delta": 1,
+             "last_crawl_at": T0, "last_success_at": None}]
+    await asyncio.gather(*(source_state.apply_source_state_updates(fail) for _ in range(5)))
+    await source_state.apply_source_state_updates(
+        [
+            {"source_id": b, "reset": False, "delta": 1,
+             "last_crawl_at": T0, "last_success_at": None},
+            {"source_id": b, "reset": True, "delta": 0,
+             "last_crawl_at": T0, "last_success_at": T0},
+        ]
+    )
+
+    state_a = await source_state.get_source_state(a)
+    state_b = await source_state.get_source_state(b)
+    assert state_a["consecutive_failures"] == 7
+    assert state_b["consecutive_failures"] == 0
+    assert state_b["last_success_at"] is not None
+
+    await crawl_log_store.append_crawl_logs(
+        [crawl_log_store.build_crawl_log_row(a, status="failed", started_at=T0, finished_at=T0)
+         for _ in range(3)]
+    )
+    assert len(await crawl_log_store.get_crawl_logs(a)) == 3
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.crawlers.base import BaseCrawler, CrawledItem, CrawlResult
+from app.crawlers.utils import http_client, json_storage
+from app.crawlers.utils.timing import collect_timings, span
+from app.db.client import init_client
+from app.services import console_service
+from app.services.stores import crawl_log_store
+
+BODY = b"<html><body>" + b"x" * 2048 + b"</body></html>"
+
+
+@pytest.fixture()
+async def local_server():
+    async def handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        await asyncio.sleep(0.02)
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+            + f"Content-Length: {len(BODY)}\r\nConnection: close\r\n\r\n".encode()
+            + BODY
+        )
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+    await server.wait_closed()
+
+
+class _PageCrawler(BaseCrawler):
+    async def fetch_and_parse(self) -> list[CrawledItem]:
+        html = await http_client.fetch_page(self.config["url"], request_delay=0.001)
+        return [CrawledItem(title=f"item-{len(html)}", url=self.config["url"])]
+
+
+async def test_run_records_fetch_parse_and_http_spans(local_server):
+    crawler = _PageCrawler({"id": "timed", "url": f"{local_server}/list"})
+    result = await crawler.run()
+
+    timings = result.timings
+    assert result.items and result.status.value == "success"
+    assert timings["http_requests"] == 1
+    assert timings["http_body_bytes"] == len(BODY)
+    assert timings["http_ttfb"] >= 0.015  # server sleeps before answering
+    assert timings["fetch"] >= timings["http_ttfb"]
+    assert {"rate_limit_wait", "http_connect", "parse", "filter"} <= set(timings)
+    assert timings["parse"] < result.duration_seconds
+
+
+async def test_spans_are_noops_without_bound_timings(local_server):
+    await http_client.fetch_page(f"{local_server}/plain", request_delay=0.001)
+    timings: dict[str, float] = {}
+    with collect_timings(timings):
+        with span("custom"):
+            await asyncio.sleep(0)
+    assert set(timings) == {"custom"}
+
+
+async def test_batch_persist_time_is_split_across_results():
+    results = [CrawlResult(source_id=f"s{i}", timings={"fetch": 1.0}) for i in range(2)]
+    await json_storage.save_crawl_results_batch(
+        [(result, {"id": result.source_id, "persist_to_db": False}) for result in results]
+    )
+    assert all(result.timings["persist"] >= 0.0 for result in results)
+    assert results[0].timings["persist"] == results[1].timings["persist"]
+
+
+async def test_timings_round_trip_and_console_breakdown(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl_log_store, "LOGS_DIR", tmp_path)
+    now = datetime.now(timezone.utc)
+    rows = [
+        crawl_log_store.build_crawl_log_row(
+            "slow_src",
+            status="success",
+            started_at=now - timedelta(minutes=i),
+            finished_at=now,
+            duration_seconds=duration,
+            timings={"fetch": fetch, "parse": 0.5, "http_requests": 2, "http_ttfb": 0.12345},
+        )
+        for i, (duration, fetch) in enumerate([(4.0, 3.0), (2.0, 1.0)])
+    ]
+    rows.append(
+        crawl_log_store.build_crawl_log_row(
+            "fast_src", status="success", started_at=now, duration_seconds=9.0,
+            timings={"fetch": 0.2, "parse": 8.5},
+        )
+    )
+    await crawl_log_store.append_crawl_logs(rows)
+    assert crawl_log_store._load_logs("slow_src")[0]["timings"]["http_ttfb"] == 0.123
+
+    async def fake_get_source(source_id):
+        return {"id": source_id, "name": source_id.upper(), "dimension": "technology"}
+
+    monkeypatch.setattr(console_service.source_service, "get_source", fake_get_source)
+
+    breakdown = await console_service.get_console_source_timings("slow_src")
+    assert breakdown.runs == 2 and breakdown.avg_duration_seconds == 3.0
+    assert [(s.stage, s.avg_seconds, s.max_seconds) for s in breakdown.stages] == [
+        ("fetch", 2.0, 3.0),
+        ("parse", 0.5, 0.5),
+    ]
+    assert breakdown.http == {"http_requests": 2.0, "http_ttfb": 0.123}
+
+    slowest = await console_service.get_console_slowest_runs(hours=1, limit=2)
+    assert [(r.source_id, r.slowest_stage) for r in slowest.items] == [
+        ("fast_src", "parse"),
+        ("slow_src", "fetch"),
+    ]
+    by_fetch = await console_service.get_console_slowest_runs(hours=1, limit=1, stage="fetch")
+    assert by_fetch.items[0].source_name == "SLOW_SRC"
+    assert by_fetch.items[0].stage_seconds == 3.0
+
+
+@pytest.fixture()
+async def pg_logs(pg_pool, json_fallback_dirs, monkeypatch):
+    await init_client(backend="postgres")
+    monkeypatch.setattr(crawl_log_store, "_timings_column", None)
+
+    source_id = f"pt_{uuid4().hex[:8]}"
+    try:
+        yield source_id
+    finally:
+        await pg_pool.execute("DELETE FROM crawl_logs WHERE source_id = $1", source_id)
+
+
+async def test_timings_are_stored_in_crawl_logs_jsonb(pg_logs):
+    now = datetime.now(timezone.utc)
+    await crawl_log_store.append_crawl_logs(
+        [
+            crawl_log_store.build_crawl_log_row(
+                pg_logs, status="success", started_at=now, finished_at=now,
+                timings={"fetch": 1.23456, "http_requests": 3},
+            ),
+            crawl_log_store.build_crawl_log_row(pg_logs, status="failed", started_at=now),
+        ]
+    )
+    logs = await crawl_log_store.get_crawl_logs(pg_logs)
+    assert sorted((log["status"], log["timings"]) for log in logs) == [
+        ("failed", None),
+        ("success", {"fetch": 1.235, "http_requests": 3}),
+    ]
+
+
+async def test_slowest_runs_are_ranked_in_sql(pg_logs):
+    now = datetime.now(timezone.utc) + timedelta(days=1)  # newer than other tests' rows
+    await crawl_log_store.append_crawl_logs(
+        [
+            crawl_log_store.build_crawl_log_row(
+                pg_logs, status="success", started_at=now, duration_seconds=duration,
+                timings={"fetch": fetch},
+            )
+            for duration, fetch in [(1.0, 5.0), (9.0, 1.0), (3.0, 2.0)]
+        ]
+    )
+    since = now - timedelta(seconds=1)
+
+    by_duration = await crawl_log_store.get_slowest_crawl_logs(since=since, limit=2)
+    assert [log["duration_seconds"] for log in by_duration] == [9.0, 3.0]
+    by_fetch = await crawl_log_store.get_slowest_crawl_logs(since=since, limit=2, stage="fetch")
+    assert [log["timings"]["fetch"] for log in by_fetch] == [5.0, 2.0]
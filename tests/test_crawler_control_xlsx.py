@@ -11,6 +11,7 @@ from openpyxl import load_workbook
 from app.crawlers.base import CrawledItem, CrawlResult, CrawlStatus
 from app.schemas.console import CrawlRequest
 from app.services.crawler_control_service import CrawlerControlService
+from app.services.stores import crawl_telemetry
 
 
 class _FakeCrawler:
@@ -106,8 +107,9 @@ async def test_crawler_control_service_exports_xlsx_without_database_persistence
     append_log = AsyncMock()
     update_state = AsyncMock()
     save_db = AsyncMock()
-    monkeypatch.setattr("app.services.crawler_control_service.append_crawl_log", append_log)
-    monkeypatch.setattr("app.services.crawler_control_service.update_source_state", update_state)
+    monkeypatch.setattr(crawl_telemetry, "_writer", crawl_telemetry.CrawlTelemetryWriter())
+    monkeypatch.setattr(crawl_telemetry, "append_crawl_logs", append_log)
+    monkeypatch.setattr(crawl_telemetry, "apply_source_state_updates", update_state)
     monkeypatch.setattr("app.services.crawler_control_service.save_crawl_result_json", save_db)
 
     service = CrawlerControlService()
@@ -29,6 +29,9 @@ class _FakeArticlesTable:
     def eq(self, *_args, **_kwargs):
         return self
 
+    def in_(self, *_args, **_kwargs):
+        return self
+
     def upsert(self, rows, **_kwargs):
         self.upsert_rows = rows
         self._selected = False
@@ -161,6 +164,39 @@ async def test_save_crawl_result_json_skips_when_persistence_disabled(
     assert called is False
 
 
+@pytest.mark.asyncio
+async def test_save_crawl_results_batch_isolates_failing_source(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    fake_client = _FakeClient()
+    monkeypatch.setattr("app.db.client.get_client", lambda: fake_client)
+    monkeypatch.setattr(json_storage, "UPSERT_CHUNK_SIZE", 2)
+    # Non-string tags stand in for a row the database rejects.
+    monkeypatch.setattr(json_storage, "_normalize_tags", lambda tags: tags)
+
+    def result(source_id: str, count: int, tags: list) -> SimpleNamespace:
+        return SimpleNamespace(items=[
+            CrawledItem(
+                title=f"{source_id}-{i}",
+                url=f"https://example.edu.cn/{source_id}/{i}",
+                tags=tags,
+                source_id=source_id,
+                dimension="universities",
+            )
+            for i in range(count)
+        ])
+
+    summaries = await json_storage.save_crawl_results_batch([
+        (result("good_a", 3, ["ok"]), {"id": "good_a", "dimension": "universities"}),
+        (result("bad", 1, [985]), {"id": "bad", "dimension": "universities"}),
+        (result("good_b", 2, ["ok"]), {"id": "good_b", "dimension": "universities"}),
+    ])
+
+    # "bad" shares a chunk with good_a and good_b; both are retried on their own.
+    assert [s["upserted"] for s in summaries] == [3, 0, 2]
+    assert [s["new"] for s in summaries] == [3, 0, 2]
+
+
 @pytest.mark.asyncio
 async def test_dynamic_page_crawler_uses_current_html_when_wait_times_out(
     monkeypatch: pytest.MonkeyPatch,
@@ -1,6 +1,14 @@
+import asyncio
 from datetime import date, datetime, timezone
+from uuid import uuid4
 
-from app.db.client import _coerce_comparison_value, _split_or_expression
+from app.db import pool as db_pool
+from app.db.client import (
+    _coerce_comparison_value,
+    _split_or_expression,
+    get_client,
+    init_client,
+)
 
 
 def test_split_or_expression_keeps_commas_inside_ilike_values():
@@ -25,3 +33,41 @@ def test_coerce_comparison_value_parses_iso_datetime_for_timestamp_columns():
 
 def test_coerce_comparison_value_leaves_non_temporal_columns_unchanged():
     assert _coerce_comparison_value("title", "2026-04-20") == "2026-04-20"
+
+
+async def test_in_filter_works_on_primary_and_secondary_loop_pools(pg_pool):
+    await init_client(backend="postgres")
+    prefix = f"pt_{uuid4().hex[:8]}"
+    for i in range(3):
+        await pg_pool.execute(
+            "INSERT INTO source_states (source_id, crawl_interval_minutes) VALUES ($1, $2)",
+            f"{prefix}_{i}",
+            60 * (i + 1),
+        )
+
+    async def query() -> tuple[list[str], list[str]]:
+        states = get_client().table("source_states")
+        by_id = await states.select("source_id").in_(
+            "source_id", [f"{prefix}_0", f"{prefix}_2"]
+        ).execute()
+        by_int = await get_client().table("source_states").select("source_id").like(
+            "source_id", f"{prefix}%"
+        ).in_("crawl_interval_minutes", [120, 180]).execute()
+        return (
+            sorted(r["source_id"] for r in by_id.data),
+            sorted(r["source_id"] for r in by_int.data),
+        )
+
+    async def on_secondary_loop() -> tuple[list[str], list[str]]:
+        # The proxy lazily opens a pool for this loop, which JSON-encodes list params.
+        try:
+            return await query()
+        finally:
+            await db_pool._pools.pop(id(asyncio.get_running_loop())).close()
+
+    expected = ([f"{prefix}_0", f"{prefix}_2"], [f"{prefix}_1", f"{prefix}_2"])
+    try:
+        assert await query() == expected
+        assert await asyncio.to_thread(asyncio.run, on_secondary_loop()) == expected
+    finally:
+        await pg_pool.execute("DELETE FROM source_states WHERE source_id LIKE $1", f"{prefix}%")
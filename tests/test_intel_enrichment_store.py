@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from uuid import uuid4
+
+import pytest
+
+from app.services.stores import intel_enrichment_store
+from app.services.stores.intel_enrichment_store import EnrichmentStore
+
+
+def _article(url_hash: str, content_hash: str = "c1") -> dict:
+    return {"url_hash": url_hash, "title": f"t-{url_hash}", "content_hash": content_hash}
+
+
+async def test_file_fallback_without_pool(monkeypatch, tmp_path):
+    def no_pool():
+        raise RuntimeError("DB pool not initialized")
+
+    monkeypatch.setattr("app.db.pool.get_pool", no_pool)
+    store = EnrichmentStore("policy", tmp_path / "_enriched", payload_key="llm")
+
+    await store.put_many([(_article("a"), {"matchScore": 40}), (_article("b"), {"matchScore": 10})])
+    assert json.loads((tmp_path / "_enriched" / "a.json").read_text())["llm"] == {"matchScore": 40}
+    assert sorted(a["url_hash"] for a, _ in await store.load_all()) == ["a", "b"]
+    assert list(await store.get_many(["b", "missing"])) == ["b"]
+
+
+@pytest.fixture()
+async def pg_store(pg_pool, monkeypatch, tmp_path):
+    monkeypatch.setattr(intel_enrichment_store._schema, "ready", None)
+
+    namespace = f"test_{uuid4().hex[:8]}"
+    try:
+        yield EnrichmentStore(namespace, tmp_path / "_enriched", payload_key="enriched_changes")
+    finally:
+        await pg_pool.execute("DELETE FROM intel_enrichments WHERE namespace = $1", namespace)
+
+
+async def test_legacy_files_are_imported_once(pg_store, tmp_path):
+    legacy = tmp_path / "_enriched"
+    legacy.mkdir()
+    for url_hash in ("a", "b"):
+        (legacy / f"{url_hash}.json").write_text(
+            json.dumps({"article": _article(url_hash), "enriched_changes": [{"id": url_hash}]}),
+            encoding="utf-8",
+        )
+
+    loaded = await pg_store.load_all()
+    assert sorted(changes[0]["id"] for _, changes in loaded) == ["a", "b"]
+    assert not legacy.exists()
+    assert sorted(p.name for p in (tmp_path / "_enriched.migrated").iterdir()) == [
+        "a.json", "b.json",
+    ]
+
+    await pg_store.put_many([(_article("a", "c2"), [{"id": "a2"}])], version="v2")
+    found = await pg_store.get_many(["a", "missing"])
+    assert list(found) == ["a"]
+    assert found["a"] == (_article("a", "c2"), [{"id": "a2"}])
+    assert len(await pg_store.load_all()) == 2
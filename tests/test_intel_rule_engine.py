@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from app.services.intel.personnel import rules as personnel_rules
+from app.services.intel.rule_engine import compile_rules
+from app.services.intel.scoring import keyword_score
+from app.services.intel.tech_frontier import rules as tech_rules
+
+TABLES = {
+    "topic": [("大模型", 20), ("LLM", 15), ("智能", 5), ("人工智能", 10)],
+    "funding": [("融资", 15), ("Series", 8), ("融资", 5)],
+}
+
+
+def test_scan_scores_every_table_like_keyword_score():
+    rules = compile_rules(TABLES)
+    text = "某人工智能公司完成 series A 融资，发布大模型"
+    scan = rules.scan(text)
+    assert scan.scores() == {name: keyword_score(text, table) for name, table in TABLES.items()}
+    assert scan.hits("topic") == ["大模型", "智能", "人工智能"]
+    assert rules.scan(text) is scan
+
+
+def test_limit_answers_prefix_queries_from_the_same_scan():
+    rules = compile_rules(TABLES)
+    title, content = "LLM 周报", "正文开头。" * 20 + "完成融资"
+    scan = rules.scan(f"{title} {content}")
+    for chars in (0, 50, 100, 200):
+        prefix = f"{title} {content[:chars]}"
+        assert scan.scores(limit=len(prefix)) == {
+            name: keyword_score(prefix, table) for name, table in TABLES.items()
+        }
+
+
+def test_tech_frontier_rules_share_one_scan_per_article():
+    article = {
+        "title": "OpenAI 发布具身智能人形机器人",
+        "content": "该公司宣布完成新一轮融资，估值上涨。" + "背景介绍。" * 200 + "大会邀请",
+        "url_hash": "a" * 32,
+    }
+    tech_rules._RULES.scan.cache_clear()
+    assert {m["topic_id"] for m in tech_rules.classify_article(article)} >= {"embodied_ai"}
+    assert tech_rules.detect_news_type(article) == "投融资"
+    # "大会" / "邀请" sit beyond content[:800], so no opportunity is flagged.
+    assert tech_rules.detect_opportunity(article) is None
+    info = tech_rules._RULES.scan.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_personnel_regexes_only_run_on_trigger_hits():
+    article = {"title": "国务院任免国家工作人员", "content": "任命张三为教育部副部长。"}
+    changes = personnel_rules.extract_changes(article)
+    assert [(c["name"], c["action"], c["department"]) for c in changes] == [
+        ("张三", "任命", "教育部")
+    ]
+    assert personnel_rules.extract_changes({"title": "人事新闻", "content": "无变动"}) == []
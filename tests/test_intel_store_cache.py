@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from app.services.intel import intel_store
+from app.services.intel.policy import service as policy_service
+from app.services.intel.tech_frontier import service as tech_service
+
+
+@pytest.fixture()
+def processed(monkeypatch, tmp_path):
+    monkeypatch.setattr(intel_store, "PROCESSED_BASE", tmp_path)
+    monkeypatch.setattr(intel_store, "_cache", {})
+
+    def write(module: str, filename: str, items: list[dict], bump: int = 0) -> None:
+        path = tmp_path / module / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"generated_at": "g", "item_count": len(items), "items": items}),
+            encoding="utf-8",
+        )
+        if bump:
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+    return write
+
+
+def test_document_is_cached_until_the_file_changes(processed):
+    processed("policy_intel", "feed.json", [{"id": "a"}])
+    first = intel_store.load_intel_document("policy_intel", "feed.json")
+    assert intel_store.load_intel_document("policy_intel", "feed.json") is first
+
+    processed("policy_intel", "feed.json", [{"id": "b"}], bump=10**9)
+    second = intel_store.load_intel_document("policy_intel", "feed.json")
+    assert second is not first and second.items == [{"id": "b"}]
+
+    assert intel_store.load_intel_json("policy_intel", "missing.json")["items"] == []
+
+
+def test_policy_feed_filters_through_indexes(processed):
+    items = [
+        {"id": str(i), "source_id": f"s{i % 3}", "category": "国家政策" if i % 2 else "北京政策",
+         "importance": "重要" if i % 4 == 0 else "一般", "matchScore": i * 10, "title": f"t{i}"}
+        for i in range(12)
+    ]
+    processed("policy_intel", "feed.json", items)
+
+    result = policy_service.get_policy_feed(
+        source_ids="s0,s1", category="北京政策", min_match_score=20, limit=2
+    )
+    expected = [
+        i for i in items
+        if i["source_id"] in {"s0", "s1"} and i["category"] == "北京政策" and i["matchScore"] >= 20
+    ]
+    assert result["total"] == len(expected)
+    assert result["items"] == expected[:2] and result["next_offset"] == 2
+    assert policy_service.get_policy_feed(importance="重要")["total"] == 3
+    assert policy_service.get_policy_feed(category="无")["items"] == []
+
+
+def test_signals_match_per_request_flattening(processed):
+    news = {"id": "n1", "title": "shared", "source_id": "s1", "date": "2026-05-02"}
+    topics = [
+        {"id": "t1", "topic": "A", "relatedNews": [news, {"id": "n2", "date": "2026-05-01"}],
+         "kolVoices": [{"id": "k1", "statement": "x", "source_id": "kol", "date": "2026-05-03"}]},
+        {"id": "t2", "topic": "B", "relatedNews": [news], "kolVoices": []},
+    ]
+    processed("tech_frontier", "topics.json", topics)
+
+    result = tech_service.get_signals()
+    assert [(s["data"]["id"], s["parentTopicId"]) for s in result["items"]] == [
+        ("k1", "t1"), ("n1", "t1"), ("n2", "t1"),
+    ]
+    assert [s["parentTopicId"] for s in tech_service.get_signals(topic_id="t2")["items"]] == ["t2"]
+    assert [s["data"]["id"] for s in tech_service.get_signals(signal_type="news")["items"]] == [
+        "n1", "n2",
+    ]
+    assert tech_service.get_signals(source_id="kol")["total"] == 1
+    assert tech_service.get_topic_detail("t2")["topic"] == "B"
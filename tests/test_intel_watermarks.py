@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.db.client import init_client
+from app.services.intel.pipeline import base, personnel_processor
+from app.services.intel.pipeline.base import ArticleDelta, HashTracker
+from app.services.stores import intel_watermark_store, json_reader
+
+T0 = datetime(2026, 5, 1, 8, 0, tzinfo=timezone.utc)
+
+
+def test_hash_tracker_resets_on_version_change(tmp_path):
+    tracker = HashTracker(tmp_path / "hashes.json", tmp_path)
+    tracker.save({"a"})
+    assert tracker.load(version="v1") == {"a"}  # unversioned files are kept
+
+    tracker.save({"a", "b"}, version="v1")
+    assert tracker.load(version="v1") == {"a", "b"}
+    assert tracker.load() == {"a", "b"}
+    assert tracker.load(version="v2") == set()
+
+
+async def test_load_article_delta_reads_from_watermark(monkeypatch):
+    calls = []
+
+    async def fake_get_watermark(processor, version):
+        return T0 if version == "v1" else None
+
+    async def fake_get_articles(dim, **kwargs):
+        calls.append((dim, kwargs["crawled_since"]))
+        return [{"url_hash": dim, "crawled_at": (T0 + timedelta(hours=1)).isoformat()}]
+
+    monkeypatch.setattr(intel_watermark_store, "get_watermark", fake_get_watermark)
+    monkeypatch.setattr(base, "get_articles", fake_get_articles)
+
+    delta = await base.load_article_delta("policy", ["a", "b"], version="v1")
+    assert not delta.full
+    assert calls == [("a", T0 - base.WATERMARK_OVERLAP), ("b", T0 - base.WATERMARK_OVERLAP)]
+    assert delta.watermark == T0 + timedelta(hours=1)
+    assert delta.dimensions == ("a", "b")
+
+    calls.clear()
+    delta = await base.load_article_delta("policy", ["a"], version="v2")
+    assert delta.full and calls == [("a", None)]
+
+
+async def test_incremental_prune_checks_only_the_records_ids(monkeypatch):
+    lookups = []
+
+    async def fake_get_stored_article_ids(url_hashes, dimensions):
+        lookups.append((sorted(url_hashes), dimensions))
+        return {"keep"}
+
+    monkeypatch.setattr(base, "get_stored_article_ids", fake_get_stored_article_ids)
+
+    records = {"keep": 1, "gone": 2}
+    delta = ArticleDelta("policy", "v", False, dimensions=("a", "b"))
+    assert await delta.prune(records) == 1
+    assert records == {"keep": 1}
+    assert lookups == [(["gone", "keep"], ("a", "b"))]
+
+    # A full load already has every stored article, so it needs no lookup.
+    records = {"keep": 1, "gone": 2}
+    full = ArticleDelta("policy", "v", True, [{"url_hash": "gone"}])
+    assert await full.prune(records) == 1
+    assert records == {"gone": 2} and len(lookups) == 1
+
+
+def test_rules_version_covers_source_scope():
+    assert base.rules_version(base) == base.rules_version(base, source_scope=[])
+    assert base.rules_version(base, source_scope={"a", "b"}) == base.rules_version(
+        base, source_scope=["b", "a"]
+    )
+    assert base.rules_version(base, source_scope={"a"}) != base.rules_version(
+        base, source_scope={"a", "b"}
+    )
+
+
+def _personnel_article(url_hash: str, title: str) -> dict:
+    return {
+        "url_hash": url_hash,
+        "title": title,
+        "url": f"https://example.gov.cn/{url_hash}.html",
+        "source_id": "gov_personnel",
+        "dimension": "personnel",
+        "published_at": "2026-05-01T00:00:00+00:00",
+        "content": f"{title}。",
+        "crawled_at": T0.isoformat(),
+    }
+
+
+async def test_personnel_merges_delta_into_feed(monkeypatch, tmp_path):
+    first_batch = [_personnel_article("a1", "任命张三为教育部副部长")]
+    second_batch = [_personnel_article("a2", "免去李四的科技部司长职务")]
+    deltas = [
+        ArticleDelta("personnel", "v", True, first_batch),
+        ArticleDelta("personnel", "v", False, second_batch),
+        # a1 was deleted from articles since the last run.
+        ArticleDelta("personnel", "v", False, []),
+    ]
+    stored = [{"a1", "a2"}, {"a2"}]
+
+    async def fake_get_stored_article_ids(url_hashes, dimensions):
+        return set(url_hashes) & stored.pop(0)
+
+    async def fake_load_article_delta(processor, dimensions, *, version, force=False):
+        return deltas.pop(0)
+
+    async def noop(delta):
+        return None
+
+    monkeypatch.setattr(personnel_processor, "PROCESSED_DIR", tmp_path)
+    monkeypatch.setattr(
+        personnel_processor, "_hash_tracker", HashTracker(tmp_path / "h.json", tmp_path)
+    )
+    monkeypatch.setattr(personnel_processor, "load_article_delta", fake_load_article_delta)
+    monkeypatch.setattr(personnel_processor, "commit_watermark", noop)
+    monkeypatch.setattr(base, "get_stored_article_ids", fake_get_stored_article_ids)
+    monkeypatch.setattr(personnel_processor, "filter_personnel_scoped_articles", lambda a: a)
+
+    first = await personnel_processor.process_personnel_pipeline()
+    second = await personnel_processor.process_personnel_pipeline()
+
+    assert first["full_reload"] and not second["full_reload"]
+    assert second["unique"] == 1 and second["feed_items"] == 2
+    assert set(personnel_processor._load_feed_items()) == {"a1", "a2"}
+
+    third = await personnel_processor.process_personnel_pipeline()
+    assert third["feed_items"] == 1
+    assert set(personnel_processor._load_feed_items()) == {"a2"}
+
+
+@pytest.fixture()
+async def pg_watermarks(pg_pool, monkeypatch):
+    monkeypatch.setattr(intel_watermark_store._schema, "ready", None)
+
+    processor = f"test_{uuid4().hex[:8]}"
+    try:
+        yield processor
+    finally:
+        await pg_pool.execute("DELETE FROM intel_watermarks WHERE processor = $1", processor)
+
+
+async def test_watermark_round_trip_and_version_invalidation(pg_watermarks):
+    processor = pg_watermarks
+    assert await intel_watermark_store.get_watermark(processor, "v1") is None
+
+    assert await intel_watermark_store.set_watermark(processor, T0, "v1")
+    assert await intel_watermark_store.get_watermark(processor, "v1") == T0
+    assert await intel_watermark_store.get_watermark(processor, "v2") is None
+
+
+async def test_stored_article_ids_are_looked_up_by_key(pg_pool):
+    await init_client(backend="postgres")
+    prefix = f"pt_{uuid4().hex[:8]}"
+    rows = [(f"{prefix}_a", "policy"), (f"{prefix}_b", "personnel")]
+    for url_hash, dim in rows:
+        await pg_pool.execute(
+            "INSERT INTO articles (url_hash, source_id, dimension, url) VALUES ($1, $2, $3, $4)",
+            url_hash, prefix, dim, f"https://example.org/{url_hash}",
+        )
+    try:
+        ids = [f"{prefix}_a", f"{prefix}_b", f"{prefix}_gone"]
+        assert await json_reader.get_stored_article_ids(ids) == {f"{prefix}_a", f"{prefix}_b"}
+        assert await json_reader.get_stored_article_ids(ids, ("policy",), chunk_size=1) == {
+            f"{prefix}_a"
+        }
+        assert await json_reader.get_stored_article_ids([]) == set()
+    finally:
+        await pg_pool.execute("DELETE FROM articles WHERE source_id = $1", prefix)
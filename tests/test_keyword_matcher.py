@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+
+from app.crawlers.base import BaseCrawler, CrawledItem
+from app.crawlers.utils.content_filter import should_keep_item
+from app.crawlers.utils.keyword_matcher import KeywordMatcher, get_matcher
+
+
+def test_find_all_reports_overlapping_keywords_in_one_pass():
+    matcher = KeywordMatcher(["智能", "人工智能", "AI", "芯片", "大模型"])
+    assert matcher.find_all("发布人工智能芯片规划") == ["智能", "人工智能", "芯片"]
+    assert matcher.search("ai芯片") is True
+    assert matcher.search("普通新闻") is False
+    assert KeywordMatcher(["AI"], case_sensitive=False).find_all("OpenAI 发布") == ["AI"]
+
+
+def test_whole_word_only_bounds_ascii_edges():
+    matcher = KeywordMatcher(["AI", "LLM", "数据"], whole_word=True)
+    assert matcher.find_all("AI芯片与数据中心") == ["AI", "数据"]
+    assert matcher.find_all("Open AI, LLM-based") == ["AI", "LLM"]
+    assert matcher.find_all("TRAIN LLMs on 大数据集") == ["数据"]
+
+
+def test_matches_substring_semantics_of_the_old_filters():
+    rng = random.Random(7)
+    alphabet = "aAbB人工智能数据 1"
+    for _ in range(500):
+        keywords = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 6))
+        ]
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert KeywordMatcher(keywords).find_all(text) == [
+            kw for kw in dict.fromkeys(keywords) if kw in text
+        ]
+        assert KeywordMatcher(keywords, case_sensitive=False).search(text) == any(
+            kw.lower() in text.lower() for kw in keywords
+        )
+
+
+def test_should_keep_item_and_matcher_cache():
+    assert should_keep_item("AI技术发展", ["AI", "人工智能"])
+    assert not should_keep_item("AI广告", ["AI"], ["广告"])
+    assert should_keep_item("TRAIN schedule", ["AI"])
+    assert not should_keep_item("TRAIN schedule", ["AI"], whole_word=True)
+    assert get_matcher(["AI", "芯片"]) is get_matcher(["AI", "芯片"])
+
+
+class _Crawler(BaseCrawler):
+    async def fetch_and_parse(self) -> list[CrawledItem]:
+        return []
+
+
+def test_base_crawler_filter_is_case_insensitive_and_honours_whole_word():
+    items = [
+        CrawledItem(title="New LLM release", url="https://a"),
+        CrawledItem(title="Training schedule", url="https://b", content="rain"),
+    ]
+    substring = _Crawler({"id": "kw", "keyword_filter": ["llm", "ai"]})
+    assert [i.url for i in substring._filter_by_keywords(items)] == ["https://a", "https://b"]
+    whole = _Crawler({"id": "kw", "keyword_filter": ["llm", "ai"], "keyword_whole_word": True})
+    assert [i.url for i in whole._filter_by_keywords(items)] == ["https://a"]
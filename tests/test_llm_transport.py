@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.services.llm import llm_transport
+from app.services.llm.llm_transport import TokenBucket, parse_reset, post_chat_completion
+
+URL = "https://llm.example.test/v1/chat/completions"
+PAYLOAD = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 10}
+OK_BODY = {"choices": [{"message": {"content": "ok"}}], "usage": {"total_tokens": 12}}
+
+
+@pytest.fixture(autouse=True)
+def fresh_states(monkeypatch):
+    monkeypatch.setattr(llm_transport, "_states", {})
+    monkeypatch.setattr(settings, "LLM_PROVIDER_LIMITS", {})
+
+
+def test_parse_reset_formats():
+    assert parse_reset("6m0s") == 360.0
+    assert parse_reset("20ms") == pytest.approx(0.02)
+    assert parse_reset("1.5") == 1.5
+    assert parse_reset(str(int((1_000_000_000 + 30) * 1000)), now=1_000_000_000) == 30.0
+    assert parse_reset("Thu, 01 Jan 1970 00:01:00 GMT", now=0) == 60.0
+    assert parse_reset("soon") is None and parse_reset(None) is None
+
+
+def test_token_bucket_refills_and_follows_headers():
+    now = [0.0]
+    bucket = TokenBucket(60, clock=lambda: now[0])
+    bucket.take(60)
+    assert bucket.delay(1) == pytest.approx(1.0)
+    now[0] = 30.0
+    assert bucket.delay(30) == 0.0
+
+    bucket.set_limit(120)  # looser than configured: ignored
+    assert bucket.limit == 60
+    bucket.set_remaining(0)
+    assert bucket.delay(6) == pytest.approx(6.0)
+
+    unlimited = TokenBucket(0)
+    unlimited.set_limit(600)  # learned from headers
+    assert unlimited.limit == 600
+
+
+async def test_429_pauses_provider_and_retries(httpx_mock):
+    httpx_mock.add_response(url=URL, status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(
+        url=URL,
+        json=OK_BODY,
+        headers={"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "2s"},
+    )
+
+    response = await post_chat_completion("p", URL, headers={}, payload=PAYLOAD)
+    assert response.json()["choices"][0]["message"]["content"] == "ok"
+
+    limiter = llm_transport.get_limiter("p")
+    assert limiter.concurrency < settings.LLM_MAX_CONCURRENCY
+    assert limiter.wait_time(1) > 1.0  # window exhausted until reset
+    assert llm_transport.get_limiter("p").in_flight == 0
+
+
+async def test_concurrency_cap_is_shared_across_callers(httpx_mock, monkeypatch):
+    monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY", 2)
+    in_flight = peak = 0
+
+    async def slow_ok(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=OK_BODY)
+
+    httpx_mock.add_callback(slow_ok, url=URL, is_reusable=True)
+    await asyncio.gather(*(
+        post_chat_completion("p", URL, headers={}, payload=PAYLOAD) for _ in range(6)
+    ))
+    assert peak == 2
+
+    clients = {id(state.client) for state in llm_transport._states.values()}
+    assert len(clients) == 1
+    await llm_transport.close_llm_clients()
+    assert llm_transport._states == {}
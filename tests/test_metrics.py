@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.crawlers.utils import http_client
+from app.services.llm.llm_call_tracker import LLMCallTracker
+from app.utils import metrics
+from app.utils.metrics import Counter, Histogram, classify_sql
+
+
+@pytest.fixture(autouse=True)
+def _clean_metrics():
+    metrics.reset_metrics()
+    yield
+    metrics.reset_metrics()
+
+
+def test_histogram_and_counter_exposition():
+    histogram = Histogram("t_latency_seconds", "Test latency.", ("route",), buckets=(0.1, 1.0))
+    counter = Counter("t_calls_total", "Test calls.", ("status",))
+    try:
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, "/a")
+        counter.inc("ok")
+        counter.inc("ok", amount=2)
+
+        text = histogram.render() + "\n" + counter.render()
+        assert "# TYPE t_latency_seconds histogram" in text
+        assert 't_latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 't_latency_seconds_bucket{route="/a",le="1"} 2' in text
+        assert 't_latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 't_latency_seconds_count{route="/a"} 3' in text
+        assert 't_calls_total{status="ok"} 3' in text
+        with pytest.raises(ValueError):
+            counter.inc()
+    finally:
+        metrics._registry.remove(histogram)
+        metrics._registry.remove(counter)
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("SELECT * FROM articles WHERE id = $1", ("articles", "select")),
+        ('select count(*) from public."crawl_logs"', ("crawl_logs", "select")),
+        ("INSERT INTO source_states (source_id) VALUES ($1)", ("source_states", "insert")),
+        ("UPDATE crawl_jobs SET status = $1", ("crawl_jobs", "update")),
+        ("DELETE FROM crawl_logs WHERE source_id = $1", ("crawl_logs", "delete")),
+        (
+            "WITH next AS (SELECT id FROM crawl_jobs LIMIT 1) UPDATE crawl_jobs SET x = 1",
+            ("crawl_jobs", "update"),
+        ),
+        ("ALTER TABLE crawl_logs ADD COLUMN IF NOT EXISTS timings JSONB", ("crawl_logs", "ddl")),
+        ("SELECT pg_try_advisory_lock($1)", ("none", "select")),
+        ("BEGIN", ("unknown", "begin")),
+    ],
+)
+def test_classify_sql(query, expected):
+    assert classify_sql(query) == expected
+
+
+def test_middleware_labels_route_templates_including_mounts():
+    inner = FastAPI()
+
+    @inner.get("/sources/{source_id}")
+    async def inner_source(source_id: str):
+        return {"id": source_id}
+
+    app = FastAPI()
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    @app.get("/articles/{article_id}")
+    async def article(article_id: str):
+        return {"id": article_id}
+
+    app.mount("/console-api", inner)
+
+    with TestClient(app) as client:
+        client.get("/articles/1")
+        client.get("/articles/2")
+        client.get("/console-api/sources/abc")
+        client.get("/nope")
+
+    seconds = metrics.API_REQUEST_SECONDS
+    assert seconds.count("GET", "/articles/{article_id}", "200") == 2
+    assert seconds.count("GET", "/console-api/sources/{source_id}", "200") == 1
+    assert seconds.count("GET", "unmatched", "404") == 1
+
+
+async def test_http_client_records_domain_and_status():
+    async def handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    domain = f"127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    try:
+        await http_client.fetch_page(f"http://{domain}/", request_delay=0.001)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert metrics.CRAWLER_HTTP_REQUESTS.value(domain, "200") == 1
+    assert metrics.CRAWLER_HTTP_SECONDS.count(domain) == 1
+    assert metrics.CRAWLER_DOMAIN_WAIT_SECONDS.count(domain) == 1
+    assert f'crawler_http_requests_total{{domain="{domain}",status="200"}} 1' in (
+        metrics.render_metrics()
+    )
+
+
+def test_llm_calls_record_tokens_and_latency(tmp_path, monkeypatch):
+    from app.services.llm import llm_call_tracker
+
+    monkeypatch.setattr(llm_call_tracker, "LOGS_DIR", tmp_path)
+    monkeypatch.setattr(llm_call_tracker, "SUMMARY_FILE", tmp_path / "summary.json")
+    monkeypatch.setattr(llm_call_tracker, "CALLS_LOG_FILE", tmp_path / "calls.jsonl")
+    tracker = LLMCallTracker()
+    common = dict(model="m", prompt="p", system_prompt="s", response_text="r")
+    tracker.log_call(**common, input_tokens=100, output_tokens=20, duration_ms=1500)
+    tracker.log_call(**common, provider="kimi", input_tokens=0, output_tokens=0, success=False)
+
+    assert metrics.LLM_REQUESTS.value("openrouter", "success") == 1
+    assert metrics.LLM_REQUESTS.value("kimi", "failed") == 1
+    assert metrics.LLM_TOKENS.value("openrouter", "input") == 100
+    assert metrics.LLM_TOKENS.value("openrouter", "output") == 20
+    assert metrics.LLM_REQUEST_SECONDS.total("openrouter") == 1.5
+
+
+async def test_pool_proxy_times_acquires(monkeypatch):
+    from app.db import pool as pool_module
+
+    class FakeConn:
+        async def fetchval(self, query, *args, timeout=None):
+            return args
+
+    class FakePool:
+        released: list = []
+
+        async def acquire(self, timeout=None):
+            return FakeConn()
+
+        async def release(self, conn):
+            self.released.append(conn)
+
+    loop_id = id(asyncio.get_running_loop())
+    monkeypatch.setattr(pool_module, "_pools", {loop_id: FakePool()})
+    monkeypatch.setattr(pool_module, "_primary_loop_id", loop_id)
+
+    db = pool_module.get_pool()
+    # The primary loop's pool keeps asyncpg argument handling (lists stay lists).
+    assert await db.fetchval("SELECT $1", ["a"]) == (["a"],)
+    async with db.acquire() as conn:
+        assert isinstance(conn, FakeConn)
+    assert metrics.DB_POOL_ACQUIRE_SECONDS.count() == 2
+    assert len(FakePool.released) == 2
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import random
+from uuid import uuid4
+
+import pytest
+
+from app.crawlers.base import CrawledItem, CrawlResult
+from app.crawlers.utils import json_storage
+from app.crawlers.utils.near_dup import (
+    MAX_DISTANCE,
+    collapse_near_duplicates,
+    from_signed64,
+    hamming,
+    simhash64,
+    simhash_bands,
+    to_signed64,
+)
+from app.db.client import init_client
+from app.db.pool import get_pool
+from app.services.stores import near_dup_store
+
+_CHARS = "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可也你"
+
+
+def _text(seed: int, length: int = 1500) -> str:
+    rng = random.Random(seed)
+    return "".join(rng.choice(_CHARS) for _ in range(length))
+
+
+def test_republished_copies_are_within_distance_and_share_a_band():
+    notice = _text(1)
+    copy = (
+        "【转载】"
+        + notice.replace(notice[700:704], "人工智能")
+        + "\n来源：教育部网站 责任编辑：张三"
+    )
+    other = _text(2)
+
+    a, b, c = simhash64(notice), simhash64(copy), simhash64(other)
+    assert hamming(a, b) <= MAX_DISTANCE
+    assert hamming(a, c) > 16
+    assert set(simhash_bands(a)) & set(simhash_bands(b))
+    assert simhash64("太短的标题") is None
+    assert from_signed64(to_signed64(2**64 - 1)) == 2**64 - 1
+
+
+def test_collapse_keeps_the_canonical_article_once():
+    rows = [
+        {"url_hash": "b", "canonical_url_hash": "a"},
+        {"url_hash": "x"},
+        {"url_hash": "a", "canonical_url_hash": "a"},
+        {"url_hash": "c", "canonical_url_hash": "a"},
+        {"url_hash": "d", "canonical_url_hash": "d"},
+        {"url_hash": "e", "canonical_url_hash": "e2"},
+    ]
+    assert [row["url_hash"] for row in collapse_near_duplicates(rows)] == ["a", "x", "d", "e"]
+
+
+@pytest.fixture()
+async def pg_articles(pg_pool, monkeypatch):
+    await init_client(backend="postgres")
+    monkeypatch.setattr(near_dup_store._schema, "ready", None)
+
+    prefix = f"nd_{uuid4().hex[:8]}"
+    try:
+        yield prefix
+    finally:
+        await pg_pool.execute(
+            "DELETE FROM article_simhash_bands WHERE url_hash IN "
+            "(SELECT url_hash FROM articles WHERE source_id LIKE $1)",
+            f"{prefix}%",
+        )
+        await pg_pool.execute("DELETE FROM articles WHERE source_id LIKE $1", f"{prefix}%")
+
+
+async def test_ingest_assigns_clusters_across_batches(pg_articles):
+    notice = _text(int(pg_articles[3:], 16))
+    title = "关于印发行动计划的通知"
+    first = CrawlResult(
+        source_id=f"{pg_articles}_moe",
+        items=[CrawledItem(title=title, url=f"https://moe.example/{pg_articles}", content=notice)],
+    )
+    await json_storage.save_crawl_results_batch([(first, {"id": first.source_id})])
+
+    second = CrawlResult(
+        source_id=f"{pg_articles}_uni",
+        items=[
+            CrawledItem(
+                title=title,
+                url=f"https://uni.example/{pg_articles}/1",
+                content=notice + "\n来源：教育部",
+            ),
+            CrawledItem(
+                title="学校新闻", url=f"https://uni.example/{pg_articles}/2", content=_text(99)
+            ),
+        ],
+    )
+    await json_storage.save_crawl_results_batch([(second, {"id": second.source_id})])
+
+    rows = await get_pool().fetch(
+        "SELECT url, url_hash, canonical_url_hash FROM articles WHERE source_id LIKE $1",
+        f"{pg_articles}%",
+    )
+    by_url = {r["url"]: r for r in rows}
+    original = by_url[f"https://moe.example/{pg_articles}"]
+    assert original["canonical_url_hash"] == original["url_hash"]
+    copy = by_url[f"https://uni.example/{pg_articles}/1"]
+    assert copy["canonical_url_hash"] == original["url_hash"]
+    unrelated = by_url[f"https://uni.example/{pg_articles}/2"]
+    assert unrelated["canonical_url_hash"] == unrelated["url_hash"]
+
+    bands = await get_pool().fetchval(
+        "SELECT COUNT(*) FROM article_simhash_bands WHERE url_hash = $1", original["url_hash"]
+    )
+    assert bands == 4
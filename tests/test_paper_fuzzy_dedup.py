@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+from uuid import uuid4
+
+import pytest
+
+from app.db.pool import get_pool
+from app.services import paper_dedup, paper_service
+
+TITLE = "Attention Is All You Need: Transformers for Sequence Transduction"
+
+
+def test_variant_titles_share_a_bucket_and_verify():
+    variants = [
+        (TITLE, ["Ashish Vaswani", "Noam Shazeer", "Niki Parmar"]),
+        (
+            "Attention is all you need - transformers for sequence transduction.",
+            ["Vaswani, Ashish", "Shazeer, Noam", "Parmar, Niki"],
+        ),
+    ]
+    (title_a, authors_a), (title_b, authors_b) = variants
+    assert set(paper_dedup.lsh_buckets(title_a, authors_a)) & set(
+        paper_dedup.lsh_buckets(title_b, authors_b)
+    )
+    score = paper_dedup.match_score(
+        {"title": title_a, "authors": authors_a, "year": 2017},
+        {"title": title_b, "authors": authors_b, "year": 2018},
+    )
+    assert score is not None and score >= paper_dedup.MERGE_MIN_SCORE
+
+
+def test_match_score_vetoes_different_papers():
+    base = {"title": TITLE, "authors": ["Ashish Vaswani"], "year": 2017}
+    assert paper_dedup.match_score(base, {**base, "year": 2021}) is None
+    assert paper_dedup.match_score(
+        {**base, "doi": "10.1/a"}, {**base, "doi": "10.1/b"}
+    ) is None
+    assert paper_dedup.match_score(
+        base, {**base, "title": "Attention Is Not All You Need for Graph Transduction"}
+    ) is None
+    assert paper_dedup.lsh_buckets("GAN") == []
+
+
+@pytest.fixture()
+async def pg_papers(pg_pool, monkeypatch):
+    monkeypatch.setattr(paper_service, "_SCHEMA_READY", False)
+
+    token = uuid4().hex[:8]
+    try:
+        yield token
+    finally:
+        paper_ids = [
+            r["paper_id"]
+            for r in await pg_pool.fetch(
+                "SELECT paper_id FROM papers WHERE source_id LIKE $1", f"pfd_{token}%"
+            )
+        ]
+        for table in ("paper_lsh_bands", "paper_source_aliases"):
+            await pg_pool.execute(
+                f"DELETE FROM {table} "
+                "WHERE paper_id = ANY(ARRAY(SELECT jsonb_array_elements_text($1::jsonb)))",
+                json.dumps(paper_ids),
+            )
+        await pg_pool.execute("DELETE FROM papers WHERE source_id LIKE $1", f"pfd_{token}%")
+        await pg_pool.execute(
+            "DELETE FROM paper_ingest_runs WHERE source_id LIKE $1", f"pfd_{token}%"
+        )
+
+
+def _payload(token: str, source: str, title: str, authors: list[str], raw_id: str) -> dict:
+    return {
+        "title": title,
+        "authors": authors,
+        "venue_year": 2017,
+        "raw_id": raw_id,
+        "source": {
+            "type": "third_party_api",
+            "name": source,
+            "source_id": f"pfd_{token}_{source}",
+            "raw_id": raw_id,
+        },
+    }
+
+
+async def test_sources_with_variant_titles_merge_into_one_paper(pg_papers):
+    token = pg_papers
+    title = f"{TITLE} {token}"
+    arxiv = await paper_service.ingest_papers(
+        get_pool(),
+        source_id=f"pfd_{token}_arxiv",
+        payloads=[_payload(token, "arxiv", title, ["Ashish Vaswani", "Noam Shazeer"], "1706")],
+    )
+    dblp_payload = _payload(
+        token, "dblp", title.lower() + ".", ["Vaswani, Ashish", "Shazeer, Noam"], "conf/nips/1"
+    )
+    dblp = await paper_service.ingest_papers(
+        get_pool(), source_id=f"pfd_{token}_dblp", payloads=[dblp_payload]
+    )
+    assert arxiv.inserted_count == 1
+    assert (dblp.inserted_count, dblp.updated_count, dblp.merged_count) == (0, 1, 1)
+    assert dblp.paper_ids == arxiv.paper_ids
+
+    alias = await get_pool().fetchrow(
+        "SELECT paper_id, match_score FROM paper_source_aliases WHERE alias_uid = $1",
+        f"source:pfd_{token}_dblp:conf/nips/1",
+    )
+    assert alias["paper_id"] == arxiv.paper_ids[0] and alias["match_score"] >= 0.85
+
+    again = await paper_service.ingest_papers(
+        get_pool(), source_id=f"pfd_{token}_dblp", payloads=[dblp_payload]
+    )
+    assert again.paper_ids == arxiv.paper_ids
+    # Resolved through the alias recorded above: an update, not a new merge.
+    assert (again.updated_count, again.merged_count) == (1, 0)
+    count = await get_pool().fetchval(
+        "SELECT COUNT(*) FROM papers WHERE source_id LIKE $1", f"pfd_{token}%"
+    )
+    assert count == 1
+
+
+async def test_backfill_merges_duplicates_stored_before_fuzzy_dedup(pg_papers, monkeypatch):
+    token = pg_papers
+    title = f"{TITLE} {token}"
+    monkeypatch.setattr(paper_service.settings, "PAPER_FUZZY_DEDUP_ENABLED", False)
+    arxiv = await paper_service.ingest_papers(
+        get_pool(),
+        source_id=f"pfd_{token}_arxiv",
+        payloads=[_payload(token, "arxiv", title, ["Ashish Vaswani", "Noam Shazeer"], "1706")],
+    )
+    dblp = await paper_service.ingest_papers(
+        get_pool(),
+        source_id=f"pfd_{token}_dblp",
+        payloads=[
+            _payload(
+                token, "dblp", title.lower() + ".", ["Vaswani, Ashish", "Shazeer, Noam"], "c/1"
+            )
+        ],
+    )
+    paper_ids = arxiv.paper_ids + dblp.paper_ids
+    await get_pool().execute(
+        "DELETE FROM paper_lsh_bands "
+        "WHERE paper_id = ANY(ARRAY(SELECT jsonb_array_elements_text($1::jsonb)))",
+        json.dumps(paper_ids),
+    )
+
+    backfill = await paper_service.backfill_fuzzy_dedup_index(get_pool())
+    assert backfill.indexed_count >= 2 and backfill.merged_count >= 1
+
+    survivors = await get_pool().fetch(
+        "SELECT paper_id FROM papers WHERE source_id LIKE $1", f"pfd_{token}%"
+    )
+    assert len(survivors) == 1 and survivors[0]["paper_id"] in paper_ids
+    aliases = await get_pool().fetch(
+        "SELECT alias_uid FROM paper_source_aliases WHERE paper_id = $1",
+        survivors[0]["paper_id"],
+    )
+    assert len(aliases) == 1
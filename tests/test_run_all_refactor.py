@@ -126,71 +126,138 @@ def test_run_all_parameter_types():
 
 
 def test_strategy_decision_logic_grouped():
-    """Test that grouped strategy selects correct execution path."""
-    # This is more of an integration test, verifying the logic is there
-    from scripts.crawl.run_all import _load_crawl_concurrency_config
+    """Test grouped strategy reads the top-level `grouped` map from the real YAML."""
+    from scripts.crawl.run_all import _load_crawl_concurrency_config, _resolve_concurrency
 
     conc_config = _load_crawl_concurrency_config()
-    strategy = "grouped"
+    concurrency_map, strategy_desc = _resolve_concurrency(conc_config, "grouped")
 
-    # Simulate the logic in run_all
-    if strategy == "grouped":
-        concurrency_map = conc_config.get("strategies", {}).get("grouped", {
-            "static": 20,
-            "rss": 20,
-            "dynamic": 8,
-            "snapshot": 10,
-        })
-        assert isinstance(concurrency_map, dict)
-        assert concurrency_map.get("static") >= 8
-        assert concurrency_map.get("dynamic") >= 5
+    assert concurrency_map == conc_config["grouped"]
+    # Only present in crawl_concurrency.yaml, not in the built-in defaults.
+    assert concurrency_map["university_leadership"] == 6
+    assert "分组" in strategy_desc and "dynamic=8" in strategy_desc
 
 
 def test_strategy_decision_logic_fixed():
-    """Test that fixed strategy selects correct execution path."""
-    from scripts.crawl.run_all import _load_crawl_concurrency_config
+    """Test fixed strategy reads `fixed.default` and honours an explicit override."""
+    from scripts.crawl.run_all import _load_crawl_concurrency_config, _resolve_concurrency
 
     conc_config = _load_crawl_concurrency_config()
-    strategy = "fixed"
-    concurrency = None
 
-    # Simulate the logic in run_all
-    if strategy == "fixed":
-        conc_val = concurrency or conc_config.get("strategies", {}).get("fixed", {}).get("default", 5)
-        assert isinstance(conc_val, int)
-        assert conc_val > 0
-        concurrency_map = conc_val
-        assert isinstance(concurrency_map, int)
+    conc_val, strategy_desc = _resolve_concurrency(conc_config, "fixed")
+    assert conc_val == conc_config["fixed"]["default"] == 12
+    assert strategy_desc == "固定 (并发=12)"
 
+    assert _resolve_concurrency(conc_config, "fixed", 3)[0] == 3
 
-def test_strategy_description_generation():
-    """Test that strategy descriptions are generated correctly."""
-    from scripts.crawl.run_all import _load_crawl_concurrency_config
 
-    conc_config = _load_crawl_concurrency_config()
+def test_strategy_falls_back_when_sections_missing():
+    """Test missing or malformed sections fall back to built-in defaults."""
+    from scripts.crawl.run_all import _resolve_concurrency
+
+    concurrency_map, _ = _resolve_concurrency({"grouped": None}, "grouped")
+    assert concurrency_map == {"static": 20, "rss": 20, "dynamic": 8, "snapshot": 10}
+    assert _resolve_concurrency({}, "fixed")[0] == 5
+
+
+def test_resolve_persistence_config_merges_and_clamps():
+    """Test _resolve_persistence_config fills defaults and rejects bad values."""
+    from scripts.crawl.run_all import _resolve_persistence_config
+
+    cfg = _resolve_persistence_config(
+        {"persistence": {"queue_size": 0, "workers": "3", "batch_size": "oops"}}
+    )
+
+    assert cfg["queue_size"] == 1
+    assert cfg["workers"] == 3
+    assert cfg["batch_size"] == 16
+    assert cfg["batch_timeout_seconds"] == 0.5
+
+    assert _resolve_persistence_config({})["workers"] == 4
 
-    # Test grouped strategy description
-    concurrency_map = conc_config.get("strategies", {}).get("grouped", {
-        "static": 20,
-        "rss": 20,
-        "dynamic": 8,
-        "snapshot": 10,
-    })
-    if isinstance(concurrency_map, dict):
-        strategy_desc = (
-            f"分组 (static/rss={concurrency_map.get('static', 20)}, "
-            f"dynamic={concurrency_map.get('dynamic', 8)}, "
-            f"snapshot={concurrency_map.get('snapshot', 10)})"
+
+@pytest.mark.asyncio
+async def test_persistence_worker_batches_across_sources():
+    """Test _run_persistence_worker merges queued results into batched writes."""
+    from scripts.crawl.run_all import _run_persistence_worker
+
+    saved_batches: list[list] = []
+    persisted: list[str] = []
+
+    async def mock_save_batch(batch):
+        saved_batches.append([cfg["id"] for _, cfg in batch])
+        return [{"upserted": 0, "new": 0, "deduped_in_batch": 0} for _ in batch]
+
+    async def on_persisted(record):
+        persisted.append(record["source_id"])
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    for i in range(5):
+        result = None if i == 2 else object()
+        await queue.put(({"id": f"s{i}"}, result, {"source_id": f"s{i}"}))
+    await queue.put(None)
+
+    with patch(
+        "app.crawlers.utils.json_storage.save_crawl_results_batch",
+        new=mock_save_batch,
+    ):
+        await _run_persistence_worker(
+            queue, on_persisted, batch_size=3, batch_timeout=0.01,
         )
-    assert "分组" in strategy_desc
-    assert "20" in strategy_desc
-    assert "8" in strategy_desc
-
-    # Test fixed strategy description
-    conc_val = 12
-    strategy_desc = f"固定 (并发={conc_val})"
-    assert "固定" in strategy_desc
-    assert "12" in strategy_desc
+
+    # Failed crawls (result=None) skip the write but still get bookkeeping.
+    assert saved_batches == [["s0", "s1"], ["s3", "s4"]]
+    assert persisted == ["s0", "s1", "s2", "s3", "s4"]
+
+
+
+def test_classify_crawl_outcome_only_flags_congestion_signals():
+    """Test timeouts/429/5xx are congestion while other failures are plain errors."""
+    from app.crawlers.utils.adaptive_concurrency import classify_crawl_outcome
+
+    assert classify_crawl_outcome("success", None) == "ok"
+    assert classify_crawl_outcome("failed", "ReadTimeout") == "congestion"
+    assert classify_crawl_outcome(
+        "failed", "Client error '429 Too Many Requests' for url 'https://x'"
+    ) == "congestion"
+    assert classify_crawl_outcome(
+        "failed", "Server error '503 Service Unavailable' for url 'https://x'"
+    ) == "congestion"
+    assert classify_crawl_outcome(
+        "failed", "Client error '404 Not Found' for url 'https://x'"
+    ) == "error"
+    assert classify_crawl_outcome("failed", "list selector matched nothing") == "error"
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_aimd_respects_ceiling_and_floor():
+    """Test additive increase up to the ceiling and multiplicative decrease."""
+    from app.crawlers.utils.adaptive_concurrency import (
+        AdaptiveConcurrencyLimiter,
+        AdaptiveSettings,
+    )
+
+    settings = AdaptiveSettings(
+        window=2,
+        initial_fraction=0.5,
+        cpu_load_threshold=1e9,
+        min_available_memory_pct=0,
+    )
+    limiter = AdaptiveConcurrencyLimiter("static", 4, settings)
+    assert limiter.limit == 2
+
+    for _ in range(6):
+        limiter.record(1.0, "ok")
+    assert limiter.limit == 4  # capped at the configured ceiling
+
+    decision = limiter.record(1.0, "congestion", detail="src: ReadTimeout")
+    assert decision is not None and decision["action"] == "decrease"
+    assert limiter.limit == 2
+    assert [d["action"] for d in limiter.decisions] == ["increase", "increase", "decrease"]
+
+    fixed = AdaptiveConcurrencyLimiter("rss", 3, AdaptiveSettings(enabled=False))
+    assert fixed.limit == 3
+    assert fixed.record(1.0, "congestion") is None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from app.db import notify
+from app.db.pool import connect_dedicated
+from app.scheduler import leader, manager
+
+
+class _FakeManager:
+    started = 0
+    stopped = 0
+
+    def __init__(self) -> None:
+        self.triggered: list[str] = []
+
+    async def start(self) -> None:
+        type(self).started += 1
+
+    async def stop(self) -> None:
+        type(self).stopped += 1
+
+    async def trigger_pipeline(self) -> None:
+        self.triggered.append("pipeline")
+
+    async def trigger_source(self, source_id: str) -> None:
+        self.triggered.append(source_id)
+
+
+@pytest.fixture()
+async def pg(pg_pool):
+    try:
+        yield
+    finally:
+        manager.set_remote_scheduler(None)
+
+
+async def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not reached in time")
+        await asyncio.sleep(0.05)
+
+
+async def test_only_one_worker_leads_and_follower_takes_over(pg, monkeypatch):
+    monkeypatch.setattr(leader, "SchedulerManager", _FakeManager)
+    monkeypatch.setattr(leader, "load_all_source_configs", lambda: [{"id": "src_a"}])
+    _FakeManager.started = _FakeManager.stopped = 0
+
+    first = leader.SchedulerLeaderElection(retry_seconds=1)
+    second = leader.SchedulerLeaderElection(retry_seconds=1)
+    await first.start()
+    await _wait_for(lambda: first.is_leader)
+    await second.start()
+    await asyncio.sleep(1.5)
+
+    assert first.is_leader and not second.is_leader
+    assert _FakeManager.started == 1
+
+    # A follower's trigger reaches the leader over NOTIFY.
+    proxy = leader.SchedulerCommandProxy()
+    await proxy.trigger_source("src_a")
+    await _wait_for(lambda: first._manager is not None and first._manager.triggered == ["src_a"])
+    with pytest.raises(ValueError):
+        await proxy.trigger_source("unknown")
+
+    await first.stop()
+    await _wait_for(lambda: second.is_leader, timeout=5)
+    assert _FakeManager.started == 2
+    await second.stop()
+    assert _FakeManager.stopped == 2
+
+
+async def test_cache_invalidation_from_other_process_runs_local_invalidator(pg):
+    cleared: list[str] = []
+    notify.register_cache_invalidator("pytest_cache", lambda: cleared.append("x"))
+    assert await notify.start_cache_invalidation_listener()
+    sender = await connect_dedicated()
+    try:
+        await sender.execute(
+            "SELECT pg_notify($1, $2)",
+            notify.CACHE_INVALIDATION_CHANNEL,
+            json.dumps({"cache": "pytest_cache", "origin": "other-host:1"}),
+        )
+        await _wait_for(lambda: cleared == ["x"])
+
+        # Our own broadcasts are not applied twice.
+        notify.invalidate_cache("pytest_cache")
+        await asyncio.sleep(0.3)
+        assert cleared == ["x", "x"]
+    finally:
+        await sender.close()
+        await notify.stop_cache_invalidation_listener()
+        notify._invalidators.pop("pytest_cache", None)
+
+
+async def test_follower_health_reports_leader_state_and_shared_pipeline_result(pg, monkeypatch):
+    from app.api.operations import health
+    from app.scheduler import pipeline
+    from app.services.stores import pipeline_result_store
+
+    monkeypatch.setattr(leader, "SchedulerManager", _FakeManager)
+    monkeypatch.setattr(leader, "load_all_source_configs", lambda: [{"id": "src_a"}])
+    monkeypatch.setattr(pipeline_result_store._schema, "ready", None)
+    monkeypatch.setattr(pipeline, "_last_pipeline_result", None)
+
+    manager.set_remote_scheduler(leader.SchedulerCommandProxy())
+    assert (await health.health_check())["scheduler"] == "no_leader"
+
+    elected = leader.SchedulerLeaderElection(retry_seconds=1)
+    await elected.start()
+    try:
+        await _wait_for(lambda: elected.is_leader)
+        # This process is now the leader; pretend to be a follower worker.
+        manager.set_remote_scheduler(leader.SchedulerCommandProxy())
+        assert await health.health_check() == {
+            "status": "ok", "scheduler": "follower", "scheduler_role": "follower",
+        }
+    finally:
+        await elected.stop()
+
+    result = pipeline.PipelineResult(
+        started_at=pipeline.datetime(2026, 1, 2, tzinfo=pipeline.timezone.utc),
+        finished_at=pipeline.datetime(2026, 1, 2, 0, 5, tzinfo=pipeline.timezone.utc),
+        stages=[pipeline.StageResult(name="crawl", status="success", summary={"n": 3})],
+    )
+    pool = await pipeline_result_store._schema.pool()
+    await pool.execute("DELETE FROM pipeline_results WHERE pipeline = 'daily'")
+    assert (await health.pipeline_status())["status"] == "never_run"
+    try:
+        await pipeline.record_pipeline_result(result)
+        # A follower never ran the pipeline, so its memory is empty.
+        monkeypatch.setattr(pipeline, "_last_pipeline_result", None)
+        status = await health.pipeline_status()
+        assert status == result.to_dict()
+        assert status["stages"][0]["summary"] == {"n": 3}
+    finally:
+        await pool.execute("DELETE FROM pipeline_results WHERE pipeline = 'daily'")
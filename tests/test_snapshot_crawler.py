@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from app.crawlers.base import CrawlStatus
+from app.crawlers.templates import snapshot_crawler
+from app.crawlers.templates.snapshot_crawler import SnapshotDiffCrawler, segment_blocks
+from app.services.stores import snapshot_store
+
+PAGE = """
+<html><body>
+  <div class="banner">今日头条 {banner}</div>
+  <div id="main">
+    院领导
+    <h2>校长</h2>
+    <ul><li>张三 校长</li><li>李四 副校长</li></ul>
+    <p>更新时间：{date}</p>
+    <script>var t = "{banner}";</script>
+  </div>
+</body></html>
+"""
+
+
+def _page(banner: str = "A", date: str = "2026-01-01", extra: str = "") -> str:
+    return PAGE.format(banner=banner, date=date).replace("</ul>", f"{extra}</ul>")
+
+
+@pytest.fixture()
+def crawler(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot_store, "SNAPSHOTS_DIR", tmp_path)
+    pages: list[str] = []
+
+    async def fake_fetch_page(url, **kwargs):
+        return pages.pop(0)
+
+    monkeypatch.setattr(snapshot_crawler, "fetch_page", fake_fetch_page)
+    instance = SnapshotDiffCrawler(
+        {
+            "id": "leaders_x",
+            "name": "X 大学领导",
+            "url": "https://x.edu.cn/leaders",
+            "ignore_selectors": [".banner"],
+            "ignore_patterns": [r"更新时间[:：]?\s*\d{4}-\d{1,2}-\d{1,2}"],
+        }
+    )
+    return instance, pages
+
+
+def test_segment_blocks_uses_innermost_blocks_and_drops_noise():
+    blocks = segment_blocks(_page(), ignore_selectors=[".banner"])
+    assert [text for _, text in blocks] == [
+        "院领导",
+        "校长",
+        "张三 校长",
+        "李四 副校长",
+        "更新时间：2026-01-01",
+    ]
+    assert all(len(digest) == 16 for digest, _ in blocks)
+
+    scoped = segment_blocks(_page(), content_area="ul")
+    assert [text for _, text in scoped] == ["张三 校长", "李四 副校长"]
+
+
+async def test_only_changed_blocks_are_reported(crawler, tmp_path):
+    instance, pages = crawler
+    pages.extend(
+        [
+            _page(),
+            # Banner and timestamp churn only.
+            _page(banner="B", date="2026-02-02"),
+            _page(extra="<li>王五 副校长</li>").replace("李四 副校长", "李四 常务副校长"),
+        ]
+    )
+
+    first = await instance.run()
+    assert first.status == CrawlStatus.SUCCESS
+    assert first.items[0].extra["is_first_snapshot"] is True
+
+    second = await instance.run()
+    assert second.status == CrawlStatus.NO_NEW_CONTENT
+
+    third = await instance.run()
+    assert third.status == CrawlStatus.SUCCESS
+    assert third.items[0].content.splitlines() == [
+        "@@ 2 blocks added, 1 removed (5 blocks) @@",
+        "- 李四 副校长",
+        "+ 李四 常务副校长",
+        "+ 王五 副校长",
+    ]
+    assert third.items[0].extra["blocks_added"] == 2
+
+    stored = json.loads((tmp_path / "leaders_x.json").read_text(encoding="utf-8"))
+    assert "content_text" not in stored
+    assert len(stored["block_hashes"]) == len(stored["blocks"]) == 5
+
+
+async def test_legacy_whole_page_snapshot_is_rebaselined_without_a_change(crawler, tmp_path):
+    instance, pages = crawler
+    html = _page()
+    legacy_hash = snapshot_crawler._legacy_content_hash(
+        html, None, instance.config["ignore_patterns"]
+    )
+    (tmp_path / "leaders_x.json").write_text(
+        json.dumps({"source_id": "leaders_x", "content_hash": legacy_hash, "content_text": "old"}),
+        encoding="utf-8",
+    )
+    pages.extend([html, html])
+
+    assert (await instance.run()).status == CrawlStatus.NO_NEW_CONTENT
+    stored = json.loads((tmp_path / "leaders_x.json").read_text(encoding="utf-8"))
+    assert stored["content_hash"] == hashlib.sha256(
+        "\n".join(stored["block_hashes"]).encode("ascii")
+    ).hexdigest()
+    assert (await instance.run()).status == CrawlStatus.NO_NEW_CONTENT
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from app.config import BASE_DIR
+from app.db.client import init_client
+from app.db.pool import get_pool
+from app.schemas.social_kol import SocialTwitterIngestRequest
+from app.services.external.social_kol_service import ingest_twitter_bundle
+
+_SOCIAL_DDL = BASE_DIR / "scripts" / "migration" / "create_social_media_tables.sql"
+
+
+@pytest.fixture()
+async def social_platform(pg_pool):
+    await pg_pool.execute(_SOCIAL_DDL.read_text(encoding="utf-8"))
+    await init_client(backend="postgres")
+
+    platform = f"pt_{uuid4().hex[:8]}"
+    try:
+        yield platform
+    finally:
+        await pg_pool.execute("DELETE FROM social_posts WHERE platform = $1", platform)
+        await pg_pool.execute("DELETE FROM social_accounts WHERE platform = $1", platform)
+
+
+def _post(post_id: str, author: str, *, followers: int = 10) -> dict:
+    return {
+        "id": post_id,
+        "text": f"text {post_id}",
+        "createdAt": "Mon Mar 02 08:00:00 +0000 2026",
+        "likeCount": 3,
+        "author": {"userName": author, "name": author.title(), "followers": followers},
+    }
+
+
+def _bundle(platform: str, users: list[dict]) -> SocialTwitterIngestRequest:
+    return SocialTwitterIngestRequest.model_validate(
+        {"platform": platform, "max_posts_per_user": 3, "users": users}
+    )
+
+
+async def test_bulk_ingest_keeps_counters_and_skips_known_posts(social_platform):
+    users = [
+        {
+            "query_username": "alice",
+            "matched_username": "Alice",
+            "display_name": "Alice",
+            # duplicate id in the same payload, a post by a non-KOL (quoted) author,
+            # a malformed entry and a post over the per-user limit
+            "latest_5_posts": [
+                _post("1", "Alice"),
+                _post("1", "Alice"),
+                "not-a-dict",
+                _post("99", "Alice"),
+            ],
+        },
+        {
+            "query_username": "bob",
+            "matched_username": "bob",
+            "latest_5_posts": [_post("2", "bob"), _post("3", "carol", followers=7)],
+        },
+        {"query_username": "dave", "matched_username": "dave", "latest_5_posts": []},
+    ]
+
+    first = await ingest_twitter_bundle(_bundle(social_platform, users))
+    assert (first.users, first.kol_accounts_upserted, first.accounts_upserted) == (3, 3, 4)
+    assert (first.posts_upserted, first.skipped_posts) == (3, 2)
+
+    users[1]["latest_5_posts"].append(_post("4", "bob"))
+    second = await ingest_twitter_bundle(_bundle(social_platform, users))
+    assert (second.posts_upserted, second.skipped_posts) == (1, 5)
+
+    rows = await get_pool().fetch(
+        """
+        SELECT p.external_post_id, p.is_kol_author, a.username_normalized, a.follower_count
+        FROM social_posts p LEFT JOIN social_accounts a ON a.id = p.account_id
+        WHERE p.platform = $1 ORDER BY p.external_post_id
+        """,
+        social_platform,
+    )
+    assert [(r["external_post_id"], r["username_normalized"]) for r in rows] == [
+        ("1", "alice"), ("2", "bob"), ("3", "carol"), ("4", "bob"),
+    ]
+    carol = next(r for r in rows if r["external_post_id"] == "3")
+    assert carol["is_kol_author"] is False and carol["follower_count"] == 7
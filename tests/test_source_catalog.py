@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from app.services.core import source_service
+from app.services.stores import source_state
 
 MOCK_CONFIGS = [
     {
@@ -64,6 +65,13 @@ MOCK_STATES = {
 }
 
 
+@pytest.fixture(autouse=True)
+def _fresh_snapshot():
+    source_service.invalidate_source_catalog_snapshot()
+    yield
+    source_service.invalidate_source_catalog_snapshot()
+
+
 def _mock_deps():
     merged_states: dict[str, dict] = {}
     for config in MOCK_CONFIGS:
@@ -171,3 +179,30 @@ async def test_list_sources_supports_taxonomy_filters_and_facets():
 
     track_facets = {item["key"]: item for item in facets["taxonomy_tracks"]}
     assert "policy_national" in track_facets
+
+
+@pytest.mark.asyncio
+async def test_catalog_snapshot_is_reused_until_source_states_change():
+    with (
+        _mock_deps() as load_states,
+        patch(
+            "app.services.core.source_service.get_source_states_stamp",
+            new=AsyncMock(return_value="db:3:t1"),
+        ) as stamp,
+        patch.object(source_service.settings, "SOURCE_CATALOG_RECHECK_SECONDS", 0.0),
+    ):
+        first = await source_service.list_sources_catalog(page_size=2)
+        again = await source_service.list_sources_catalog(page=2, page_size=2)
+        assert load_states.await_count == 1
+        assert first["facets"] is again["facets"]
+        assert first["total_pages"] == 2 and len(again["items"]) == 1
+
+        # Another process touched source_states: the stamp moves.
+        stamp.return_value = "db:3:t2"
+        await source_service.list_sources()
+        assert load_states.await_count == 2
+
+        # A write from this process (crawl result, enable override) bumps the version.
+        source_state._bump_state_version()
+        await source_service.get_source("leaders_tsinghua")
+        assert load_states.await_count == 3
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from app.config import settings
+from app.scheduler import source_catalog
+from app.scheduler.manager import load_all_source_configs
+from app.scheduler.source_catalog import get_source_catalog
+
+
+def _write(path, body: str, *, mtime_ns: int) -> None:
+    path.write_text(body, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture()
+def sources_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SOURCES_DIR", tmp_path)
+    source_catalog.invalidate_source_catalog()
+    _write(
+        tmp_path / "policy.yaml",
+        """
+dimension: national_policy
+default_keyword_filter: [AI]
+sources:
+  - {id: gov_a, name: Gov A, crawl_method: static, group: gov, tags: [policy]}
+  - {id: gov_b, name: Gov B, crawl_method: rss, group: gov}
+""",
+        mtime_ns=1_000_000_000,
+    )
+    (tmp_path / "nested").mkdir()
+    _write(
+        tmp_path / "nested" / "tech.yaml",
+        """
+dimension: technology
+sources:
+  - {id: tech_a, name: Tech A, crawl_method: static, crawler_class: arxiv_api}
+""",
+        mtime_ns=1_000_000_000,
+    )
+    yield tmp_path
+    source_catalog.invalidate_source_catalog()
+
+
+def test_catalog_indexes_and_read_only_views(sources_dir):
+    catalog = get_source_catalog()
+    assert [c["id"] for c in catalog] == ["tech_a", "gov_a", "gov_b"]
+    assert [c["id"] for c in catalog.by_crawl_method["static"]] == ["tech_a", "gov_a"]
+    assert [c["id"] for c in catalog.by_group["gov"]] == ["gov_a", "gov_b"]
+    assert catalog.by_crawler_class["arxiv_api"][0]["dimension"] == "technology"
+    assert catalog.get("gov_a")["source_file_path"] == "policy.yaml"
+    assert catalog.get("gov_a")["keyword_filter"] == ("AI",)
+
+    with pytest.raises(TypeError):
+        catalog.get("gov_a")["name"] = "changed"
+    with pytest.raises(AttributeError):
+        catalog.get("gov_a")["tags"].append("x")
+
+    copies = load_all_source_configs()
+    copies[1]["tags"].append("mutated")
+    copies[1]["name"] = "changed"
+    assert get_source_catalog().get("gov_a")["tags"] == ("policy",)
+    assert load_all_source_configs()[1]["name"] == "Gov A"
+
+
+def test_only_changed_files_are_reparsed(sources_dir, monkeypatch):
+    first = get_source_catalog()
+    parsed: list[str] = []
+    real_parse = source_catalog._parse_source_file
+
+    def counting_parse(path, root):
+        parsed.append(path.name)
+        return real_parse(path, root)
+
+    monkeypatch.setattr(source_catalog, "_parse_source_file", counting_parse)
+    assert get_source_catalog() is first
+    assert parsed == []
+
+    _write(
+        sources_dir / "policy.yaml",
+        "dimension: national_policy\nsources:\n  - {id: gov_c, name: Gov C}\n",
+        mtime_ns=2_000_000_000,
+    )
+    updated = get_source_catalog()
+    assert parsed == ["policy.yaml"]
+    assert sorted(updated.by_id) == ["gov_c", "tech_a"]
+
+    (sources_dir / "nested" / "tech.yaml").unlink()
+    assert list(get_source_catalog().by_id) == ["gov_c"]
+    assert parsed == ["policy.yaml"]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from app.db.client import init_client
+from app.db.pool import get_pool
+from app.services.stores.source_state import (
+    catalog_content_hash,
+    sync_source_catalog_from_configs,
+)
+
+
+@pytest.fixture()
+async def pg_catalog(pg_pool, json_fallback_dirs):
+    await init_client(backend="postgres")
+
+    prefix = f"pt_{uuid4().hex[:8]}"
+    saved = await pg_pool.fetchrow(
+        "SELECT to_regclass('source_catalog_sync') IS NOT NULL AS present"
+    )
+    previous = None
+    if saved["present"]:
+        previous = await pg_pool.fetchrow(
+            "SELECT * FROM source_catalog_sync WHERE catalog = 'source_states'"
+        )
+    try:
+        yield prefix
+    finally:
+        await pg_pool.execute("DELETE FROM source_states WHERE source_id LIKE $1", f"{prefix}%")
+        await pg_pool.execute("DELETE FROM source_catalog_sync WHERE catalog = 'source_states'")
+        if previous is not None:
+            await pg_pool.execute(
+                "INSERT INTO source_catalog_sync VALUES ($1, $2, $3, $4)", *previous.values()
+            )
+
+
+def _config(source_id: str, **extra) -> dict:
+    return {
+        "id": source_id,
+        "name": source_id.upper(),
+        "url": f"https://example.com/{source_id}",
+        "dimension": "technology",
+        "crawl_method": "static",
+        "schedule": "daily",
+        "tags": ["ai", "news"],
+        **extra,
+    }
+
+
+def test_catalog_hash_ignores_row_order_and_timestamps():
+    a = {"source_id": "a", "tags": ["x"], "updated_at": "2026-01-01"}
+    b = {"source_id": "b", "tags": [], "updated_at": "2026-01-01"}
+    same = catalog_content_hash([a, b], mark_missing_unsupported=True)
+    assert same == catalog_content_hash(
+        [dict(b, updated_at="2026-02-02"), a], mark_missing_unsupported=True
+    )
+    assert same != catalog_content_hash([a, dict(b, tags=["y"])], mark_missing_unsupported=True)
+    assert same != catalog_content_hash([a, b], mark_missing_unsupported=False)
+
+
+async def test_bulk_sync_upserts_once_and_skips_unchanged_catalog(pg_catalog):
+    configs = [_config(f"{pg_catalog}_{i}") for i in range(3)]
+
+    first = await sync_source_catalog_from_configs(configs, mark_missing_unsupported=False)
+    assert (first["upserted"], first["schema_mode"]) == (3, "full")
+
+    again = await sync_source_catalog_from_configs(configs, mark_missing_unsupported=False)
+    assert again["skipped"] is True and again["upserted"] == 0
+
+    configs[0]["name"] = "Renamed"
+    changed = await sync_source_catalog_from_configs(configs, mark_missing_unsupported=False)
+    assert changed["upserted"] == 3 and "skipped" not in changed
+
+    row = await get_pool().fetchrow(
+        "SELECT source_name, tags, is_supported FROM source_states WHERE source_id = $1",
+        f"{pg_catalog}_0",
+    )
+    assert row["source_name"] == "Renamed"
+    assert row["tags"] == ["ai", "news"] and row["is_supported"] is True
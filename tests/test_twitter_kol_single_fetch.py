@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.config import settings
+from app.scheduler import jobs
+from app.schemas.social_kol import SocialIngestResponse
+from app.services.external import social_kol_service
+from app.services.external.twitter_service import twitter_client
+from app.services.stores import crawl_telemetry
+
+
+def _raw_tweet(
+    username: str, idx: int, *, likes: int = 500, kind: str = "tweet", reply: bool = False
+) -> dict:
+    return {
+        "type": kind,
+        "isReply": reply,
+        "id": f"{username}-{idx}",
+        "text": f"post {idx} by {username}",
+        "url": f"https://x.com/{username}/status/{idx}",
+        "createdAt": "Mon Mar 02 08:00:00 +0000 2026",
+        "likeCount": likes,
+        "author": {
+            "userName": username,
+            "name": username.title(),
+            "description": f"bio of {username}",
+            "location": "SF",
+        },
+    }
+
+
+def _patch_job(monkeypatch, fake_fetch) -> tuple[list, list]:
+    """Route execute_crawl_job through ``fake_fetch``; returns (ingested, saved)."""
+    ingested: list = []
+    saved: list = []
+
+    async def fake_ingest(bundle):
+        ingested.append(bundle)
+        return SocialIngestResponse(
+            platform="x", users=len(bundle.users), kol_accounts_upserted=0,
+            accounts_upserted=0, posts_upserted=0,
+        )
+
+    async def fake_save(result, _config):
+        saved.append(result)
+
+    async def noop(*_args, **_kwargs):
+        return {}
+
+    monkeypatch.setattr(settings, "TWITTER_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "TWITTER_API_PROXY", "")
+    monkeypatch.setattr(twitter_client, "_api_key", "test-key")
+    monkeypatch.setattr(social_kol_service, "_fetch_twitter_user_posts", fake_fetch)
+    monkeypatch.setattr(social_kol_service, "ingest_twitter_bundle", fake_ingest)
+    monkeypatch.setattr(jobs, "save_crawl_result_json", fake_save)
+    monkeypatch.setattr(crawl_telemetry, "_writer", crawl_telemetry.CrawlTelemetryWriter())
+    monkeypatch.setattr(crawl_telemetry, "append_crawl_logs", noop)
+    monkeypatch.setattr(crawl_telemetry, "apply_source_state_updates", noop)
+    monkeypatch.setattr(jobs, "get_source_state", noop)
+    return ingested, saved
+
+
+def _block(username: str, tweets: list[dict]) -> dict:
+    return {
+        "query_username": username,
+        "matched_username": username,
+        "display_name": username.title(),
+        "latest_5_posts": tweets,
+    }
+
+
+async def test_twitter_kol_job_fetches_each_account_once_and_reuses_bundle(monkeypatch):
+    usernames = [f"kol{i}" for i in range(6)]
+    source_config = {
+        "id": "twitter_pytest",
+        "crawler_class": "twitter_kol",
+        "dimension": "technology",
+        "twitter_accounts": usernames,
+        "max_tweets_per_account": 3,
+        "min_likes": 100,
+        "twitter_fetch_concurrency": 2,
+    }
+    fetched: list[str] = []
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch(_client, *, username, include_replies):
+        nonlocal in_flight, peak
+        fetched.append(username)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        tweets = [_raw_tweet(username, 1), _raw_tweet(username, 2, likes=5)]
+        tweets.append(_raw_tweet(username, 3, kind="reply"))
+        return _block(username, tweets)
+
+    ingested, saved = _patch_job(monkeypatch, fake_fetch)
+    result = await jobs.execute_crawl_job(source_config)
+
+    assert sorted(fetched) == usernames  # one fetch per account, no second pass
+    assert peak <= 2
+    assert len(ingested) == 1 and len(ingested[0].users) == len(usernames)
+    # Article items come from the same bundle: popular original tweets only.
+    assert saved[0] is result
+    assert result.items_total == len(usernames)
+    assert {item.extra["author_bio"] for item in result.items} == {
+        f"bio of {u}" for u in usernames
+    }
+
+
+async def test_replies_at_the_head_of_the_timeline_do_not_crowd_out_articles(monkeypatch):
+    source_config = {
+        "id": "twitter_pytest",
+        "crawler_class": "twitter_kol",
+        "dimension": "technology",
+        "twitter_accounts": [
+            {"username": "lead", "cohort": "core"},
+            {"username": "wide", "cohort": "expansion"},
+        ],
+        "crawl_accounts_cohort": "core",
+        "max_tweets_per_account": 2,
+    }
+
+    async def fake_fetch(_client, *, username, include_replies):
+        replies = [_raw_tweet(username, i, reply=True) for i in range(3)]
+        retweet = _raw_tweet(username, 3, kind="retweet")
+        originals = [_raw_tweet(username, i) for i in range(4, 7)]
+        return _block(username, [*replies, retweet, *originals])
+
+    ingested, saved = _patch_job(monkeypatch, fake_fetch)
+    result = await jobs.execute_crawl_job(source_config)
+
+    # Articles: the first two originals of every account, whatever its cohort.
+    assert sorted(item.extra["tweet_id"] for item in result.items) == [
+        "lead-4", "lead-5", "wide-4", "wide-5",
+    ]
+    # Social ingest: only the selected cohort, with the full fetched page.
+    (bundle,) = ingested
+    assert [user["query_username"] for user in bundle.users] == ["lead"]
+    assert len(bundle.users[0]["latest_5_posts"]) == 7
+    assert bundle.max_posts_per_user == 2
@@ -5,6 +5,7 @@ import pytest
 
 from app.crawlers.base import CrawledItem, CrawlResult, CrawlStatus
 from app.services.core.institution import leadership
+from app.services.stores import crawl_telemetry
 
 
 class _DummyCrawler:
@@ -69,29 +70,42 @@ async def test_run_university_leadership_full_crawl_updates_state_on_success():
                 }
             ),
         ),
-        patch.object(leadership, "append_crawl_log", new=AsyncMock()) as append_log,
-        patch.object(leadership, "update_source_state", new=AsyncMock()) as update_state,
+        patch.object(crawl_telemetry, "_writer", crawl_telemetry.CrawlTelemetryWriter()),
+        patch.object(crawl_telemetry, "append_crawl_logs", new=AsyncMock()) as append_logs,
+        patch.object(
+            crawl_telemetry, "apply_source_state_updates", new=AsyncMock()
+        ) as update_states,
     ):
         summary = await leadership.run_university_leadership_full_crawl(max_concurrency=1)
 
     assert summary["total_sources"] == 1
     assert summary["success_sources"] == 1
     assert summary["failed_sources"] == 0
-    append_log.assert_awaited_once_with(
-        source_id="leaders_tsinghua",
-        status="success",
-        items_total=1,
-        items_new=1,
-        error_message=None,
-        started_at=started_at,
-        finished_at=finished_at,
-        duration_seconds=12.0,
+    append_logs.assert_awaited_once_with(
+        [
+            {
+                "source_id": "leaders_tsinghua",
+                "status": "success",
+                "items_total": 1,
+                "items_new": 1,
+                "error_message": None,
+                "started_at": started_at,
+                "finished_at": finished_at,
+                "duration_seconds": 12.0,
+                "timings": None,
+            }
+        ]
     )
-    update_state.assert_awaited_once_with(
-        "leaders_tsinghua",
-        last_crawl_at=finished_at,
-        last_success_at=finished_at,
-        reset_failures=True,
+    update_states.assert_awaited_once_with(
+        [
+            {
+                "source_id": "leaders_tsinghua",
+                "reset": True,
+                "delta": 0,
+                "last_crawl_at": finished_at,
+                "last_success_at": finished_at,
+            }
+        ]
     )
 
 
@@ -126,25 +140,40 @@ async def test_run_university_leadership_full_crawl_updates_state_on_failure():
         ),
         patch.object(leadership, "save_crawl_result_json", new=AsyncMock()),
         patch.object(leadership, "_upsert_current", new=AsyncMock()),
-        patch.object(leadership, "append_crawl_log", new=AsyncMock()) as append_log,
-        patch.object(leadership, "update_source_state", new=AsyncMock()) as update_state,
+        patch.object(crawl_telemetry, "_writer", crawl_telemetry.CrawlTelemetryWriter()),
+        patch.object(crawl_telemetry, "append_crawl_logs", new=AsyncMock()) as append_logs,
+        patch.object(
+            crawl_telemetry, "apply_source_state_updates", new=AsyncMock()
+        ) as update_states,
     ):
         summary = await leadership.run_university_leadership_full_crawl(max_concurrency=1)
 
     assert summary["total_sources"] == 1
     assert summary["success_sources"] == 0
     assert summary["failed_sources"] == 1
-    append_log.assert_awaited_once_with(
-        source_id="leaders_tsinghua",
-        status="failed",
-        items_total=0,
-        items_new=0,
-        error_message="network error",
-        started_at=started_at,
-        finished_at=finished_at,
-        duration_seconds=5.0,
+    append_logs.assert_awaited_once_with(
+        [
+            {
+                "source_id": "leaders_tsinghua",
+                "status": "failed",
+                "items_total": 0,
+                "items_new": 0,
+                "error_message": "network error",
+                "started_at": started_at,
+                "finished_at": finished_at,
+                "duration_seconds": 5.0,
+                "timings": None,
+            }
+        ]
     )
-    update_state.assert_awaited_once_with(
-        "leaders_tsinghua",
-        last_crawl_at=finished_at,
+    update_states.assert_awaited_once_with(
+        [
+            {
+                "source_id": "leaders_tsinghua",
+                "reset": False,
+                "delta": 1,
+                "last_crawl_at": finished_at,
+                "last_success_at": None,
+            }
+        ]
     )
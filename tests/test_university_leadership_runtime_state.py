@@ -5,6 +5,7 @@ import pytest
 
 from app.crawlers.base import CrawlResult, CrawlStatus, CrawledItem
 from app.services.core.institution import leadership
+from app.services.stores import crawl_telemetry
 
 
 SOURCE_CONFIG = {
@@ -50,23 +51,31 @@ async def test_run_university_leadership_full_crawl_records_success_runtime_stat
         patch.object(leadership.CrawlerRegistry, "create_crawler", return_value=crawler),
         patch.object(leadership, "save_crawl_result_json", AsyncMock()),
         patch.object(leadership, "_upsert_current", AsyncMock(return_value={"changed": False})),
-        patch.object(leadership, "append_crawl_log", AsyncMock()) as append_log,
-        patch.object(leadership, "update_source_state", AsyncMock()) as update_state,
+        patch.object(crawl_telemetry, "_writer", crawl_telemetry.CrawlTelemetryWriter()),
+        patch.object(crawl_telemetry, "append_crawl_logs", AsyncMock()) as append_logs,
+        patch.object(
+            crawl_telemetry, "apply_source_state_updates", AsyncMock()
+        ) as update_states,
     ):
         summary = await leadership.run_university_leadership_full_crawl()
 
     assert summary["success_sources"] == 1
-    append_log.assert_awaited_once()
-    _, kwargs = append_log.await_args
-    assert kwargs["source_id"] == SOURCE_CONFIG["id"]
-    assert kwargs["status"] == CrawlStatus.SUCCESS.value
-    assert kwargs["items_total"] == 1
-    assert kwargs["items_new"] == 1
-    update_state.assert_awaited_once_with(
-        SOURCE_CONFIG["id"],
-        last_crawl_at=finished_at,
-        last_success_at=finished_at,
-        reset_failures=True,
+    append_logs.assert_awaited_once()
+    (rows,), _ = append_logs.await_args
+    assert rows[0]["source_id"] == SOURCE_CONFIG["id"]
+    assert rows[0]["status"] == CrawlStatus.SUCCESS.value
+    assert rows[0]["items_total"] == 1
+    assert rows[0]["items_new"] == 1
+    update_states.assert_awaited_once_with(
+        [
+            {
+                "source_id": SOURCE_CONFIG["id"],
+                "reset": True,
+                "delta": 0,
+                "last_crawl_at": finished_at,
+                "last_success_at": finished_at,
+            }
+        ]
     )
 
 
@@ -88,19 +97,29 @@ async def test_run_university_leadership_full_crawl_records_failed_runtime_state
             "create_crawler",
             side_effect=RuntimeError("boom"),
         ),
-        patch.object(leadership, "append_crawl_log", AsyncMock()) as append_log,
-        patch.object(leadership, "update_source_state", AsyncMock()) as update_state,
+        patch.object(crawl_telemetry, "_writer", crawl_telemetry.CrawlTelemetryWriter()),
+        patch.object(crawl_telemetry, "append_crawl_logs", AsyncMock()) as append_logs,
+        patch.object(
+            crawl_telemetry, "apply_source_state_updates", AsyncMock()
+        ) as update_states,
         patch.object(leadership, "datetime", FixedDateTime),
     ):
         summary = await leadership.run_university_leadership_full_crawl()
 
     assert summary["failed_sources"] == 1
-    append_log.assert_awaited_once()
-    _, kwargs = append_log.await_args
-    assert kwargs["source_id"] == SOURCE_CONFIG["id"]
-    assert kwargs["status"] == CrawlStatus.FAILED.value
-    assert "create crawler failed" in kwargs["error_message"]
-    update_state.assert_awaited_once_with(
-        SOURCE_CONFIG["id"],
-        last_crawl_at=started_at,
+    append_logs.assert_awaited_once()
+    (rows,), _ = append_logs.await_args
+    assert rows[0]["source_id"] == SOURCE_CONFIG["id"]
+    assert rows[0]["status"] == CrawlStatus.FAILED.value
+    assert "create crawler failed" in rows[0]["error_message"]
+    update_states.assert_awaited_once_with(
+        [
+            {
+                "source_id": SOURCE_CONFIG["id"],
+                "reset": False,
+                "delta": 1,
+                "last_crawl_at": started_at,
+                "last_success_at": None,
+            }
+        ]
     )